@@ -0,0 +1,192 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+"""Benchmark identifying miners from web pages and RPC responses.
+
+Runs a corpus of responses through the fingerprint tables used by `MinerFactory`,
+and through the if-chains they replaced.  The previous identification parsed the
+winning response twice, so the old numbers are for two parses per response.
+
+Run with `python benchmarks/fingerprint.py`.
+"""
+
+import json
+import timeit
+
+import httpx
+
+from pyasic.miners.factory import MinerFactory, MinerTypes
+
+PAGE = (
+    "<!DOCTYPE html><html><head><meta charset='utf-8'><title>{title}</title>"
+    "<link rel='stylesheet' href='/css/app.css'></head><body>"
+    + "<div class='row'><span>placeholder</span></div>" * 200
+    + "<footer>{footer}</footer><script src='/js/app.js'></script></body></html>"
+)
+
+WEB_CORPUS = [
+    PAGE.format(title="Braiins OS", footer=""),
+    PAGE.format(title="Luxor Firmware", footer=""),
+    PAGE.format(title="AxeOS", footer=""),
+    PAGE.format(title="Dashboard", footer="cloud-box"),
+    PAGE.format(title="AnthillOS", footer=""),
+    PAGE.format(title="Miner Web Dashboard", footer=""),
+    PAGE.format(title="Avalon Device", footer=""),
+    PAGE.format(title="Miner UI", footer=""),
+    PAGE.format(title="Router", footer="unknown"),
+]
+
+
+def _rpc(description: str, miner_type: str) -> str:
+    return json.dumps(
+        {
+            "STATUS": [
+                {"STATUS": "S", "When": 1, "Code": 22, "Description": description}
+            ],
+            "VERSION": [{"API": "3.1", "Type": miner_type, "CompileTime": "now"}],
+            "id": 1,
+        }
+    )
+
+
+SOCKET_CORPUS = [
+    _rpc("bosminer 1.0", "Antminer S19"),
+    _rpc("btminer", "M30S"),
+    _rpc("LUXminer 2024", "Antminer S19"),
+    _rpc("cgminer 4.9.2", "Antminer S19 Pro Hiveon"),
+    _rpc("cgminer 4.9.2", "Antminer S19 Pro"),
+    _rpc("bfgminer 5.4.2", "cloud-box"),
+    _rpc("cgminer 4.11.1", "Avalon 1246"),
+    _rpc("gcminer", "AT1500"),
+    _rpc("cgminer", "unknown"),
+]
+
+
+def legacy_web(web_text: str, web_resp: httpx.Response) -> MinerTypes | None:
+    if web_resp.status_code == 401 and 'realm="antMiner' in web_resp.headers.get(
+        "www-authenticate", ""
+    ):
+        return MinerTypes.ANTMINER
+    if web_resp.status_code == 401 and 'realm="blackMiner' in web_resp.headers.get(
+        "www-authenticate", ""
+    ):
+        return MinerTypes.HAMMER
+    if web_resp.status_code == 401 and 'realm="Daoge' in web_resp.headers.get(
+        "www-authenticate", ""
+    ):
+        return MinerTypes.ELPHAPEX
+    if len(web_resp.history) > 0:
+        history_resp = web_resp.history[0]
+        if (
+            "/cgi-bin/luci" in web_text
+            and history_resp.status_code == 307
+            and "https://" in history_resp.headers.get("location", "")
+        ):
+            return MinerTypes.WHATSMINER
+    if "Braiins OS" in web_text:
+        return MinerTypes.BRAIINS_OS
+    if "Luxor Firmware" in web_text:
+        return MinerTypes.LUX_OS
+    if "<TITLE>用户界面</TITLE>" in web_text:
+        return MinerTypes.ICERIVER
+    if "AxeOS" in web_text:
+        return MinerTypes.BITAXE
+    if "Lucky miner" in web_text:
+        return MinerTypes.LUCKYMINER
+    if "cloud-box" in web_text:
+        return MinerTypes.GOLDSHELL
+    if "AnthillOS" in web_text:
+        return MinerTypes.VNISH
+    if "Miner Web Dashboard" in web_text:
+        return MinerTypes.EPIC
+    if "Avalon" in web_text:
+        return MinerTypes.AVALONMINER
+    if "DragonMint" in web_text:
+        return MinerTypes.INNOSILICON
+    if "Miner UI" in web_text:
+        return MinerTypes.AURADINE
+    return None
+
+
+def legacy_socket(data: str) -> MinerTypes | None:
+    upper_data = data.upper()
+    if "BOSMINER" in upper_data or "BOSER" in upper_data:
+        return MinerTypes.BRAIINS_OS
+    if "BTMINER" in upper_data or "BITMICRO" in upper_data:
+        return MinerTypes.WHATSMINER
+    if "LUXMINER" in upper_data:
+        return MinerTypes.LUX_OS
+    if "HIVEON" in upper_data:
+        return MinerTypes.HIVEON
+    if "KAONSU" in upper_data:
+        return MinerTypes.MARATHON
+    if "RWGLR" in upper_data:
+        return MinerTypes.MSKMINER
+    if "ANTMINER" in upper_data and "DEVDETAILS" not in upper_data:
+        return MinerTypes.ANTMINER
+    if (
+        "INTCHAINS_QOMO" in upper_data
+        or "KDAMINER" in upper_data
+        or "BFGMINER" in upper_data
+    ):
+        return MinerTypes.GOLDSHELL
+    if "INNOMINER" in upper_data:
+        return MinerTypes.INNOSILICON
+    if "AVALON" in upper_data:
+        return MinerTypes.AVALONMINER
+    if "GCMINER" in upper_data or "FLUXOS" in upper_data:
+        return MinerTypes.AURADINE
+    if "VNISH" in upper_data:
+        return MinerTypes.VNISH
+    return None
+
+
+def main(number: int = 2000) -> None:
+    resp = httpx.Response(200)
+    for text in WEB_CORPUS:
+        assert legacy_web(text, resp) == MinerFactory._parse_web_type(text, resp)
+    for data in SOCKET_CORPUS:
+        assert legacy_socket(data) == MinerFactory._parse_socket_type(data)
+
+    def web_old() -> None:
+        for text in WEB_CORPUS:
+            if legacy_web(text, resp) is not None:
+                legacy_web(text, resp)
+
+    def web_new() -> None:
+        for text in WEB_CORPUS:
+            MinerFactory._parse_web_type(text, resp)
+
+    def socket_old() -> None:
+        for data in SOCKET_CORPUS:
+            if legacy_socket(data) is not None:
+                legacy_socket(data)
+
+    def socket_new() -> None:
+        for data in SOCKET_CORPUS:
+            MinerFactory._parse_socket_type(data)
+
+    for name, func, corpus in [
+        ("web old", web_old, WEB_CORPUS),
+        ("web new", web_new, WEB_CORPUS),
+        ("socket old", socket_old, SOCKET_CORPUS),
+        ("socket new", socket_new, SOCKET_CORPUS),
+    ]:
+        elapsed = timeit.timeit(func, number=number)
+        print(f"{name:<12}{number * len(corpus) / elapsed:>12,.0f} responses/sec")
+
+
+if __name__ == "__main__":
+    main()
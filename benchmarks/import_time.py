@@ -0,0 +1,68 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+"""Benchmark the time taken by `import pyasic`.
+
+Each import runs in a fresh interpreter.  `eager` also imports every miner class
+and the gRPC client, which is what `import pyasic` used to do before the miner
+class registry was made lazy.
+
+Run with `python benchmarks/import_time.py`.
+"""
+
+import statistics
+import subprocess
+import sys
+
+LAZY = "import pyasic"
+EAGER = (
+    "import pyasic\n"
+    "from pyasic.miners.factory import MINER_CLASSES\n"
+    "from pyasic.web.braiins_os.boser import BOSerWebAPI\n"
+    "for classes in MINER_CLASSES.values():\n"
+    "    for model in classes:\n"
+    "        classes[model]\n"
+)
+REPORT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "{code}\n"
+    "print(time.perf_counter() - start, len(sys.modules))\n"
+)
+
+
+def measure(code: str, runs: int) -> tuple[float, int]:
+    times = []
+    modules = 0
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", REPORT.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        modules = int(out[1])
+    return statistics.median(times), modules
+
+
+def main(runs: int = 10) -> None:
+    for name, code in {"lazy": LAZY, "eager": EAGER}.items():
+        elapsed, modules = measure(code, runs)
+        print(f"{name:<8}{elapsed * 1000:>8.0f} ms{modules:>8} modules")
+
+
+if __name__ == "__main__":
+    main()
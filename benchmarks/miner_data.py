@@ -0,0 +1,133 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+"""Benchmark building `MinerData` from gathered data.
+
+Compares the previous construct-then-assign approach with the single validated
+construction used by `get_data()`, and with `get_data(validate=False)`.
+
+Run with `python benchmarks/miner_data.py`.
+"""
+
+import timeit
+from typing import Any
+
+from pyasic.config import MinerConfig
+from pyasic.data import Fan, HashBoard, MinerData
+from pyasic.data.error_codes import WhatsminerError, X19Error
+from pyasic.data.pools import PoolMetrics, PoolUrl
+from pyasic.device.algorithm import SHA256Algo
+from pyasic.miners.antminer.bmminer.X19.S19 import BMMinerS19Pro
+from pyasic.miners.whatsminer.btminer.M3X.M30S import BTMinerM30SV10
+
+
+def _common(boards: int, fans: int) -> dict[str, Any]:
+    return {
+        "mac": "00:11:22:33:44:55",
+        "api_ver": "3.1",
+        "fw_ver": "2023.01.01",
+        "hostname": "miner",
+        "hashrate": SHA256Algo.hashrate(rate=110.0, unit=SHA256Algo.unit.TH),
+        "expected_hashrate": SHA256Algo.hashrate(rate=110.0, unit=SHA256Algo.unit.TH),
+        "hashboards": [
+            HashBoard(
+                slot=i,
+                hashrate=SHA256Algo.hashrate(rate=36.6, unit=SHA256Algo.unit.TH),
+                temp=55,
+                chip_temp=75,
+                chips=114,
+                expected_chips=114,
+                serial_number=f"SN{i}",
+                missing=False,
+            )
+            for i in range(boards)
+        ],
+        "wattage": 3250,
+        "wattage_limit": 3300,
+        "fans": [Fan(speed=5000) for _ in range(fans)],
+        "config": MinerConfig(),
+        "fault_light": False,
+        "is_mining": True,
+        "uptime": 86400,
+        "pools": [
+            PoolMetrics(
+                url=PoolUrl.from_str("stratum+tcp://pool.example.com:3333"),
+                user="user.worker",
+                accepted=1000,
+                rejected=2,
+                active=i == 0,
+                alive=True,
+                index=i,
+            )
+            for i in range(3)
+        ],
+    }
+
+
+def s19_data() -> dict[str, Any]:
+    data = _common(boards=3, fans=4)
+    data["errors"] = [X19Error(error_message="Fan lost")]
+    return data
+
+
+def whatsminer_data() -> dict[str, Any]:
+    data = _common(boards=3, fans=2)
+    data["fan_psu"] = 4000
+    data["env_temp"] = 25.0
+    data["errors"] = [WhatsminerError(error_code=110)]
+    return data
+
+
+def assign(miner: Any, gathered: dict[str, Any]) -> MinerData:
+    # the previous `get_data()` approach, construct then assign each item
+    data = MinerData(
+        ip=str(miner.ip),
+        device_info=miner.device_info,
+        expected_chips=miner.expected_chips * miner.expected_hashboards,
+        expected_hashboards=miner.expected_hashboards,
+        expected_fans=miner.expected_fans,
+        hashboards=[
+            HashBoard(slot=i, expected_chips=miner.expected_chips)
+            for i in range(miner.expected_hashboards)
+        ],
+    )
+    for item, value in gathered.items():
+        if value is not None:
+            setattr(data, item, value)
+    return data
+
+
+def main(number: int = 20000) -> None:
+    shapes = {
+        "S19": (BMMinerS19Pro("127.0.0.1"), s19_data()),
+        "Whatsminer": (BTMinerM30SV10("127.0.0.1"), whatsminer_data()),
+    }
+    for name, (miner, gathered) in shapes.items():
+        results = {
+            "assign": timeit.timeit(lambda: assign(miner, gathered), number=number),
+            "validate": timeit.timeit(
+                lambda: miner._build_miner_data(gathered), number=number
+            ),
+            "no validate": timeit.timeit(
+                lambda: miner._build_miner_data(gathered, validate=False),
+                number=number,
+            ),
+        }
+        for method, elapsed in results.items():
+            print(f"{name:<12}{method:<14}{number / elapsed:>12,.0f} objects/sec")
+
+
+if __name__ == "__main__":
+    main()
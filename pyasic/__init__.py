@@ -26,3 +26,12 @@ from pyasic.ssh import *
 from pyasic.web import *
 
 __version__ = importlib.metadata.version("pyasic")
+
+
+def __getattr__(name: str) -> type:
+    # imported on first use, see `pyasic.web.braiins_os`
+    if name == "BOSerWebAPI":
+        from pyasic.web.braiins_os.boser import BOSerWebAPI
+
+        return BOSerWebAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
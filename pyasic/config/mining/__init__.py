@@ -20,20 +20,6 @@ from typing import Any, TypeVar
 
 from pyasic import settings
 from pyasic.config.base import MinerConfigOption, MinerConfigValue
-from pyasic.web.braiins_os.proto.braiins.bos.v1 import (
-    DpsHashrateTarget,
-    DpsPowerTarget,
-    DpsTarget,
-    HashrateTargetMode,
-    PerformanceMode,
-    Power,
-    PowerTargetMode,
-    SaveAction,
-    SetDpsRequest,
-    SetPerformanceModeRequest,
-    TeraHashrate,
-    TunerPerformanceMode,
-)
 
 from .algo import (
     BoardTuneAlgo,
@@ -268,6 +254,18 @@ class MiningModePowerTune(MinerConfigValue):
         return cfg
 
     def as_boser(self) -> dict:
+        from pyasic.web.braiins_os.proto.braiins.bos.v1 import (
+            DpsPowerTarget,
+            DpsTarget,
+            PerformanceMode,
+            Power,
+            PowerTargetMode,
+            SaveAction,
+            SetDpsRequest,
+            SetPerformanceModeRequest,
+            TunerPerformanceMode,
+        )
+
         cfg: dict[str, Any] = {
             "set_performance_mode": SetPerformanceModeRequest(
                 save_action=SaveAction(SaveAction.SAVE_AND_APPLY),
@@ -367,6 +365,18 @@ class MiningModeHashrateTune(MinerConfigValue):
         return {"autotuning": conf}
 
     def as_boser(self) -> dict:
+        from pyasic.web.braiins_os.proto.braiins.bos.v1 import (
+            DpsHashrateTarget,
+            DpsTarget,
+            HashrateTargetMode,
+            PerformanceMode,
+            SaveAction,
+            SetDpsRequest,
+            SetPerformanceModeRequest,
+            TeraHashrate,
+            TunerPerformanceMode,
+        )
+
         cfg: dict[str, Any] = {
             "set_performance_mode": SetPerformanceModeRequest(
                 save_action=SaveAction(SaveAction.SAVE_AND_APPLY),
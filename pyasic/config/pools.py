@@ -17,18 +17,17 @@ from __future__ import annotations
 
 import random
 import string
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import Field
 
 from pyasic.config.base import MinerConfigValue
-from pyasic.web.braiins_os.proto.braiins.bos.v1 import (
-    PoolConfiguration,
-    PoolGroupConfiguration,
-    Quota,
-    SaveAction,
-    SetPoolGroupsRequest,
-)
+
+if TYPE_CHECKING:
+    from pyasic.web.braiins_os.proto.braiins.bos.v1 import (
+        PoolConfiguration,
+        PoolGroupConfiguration,
+    )
 
 
 class Pool(MinerConfigValue):
@@ -137,6 +136,8 @@ class Pool(MinerConfigValue):
         }
 
     def as_boser(self, user_suffix: str | None = None) -> PoolConfiguration:
+        from pyasic.web.braiins_os.proto.braiins.bos.v1 import PoolConfiguration
+
         return PoolConfiguration(
             url=self.url,
             user=f"{self.user}{user_suffix or ''}",
@@ -380,6 +381,11 @@ class PoolGroup(MinerConfigValue):
         return self.pools[0].as_espminer(user_suffix=user_suffix)
 
     def as_boser(self, user_suffix: str | None = None) -> PoolGroupConfiguration:
+        from pyasic.web.braiins_os.proto.braiins.bos.v1 import (
+            PoolGroupConfiguration,
+            Quota,
+        )
+
         return PoolGroupConfiguration(
             name=self.name or "",
             quota=Quota(value=self.quota),
@@ -582,6 +588,11 @@ class PoolConfig(MinerConfigValue):
         return {"group": [PoolGroup().as_bosminer()]}
 
     def as_boser(self, user_suffix: str | None = None) -> dict:
+        from pyasic.web.braiins_os.proto.braiins.bos.v1 import (
+            SaveAction,
+            SetPoolGroupsRequest,
+        )
+
         return {
             "set_pool_groups": SetPoolGroupsRequest(
                 save_action=SaveAction(SaveAction.SAVE_AND_APPLY),
@@ -38,6 +38,8 @@ from .error_codes import (
 )
 from .error_codes.base import BaseMinerError
 from .fans import Fan
+from .influxdb import encode_influxdb
+from .snapshot import FleetSnapshot
 
 
 class MinerData(BaseModel):
@@ -0,0 +1,265 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from pyasic.device.algorithm.hashrate import AlgoHashRateType
+
+from .boards import HashBoard
+from .error_codes.base import BaseMinerError
+from .fans import Fan
+from .pools import PoolMetrics, PoolUrl
+
+if TYPE_CHECKING:
+    from pyasic.data import MinerData
+
+# these mirror the fields written by the `as_influxdb` methods of each model
+MINER_FIELDS = (
+    "uptime",
+    "expected_hashrate",
+    "hashrate",
+    "hashboards",
+    "temperature_avg",
+    "env_temp",
+    "wattage",
+    "wattage_limit",
+    "voltage",
+    "fans",
+    "expected_fans",
+    "fan_psu",
+    "total_chips",
+    "expected_chips",
+    "efficiency",
+    "fault_light",
+    "is_mining",
+    "errors",
+    "pools",
+)
+HASHBOARD_FIELDS = (
+    "hashrate",
+    "temp",
+    "chip_temp",
+    "chips",
+    "expected_chips",
+    "tuned",
+    "active",
+    "voltage",
+)
+POOL_FIELDS = ("url", "accepted", "rejected", "active", "alive", "user")
+
+
+def _int(key: str, value: int | float) -> str:
+    return f"{key}={value}"
+
+
+def _bool(key: str, value: bool) -> str:
+    return f"{key}=true" if value else f"{key}=false"
+
+
+def _str(key: str, value: str) -> str:
+    return f'{key}="{value}"'
+
+
+_SCALARS: dict[type, Callable[[str, Any], str]] = {
+    int: _int,
+    float: _int,
+    bool: _bool,
+    str: _str,
+}
+
+
+@lru_cache(maxsize=4096)
+def _field_keys(key: str, delim: str, fields: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(f"{key}{delim}{field}" for field in fields)
+
+
+def _hashboard(key: str, value: HashBoard, delim: str) -> str:
+    field_data = []
+    values = value.__dict__
+    for field, field_key in zip(
+        HASHBOARD_FIELDS, _field_keys(key, delim, HASHBOARD_FIELDS)
+    ):
+        field_val = values[field]
+        if field_val is None:
+            continue
+        encoder = _SCALARS.get(type(field_val))
+        if encoder is not None:
+            field_data.append(encoder(field_key, field_val))
+        elif isinstance(field_val, AlgoHashRateType):
+            field_data.append(f"{field_key}={round(float(field_val), 2)}")
+    return ",".join(field_data)
+
+
+def _pool(key: str, value: PoolMetrics, delim: str) -> str:
+    field_data = []
+    for field, field_key in zip(POOL_FIELDS, _field_keys(key, delim, POOL_FIELDS)):
+        field_val = getattr(value, field)
+        if field_val is None:
+            continue
+        if type(field_val) is PoolUrl:
+            field_data.append(f'{field_key}="{field_val}"')
+            continue
+        encoder = _SCALARS.get(type(field_val))
+        if encoder is not None:
+            field_data.append(encoder(field_key, field_val))
+    return ",".join(field_data)
+
+
+def _fan(key: str, value: Fan, delim: str) -> str:
+    return f"{key}{delim}speed={value.speed}"
+
+
+def _list(key: str, value: list, delim: str) -> str | None:
+    if len(value) == 0:
+        return None
+    list_field_data = []
+    for idx, item in enumerate(value):
+        serialized = _value(f"{key}{delim}{idx}", item, delim)
+        if serialized is not None:
+            list_field_data.append(serialized)
+    return ",".join(list_field_data)
+
+
+_MODELS: dict[type, Callable[[str, Any, str], str | None]] = {
+    list: _list,
+    HashBoard: _hashboard,
+    PoolMetrics: _pool,
+    Fan: _fan,
+}
+
+
+def _value(key: str, value: Any, delim: str) -> str | None:
+    t = type(value)
+    scalar = _SCALARS.get(t)
+    if scalar is not None:
+        return scalar(key, value)
+    model = _MODELS.get(t)
+    if model is not None:
+        return model(key, value, delim)
+    if isinstance(value, AlgoHashRateType):
+        return f"{key}={round(float(value), 2)}"
+    if isinstance(value, BaseMinerError):
+        return value.as_influxdb(key, level_delimiter=delim)
+    return None
+
+
+def _hashrate(data: MinerData) -> float | None:
+    # same as MinerData.hashrate, without building a hashrate model for each board
+    algo = data.device_info.algo if data.device_info is not None else None
+    if algo is None:
+        hashrate = data.hashrate
+        return float(hashrate) if hashrate is not None else None
+    unit = algo.unit.default  # type: ignore[attr-defined]
+    total = 0.0
+    found = False
+    for board in data.hashboards:
+        board_hashrate = board.hashrate
+        if board_hashrate is None:
+            continue
+        if board_hashrate.unit != unit:
+            board_hashrate = board_hashrate.into(unit)
+        total += float(board_hashrate)
+        found = True
+    if found:
+        return total
+    if data.raw_hashrate is not None:
+        return float(data.raw_hashrate)
+    return None
+
+
+def _miner_fields(data: MinerData, delim: str) -> list[str]:
+    field_data = []
+    hashrate = _hashrate(data)
+    for field in MINER_FIELDS:
+        serialized: str | None
+        if field == "hashrate":
+            serialized = None if hashrate is None else f"hashrate={round(hashrate, 2)}"
+        elif field == "efficiency":
+            # same as MinerData.efficiency, using the hashrate from above
+            wattage = data.wattage
+            if hashrate is None or wattage is None:
+                serialized = None
+            elif hashrate == 0:
+                serialized = "efficiency=0"
+            else:
+                serialized = f"efficiency={int(round(wattage / hashrate, 0))}"
+        else:
+            serialized = _value(field, getattr(data, field), delim)
+        if serialized is not None:
+            field_data.append(serialized)
+    return field_data
+
+
+def encode_influxdb_line(
+    data: MinerData, measurement_name: str = "miner_data", level_delimiter: str = "."
+) -> str:
+    """Encode a single `MinerData` as an influxdb line protocol line.
+
+    The line matches [`MinerData.as_influxdb()`][pyasic.data.MinerData.as_influxdb].
+
+    Parameters:
+        data: The data to encode.
+        measurement_name: The name of the measurement to insert into in influxdb.
+        level_delimiter: The delimiter between levels of nested field names.
+
+    Returns:
+        The line, without a trailing newline.
+    """
+    tags_str = (
+        f"{measurement_name},ip={data.ip},mac={data.mac},make={data.make},"
+        f"model={data.model},firmware={data.firmware},algo={data.algo}"
+    ).replace(" ", "\\ ")
+
+    field_str = ",".join(_miner_fields(data, level_delimiter)).replace(" ", "\\ ")
+
+    return f"{tags_str} {field_str} {data.timestamp * 10**9}"
+
+
+def encode_influxdb(
+    data: Iterable[MinerData],
+    measurement_name: str = "miner_data",
+    level_delimiter: str = ".",
+    chunk_size: int = 1 << 20,
+) -> Iterator[bytes]:
+    """Encode many `MinerData` as influxdb line protocol, in chunks ready to write.
+
+    Lines are written into one buffer, which is yielded once it grows past
+    `chunk_size` bytes.  Chunks always end on a line boundary, so each chunk can be
+    used as the body of a separate write request.
+
+    Parameters:
+        data: The data to encode.
+        measurement_name: The name of the measurement to insert into in influxdb.
+        level_delimiter: The delimiter between levels of nested field names.
+        chunk_size: The size in bytes to yield a chunk at.
+
+    Returns:
+        An iterator of newline separated line protocol chunks.
+    """
+    buffer = bytearray()
+    for item in data:
+        buffer += encode_influxdb_line(
+            item, measurement_name=measurement_name, level_delimiter=level_delimiter
+        ).encode("utf-8")
+        buffer += b"\n"
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
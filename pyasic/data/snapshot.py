@@ -0,0 +1,334 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyasic.data import MinerData
+
+_NAN = float("nan")
+
+MINER_COLUMNS = (
+    "timestamp",
+    "hashrate",
+    "expected_hashrate",
+    "wattage",
+    "wattage_limit",
+    "efficiency",
+    "temperature_avg",
+    "env_temp",
+    "total_chips",
+    "expected_chips",
+    "uptime",
+    "fan_psu",
+)
+MINER_FLAGS = ("is_mining", "fault_light")
+MINER_CATEGORIES = ("make", "model", "firmware", "algo")
+MINER_STRINGS = ("ip", "mac", "hostname")
+BOARD_COLUMNS = ("slot", "hashrate", "temp", "chip_temp", "chips", "expected_chips")
+FAN_COLUMNS = ("slot", "speed")
+
+
+def _float(value: Any) -> float:
+    if value is None:
+        return _NAN
+    return float(value)
+
+
+def _flag(value: bool | None) -> int:
+    if value is None:
+        return -1
+    return int(value)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    # linear interpolation between closest ranks, values must be sorted
+    if not values:
+        return _NAN
+    pos = (len(values) - 1) * q / 100
+    lower = math.floor(pos)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (pos - lower)
+
+
+class Categorical(Sequence[str]):
+    """A dictionary encoded string column.
+
+    Each distinct value is stored once in `categories`, and each row stores the index
+    of its value in `codes`.
+    """
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.categories: list[str] = []
+        self._lookup: dict[str, int] = {}
+
+    def append(self, value: str | None) -> None:
+        value = value or ""
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            self._lookup[value] = code
+        self.codes.append(code)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self.categories[c] for c in self.codes[idx]]
+        return self.categories[self.codes[idx]]
+
+    def __iter__(self) -> Iterator[str]:
+        categories = self.categories
+        return (categories[c] for c in self.codes)
+
+
+class Table:
+    """A table of typed columns, used for each part of a [`FleetSnapshot`][pyasic.data.FleetSnapshot].
+
+    Numeric columns are `array("d")`, with missing values stored as `nan`, flag columns
+    are `array("b")` with `-1` for unknown, and string columns used for grouping are
+    [`Categorical`][pyasic.data.snapshot.Categorical].  Child tables, such as boards and
+    fans, have a `miner` column holding the row of their miner in the parent table, and
+    can be grouped by any categorical column of the parent.
+    """
+
+    def __init__(self, columns: dict[str, Any], parent: Table | None = None) -> None:
+        self.columns = columns
+        self._parent = parent
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, column: str) -> Any:
+        return self.columns[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    def _categorical(self, by: str) -> Categorical:
+        col = self.columns.get(by)
+        if isinstance(col, Categorical):
+            return col
+        raise KeyError(f"{by} is not a categorical column.")
+
+    def _groups(self, by: str) -> tuple[Iterable[int], list[str]]:
+        if by in self.columns:
+            col = self._categorical(by)
+            return col.codes, col.categories
+        if self._parent is None:
+            raise KeyError(f"{by} is not a categorical column.")
+        parent_col = self._parent._categorical(by)
+        parent_codes = parent_col.codes
+        return (parent_codes[i] for i in self.columns["miner"]), parent_col.categories
+
+    def _values(self, column: str) -> list[float]:
+        return [v for v in self.columns[column] if v == v]
+
+    def _grouped_values(self, column: str, by: str) -> dict[str, list[float]]:
+        codes, categories = self._groups(by)
+        grouped: list[list[float]] = [[] for _ in categories]
+        for code, value in zip(codes, self.columns[column]):
+            # skip nan
+            if value == value:
+                grouped[code].append(value)
+        return {categories[i]: v for i, v in enumerate(grouped)}
+
+    def count(self, by: str | None = None) -> int | dict[str, int]:
+        """Count rows, optionally grouped by a categorical column."""
+        if by is None:
+            return len(self)
+        codes, categories = self._groups(by)
+        counts = [0] * len(categories)
+        for code in codes:
+            counts[code] += 1
+        return dict(zip(categories, counts))
+
+    def sum(self, column: str, by: str | None = None) -> float | dict[str, float]:
+        """Sum a column, skipping missing values, optionally grouped by a categorical column."""
+        if by is None:
+            return math.fsum(self._values(column))
+        return {k: math.fsum(v) for k, v in self._grouped_values(column, by).items()}
+
+    def mean(self, column: str, by: str | None = None) -> float | dict[str, float]:
+        """Average a column, skipping missing values, optionally grouped by a categorical column."""
+
+        def _mean(values: list[float]) -> float:
+            return math.fsum(values) / len(values) if values else _NAN
+
+        if by is None:
+            return _mean(self._values(column))
+        return {k: _mean(v) for k, v in self._grouped_values(column, by).items()}
+
+    def percentiles(
+        self, column: str, q: Sequence[float], by: str | None = None
+    ) -> dict[float, float] | dict[str, dict[float, float]]:
+        """Get percentiles of a column, skipping missing values.
+
+        Parameters:
+            column: The column to get percentiles of.
+            q: The percentiles to get, from 0 to 100.
+            by: An optional categorical column to group by.
+
+        Returns:
+            A dict of percentile to value, or a dict of group to percentiles if `by` is passed.
+        """
+
+        def _percentiles(values: list[float]) -> dict[float, float]:
+            values.sort()
+            return {p: _percentile(values, p) for p in q}
+
+        if by is None:
+            return _percentiles(self._values(column))
+        return {k: _percentiles(v) for k, v in self._grouped_values(column, by).items()}
+
+
+class FleetSnapshot:
+    """A columnar snapshot of data from a fleet of miners.
+
+    Instead of holding a [`MinerData`][pyasic.data.MinerData] per miner, values are
+    stored in typed columns, one row per miner in `miners`, one row per hashboard in
+    `boards`, and one row per fan in `fans`.  Board and fan rows hold the row of their
+    miner in the `miner` column.  Hashrates are stored as floats in the default unit of
+    each miner's algorithm.
+
+    The columns support the buffer protocol, so they can be wrapped without a copy by
+    array libraries, e.g. `numpy.frombuffer(snapshot.miners["hashrate"])`.
+
+    Parameters:
+        data: `MinerData` to add to the snapshot.
+    """
+
+    def __init__(self, data: Iterable[MinerData] = ()) -> None:
+        miner_columns: dict[str, Any] = {name: [] for name in MINER_STRINGS}
+        miner_columns.update({name: Categorical() for name in MINER_CATEGORIES})
+        miner_columns.update({name: array("d") for name in MINER_COLUMNS})
+        miner_columns.update({name: array("b") for name in MINER_FLAGS})
+        self.miners = Table(miner_columns)
+
+        board_columns: dict[str, Any] = {"miner": array("I")}
+        board_columns.update({name: array("d") for name in BOARD_COLUMNS})
+        board_columns["missing"] = array("b")
+        self.boards = Table(board_columns, parent=self.miners)
+
+        fan_columns: dict[str, Any] = {"miner": array("I")}
+        fan_columns.update({name: array("d") for name in FAN_COLUMNS})
+        self.fans = Table(fan_columns, parent=self.miners)
+
+        self.extend(data)
+
+    @classmethod
+    def from_miner_data(cls, data: Iterable[MinerData]) -> FleetSnapshot:
+        return cls(data)
+
+    def __len__(self) -> int:
+        return len(self.miners)
+
+    def extend(self, data: Iterable[MinerData]) -> None:
+        """Add data from many miners to the snapshot."""
+        for item in data:
+            self.append(item)
+
+    def append(self, data: MinerData) -> None:
+        """Add data from a miner to the snapshot."""
+        m = self.miners.columns
+        b = self.boards.columns
+        f = self.fans.columns
+        row = len(m["ip"])
+
+        algo = data.device_info.algo if data.device_info is not None else None
+        unit = algo.unit.default if algo is not None else None  # type: ignore[attr-defined]
+        board_hashrate = 0.0
+        board_hashrate_count = 0
+        temp_total = 0.0
+        temp_count = 0
+        chips: int | None = None
+        for board in data.hashboards:
+            hr = board.hashrate
+            if hr is not None and unit is not None and hr.unit != unit:
+                hr = hr.into(unit)
+            b["miner"].append(row)
+            b["slot"].append(board.slot)
+            b["hashrate"].append(_float(hr))
+            if hr is not None:
+                board_hashrate += float(hr)
+                board_hashrate_count += 1
+            b["temp"].append(_float(board.temp))
+            b["chip_temp"].append(_float(board.chip_temp))
+            b["chips"].append(_float(board.chips))
+            b["expected_chips"].append(_float(board.expected_chips))
+            b["missing"].append(_flag(board.missing))
+            if board.temp is not None:
+                temp_total += board.temp
+                temp_count += 1
+            if board.chips is not None:
+                chips = (chips or 0) + board.chips
+        for slot, fan in enumerate(data.fans):
+            f["miner"].append(row)
+            f["slot"].append(slot)
+            f["speed"].append(_float(fan.speed))
+
+        if board_hashrate_count and unit is not None:
+            # same as MinerData.hashrate, without building hashrate models
+            hashrate = board_hashrate
+        else:
+            hashrate = _float(data.hashrate)
+        wattage = _float(data.wattage)
+        m["ip"].append(data.ip)
+        m["mac"].append(data.mac)
+        m["hostname"].append(data.hostname)
+        m["make"].append(data.make)
+        m["model"].append(data.model)
+        m["firmware"].append(data.firmware)
+        m["algo"].append(data.algo)
+        m["timestamp"].append(data.raw_datetime.timestamp())
+        m["hashrate"].append(hashrate)
+        m["expected_hashrate"].append(_float(data.expected_hashrate))
+        m["wattage"].append(wattage)
+        m["wattage_limit"].append(_float(data.wattage_limit))
+        m["efficiency"].append(wattage / hashrate if hashrate > 0 else _NAN)
+        m["temperature_avg"].append(temp_total / temp_count if temp_count else _NAN)
+        m["env_temp"].append(_float(data.env_temp))
+        m["total_chips"].append(_float(chips) if data.hashboards else 0.0)
+        m["expected_chips"].append(_float(data.expected_chips))
+        m["uptime"].append(_float(data.uptime))
+        m["fan_psu"].append(_float(data.fan_psu))
+        m["is_mining"].append(_flag(data.is_mining))
+        m["fault_light"].append(_flag(data.fault_light))
+
+    def total_hashrate(self, by: str | None = None) -> float | dict[str, float]:
+        """Get the total hashrate of the fleet, optionally grouped by a categorical column such as `model`."""
+        return self.miners.sum("hashrate", by=by)
+
+    def total_wattage(self, by: str | None = None) -> float | dict[str, float]:
+        """Get the total wattage of the fleet, optionally grouped by a categorical column such as `model`."""
+        return self.miners.sum("wattage", by=by)
+
+    def efficiency_percentiles(
+        self, q: Sequence[float] = (50, 90, 99), by: str | None = None
+    ) -> dict[float, float] | dict[str, dict[float, float]]:
+        """Get percentiles of miner efficiency, optionally grouped by a categorical column.
+
+        Efficiency is in J per default hashrate unit of each miner's algorithm, such as
+        J/TH for SHA256, so group by `algo` when the fleet mixes algorithms.
+        """
+        return self.miners.percentiles("efficiency", q, by=by)
@@ -31,6 +31,14 @@ class APIError(Exception):
             return "Incorrect API parameters."
 
 
+class GovernorRejectedError(APIError):
+    def __str__(self):
+        if self.message:
+            return f"{self.message}"
+        else:
+            return "Request rejected by the governor."
+
+
 class PhaseBalancingError(Exception):
     def __init__(self, *args):
         if args:
@@ -45,6 +53,20 @@ class PhaseBalancingError(Exception):
             return "Failed to balance phase."
 
 
+class ParsePhaseIOError(AssertionError):
+    def __init__(self, *args):
+        if args:
+            self.message = args[0]
+        else:
+            self.message = None
+
+    def __str__(self):
+        if self.message:
+            return f"{self.message}"
+        else:
+            return "I/O was performed while parsing data."
+
+
 class APIWarning(Warning):
     def __init__(self, *args):
         if args:
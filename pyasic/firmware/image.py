@@ -0,0 +1,181 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import hashlib
+import io
+import mmap
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+from pathlib import Path
+
+CHUNK_SIZE = 64 * 1024
+
+# set per upload by `Rollout`, called with the number of bytes sent
+upload_progress: ContextVar[Callable[[int], None] | None] = ContextVar(
+    "upload_progress", default=None
+)
+
+
+def _report(sent: int) -> None:
+    callback = upload_progress.get()
+    if callback is not None:
+        callback(sent)
+
+
+class FirmwareImage:
+    """A firmware file, memory mapped once and shared between uploads.
+
+    The file is mapped read-only, so every upload streams from the same pages instead
+    of reading its own copy of the file, and the checksum is only computed once.
+
+    Parameters:
+        path: The firmware file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self.size = self.path.stat().st_size
+        self._mmap: mmap.mmap | None = None
+        if self.size:
+            # an empty file can't be mapped
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+        else:
+            self._view = memoryview(b"")
+
+    def __repr__(self) -> str:
+        return f"FirmwareImage({str(self.path)!r})"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> FirmwareImage:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    @property
+    def view(self) -> memoryview:
+        """A read-only view of the whole image."""
+        return self._view
+
+    @cached_property
+    def sha256(self) -> str:
+        """The SHA256 checksum of the image, as a hex string."""
+        return hashlib.sha256(self._view).hexdigest()
+
+    def chunks(self, size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+        """Iterate over the image in views of at most `size` bytes.
+
+        Each chunk is reported to the progress callback of the current upload as it is
+        yielded.
+
+        Parameters:
+            size: The maximum size of each chunk.
+        """
+        for offset in range(0, self.size, size):
+            chunk = self._view[offset : offset + size]
+            yield chunk
+            _report(offset + len(chunk))
+
+    def reader(self) -> FirmwareReader:
+        """Get a new file-like reader over the image, e.g. to upload with `httpx`."""
+        return FirmwareReader(self)
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if self.closed:
+            return
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+
+class FirmwareReader(io.RawIOBase):
+    """A seekable, read-only file over a [`FirmwareImage`][pyasic.firmware.FirmwareImage].
+
+    Reads are copied from the shared mapping a chunk at a time, and reported to the
+    progress callback of the current upload.
+    """
+
+    def __init__(self, image: FirmwareImage) -> None:
+        self.image = image
+        self.name = image.name
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.image.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        start = min(self._pos, self.image.size)
+        end = min(start + len(buffer), self.image.size)
+        n = end - start
+        memoryview(buffer)[:n] = self.image.view[start:end]
+        self._pos = end
+        if n:
+            _report(end)
+        return n
+
+
+@contextmanager
+def open_image(file: str | Path | FirmwareImage) -> Iterator[FirmwareImage]:
+    """Use an existing image, or map a file for the length of the block.
+
+    Parameters:
+        file: An image, which is left open, or the path of a file to map.
+    """
+    if isinstance(file, FirmwareImage):
+        yield file
+        return
+    image = FirmwareImage(file)
+    try:
+        yield image
+    finally:
+        image.close()
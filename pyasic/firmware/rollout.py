@@ -0,0 +1,262 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .image import FirmwareImage, upload_progress
+
+if TYPE_CHECKING:
+    from pyasic.miners.base import AnyMiner
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class HostProgress:
+    """The progress of a firmware upgrade on a single miner.
+
+    Attributes:
+        ip: The IP address of the miner.
+        status: One of `pending`, `running`, `done`, or `failed`.
+        sent: The number of bytes of the image sent so far, if the backend streams the image.
+        total: The size of the image in bytes.
+        error: Why the last attempt failed, if it did.
+        attempts: How many times the upgrade has been started.
+        started: The unix time the last attempt was started at.
+        finished: The unix time the last attempt finished at.
+    """
+
+    ip: str
+    status: str = PENDING
+    sent: int = 0
+    total: int = 0
+    error: str | None = None
+    attempts: int = 0
+    started: float | None = None
+    finished: float | None = None
+
+
+class RolloutState:
+    """The state of a [`Rollout`][pyasic.firmware.Rollout], which can be saved to resume it later.
+
+    Parameters:
+        sha256: The checksum of the image being rolled out.
+        path: An optional JSON file to save the state to after each miner finishes.
+    """
+
+    def __init__(self, sha256: str, path: str | Path | None = None) -> None:
+        self.sha256 = sha256
+        self.path = Path(path) if path is not None else None
+        self.hosts: dict[str, HostProgress] = {}
+
+    def __getitem__(self, ip: str) -> HostProgress:
+        return self.hosts[ip]
+
+    def __len__(self) -> int:
+        return len(self.hosts)
+
+    def _with_status(self, status: str) -> list[str]:
+        return [ip for ip, host in self.hosts.items() if host.status == status]
+
+    @property
+    def done(self) -> list[str]:
+        return self._with_status(DONE)
+
+    @property
+    def failed(self) -> list[str]:
+        return self._with_status(FAILED)
+
+    @property
+    def pending(self) -> list[str]:
+        return self._with_status(PENDING) + self._with_status(RUNNING)
+
+    @classmethod
+    def load(cls, path: str | Path) -> RolloutState:
+        """Load a saved state.
+
+        Miners which were still running when the state was saved are reset to pending.
+
+        Parameters:
+            path: The file to load from.
+        """
+        with open(path) as f:
+            raw = json.load(f)
+        state = cls(raw["sha256"], path=path)
+        for item in raw["hosts"]:
+            host = HostProgress(**item)
+            if host.status == RUNNING:
+                host.status = PENDING
+            state.hosts[host.ip] = host
+        return state
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Save the state to a JSON file.
+
+        The file is replaced atomically, so an interrupted save leaves the previous state.
+
+        Parameters:
+            path: The file to save to. Defaults to the path the state was created with.
+        """
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("No path to save the rollout state to.")
+        tmp = path.with_name(f"{path.name}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "sha256": self.sha256,
+                    "hosts": [asdict(h) for h in self.hosts.values()],
+                },
+                f,
+            )
+        os.replace(tmp, path)
+
+
+class Rollout:
+    """Upgrade the firmware of a fleet of miners from one shared image.
+
+    The image is mapped and checksummed once, and every miner is upgraded with
+    `upgrade_firmware(file=image)`, so backends which support
+    [`FirmwareImage`][pyasic.firmware.FirmwareImage] stream their upload from the
+    shared mapping.  At most `concurrency` miners are upgraded at once.
+
+    If a `state` file is passed, progress is saved to it after each miner finishes,
+    and miners already upgraded with the same image are skipped when the rollout is
+    run again, so an interrupted rollout can be resumed.
+
+    Parameters:
+        miners: The miners to upgrade.
+        image: The firmware image, or the path of the firmware file.
+        concurrency: The maximum number of upgrades in flight at once.
+        keep_settings: Passed to `upgrade_firmware()`.
+        timeout: The timeout for a single upgrade, in seconds, or `None` for no timeout.
+        state: An optional JSON file to save progress to and resume from.
+        on_progress: Called with the [`HostProgress`][pyasic.firmware.HostProgress] of a miner each time it changes.
+    """
+
+    def __init__(
+        self,
+        miners: Iterable[AnyMiner],
+        image: FirmwareImage | str | Path,
+        concurrency: int = 8,
+        keep_settings: bool = True,
+        timeout: float | None = None,
+        state: str | Path | None = None,
+        on_progress: Callable[[HostProgress], None] | None = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("Rollout concurrency must be at least 1.")
+        self.miners = list(miners)
+        self._owns_image = not isinstance(image, FirmwareImage)
+        self.image = image if isinstance(image, FirmwareImage) else FirmwareImage(image)
+        self.concurrency = concurrency
+        self.keep_settings = keep_settings
+        self.timeout = timeout
+        self.on_progress = on_progress
+
+        if state is not None and Path(state).exists():
+            self.state = RolloutState.load(state)
+            if self.state.sha256 != self.image.sha256:
+                if self._owns_image:
+                    self.image.close()
+                raise ValueError(
+                    f"Rollout state in {state} is for a different firmware image."
+                )
+        else:
+            self.state = RolloutState(self.image.sha256, path=state)
+        for miner in self.miners:
+            host = self.state.hosts.setdefault(
+                str(miner.ip), HostProgress(str(miner.ip))
+            )
+            host.total = self.image.size
+
+    def __len__(self) -> int:
+        return len(self.miners)
+
+    async def run(self) -> RolloutState:
+        """Upgrade every miner which hasn't been upgraded yet.
+
+        Returns:
+            The state of the rollout once every miner has finished.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            await asyncio.gather(
+                *(
+                    self._upgrade(miner, semaphore)
+                    for miner in self.miners
+                    if self.state[str(miner.ip)].status != DONE
+                )
+            )
+        finally:
+            if self._owns_image:
+                self.image.close()
+        return self.state
+
+    def _notify(self, host: HostProgress) -> None:
+        if self.on_progress is not None:
+            self.on_progress(host)
+
+    def _sent(self, host: HostProgress, sent: int) -> None:
+        host.sent = sent
+        self._notify(host)
+
+    async def _upgrade(self, miner: AnyMiner, semaphore: asyncio.Semaphore) -> None:
+        host = self.state[str(miner.ip)]
+        async with semaphore:
+            host.status = RUNNING
+            host.attempts += 1
+            host.sent = 0
+            host.error = None
+            host.started = time.time()
+            host.finished = None
+            self._notify(host)
+
+            # each upgrade runs in its own task, so this only sees its own uploads
+            upload_progress.set(lambda sent: self._sent(host, sent))
+            try:
+                ok = await asyncio.wait_for(
+                    miner.upgrade_firmware(
+                        file=self.image,
+                        keep_settings=self.keep_settings,
+                    ),
+                    timeout=self.timeout,
+                )
+                if not ok:
+                    host.error = "Upgrade failed."
+            except asyncio.TimeoutError:
+                host.error = "Upgrade timed out."
+            except Exception as e:
+                logging.debug(f"{miner} - Firmware upgrade failed: {e!r}")
+                host.error = str(e) or type(e).__name__
+
+            host.status = FAILED if host.error is not None else DONE
+            host.finished = time.time()
+            if self.state.path is not None:
+                self.state.save()
+            self._notify(host)
@@ -0,0 +1,447 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from pyasic.data import MinerData
+from pyasic.miners.base import BaseMiner
+
+SLEEP = "sleep"
+THROTTLE = "throttle"
+RESUME = "resume"
+RESTORE = "restore"
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+# the call was cancelled, so the miner may or may not have applied it
+TIMED_OUT = "timed_out"
+
+
+@dataclass
+class CurtailAction:
+    """A change to the power of a single miner.
+
+    Attributes:
+        miner: The miner to change.
+        action: One of `sleep`, `throttle`, `resume`, or `restore`.
+        wattage: The last known wattage of the miner before it was curtailed.
+        shed: The watts this action is expected to shed, negative when powering up.
+        power_limit: The power limit to set when throttling or restoring.
+        previous_limit: The power limit of the miner before it was throttled, if known.
+        wave: The wave this action was planned in, starting at 0.
+        status: One of `pending`, `running`, `done`, `failed`, or `timed_out`.
+        error: Why the action failed, if it did.
+        started: The unix time the action was started at.
+        finished: The unix time the action finished at.
+    """
+
+    miner: BaseMiner
+    action: str
+    wattage: int
+    shed: int
+    power_limit: int | None = None
+    previous_limit: int | None = None
+    wave: int = 0
+    status: str = PENDING
+    error: str | None = None
+    started: float | None = None
+    finished: float | None = None
+
+    @property
+    def ip(self) -> str:
+        return str(self.miner.ip)
+
+
+@dataclass
+class CurtailReport:
+    """The outcome of curtailing or restoring a fleet.
+
+    Attributes:
+        target: The target wattage of the fleet.
+        starting: The last known wattage of the fleet before any action was taken.
+        required: The watts which needed to be shed, or the negative of the watts planned to be restored when powering up.
+        actions: Every action taken, in the order they were planned.
+    """
+
+    target: int
+    starting: int
+    required: int
+    actions: list[CurtailAction] = field(default_factory=list)
+
+    def _with_status(self, status: str) -> list[CurtailAction]:
+        return [a for a in self.actions if a.status == status]
+
+    @property
+    def done(self) -> list[CurtailAction]:
+        return self._with_status(DONE)
+
+    @property
+    def stragglers(self) -> list[CurtailAction]:
+        """Actions which failed, timed out, or missed the deadline."""
+        return self._with_status(FAILED) + self._with_status(TIMED_OUT)
+
+    @property
+    def timed_out(self) -> list[CurtailAction]:
+        """Actions which timed out, and may still have been applied by the miner."""
+        return self._with_status(TIMED_OUT)
+
+    @property
+    def pending(self) -> list[CurtailAction]:
+        return self._with_status(PENDING) + self._with_status(RUNNING)
+
+    @property
+    def achieved(self) -> int:
+        """The watts shed by the actions which succeeded, negative when powering up."""
+        return sum(a.shed for a in self.done)
+
+    @property
+    def wattage(self) -> int:
+        """The expected wattage of the fleet after the actions which succeeded."""
+        return self.starting - self.achieved
+
+    @property
+    def met(self) -> bool:
+        """Whether the actions which succeeded shed, or restored, all the watts required."""
+        return abs(self.achieved) >= abs(self.required)
+
+
+class Curtailer:
+    """Shed power across a fleet of miners to bring it down to a target wattage.
+
+    Miners are planned from their last known [`MinerData`][pyasic.data.MinerData],
+    least efficient first.  Each miner is put to sleep with `stop_mining()`, except the
+    last one needed, which is throttled with `set_power_limit()` instead if it only
+    needs to shed part of its power and can stay above `throttle_floor` of its wattage.
+    Miners without a known wattage are never planned.
+
+    Actions run in waves, at most `concurrency` at once, each bounded by `timeout`.
+    Once a wave finishes, any shortfall left by stragglers is planned from the
+    remaining miners as the next wave, until the target is met, `max_waves` have
+    run, or the `deadline` passes.  An action which times out is marked `timed_out`
+    rather than `failed`, since the miner may still apply it, and is undone by
+    [`restore()`][pyasic.fleet.Curtailer.restore] along with the actions which
+    succeeded.  Progress is reported to `on_progress` as each action changes, and
+    through the live [`report`][pyasic.fleet.Curtailer.report].
+
+    Parameters:
+        miners: The miners in the fleet.
+        data: The last known data of the miners, matched to them by IP.
+        concurrency: The maximum number of actions in flight at once.
+        timeout: The timeout for a single action, in seconds.
+        deadline: The time allowed for all waves, in seconds, or `None` for no deadline.
+        max_waves: The maximum number of waves to run.
+        throttle: Whether to throttle a miner when it only needs to shed part of its power.
+        throttle_floor: The lowest fraction of its wattage a miner can be throttled to.
+        on_progress: Called with the [`CurtailAction`][pyasic.fleet.CurtailAction] of a miner each time it changes.
+    """
+
+    def __init__(
+        self,
+        miners: Iterable[BaseMiner],
+        data: Iterable[MinerData],
+        concurrency: int = 255,
+        timeout: float = 10.0,
+        deadline: float | None = None,
+        max_waves: int = 3,
+        throttle: bool = True,
+        throttle_floor: float = 0.5,
+        on_progress: Callable[[CurtailAction], None] | None = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("Curtail concurrency must be at least 1.")
+        if max_waves < 1:
+            raise ValueError("Curtailing needs at least 1 wave.")
+        self.miners = list(miners)
+        self.data = {str(d.ip): d for d in data}
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.deadline = deadline
+        self.max_waves = max_waves
+        self.throttle = throttle
+        self.throttle_floor = throttle_floor
+        self.on_progress = on_progress
+        self.report: CurtailReport | None = None
+
+    def __len__(self) -> int:
+        return len(self.miners)
+
+    def _wattage(self, miner: BaseMiner) -> int | None:
+        data = self.data.get(str(miner.ip))
+        if data is None or not data.wattage or data.is_mining is False:
+            return None
+        return data.wattage
+
+    def _candidates(self) -> list[tuple[BaseMiner, int]]:
+        # least efficient first, miners with an unknown efficiency last
+        def priority(item: tuple[BaseMiner, int]) -> tuple[bool, float]:
+            efficiency = self.data[str(item[0].ip)].efficiency_fract
+            if efficiency is None:
+                return True, 0.0
+            if efficiency == 0:
+                # drawing power without hashing
+                return False, -math.inf
+            return False, -efficiency
+
+        candidates = [
+            (miner, wattage)
+            for miner in self.miners
+            if (wattage := self._wattage(miner)) is not None
+        ]
+        return sorted(candidates, key=priority)
+
+    def fleet_wattage(self) -> int:
+        """Get the last known total wattage of the fleet."""
+        return sum(w for m in self.miners if (w := self._wattage(m)) is not None)
+
+    def plan(
+        self,
+        shed: int,
+        wave: int = 0,
+        exclude: Iterable[str] = (),
+    ) -> list[CurtailAction]:
+        """Plan which miners to sleep or throttle to shed a number of watts.
+
+        Parameters:
+            shed: The watts to shed.
+            wave: The wave number to give the actions.
+            exclude: IPs of miners to leave out of the plan.
+
+        Returns:
+            The planned actions, in priority order.
+        """
+        excluded = set(exclude)
+        actions = []
+        remaining = shed
+        for miner, wattage in self._candidates():
+            if remaining <= 0:
+                break
+            if str(miner.ip) in excluded:
+                continue
+            limit = wattage - remaining
+            if (
+                self.throttle
+                and remaining < wattage
+                and limit >= wattage * self.throttle_floor
+            ):
+                data = self.data[str(miner.ip)]
+                actions.append(
+                    CurtailAction(
+                        miner=miner,
+                        action=THROTTLE,
+                        wattage=wattage,
+                        shed=remaining,
+                        power_limit=limit,
+                        previous_limit=data.wattage_limit,
+                        wave=wave,
+                    )
+                )
+                remaining = 0
+            else:
+                actions.append(
+                    CurtailAction(
+                        miner=miner,
+                        action=SLEEP,
+                        wattage=wattage,
+                        shed=wattage,
+                        wave=wave,
+                    )
+                )
+                remaining -= wattage
+        return actions
+
+    async def curtail(self, target: int) -> CurtailReport:
+        """Curtail the fleet down to a target wattage.
+
+        Parameters:
+            target: The wattage the fleet should be at or under.
+
+        Returns:
+            A report of the shed achieved and any stragglers.
+        """
+        starting = self.fleet_wattage()
+        self.report = report = CurtailReport(
+            target=target, starting=starting, required=max(starting - target, 0)
+        )
+        deadline = self._deadline()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        for wave in range(self.max_waves):
+            remaining = report.required - report.achieved
+            if remaining <= 0 or self._expired(deadline):
+                break
+            actions = self.plan(
+                remaining, wave=wave, exclude=(a.ip for a in report.actions)
+            )
+            if not actions:
+                break
+            report.actions.extend(actions)
+            await self._run_wave(actions, semaphore, deadline)
+        return report
+
+    async def restore(
+        self, report: CurtailReport, target: int | None = None
+    ) -> CurtailReport:
+        """Power the miners curtailed by a report back up.
+
+        Miners are restored most efficient first.  If a target is passed, miners are
+        only restored while the fleet is expected to stay at or under it.  Miners whose
+        curtail action timed out may or may not have applied it, so they are always
+        restored as a best effort, without counting towards the target.  Throttled
+        miners whose power limit before throttling is unknown can not be restored, so
+        they are reported as failed.  Restoring runs as a single wave, bounded by the
+        same concurrency, timeout, and deadline.
+
+        Parameters:
+            report: The report returned by [`curtail()`][pyasic.fleet.Curtailer.curtail].
+            target: The wattage the fleet may be restored up to, or `None` to restore every miner.
+
+        Returns:
+            A report of the power restored and any stragglers.
+        """
+        starting = report.wattage
+        limit = math.inf if target is None else target
+        restore = CurtailReport(
+            target=target if target is not None else report.starting,
+            starting=starting,
+            required=0,
+        )
+        expected = starting
+        for action in reversed(report.actions):
+            if action.action == THROTTLE and action.previous_limit is None:
+                # setting any other limit would leave the miner capped, not restored
+                if action.status in (DONE, TIMED_OUT):
+                    restore.actions.append(
+                        CurtailAction(
+                            miner=action.miner,
+                            action=RESTORE,
+                            wattage=action.wattage - action.shed,
+                            shed=0,
+                            status=FAILED,
+                            error="The power limit before throttling is unknown.",
+                        )
+                    )
+                continue
+            if action.status == TIMED_OUT:
+                # the fleet wattage already assumes these are running
+                shed = 0
+            elif action.status == DONE:
+                if expected + action.shed > limit:
+                    continue
+                expected += action.shed
+                shed = -action.shed
+            else:
+                continue
+            if action.action == THROTTLE:
+                restore.actions.append(
+                    CurtailAction(
+                        miner=action.miner,
+                        action=RESTORE,
+                        wattage=action.wattage - action.shed,
+                        shed=shed,
+                        power_limit=action.previous_limit,
+                    )
+                )
+            else:
+                restore.actions.append(
+                    CurtailAction(
+                        miner=action.miner,
+                        action=RESUME,
+                        wattage=0,
+                        shed=shed,
+                    )
+                )
+        restore.required = sum(a.shed for a in restore.actions)
+        self.report = restore
+        await self._run_wave(
+            [a for a in restore.actions if a.status == PENDING],
+            asyncio.Semaphore(self.concurrency),
+            self._deadline(),
+        )
+        return restore
+
+    def _deadline(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return asyncio.get_running_loop().time() + self.deadline
+
+    @staticmethod
+    def _expired(deadline: float | None) -> bool:
+        return deadline is not None and asyncio.get_running_loop().time() >= deadline
+
+    def _notify(self, action: CurtailAction) -> None:
+        if self.on_progress is not None:
+            self.on_progress(action)
+
+    async def _run_wave(
+        self,
+        actions: list[CurtailAction],
+        semaphore: asyncio.Semaphore,
+        deadline: float | None,
+    ) -> None:
+        await asyncio.gather(*(self._run(a, semaphore, deadline) for a in actions))
+
+    async def _apply(self, action: CurtailAction) -> bool:
+        if action.action == SLEEP:
+            return await action.miner.stop_mining()
+        if action.action == RESUME:
+            return await action.miner.resume_mining()
+        # throttle and restore both set a power limit
+        if action.power_limit is None:
+            return False
+        return await action.miner.set_power_limit(action.power_limit)
+
+    async def _run(
+        self,
+        action: CurtailAction,
+        semaphore: asyncio.Semaphore,
+        deadline: float | None,
+    ) -> None:
+        async with semaphore:
+            timeout = self.timeout
+            if deadline is not None:
+                timeout = min(timeout, deadline - asyncio.get_running_loop().time())
+            if timeout <= 0:
+                action.status = FAILED
+                action.error = "Deadline passed."
+                action.finished = time.time()
+                self._notify(action)
+                return
+
+            action.status = RUNNING
+            action.started = time.time()
+            self._notify(action)
+            try:
+                ok = await asyncio.wait_for(self._apply(action), timeout=timeout)
+                if not ok:
+                    action.error = f"Failed to {action.action} miner."
+            except asyncio.TimeoutError:
+                action.error = f"Timed out trying to {action.action} miner."
+                action.status = TIMED_OUT
+            except Exception as e:
+                logging.debug(f"{action.miner} - Failed to {action.action}: {e!r}")
+                action.error = str(e) or type(e).__name__
+
+            if action.status != TIMED_OUT:
+                action.status = FAILED if action.error is not None else DONE
+            action.finished = time.time()
+            self._notify(action)
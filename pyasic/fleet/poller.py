@@ -0,0 +1,232 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+
+from pyasic.data import MinerData
+from pyasic.miners.base import BaseMiner
+from pyasic.miners.data import DataOptions
+
+
+@dataclass
+class PollResult:
+    """The result of polling a single miner.
+
+    Attributes:
+        miner: The miner that was polled.
+        data: The data returned by the miner, or `None` if the poll failed.
+        error: The exception raised while polling, or `None` if the poll succeeded.
+        timestamp: The unix time the poll was started at.
+        duration: How long the poll took, in seconds.
+        cycle: The polling cycle this result belongs to, starting at 0.
+    """
+
+    miner: BaseMiner
+    data: MinerData | None
+    error: BaseException | None
+    timestamp: float
+    duration: float
+    cycle: int
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class Poller:
+    """Poll a fleet of miners with `get_data()` on a fixed interval.
+
+    Instead of starting every poll at once, each miner gets a fixed slot inside the
+    interval, so `n` miners are started `interval / n` seconds apart.  A global
+    concurrency budget caps how many polls can be in flight, and each poll is bounded
+    by a timeout.  If a miner is still being polled when its next slot comes up, that
+    slot is skipped.
+
+    Results are streamed as [`PollResult`][pyasic.fleet.PollResult] instances, either
+    by iterating the poller directly or through [`poll()`][pyasic.fleet.Poller.poll].
+
+    Parameters:
+        miners: The miners to poll.
+        interval: The time between polls of the same miner, in seconds.
+        concurrency: The maximum number of polls in flight at once.
+        timeout: The timeout for a single poll, in seconds. Defaults to `interval`.
+        include: Data items to gather, passed to `get_data()`.
+        exclude: Data items to skip, passed to `get_data()`.
+        allow_warning: Passed to `get_data()`.
+        validate: Passed to `get_data()`, pass `False` to skip validating the data of each poll.
+    """
+
+    def __init__(
+        self,
+        miners: Iterable[BaseMiner],
+        interval: float = 60.0,
+        concurrency: int = 255,
+        timeout: float | None = None,
+        include: list[str | DataOptions] | None = None,
+        exclude: list[str | DataOptions] | None = None,
+        allow_warning: bool = False,
+        validate: bool = True,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("Poll interval must be greater than 0.")
+        if concurrency < 1:
+            raise ValueError("Poll concurrency must be at least 1.")
+        self.miners = list(miners)
+        self.interval = interval
+        self.concurrency = concurrency
+        self.timeout = timeout if timeout is not None else interval
+        self.include = include
+        self.exclude = exclude
+        self.allow_warning = allow_warning
+        self.validate = validate
+
+        self._stop = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self.miners)
+
+    def __aiter__(self) -> AsyncIterator[PollResult]:
+        return self.poll()
+
+    def stop(self) -> None:
+        """Stop scheduling new polls.
+
+        Polls that are already in flight are allowed to finish, and their results are
+        still yielded before iteration ends.
+        """
+        self._stop.set()
+
+    async def poll(self, cycles: int | None = None) -> AsyncIterator[PollResult]:
+        """Poll the miners, yielding results as they complete.
+
+        Parameters:
+            cycles: The number of times to poll each miner. Defaults to polling until `stop()` is called.
+
+        Returns:
+            An asynchronous generator of poll results.
+        """
+        self._stop.clear()
+        queue: asyncio.Queue[PollResult | None] = asyncio.Queue(
+            maxsize=self.concurrency
+        )
+        dispatcher = asyncio.create_task(self._dispatch(queue, cycles))
+        try:
+            while True:
+                result = await queue.get()
+                if result is None:
+                    break
+                yield result
+        finally:
+            dispatcher.cancel()
+            await asyncio.gather(dispatcher, return_exceptions=True)
+        # surface any unexpected dispatcher failure
+        dispatcher.result()
+
+    async def _dispatch(
+        self, queue: asyncio.Queue[PollResult | None], cycles: int | None
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        in_flight: set[int] = set()
+        tasks: set[asyncio.Task[None]] = set()
+        spacing = self.interval / len(self.miners) if self.miners else 0.0
+
+        start = loop.time()
+        cycle = 0
+        error: Exception | None = None
+        try:
+            while not self._stop.is_set() and (cycles is None or cycle < cycles):
+                cycle_start = start + cycle * self.interval
+                for idx, miner in enumerate(self.miners):
+                    await self._sleep_until(cycle_start + idx * spacing)
+                    if self._stop.is_set():
+                        break
+                    if idx in in_flight:
+                        continue
+                    await semaphore.acquire()
+                    in_flight.add(idx)
+                    task = asyncio.create_task(
+                        self._poll_miner(idx, miner, cycle, semaphore, queue, in_flight)
+                    )
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                cycle += 1
+                if cycles is None or cycle < cycles:
+                    await self._sleep_until(start + cycle * self.interval)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except Exception as e:
+            error = e
+        finally:
+            for task in list(tasks):
+                task.cancel()
+        await queue.put(None)
+        if error is not None:
+            raise error
+
+    async def _sleep_until(self, deadline: float) -> None:
+        delay = deadline - asyncio.get_running_loop().time()
+        if delay <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _poll_miner(
+        self,
+        idx: int,
+        miner: BaseMiner,
+        cycle: int,
+        semaphore: asyncio.Semaphore,
+        queue: asyncio.Queue[PollResult | None],
+        in_flight: set[int],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        timestamp = time.time()
+        started = loop.time()
+        data = None
+        error: BaseException | None = None
+        try:
+            try:
+                data = await asyncio.wait_for(
+                    miner.get_data(
+                        allow_warning=self.allow_warning,
+                        include=self.include,
+                        exclude=self.exclude,
+                        validate=self.validate,
+                    ),
+                    timeout=self.timeout,
+                )
+            except Exception as e:
+                error = e
+            await queue.put(
+                PollResult(
+                    miner=miner,
+                    data=data,
+                    error=error,
+                    timestamp=timestamp,
+                    duration=loop.time() - started,
+                    cycle=cycle,
+                )
+            )
+        finally:
+            in_flight.discard(idx)
+            semaphore.release()
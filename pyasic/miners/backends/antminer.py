@@ -23,6 +23,7 @@ from pyasic.data.error_codes import X19Error
 from pyasic.data.pools import PoolMetrics, PoolUrl
 from pyasic.device.algorithm import AlgoHashRateType
 from pyasic.errors import APIError
+from pyasic.firmware import FirmwareImage
 from pyasic.miners.backends.bmminer import BMMiner
 from pyasic.miners.backends.cgminer import CGMiner
 from pyasic.miners.data import (
@@ -80,7 +81,7 @@ ANTMINER_MODERN_DATA_LOC = DataLocations(
         ),
         str(DataOptions.HASHBOARDS): DataFunction(
             "_get_hashboards",
-            [],
+            [RPCAPICommand("rpc_new_api_stats", "stats", {"new_api": True})],
         ),
         str(DataOptions.IS_MINING): DataFunction(
             "_is_mining",
@@ -139,7 +140,7 @@ class AntminerModern(BMMiner):
     async def upgrade_firmware(
         self,
         *,
-        file: str | None = None,
+        file: str | FirmwareImage | None = None,
         url: str | None = None,
         version: str | None = None,
         keep_settings: bool = True,
@@ -148,7 +149,7 @@ class AntminerModern(BMMiner):
         Upgrade the firmware of the AntMiner device.
 
         Args:
-            file: Path to the firmware file as a string.
+            file: Path to the firmware file as a string, or a shared `FirmwareImage`.
             url: URL to download firmware from (not implemented).
             version: Version to upgrade to (not implemented).
             keep_settings: Whether to keep the current settings after the update.
@@ -166,7 +167,7 @@ class AntminerModern(BMMiner):
             )
 
         try:
-            file_path = Path(file)
+            file_path = file if isinstance(file, FirmwareImage) else Path(file)
 
             if not hasattr(self.web, "update_firmware"):
                 logging.error(
@@ -285,7 +286,9 @@ class AntminerModern(BMMiner):
                 pass
         return errors
 
-    async def _get_hashboards(self) -> list[HashBoard]:  # type: ignore[override]
+    async def _get_hashboards(
+        self, rpc_new_api_stats: dict | None = None
+    ) -> list[HashBoard]:
         if self.expected_hashboards is None:
             return []
 
@@ -294,10 +297,12 @@ class AntminerModern(BMMiner):
             for idx in range(self.expected_hashboards)
         ]
 
-        try:
-            rpc_stats = await self.rpc.stats(new_api=True)
-        except APIError:
-            return hashboards
+        rpc_stats = rpc_new_api_stats
+        if rpc_stats is None and not self._in_parse_phase():
+            try:
+                rpc_stats = await self.rpc.stats(new_api=True)
+            except APIError:
+                return hashboards
 
         if rpc_stats is not None:
             try:
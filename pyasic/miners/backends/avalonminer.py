@@ -286,7 +286,7 @@ class AvalonMiner(CGMiner):
 
         if rpc_estats is not None:
             try:
-                parsed_estats = self.parse_estats(rpc_estats)
+                parsed_estats = self._parse_cached(self.parse_estats, rpc_estats)
             except (IndexError, KeyError, ValueError, TypeError):
                 return hashboards
 
@@ -396,7 +396,8 @@ class AvalonMiner(CGMiner):
 
         if rpc_estats is not None:
             try:
-                parsed_estats = self.parse_estats(rpc_estats)["STATS"][0]["MM ID0"]
+                estats = self._parse_cached(self.parse_estats, rpc_estats)
+                parsed_estats = estats["STATS"][0]["MM ID0"]
                 return self.algo.hashrate(
                     rate=float(parsed_estats["GHSmm"]),
                     unit=self.algo.unit.GH,  # type: ignore[attr-defined]
@@ -414,7 +415,8 @@ class AvalonMiner(CGMiner):
 
         if rpc_estats is not None:
             try:
-                parsed_estats = self.parse_estats(rpc_estats)["STATS"][0]["MM ID0"]
+                estats = self._parse_cached(self.parse_estats, rpc_estats)
+                parsed_estats = estats["STATS"][0]["MM ID0"]
                 return float(parsed_estats["Temp"])
             except (IndexError, KeyError, ValueError, TypeError):
                 pass
@@ -429,7 +431,8 @@ class AvalonMiner(CGMiner):
 
         if rpc_estats is not None:
             try:
-                parsed_estats = self.parse_estats(rpc_estats)["STATS"][0]["MM ID0"]
+                estats = self._parse_cached(self.parse_estats, rpc_estats)
+                parsed_estats = estats["STATS"][0]["MM ID0"]
                 return int(parsed_estats["MPO"])
             except (IndexError, KeyError, ValueError, TypeError):
                 pass
@@ -444,7 +447,8 @@ class AvalonMiner(CGMiner):
 
         if rpc_estats is not None:
             try:
-                parsed_estats = self.parse_estats(rpc_estats)["STATS"][0]["MM ID0"]
+                estats = self._parse_cached(self.parse_estats, rpc_estats)
+                parsed_estats = estats["STATS"][0]["MM ID0"]
                 return int(parsed_estats["WALLPOWER"])
             except (IndexError, KeyError, ValueError, TypeError):
                 pass
@@ -463,7 +467,8 @@ class AvalonMiner(CGMiner):
         fans_data = [Fan() for _ in range(self.expected_fans)]
         if rpc_estats is not None:
             try:
-                parsed_estats = self.parse_estats(rpc_estats)["STATS"][0]["MM ID0"]
+                estats = self._parse_cached(self.parse_estats, rpc_estats)
+                parsed_estats = estats["STATS"][0]["MM ID0"]
             except LookupError:
                 return fans_data
 
@@ -485,7 +490,8 @@ class AvalonMiner(CGMiner):
 
         if rpc_estats is not None:
             try:
-                parsed_estats = self.parse_estats(rpc_estats)["STATS"][0]["MM ID0"]
+                estats = self._parse_cached(self.parse_estats, rpc_estats)
+                parsed_estats = estats["STATS"][0]["MM ID0"]
                 led = int(parsed_estats["Led"])
                 return True if led == 1 else False
             except (IndexError, KeyError, ValueError, TypeError):
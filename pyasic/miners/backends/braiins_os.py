@@ -16,8 +16,8 @@
 import base64
 import logging
 import time
+from typing import TYPE_CHECKING
 
-import aiofiles
 import tomli_w
 
 try:
@@ -32,6 +32,7 @@ from pyasic.data.error_codes import BraiinsOSError, MinerErrorData
 from pyasic.data.pools import PoolMetrics, PoolUrl
 from pyasic.device.algorithm import AlgoHashRateType
 from pyasic.errors import APIError
+from pyasic.firmware import FirmwareImage, open_image
 from pyasic.miners.data import (
     DataFunction,
     DataLocations,
@@ -42,8 +43,10 @@ from pyasic.miners.data import (
 from pyasic.miners.device.firmware import BraiinsOSFirmware
 from pyasic.rpc.bosminer import BOSMinerRPCAPI
 from pyasic.ssh.braiins_os import BOSMinerSSH
-from pyasic.web.braiins_os import BOSerWebAPI, BOSMinerWebAPI
-from pyasic.web.braiins_os.proto.braiins.bos.v1 import SaveAction
+from pyasic.web.braiins_os.bosminer import BOSMinerWebAPI
+
+if TYPE_CHECKING:
+    from pyasic.web.braiins_os.boser import BOSerWebAPI
 
 BOSMINER_DATA_LOC = DataLocations(
     **{
@@ -395,7 +398,8 @@ class BOSMiner(BraiinsOSFirmware):
             cmds.append("devdetails")
         if rpc_devs is None:
             cmds.append("devs")
-        if len(cmds) > 0:
+        # inside get_data these were already sent in the batched multicommand
+        if len(cmds) > 0 and not self._in_parse_phase():
             try:
                 d = await self.rpc.multicommand(*cmds)
             except APIError:
@@ -651,7 +655,7 @@ class BOSMiner(BraiinsOSFirmware):
     async def upgrade_firmware(
         self,
         *,
-        file: str | None = None,
+        file: str | FirmwareImage | None = None,
         url: str | None = None,
         version: str | None = None,
         keep_settings: bool = True,
@@ -660,7 +664,7 @@ class BOSMiner(BraiinsOSFirmware):
         Upgrade the firmware of the BOSMiner device.
 
         Args:
-            file: The local file path of the firmware to be uploaded.
+            file: The local file path of the firmware to be uploaded, or a shared `FirmwareImage`.
             url: URL of firmware to download (not used in this implementation).
             version: Specific version to upgrade to (not used in this implementation).
             keep_settings: Whether to keep current settings (not used in this implementation).
@@ -674,12 +678,9 @@ class BOSMiner(BraiinsOSFirmware):
             if not file:
                 raise ValueError("File location must be provided for firmware upgrade.")
 
-            # Read the firmware file contents
-            async with aiofiles.open(file, "rb") as f:
-                upgrade_contents = await f.read()
-
-            # Encode the firmware contents in base64
-            encoded_contents = base64.b64encode(upgrade_contents).decode("utf-8")
+            # Encode the firmware contents in base64, straight from the memory mapped image
+            with open_image(file) as image:
+                encoded_contents = base64.b64encode(image.view).decode("utf-8")
 
             # Upload the firmware file to the BOSMiner device
             logging.info(f"Uploading firmware file from {file} to the device.")
@@ -712,15 +713,23 @@ BOSER_DATA_LOC = DataLocations(
     **{
         str(DataOptions.SERIAL_NUMBER): DataFunction(
             "_get_serial_number",
-            [WebAPICommand("grpc_miner_details", "get_miner_details")],
+            [
+                WebAPICommand(
+                    "grpc_miner_details", "get_miner_details", ("serialNumber",)
+                )
+            ],
         ),
         str(DataOptions.PSU_SERIAL_NUMBER): DataFunction(
             "_get_psu_serial_number",
-            [WebAPICommand("grpc_miner_details", "get_miner_details")],
+            [
+                WebAPICommand(
+                    "grpc_miner_details", "get_miner_details", ("psuInfo.serialNumber",)
+                )
+            ],
         ),
         str(DataOptions.MAC): DataFunction(
             "_get_mac",
-            [WebAPICommand("grpc_miner_details", "get_miner_details")],
+            [WebAPICommand("grpc_miner_details", "get_miner_details", ("macAddress",))],
         ),
         str(DataOptions.API_VERSION): DataFunction(
             "_get_api_ver",
@@ -728,11 +737,15 @@ BOSER_DATA_LOC = DataLocations(
         ),
         str(DataOptions.FW_VERSION): DataFunction(
             "_get_fw_ver",
-            [WebAPICommand("grpc_miner_details", "get_miner_details")],
+            [
+                WebAPICommand(
+                    "grpc_miner_details", "get_miner_details", ("bosVersion.current",)
+                )
+            ],
         ),
         str(DataOptions.HOSTNAME): DataFunction(
             "_get_hostname",
-            [WebAPICommand("grpc_miner_details", "get_miner_details")],
+            [WebAPICommand("grpc_miner_details", "get_miner_details", ("hostname",))],
         ),
         str(DataOptions.HASHRATE): DataFunction(
             "_get_hashrate",
@@ -740,27 +753,54 @@ BOSER_DATA_LOC = DataLocations(
         ),
         str(DataOptions.EXPECTED_HASHRATE): DataFunction(
             "_get_expected_hashrate",
-            [WebAPICommand("grpc_miner_details", "get_miner_details")],
+            [
+                WebAPICommand(
+                    "grpc_miner_details",
+                    "get_miner_details",
+                    ("stickerHashrate.gigahashPerSecond",),
+                )
+            ],
         ),
         str(DataOptions.HASHBOARDS): DataFunction(
             "_get_hashboards",
-            [WebAPICommand("grpc_hashboards", "get_hashboards")],
+            [
+                WebAPICommand(
+                    "grpc_hashboards",
+                    "get_hashboards",
+                    (
+                        "hashboards.id",
+                        "hashboards.chipsCount",
+                        "hashboards.boardTemp",
+                        "hashboards.highestChipTemp.temperature",
+                        "hashboards.stats.realHashrate.last5S",
+                        "hashboards.serialNumber",
+                    ),
+                )
+            ],
         ),
         str(DataOptions.WATTAGE): DataFunction(
             "_get_wattage",
-            [WebAPICommand("grpc_miner_stats", "get_miner_stats")],
+            [
+                WebAPICommand(
+                    "grpc_miner_stats",
+                    "get_miner_stats",
+                    ("powerStats.approximatedConsumption",),
+                )
+            ],
         ),
         str(DataOptions.WATTAGE_LIMIT): DataFunction(
             "_get_wattage_limit",
             [
                 WebAPICommand(
-                    "grpc_active_performance_mode", "get_active_performance_mode"
+                    "grpc_active_performance_mode",
+                    "get_active_performance_mode",
+                    ("tunerMode.powerTarget.powerTarget",),
                 )
             ],
         ),
         str(DataOptions.FANS): DataFunction(
             "_get_fans",
-            [WebAPICommand("grpc_cooling_state", "get_cooling_state")],
+            [WebAPICommand("grpc_cooling_state", "get_cooling_state", ("fans.rpm",))],
         ),
         str(DataOptions.ERRORS): DataFunction(
             "_get_errors",
@@ -779,7 +819,21 @@ BOSER_DATA_LOC = DataLocations(
             [RPCAPICommand("rpc_summary", "summary")],
         ),
         str(DataOptions.POOLS): DataFunction(
-            "_get_pools", [WebAPICommand("grpc_pool_groups", "get_pool_groups")]
+            "_get_pools",
+            [
+                WebAPICommand(
+                    "grpc_pool_groups",
+                    "get_pool_groups",
+                    (
+                        "poolGroups.pools.url",
+                        "poolGroups.pools.user",
+                        "poolGroups.pools.active",
+                        "poolGroups.pools.alive",
+                        "poolGroups.pools.stats.acceptedShares",
+                        "poolGroups.pools.stats.rejectedShares",
+                    ),
+                )
+            ],
         ),
     }
 )
@@ -790,14 +844,20 @@ class BOSer(BraiinsOSFirmware):
 
     _rpc_cls = BOSMinerRPCAPI
     rpc: BOSMinerRPCAPI
-    _web_cls = BOSerWebAPI
-    web: BOSerWebAPI
+    web: "BOSerWebAPI"
 
     data_locations = BOSER_DATA_LOC
 
     supports_autotuning = True
     supports_shutdown = True
 
+    @property
+    def _web_cls(self) -> "type[BOSerWebAPI]":  # type: ignore[override]
+        # the gRPC client and its messages are slow to import, so only do it for BOSer miners
+        from pyasic.web.braiins_os.boser import BOSerWebAPI
+
+        return BOSerWebAPI
+
     async def fault_light_on(self) -> bool:
         resp = await self.web.set_locate_device_status(True)
         if resp.get("enabled", False):
@@ -850,6 +910,8 @@ class BOSer(BraiinsOSFirmware):
             await self.web.send_command(key, message=boser_cfg[key])
 
     async def set_power_limit(self, wattage: int) -> bool:
+        from pyasic.web.braiins_os.proto.braiins.bos.v1 import SaveAction
+
         try:
             result = await self.web.set_power_target(
                 wattage,
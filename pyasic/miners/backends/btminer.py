@@ -16,7 +16,6 @@
 import asyncio
 import logging
 
-import aiofiles
 import semver
 
 from pyasic.config import MinerConfig, MiningModeConfig
@@ -25,6 +24,7 @@ from pyasic.data.error_codes import MinerErrorData, WhatsminerError
 from pyasic.data.pools import PoolMetrics, PoolUrl
 from pyasic.device.algorithm import AlgoHashRateType
 from pyasic.errors import APIError
+from pyasic.firmware import FirmwareImage, open_image
 from pyasic.miners.data import DataFunction, DataLocations, DataOptions, RPCAPICommand
 from pyasic.miners.device.firmware import StockFirmware
 from pyasic.rpc.btminer import BTMinerRPCAPI, BTMinerV3RPCAPI
@@ -772,7 +772,7 @@ class BTMinerV2(StockFirmware):
     async def upgrade_firmware(
         self,
         *,
-        file: str | None = None,
+        file: str | FirmwareImage | None = None,
         url: str | None = None,
         version: str | None = None,
         keep_settings: bool = True,
@@ -781,7 +781,7 @@ class BTMinerV2(StockFirmware):
         Upgrade the firmware of the Whatsminer device.
 
         Args:
-            file: The local file path of the firmware to be uploaded.
+            file: The local file path of the firmware to be uploaded, or a shared `FirmwareImage`.
             url: URL to download firmware from (not supported).
             version: Specific version to upgrade to (not supported).
             keep_settings: Whether to keep settings after upgrade.
@@ -795,11 +795,9 @@ class BTMinerV2(StockFirmware):
             if not file:
                 raise ValueError("File location must be provided for firmware upgrade.")
 
-            # Read the firmware file contents
-            async with aiofiles.open(file, "rb") as f:
-                upgrade_contents = await f.read()
-
-            await self.rpc.update_firmware(upgrade_contents)
+            # stream the firmware from a memory mapped image
+            with open_image(file) as image:
+                await self.rpc.update_firmware(image)
 
             logging.info(
                 "Firmware upgrade process completed successfully for Whatsminer."
@@ -21,6 +21,7 @@ from pyasic.data.error_codes import MinerErrorData, X19Error
 from pyasic.data.pools import PoolMetrics, PoolUrl
 from pyasic.device.algorithm import AlgoHashRateType, ScryptAlgo
 from pyasic.errors import APIError
+from pyasic.firmware import FirmwareImage
 from pyasic.logger import logger
 from pyasic.miners.data import DataFunction, DataLocations, DataOptions, WebAPICommand
 from pyasic.miners.device.firmware import ePICFirmware
@@ -485,7 +486,7 @@ class ePIC(ePICFirmware):
     async def upgrade_firmware(
         self,
         *,
-        file: str | None = None,
+        file: str | FirmwareImage | None = None,
         url: str | None = None,
         version: str | None = None,
         keep_settings: bool = True,
@@ -494,7 +495,7 @@ class ePIC(ePICFirmware):
         Upgrade the firmware of the ePIC miner device.
 
         Args:
-            file: The local file path of the firmware to be uploaded.
+            file: The local file path of the firmware to be uploaded, or a shared `FirmwareImage`.
             url: The URL to download the firmware from. Must be a valid URL if provided.
             version: The version of the firmware to upgrade to. If None, the version will be inferred from the file or URL.
             keep_settings: Whether to keep the current settings after the update.
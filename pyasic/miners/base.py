@@ -16,8 +16,13 @@
 import asyncio
 import ipaddress
 import warnings
+from collections.abc import Callable
+from contextvars import ContextVar
 from typing import Any, Protocol, TypeVar
 
+from pydantic import ValidationError
+
+from pyasic import settings
 from pyasic.config import MinerConfig
 from pyasic.data import Fan, HashBoard, MinerData
 from pyasic.data.device import DeviceInfo
@@ -29,8 +34,28 @@ from pyasic.device.firmware import MinerFirmware
 from pyasic.device.makes import MinerMake
 from pyasic.device.models import MinerModelType
 from pyasic.errors import APIError
+from pyasic.firmware.image import FirmwareImage
 from pyasic.logger import logger
 from pyasic.miners.data import DataOptions, RPCAPICommand, WebAPICommand
+from pyasic.misc import parse_phase
+from pyasic.rpc.capabilities import capability_cache
+
+# parsed responses for the running `get_data` call, see `MinerProtocol._parse_cached`
+_parse_cache: ContextVar[dict[tuple[Any, int], tuple[Any, Any]] | None] = ContextVar(
+    "_parse_cache", default=None
+)
+
+T = TypeVar("T")
+
+# data items that are set on `MinerData` through a property
+_MINER_DATA_SETTERS = {"hashrate": "raw_hashrate", "wattage_limit": "raw_wattage_limit"}
+# unvalidated `MinerData` is copied from this, which is much faster than `model_construct`
+_MINER_DATA_TEMPLATE = MinerData.model_construct(ip="")
+_MINER_DATA_FACTORIES = {
+    name: field.default_factory
+    for name, field in MinerData.model_fields.items()
+    if field.default_factory is not None
+}
 
 
 class MinerProtocol(Protocol):
@@ -188,7 +213,7 @@ class MinerProtocol(Protocol):
     async def upgrade_firmware(
         self,
         *,
-        file: str | None = None,
+        file: str | FirmwareImage | None = None,
         url: str | None = None,
         version: str | None = None,
         keep_settings: bool = True,
@@ -196,7 +221,7 @@ class MinerProtocol(Protocol):
         """Upgrade the firmware of the miner.
 
         Parameters:
-            file: The file path to the firmware to upgrade from. Must be a valid file path if provided.
+            file: The file path to the firmware to upgrade from, or a [`FirmwareImage`][pyasic.firmware.FirmwareImage] shared between uploads. Must be a valid file path if provided.
             url: The URL to download the firmware from. Must be a valid URL if provided.
             version: The version of the firmware to upgrade to. If None, the version will be inferred from the file or URL.
             keep_settings: Whether to keep the current settings during the upgrade. Defaults to True.
@@ -478,7 +503,10 @@ class MinerProtocol(Protocol):
                     include.remove(str(item))
 
         rpc_multicommand = set()
+        rpc_param_commands: dict[Any, RPCAPICommand] = {}
         web_multicommand = set()
+        # fields each web command is projected to, `None` if any caller needs all of it
+        web_fields: dict[str, set[str] | None] = {}
         # create multicommand
         for data_name in include:
             try:
@@ -488,9 +516,18 @@ class MinerProtocol(Protocol):
                 # keep track of which RPC/Web commands need to be sent
                 for arg in fn_args:
                     if isinstance(arg, RPCAPICommand):
-                        rpc_multicommand.add(arg.cmd)
+                        if arg.params:
+                            rpc_param_commands[arg.key] = arg
+                        else:
+                            rpc_multicommand.add(arg.cmd)
                     if isinstance(arg, WebAPICommand):
                         web_multicommand.add(arg.cmd)
+                        if not arg.fields:
+                            web_fields[arg.cmd] = None
+                        elif arg.cmd not in web_fields:
+                            web_fields[arg.cmd] = set(arg.fields)
+                        elif (projected := web_fields[arg.cmd]) is not None:
+                            projected.update(arg.fields)
             except KeyError as e:
                 logger.error(type(e), e, data_name)
                 continue
@@ -511,14 +548,31 @@ class MinerProtocol(Protocol):
             and self.web is not None
             and hasattr(self.web, "multicommand")
         ):
+            projections = {
+                cmd: tuple(sorted(fields))
+                for cmd, fields in web_fields.items()
+                if fields is not None
+            }
+            web_kwargs: dict[str, Any] = {"allow_warning": allow_warning}
+            if projections:
+                web_kwargs["fields"] = projections
             web_command_task = asyncio.create_task(
-                self.web.multicommand(*web_multicommand, allow_warning=allow_warning)
+                self.web.multicommand(*web_multicommand, **web_kwargs)
             )
         else:
             web_command_task = asyncio.create_task(asyncio.sleep(0))
+        # commands with parameters can't be joined, send them alongside the multicommand
+        rpc_param_tasks = {}
+        if self.rpc is not None:
+            rpc_param_tasks = {
+                key: asyncio.create_task(self._send_rpc_param_command(arg))
+                for key, arg in rpc_param_commands.items()
+            }
 
         # make sure the tasks complete
-        await asyncio.gather(rpc_command_task, web_command_task)
+        await asyncio.gather(
+            rpc_command_task, web_command_task, *rpc_param_tasks.values()
+        )
 
         # grab data out of the tasks
         web_command_data = web_command_task.result()
@@ -527,47 +581,104 @@ class MinerProtocol(Protocol):
         api_command_data = rpc_command_task.result()
         if api_command_data is None:
             api_command_data = {}
+        rpc_param_data = {key: task.result() for key, task in rpc_param_tasks.items()}
 
         miner_data = {}
 
-        for data_name in include:
-            try:
-                fn_args = getattr(self.data_locations, str(data_name)).kwargs
-                args_to_send = {k.name: None for k in fn_args}
-                for arg in fn_args:
-                    try:
-                        if isinstance(arg, RPCAPICommand):
-                            if api_command_data.get("multicommand"):
-                                args_to_send[arg.name] = api_command_data[arg.cmd][0]
-                            else:
-                                args_to_send[arg.name] = api_command_data
-                        if isinstance(arg, WebAPICommand):
-                            if web_command_data is not None:
-                                if web_command_data.get("multicommand"):
-                                    args_to_send[arg.name] = web_command_data[arg.cmd]
+        # let data functions share parsed responses, see `_parse_cached`
+        cache_token = _parse_cache.set({})
+        try:
+            for data_name in include:
+                try:
+                    fn_args = getattr(self.data_locations, str(data_name)).kwargs
+                    args_to_send: dict[str, dict | None] = {
+                        k.name: None for k in fn_args
+                    }
+                    for arg in fn_args:
+                        try:
+                            if isinstance(arg, RPCAPICommand) and arg.params:
+                                args_to_send[arg.name] = rpc_param_data[arg.key]
+                            elif isinstance(arg, RPCAPICommand):
+                                if api_command_data.get("multicommand"):
+                                    args_to_send[arg.name] = api_command_data[arg.cmd][
+                                        0
+                                    ]
                                 else:
-                                    if not web_command_data == {"multicommand": False}:
-                                        args_to_send[arg.name] = web_command_data
-                    except LookupError:
-                        args_to_send[arg.name] = None
-            except LookupError:
-                continue
-            try:
-                function = getattr(
-                    self, getattr(self.data_locations, str(data_name)).cmd
-                )
-                miner_data[data_name] = await function(**args_to_send)
-            except Exception as e:
-                raise APIError(
-                    f"Failed to call {data_name} on {self} while getting data."
-                ) from e
+                                    args_to_send[arg.name] = api_command_data
+                            if isinstance(arg, WebAPICommand):
+                                if web_command_data is not None:
+                                    if web_command_data.get("multicommand"):
+                                        args_to_send[arg.name] = web_command_data[
+                                            arg.cmd
+                                        ]
+                                    else:
+                                        if not web_command_data == {
+                                            "multicommand": False
+                                        }:
+                                            args_to_send[arg.name] = web_command_data
+                        except LookupError:
+                            args_to_send[arg.name] = None
+                except LookupError:
+                    continue
+                phase_token = parse_phase.set(str(data_name))
+                try:
+                    function = getattr(
+                        self, getattr(self.data_locations, str(data_name)).cmd
+                    )
+                    miner_data[data_name] = await function(**args_to_send)
+                except Exception as e:
+                    raise APIError(
+                        f"Failed to call {data_name} on {self} while getting data."
+                    ) from e
+                finally:
+                    parse_phase.reset(phase_token)
+        finally:
+            _parse_cache.reset(cache_token)
         return miner_data
 
+    async def _send_rpc_param_command(self, command: RPCAPICommand) -> dict | None:
+        try:
+            return await getattr(self.rpc, command.cmd)(**command.params)
+        except APIError:
+            return None
+
+    def _in_parse_phase(self) -> bool:
+        """Whether `get_data` is currently parsing the responses of its batched commands.
+
+        Data functions can use this to skip fetching their own data when a batched
+        command failed, as the command has already been sent.
+        """
+        return parse_phase.get() is not None
+
+    def _parse_cached(self, parser: Callable[[Any], T], data: Any) -> T:
+        """Parse a raw API response, reusing the result within the same `get_data` call.
+
+        Data functions that run an expensive parser on a response shared with other
+        data functions should use this, so the parser runs once per response.  The parsed
+        result is shared, and should not be modified.
+
+        Parameters:
+            parser: The function to parse the response with.
+            data: The raw response.
+
+        Returns:
+            The parsed response.
+        """
+        cache = _parse_cache.get()
+        if cache is None:
+            return parser(data)
+        key = (parser, id(data))
+        if key not in cache:
+            # keep the response alive so its id can't be reused during this call
+            cache[key] = (data, parser(data))
+        return cache[key][1]
+
     async def get_data(
         self,
         allow_warning: bool = False,
         include: list[str | DataOptions] | None = None,
         exclude: list[str | DataOptions] | None = None,
+        validate: bool = True,
     ) -> MinerData:
         """Get data from the miner in the form of [`MinerData`][pyasic.data.MinerData].
 
@@ -575,39 +686,68 @@ class MinerProtocol(Protocol):
             allow_warning: Allow warning when an API command fails.
             include: Names of data items you want to gather. Defaults to all data.
             exclude: Names of data items to exclude.  Exclusion happens after considering included items.
+            validate: Validate the gathered data when building the result.  Collectors that trust the
+                parsers can pass `False` to skip validation, which is much faster for large fleets.
 
         Returns:
             A [`MinerData`][pyasic.data.MinerData] instance containing data from the miner.
         """
-        data = MinerData(
-            ip=str(self.ip),
-            device_info=self.device_info,
-            expected_chips=(
+        gathered_data = await self._get_data(
+            allow_warning=allow_warning, include=include, exclude=exclude
+        )
+        return self._build_miner_data(gathered_data, validate=validate)
+
+    def _build_miner_data(
+        self, gathered_data: dict[str, Any], validate: bool = True
+    ) -> MinerData:
+        """Build [`MinerData`][pyasic.data.MinerData] from the results of `_get_data`.
+
+        All values are passed to the model at once, so it is only validated a single
+        time.  If validation fails, the data is built without validation, as the data
+        functions are allowed to return values the model would coerce or reject.
+
+        Parameters:
+            gathered_data: The gathered data, by data item name.
+            validate: Whether to validate the data, or trust it as returned by the data functions.
+
+        Returns:
+            A [`MinerData`][pyasic.data.MinerData] instance containing the gathered data.
+        """
+        values: dict[str, Any] = {
+            "ip": str(self.ip),
+            "device_info": self.device_info,
+            "expected_chips": (
                 self.expected_chips * self.expected_hashboards
                 if self.expected_chips is not None
                 and self.expected_hashboards is not None
                 else 0
             ),
-            expected_hashboards=self.expected_hashboards,
-            expected_fans=self.expected_fans,
-            hashboards=[
+            "expected_hashboards": self.expected_hashboards,
+            "expected_fans": self.expected_fans,
+        }
+        for item, value in gathered_data.items():
+            if value is not None:
+                values[_MINER_DATA_SETTERS.get(item, item)] = value
+
+        if "hashboards" not in values:
+            values["hashboards"] = [
                 HashBoard(slot=i, expected_chips=self.expected_chips)
                 for i in range(
                     self.expected_hashboards
                     if self.expected_hashboards is not None
                     else 0
                 )
-            ],
-        )
-
-        gathered_data = await self._get_data(
-            allow_warning=allow_warning, include=include, exclude=exclude
-        )
-        for item in gathered_data:
-            if gathered_data[item] is not None:
-                setattr(data, item, gathered_data[item])
+            ]
 
-        return data
+        if validate:
+            try:
+                return MinerData(**values)
+            except ValidationError as e:
+                logger.debug(f"{self} - Failed to validate data: {e}")
+        for name, factory in _MINER_DATA_FACTORIES.items():
+            if name not in values:
+                values[name] = factory()  # type: ignore[call-arg]
+        return _MINER_DATA_TEMPLATE.model_copy(update=values)
 
 
 class BaseMiner(MinerProtocol):
@@ -623,6 +763,10 @@ class BaseMiner(MinerProtocol):
         # interfaces
         if self._rpc_cls is not None:
             self.rpc = self._rpc_cls(ip)
+            if settings.get("rpc_capability_cache", True):
+                self.rpc.capabilities = capability_cache.get(
+                    (self._rpc_cls, self.raw_model, self.firmware)
+                )
         if self._web_cls is not None:
             self.web = self._web_cls(ip)
         if self._ssh_cls is not None:
@@ -0,0 +1,202 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class IdentificationEntry:
+    """A cached miner identification.
+
+    Attributes:
+        ip: The IP address of the miner.
+        miner_type: The name of the `MinerTypes` member the miner was identified as.
+        model: The model string returned by the miner, if any.
+        version: The firmware version returned by the miner, if any.
+        mac: The MAC address of the miner, if known.
+        timestamp: The unix time the miner was identified at.
+    """
+
+    ip: str
+    miner_type: str
+    model: str | None = None
+    version: str | None = None
+    mac: str | None = None
+    timestamp: float = field(default_factory=time.time)
+
+
+class IdentificationCache:
+    """An in-memory cache of miner identifications, used by `MinerFactory`.
+
+    Entries are keyed by IP, and optionally checked against a MAC address so a
+    different device taking over an address is not matched.  Entries expire after
+    `ttl` seconds.  The cache can be saved to and loaded from a JSON file.
+
+    Parameters:
+        ttl: How long an entry is valid for, in seconds.
+        path: An optional JSON file to load entries from, and save entries to with `save()`.
+    """
+
+    def __init__(self, ttl: float = 86400, path: str | Path | None = None) -> None:
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, IdentificationEntry] = {}
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, ip: str) -> bool:
+        return self.get(ip) is not None
+
+    def get(self, ip: str, mac: str | None = None) -> IdentificationEntry | None:
+        """Get a valid entry for a miner.
+
+        Parameters:
+            ip: The IP address of the miner.
+            mac: The MAC address of the miner, if known.
+
+        Returns:
+            The cached entry, or `None` if there is no entry, it has expired, or the MAC does not match.
+        """
+        entry = self._entries.get(str(ip))
+        if entry is None:
+            return None
+        if time.time() - entry.timestamp > self.ttl:
+            self.remove(ip)
+            return None
+        if mac is not None and entry.mac is not None:
+            if mac.upper() != entry.mac.upper():
+                return None
+        return entry
+
+    def set(self, entry: IdentificationEntry) -> None:
+        """Add or replace the entry for a miner.
+
+        Parameters:
+            entry: The identification to store.
+        """
+        self._entries[entry.ip] = entry
+
+    def remove(self, ip: str) -> None:
+        """Remove the entry for a miner.
+
+        Parameters:
+            ip: The IP address of the miner.
+        """
+        self._entries.pop(str(ip), None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def load(self, path: str | Path) -> None:
+        """Load entries from a JSON file, skipping any that have expired.
+
+        Parameters:
+            path: The file to load from.
+        """
+        with open(path) as f:
+            raw = json.load(f)
+        now = time.time()
+        for item in raw:
+            entry = IdentificationEntry(**item)
+            if now - entry.timestamp <= self.ttl:
+                self._entries[entry.ip] = entry
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Save entries to a JSON file.
+
+        Parameters:
+            path: The file to save to. Defaults to the path the cache was created with.
+        """
+        path = path if path is not None else self.path
+        if path is None:
+            raise ValueError("No path to save the identification cache to.")
+        with open(path, "w") as f:
+            json.dump([asdict(e) for e in self._entries.values()], f)
+
+
+class SQLiteIdentificationCache(IdentificationCache):
+    """An identification cache persisted to a SQLite database.
+
+    Entries are written through to the database as they are set, so no explicit
+    `save()` is needed.
+
+    Parameters:
+        path: The SQLite database file.
+        ttl: How long an entry is valid for, in seconds.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = 86400) -> None:
+        self._db = sqlite3.connect(str(path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS identification ("
+            "ip TEXT PRIMARY KEY, miner_type TEXT NOT NULL, model TEXT, "
+            "version TEXT, mac TEXT, timestamp REAL NOT NULL)"
+        )
+        self._db.commit()
+        super().__init__(ttl=ttl)
+        self.path = Path(path)
+        self.load(self.path)
+
+    def set(self, entry: IdentificationEntry) -> None:
+        super().set(entry)
+        self._db.execute(
+            "INSERT OR REPLACE INTO identification VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                entry.ip,
+                entry.miner_type,
+                entry.model,
+                entry.version,
+                entry.mac,
+                entry.timestamp,
+            ),
+        )
+        self._db.commit()
+
+    def remove(self, ip: str) -> None:
+        super().remove(ip)
+        self._db.execute("DELETE FROM identification WHERE ip = ?", (str(ip),))
+        self._db.commit()
+
+    def clear(self) -> None:
+        super().clear()
+        self._db.execute("DELETE FROM identification")
+        self._db.commit()
+
+    def load(self, path: str | Path) -> None:
+        rows = self._db.execute(
+            "SELECT ip, miner_type, model, version, mac, timestamp "
+            "FROM identification WHERE timestamp >= ?",
+            (time.time() - self.ttl,),
+        )
+        for row in rows:
+            entry = IdentificationEntry(*row)
+            self._entries[entry.ip] = entry
+
+    def save(self, path: str | Path | None = None) -> None:
+        self._db.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
@@ -16,6 +16,7 @@
 
 from dataclasses import dataclass, field, make_dataclass
 from enum import Enum
+from typing import Any
 
 
 class DataOptions(Enum):
@@ -56,12 +57,24 @@ class DataOptions(Enum):
 class RPCAPICommand:
     name: str
     cmd: str
+    # keyword arguments for the RPC API method, such as `{"new_api": True}`
+    # commands with params are sent alongside the multicommand instead of in it
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str | tuple:
+        if not self.params:
+            return self.cmd
+        return self.cmd, tuple(sorted(self.params.items()))
 
 
 @dataclass
 class WebAPICommand:
     name: str
     cmd: str
+    # dotted paths of the response fields the data function reads, for web APIs which
+    # can decode only part of a response, such as BOS+ gRPC; empty to decode it whole
+    fields: tuple[str, ...] = ()
 
 
 @dataclass
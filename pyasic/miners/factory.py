@@ -17,11 +17,12 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import importlib
 import ipaddress
 import json
 import re
 import warnings
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Collection, Iterator, Mapping
 from typing import Any, cast
 
 import anyio
@@ -29,24 +30,14 @@ import httpx
 
 from pyasic import settings
 from pyasic.logger import logger
-from pyasic.miners.antminer import *
-from pyasic.miners.auradine import *
-from pyasic.miners.avalonminer import *
-from pyasic.miners.backends import *
 from pyasic.miners.base import AnyMiner
-from pyasic.miners.bitaxe import *
-from pyasic.miners.blockminer import *
-from pyasic.miners.braiins import *
-from pyasic.miners.device.makes import *
-from pyasic.miners.elphapex import *
-from pyasic.miners.goldshell import *
-from pyasic.miners.hammer import *
-from pyasic.miners.iceriver import *
-from pyasic.miners.iceriver.iceminer.ALX import IceRiverAL3
-from pyasic.miners.innosilicon import *
-from pyasic.miners.luckyminer import *
-from pyasic.miners.volcminer import *
-from pyasic.miners.whatsminer import *
+from pyasic.miners.cache import IdentificationCache, IdentificationEntry
+from pyasic.miners.fingerprint import (
+    Fingerprint,
+    FingerprintMatcher,
+    HeaderFingerprint,
+    HeaderMatcher,
+)
 
 
 class MinerTypes(enum.Enum):
@@ -71,655 +62,804 @@ class MinerTypes(enum.Enum):
     MSKMINER = 18
 
 
-MINER_CLASSES: dict[MinerTypes, dict[str | None, Any]] = {
+# miner classes are imported on first lookup, as importing every model is slow
+_ANTMINER = "pyasic.miners.antminer"
+_AURADINE = "pyasic.miners.auradine"
+_AVALONMINER = "pyasic.miners.avalonminer"
+_BACKENDS = "pyasic.miners.backends"
+_BITAXE = "pyasic.miners.bitaxe"
+_BLOCKMINER = "pyasic.miners.blockminer"
+_BRAIINS = "pyasic.miners.braiins"
+_ELPHAPEX = "pyasic.miners.elphapex"
+_GOLDSHELL = "pyasic.miners.goldshell"
+_HAMMER = "pyasic.miners.hammer"
+_ICERIVER = "pyasic.miners.iceriver"
+_INNOSILICON = "pyasic.miners.innosilicon"
+_LUCKYMINER = "pyasic.miners.luckyminer"
+_VOLCMINER = "pyasic.miners.volcminer"
+_WHATSMINER = "pyasic.miners.whatsminer"
+_MAKES = "pyasic.miners.device.makes"
+_UNKNOWN_MINER = (_BACKENDS, "UnknownMiner")
+
+# a `(module, class name)` pair, or a function building the class
+MinerClassRef = tuple[str, str] | Callable[[], type]
+
+
+def _unknown(name: str, backend: str, make: str) -> Callable[[], type]:
+    """Reference a class for unknown models of a make, combining a backend and the make."""
+
+    def build() -> type:
+        return type(
+            name, (_load_class((_BACKENDS, backend)), _load_class((_MAKES, make))), {}
+        )
+
+    return build
+
+
+def _load_class(ref: MinerClassRef) -> type:
+    if callable(ref):
+        return ref()
+    module, name = ref
+    return getattr(importlib.import_module(module), name)
+
+
+class MinerClasses(Mapping[str | None, type]):
+    """The miner classes of a `MinerTypes`, by model.
+
+    Classes are stored as references, and imported on first lookup, so only the
+    models that are actually found are imported.
+
+    Parameters:
+        classes: A reference to the class of each model.
+    """
+
+    def __init__(self, classes: dict[str | None, MinerClassRef]) -> None:
+        self._refs = classes
+        self._classes: dict[str | None, type] = {}
+
+    def __getitem__(self, model: str | None) -> type:
+        cls = self._classes.get(model)
+        if cls is None:
+            cls = self._classes[model] = _load_class(self._refs[model])
+        return cls
+
+    def __iter__(self) -> Iterator[str | None]:
+        return iter(self._refs)
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __contains__(self, model: object) -> bool:
+        return model in self._refs
+
+
+_MINER_CLASSES: dict[MinerTypes, dict[str | None, MinerClassRef]] = {
     MinerTypes.ANTMINER: {
-        None: type("AntminerUnknown", (BMMiner, AntMinerMake), {}),
-        "ANTMINER D3": CGMinerD3,
-        "ANTMINER HS3": BMMinerHS3,
-        "ANTMINER L3+": BMMinerL3Plus,
-        "ANTMINER KA3": BMMinerKA3,
-        "ANTMINER KS3": BMMinerKS3,
-        "ANTMINER DR5": CGMinerDR5,
-        "ANTMINER KS5": BMMinerKS5,
-        "ANTMINER KS5 PRO": BMMinerKS5Pro,
-        "ANTMINER L7": BMMinerL7,
-        "ANTMINER L7_I": BMMinerL7,
-        "ANTMINER K7": BMMinerK7,
-        "ANTMINER D7": BMMinerD7,
-        "ANTMINER E9 PRO": BMMinerE9Pro,
-        "ANTMINER D9": BMMinerD9,
-        "ANTMINER S9": BMMinerS9,
-        "ANTMINER S9I": BMMinerS9i,
-        "ANTMINER S9J": BMMinerS9j,
-        "ANTMINER T9": BMMinerT9,
-        "ANTMINER L9": BMMinerL9,
-        "ANTMINER L9_I": BMMinerL9,
-        "ANTMINER Z15": CGMinerZ15,
-        "ANTMINER Z15 PRO": BMMinerZ15Pro,
-        "ANTMINER S17": BMMinerS17,
-        "ANTMINER S17+": BMMinerS17Plus,
-        "ANTMINER S17 PRO": BMMinerS17Pro,
-        "ANTMINER S17E": BMMinerS17e,
-        "ANTMINER T17": BMMinerT17,
-        "ANTMINER T17+": BMMinerT17Plus,
-        "ANTMINER T17E": BMMinerT17e,
-        "ANTMINER S19": BMMinerS19,
-        "ANTMINER S19L": BMMinerS19L,
-        "ANTMINER S19 PRO": BMMinerS19Pro,
-        "ANTMINER S19J": BMMinerS19j,
-        "ANTMINER S19I": BMMinerS19i,
-        "ANTMINER S19+": BMMinerS19Plus,
-        "ANTMINER S19J88NOPIC": BMMinerS19jNoPIC,
-        "ANTMINER S19PRO+": BMMinerS19ProPlus,
-        "ANTMINER S19J PRO": BMMinerS19jPro,
-        "ANTMINER S19J+": BMMinerS19jPlus,
-        "ANTMINER S19J PRO+": BMMinerS19jProPlus,
-        "BHB42XXXX": BMMinerS19jProPlus,
-        "ANTMINER S19 XP": BMMinerS19XP,
-        "ANTMINER S19A": BMMinerS19a,
-        "ANTMINER S19A PRO": BMMinerS19aPro,
-        "ANTMINER S19 HYDRO": BMMinerS19Hydro,
-        "ANTMINER S19 PRO HYD.": BMMinerS19ProHydro,
-        "ANTMINER S19 PRO+ HYD.": BMMinerS19ProPlusHydro,
-        "ANTMINER S19K PRO": BMMinerS19KPro,
-        "ANTMINER S19J XP": BMMinerS19jXP,
-        "ANTMINER T19": BMMinerT19,
-        "ANTMINER S21": BMMinerS21,
-        "ANTMINER BHB68601": BMMinerS21,  # ???
-        "ANTMINER BHB68606": BMMinerS21,  # ???
-        "ANTMINER S21+": BMMinerS21Plus,
-        "ANTMINER S21+ HYD.": BMMinerS21PlusHydro,
-        "ANTMINER S21+ HYD": BMMinerS21PlusHydro,
-        "ANTMINER S21 PRO": BMMinerS21Pro,
-        "ANTMINER T21": BMMinerT21,
-        "ANTMINER S21 HYD.": BMMinerS21Hydro,
-        "ANTMINER S21 XP": BMMinerS21XP,
+        None: _unknown("AntminerUnknown", "BMMiner", "AntMinerMake"),
+        "ANTMINER D3": (_ANTMINER, "CGMinerD3"),
+        "ANTMINER HS3": (_ANTMINER, "BMMinerHS3"),
+        "ANTMINER L3+": (_ANTMINER, "BMMinerL3Plus"),
+        "ANTMINER KA3": (_ANTMINER, "BMMinerKA3"),
+        "ANTMINER KS3": (_ANTMINER, "BMMinerKS3"),
+        "ANTMINER DR5": (_ANTMINER, "CGMinerDR5"),
+        "ANTMINER KS5": (_ANTMINER, "BMMinerKS5"),
+        "ANTMINER KS5 PRO": (_ANTMINER, "BMMinerKS5Pro"),
+        "ANTMINER L7": (_ANTMINER, "BMMinerL7"),
+        "ANTMINER L7_I": (_ANTMINER, "BMMinerL7"),
+        "ANTMINER K7": (_ANTMINER, "BMMinerK7"),
+        "ANTMINER D7": (_ANTMINER, "BMMinerD7"),
+        "ANTMINER E9 PRO": (_ANTMINER, "BMMinerE9Pro"),
+        "ANTMINER D9": (_ANTMINER, "BMMinerD9"),
+        "ANTMINER S9": (_ANTMINER, "BMMinerS9"),
+        "ANTMINER S9I": (_ANTMINER, "BMMinerS9i"),
+        "ANTMINER S9J": (_ANTMINER, "BMMinerS9j"),
+        "ANTMINER T9": (_ANTMINER, "BMMinerT9"),
+        "ANTMINER L9": (_ANTMINER, "BMMinerL9"),
+        "ANTMINER L9_I": (_ANTMINER, "BMMinerL9"),
+        "ANTMINER Z15": (_ANTMINER, "CGMinerZ15"),
+        "ANTMINER Z15 PRO": (_ANTMINER, "BMMinerZ15Pro"),
+        "ANTMINER S17": (_ANTMINER, "BMMinerS17"),
+        "ANTMINER S17+": (_ANTMINER, "BMMinerS17Plus"),
+        "ANTMINER S17 PRO": (_ANTMINER, "BMMinerS17Pro"),
+        "ANTMINER S17E": (_ANTMINER, "BMMinerS17e"),
+        "ANTMINER T17": (_ANTMINER, "BMMinerT17"),
+        "ANTMINER T17+": (_ANTMINER, "BMMinerT17Plus"),
+        "ANTMINER T17E": (_ANTMINER, "BMMinerT17e"),
+        "ANTMINER S19": (_ANTMINER, "BMMinerS19"),
+        "ANTMINER S19L": (_ANTMINER, "BMMinerS19L"),
+        "ANTMINER S19 PRO": (_ANTMINER, "BMMinerS19Pro"),
+        "ANTMINER S19J": (_ANTMINER, "BMMinerS19j"),
+        "ANTMINER S19I": (_ANTMINER, "BMMinerS19i"),
+        "ANTMINER S19+": (_ANTMINER, "BMMinerS19Plus"),
+        "ANTMINER S19J88NOPIC": (_ANTMINER, "BMMinerS19jNoPIC"),
+        "ANTMINER S19PRO+": (_ANTMINER, "BMMinerS19ProPlus"),
+        "ANTMINER S19J PRO": (_ANTMINER, "BMMinerS19jPro"),
+        "ANTMINER S19J+": (_ANTMINER, "BMMinerS19jPlus"),
+        "ANTMINER S19J PRO+": (_ANTMINER, "BMMinerS19jProPlus"),
+        "BHB42XXXX": (_ANTMINER, "BMMinerS19jProPlus"),
+        "ANTMINER S19 XP": (_ANTMINER, "BMMinerS19XP"),
+        "ANTMINER S19A": (_ANTMINER, "BMMinerS19a"),
+        "ANTMINER S19A PRO": (_ANTMINER, "BMMinerS19aPro"),
+        "ANTMINER S19 HYDRO": (_ANTMINER, "BMMinerS19Hydro"),
+        "ANTMINER S19 PRO HYD.": (_ANTMINER, "BMMinerS19ProHydro"),
+        "ANTMINER S19 PRO+ HYD.": (_ANTMINER, "BMMinerS19ProPlusHydro"),
+        "ANTMINER S19K PRO": (_ANTMINER, "BMMinerS19KPro"),
+        "ANTMINER S19J XP": (_ANTMINER, "BMMinerS19jXP"),
+        "ANTMINER T19": (_ANTMINER, "BMMinerT19"),
+        "ANTMINER S21": (_ANTMINER, "BMMinerS21"),
+        "ANTMINER BHB68601": (_ANTMINER, "BMMinerS21"),  # ???
+        "ANTMINER BHB68606": (_ANTMINER, "BMMinerS21"),  # ???
+        "ANTMINER S21+": (_ANTMINER, "BMMinerS21Plus"),
+        "ANTMINER S21+ HYD.": (_ANTMINER, "BMMinerS21PlusHydro"),
+        "ANTMINER S21+ HYD": (_ANTMINER, "BMMinerS21PlusHydro"),
+        "ANTMINER S21 PRO": (_ANTMINER, "BMMinerS21Pro"),
+        "ANTMINER T21": (_ANTMINER, "BMMinerT21"),
+        "ANTMINER S21 HYD.": (_ANTMINER, "BMMinerS21Hydro"),
+        "ANTMINER S21 XP": (_ANTMINER, "BMMinerS21XP"),
     },
     MinerTypes.WHATSMINER: {
-        None: type("WhatsminerUnknown", (BTMiner, WhatsMinerMake), {}),
-        "M20PV10": BTMinerM20PV10,
-        "M20PV30": BTMinerM20PV30,
-        "M20S+V30": BTMinerM20SPlusV30,
-        "M20SV10": BTMinerM20SV10,
-        "M20SV20": BTMinerM20SV20,
-        "M20SV30": BTMinerM20SV30,
-        "M20V10": BTMinerM20V10,
-        "M21S+V20": BTMinerM21SPlusV20,
-        "M21SV20": BTMinerM21SV20,
-        "M21SV60": BTMinerM21SV60,
-        "M21SV70": BTMinerM21SV70,
-        "M21V10": BTMinerM21V10,
-        "M29V10": BTMinerM29V10,
-        "M30KV10": BTMinerM30KV10,
-        "M30LV10": BTMinerM30LV10,
-        "M30S++V10": BTMinerM30SPlusPlusV10,
-        "M30S++V20": BTMinerM30SPlusPlusV20,
-        "M30S++VE30": BTMinerM30SPlusPlusVE30,
-        "M30S++VE40": BTMinerM30SPlusPlusVE40,
-        "M30S++VE50": BTMinerM30SPlusPlusVE50,
-        "M30S++VF40": BTMinerM30SPlusPlusVF40,
-        "M30S++VG30": BTMinerM30SPlusPlusVG30,
-        "M30S++VG40": BTMinerM30SPlusPlusVG40,
-        "M30S++VG50": BTMinerM30SPlusPlusVG50,
-        "M30S++VH10": BTMinerM30SPlusPlusVH10,
-        "M30S++VH100": BTMinerM30SPlusPlusVH100,
-        "M30S++VH110": BTMinerM30SPlusPlusVH110,
-        "M30S++VH20": BTMinerM30SPlusPlusVH20,
-        "M30S++VH30": BTMinerM30SPlusPlusVH30,
-        "M30S++VH40": BTMinerM30SPlusPlusVH40,
-        "M30S++VH50": BTMinerM30SPlusPlusVH50,
-        "M30S++VH60": BTMinerM30SPlusPlusVH60,
-        "M30S++VH70": BTMinerM30SPlusPlusVH70,
-        "M30S++VH80": BTMinerM30SPlusPlusVH80,
-        "M30S++VH90": BTMinerM30SPlusPlusVH90,
-        "M30S++VI30": BTMinerM30SPlusPlusVI30,
-        "M30S++VJ20": BTMinerM30SPlusPlusVJ20,
-        "M30S++VJ30": BTMinerM30SPlusPlusVJ30,
-        "M30S++VJ50": BTMinerM30SPlusPlusVJ50,
-        "M30S++VJ60": BTMinerM30SPlusPlusVJ60,
-        "M30S++VJ70": BTMinerM30SPlusPlusVJ70,
-        "M30S++VK30": BTMinerM30SPlusPlusVK30,
-        "M30S++VK40": BTMinerM30SPlusPlusVK40,
-        "M30S+V10": BTMinerM30SPlusV10,
-        "M30S+V100": BTMinerM30SPlusV100,
-        "M30S+V20": BTMinerM30SPlusV20,
-        "M30S+V30": BTMinerM30SPlusV30,
-        "M30S+V40": BTMinerM30SPlusV40,
-        "M30S+V50": BTMinerM30SPlusV50,
-        "M30S+V60": BTMinerM30SPlusV60,
-        "M30S+V70": BTMinerM30SPlusV70,
-        "M30S+V80": BTMinerM30SPlusV80,
-        "M30S+V90": BTMinerM30SPlusV90,
-        "M30S+VE100": BTMinerM30SPlusVE100,
-        "M30S+VE30": BTMinerM30SPlusVE30,
-        "M30S+VE40": BTMinerM30SPlusVE40,
-        "M30S+VE50": BTMinerM30SPlusVE50,
-        "M30S+VE60": BTMinerM30SPlusVE60,
-        "M30S+VE70": BTMinerM30SPlusVE70,
-        "M30S+VE80": BTMinerM30SPlusVE80,
-        "M30S+VE90": BTMinerM30SPlusVE90,
-        "M30S+VF20": BTMinerM30SPlusVF20,
-        "M30S+VF30": BTMinerM30SPlusVF30,
-        "M30S+VG20": BTMinerM30SPlusVG20,
-        "M30S+VG30": BTMinerM30SPlusVG30,
-        "M30S+VG40": BTMinerM30SPlusVG40,
-        "M30S+VG50": BTMinerM30SPlusVG50,
-        "M30S+VG60": BTMinerM30SPlusVG60,
-        "M30S+VH10": BTMinerM30SPlusVH10,
-        "M30S+VH20": BTMinerM30SPlusVH20,
-        "M30S+VH30": BTMinerM30SPlusVH30,
-        "M30S+VH40": BTMinerM30SPlusVH40,
-        "M30S+VH50": BTMinerM30SPlusVH50,
-        "M30S+VH60": BTMinerM30SPlusVH60,
-        "M30S+VH70": BTMinerM30SPlusVH70,
-        "M30S+VI30": BTMinerM30SPlusVI30,
-        "M30S+VJ30": BTMinerM30SPlusVJ30,
-        "M30S+VJ40": BTMinerM30SPlusVJ40,
-        "M30SV10": BTMinerM30SV10,
-        "M30SV20": BTMinerM30SV20,
-        "M30SV30": BTMinerM30SV30,
-        "M30SV40": BTMinerM30SV40,
-        "M30SV50": BTMinerM30SV50,
-        "M30SV60": BTMinerM30SV60,
-        "M30SV70": BTMinerM30SV70,
-        "M30SV80": BTMinerM30SV80,
-        "M30SVE10": BTMinerM30SVE10,
-        "M30SVE20": BTMinerM30SVE20,
-        "M30SVE30": BTMinerM30SVE30,
-        "M30SVE40": BTMinerM30SVE40,
-        "M30SVE50": BTMinerM30SVE50,
-        "M30SVE60": BTMinerM30SVE60,
-        "M30SVE70": BTMinerM30SVE70,
-        "M30SVF10": BTMinerM30SVF10,
-        "M30SVF20": BTMinerM30SVF20,
-        "M30SVF30": BTMinerM30SVF30,
-        "M30SVG10": BTMinerM30SVG10,
-        "M30SVG20": BTMinerM30SVG20,
-        "M30SVG30": BTMinerM30SVG30,
-        "M30SVG40": BTMinerM30SVG40,
-        "M30SVH10": BTMinerM30SVH10,
-        "M30SVH20": BTMinerM30SVH20,
-        "M30SVH30": BTMinerM30SVH30,
-        "M30SVH40": BTMinerM30SVH40,
-        "M30SVH50": BTMinerM30SVH50,
-        "M30SVH60": BTMinerM30SVH60,
-        "M30SVI20": BTMinerM30SVI20,
-        "M30SVJ30": BTMinerM30SVJ30,
-        "M30V10": BTMinerM30V10,
-        "M30V20": BTMinerM30V20,
-        "M31HV10": BTMinerM31HV10,
-        "M31HV40": BTMinerM31HV40,
-        "M31LV10": BTMinerM31LV10,
-        "M31S+V10": BTMinerM31SPlusV10,
-        "M31S+V100": BTMinerM31SPlusV100,
-        "M31S+V20": BTMinerM31SPlusV20,
-        "M31S+V30": BTMinerM31SPlusV30,
-        "M31S+V40": BTMinerM31SPlusV40,
-        "M31S+V50": BTMinerM31SPlusV50,
-        "M31S+V60": BTMinerM31SPlusV60,
-        "M31S+V80": BTMinerM31SPlusV80,
-        "M31S+V90": BTMinerM31SPlusV90,
-        "M31S+VE10": BTMinerM31SPlusVE10,
-        "M31S+VE20": BTMinerM31SPlusVE20,
-        "M31S+VE30": BTMinerM31SPlusVE30,
-        "M31S+VE40": BTMinerM31SPlusVE40,
-        "M31S+VE50": BTMinerM31SPlusVE50,
-        "M31S+VE60": BTMinerM31SPlusVE60,
-        "M31S+VE80": BTMinerM31SPlusVE80,
-        "M31S+VF20": BTMinerM31SPlusVF20,
-        "M31S+VF30": BTMinerM31SPlusVF30,
-        "M31S+VG20": BTMinerM31SPlusVG20,
-        "M31S+VG30": BTMinerM31SPlusVG30,
-        "M31SEV10": BTMinerM31SEV10,
-        "M31SEV20": BTMinerM31SEV20,
-        "M31SEV30": BTMinerM31SEV30,
-        "M31SV10": BTMinerM31SV10,
-        "M31SV20": BTMinerM31SV20,
-        "M31SV30": BTMinerM31SV30,
-        "M31SV40": BTMinerM31SV40,
-        "M31SV50": BTMinerM31SV50,
-        "M31SV60": BTMinerM31SV60,
-        "M31SV70": BTMinerM31SV70,
-        "M31SV80": BTMinerM31SV80,
-        "M31SV90": BTMinerM31SV90,
-        "M31SVE10": BTMinerM31SVE10,
-        "M31SVE20": BTMinerM31SVE20,
-        "M31SVE30": BTMinerM31SVE30,
-        "M31V10": BTMinerM31V10,
-        "M31V20": BTMinerM31V20,
-        "M32V10": BTMinerM32V10,
-        "M32V20": BTMinerM32V20,
-        "M33S++VG40": BTMinerM33SPlusPlusVG40,
-        "M33S++VH20": BTMinerM33SPlusPlusVH20,
-        "M33S++VH30": BTMinerM33SPlusPlusVH30,
-        "M33S+VG20": BTMinerM33SPlusVG20,
-        "M33S+VG30": BTMinerM33SPlusVG30,
-        "M33S+VH20": BTMinerM33SPlusVH20,
-        "M33S+VH30": BTMinerM33SPlusVH30,
-        "M33SVG30": BTMinerM33SVG30,
-        "M33V10": BTMinerM33V10,
-        "M33V20": BTMinerM33V20,
-        "M33V30": BTMinerM33V30,
-        "M34S+VE10": BTMinerM34SPlusVE10,
-        "M36S++VH30": BTMinerM36SPlusPlusVH30,
-        "M36S+VG30": BTMinerM36SPlusVG30,
-        "M36SVE10": BTMinerM36SVE10,
-        "M39V10": BTMinerM39V10,
-        "M39V20": BTMinerM39V20,
-        "M39V30": BTMinerM39V30,
-        "M50S++VK10": BTMinerM50SPlusPlusVK10,
-        "M50S++VK20": BTMinerM50SPlusPlusVK20,
-        "M50S++VK30": BTMinerM50SPlusPlusVK30,
-        "M50S++VK40": BTMinerM50SPlusPlusVK40,
-        "M50S++VK50": BTMinerM50SPlusPlusVK50,
-        "M50S++VK60": BTMinerM50SPlusPlusVK60,
-        "M50S++VL20": BTMinerM50SPlusPlusVL20,
-        "M50S++VL30": BTMinerM50SPlusPlusVL30,
-        "M50S++VL40": BTMinerM50SPlusPlusVL40,
-        "M50S++VL50": BTMinerM50SPlusPlusVL50,
-        "M50S++VL60": BTMinerM50SPlusPlusVL60,
-        "M50S+VH30": BTMinerM50SPlusVH30,
-        "M50S+VH40": BTMinerM50SPlusVH40,
-        "M50S+VJ30": BTMinerM50SPlusVJ30,
-        "M50S+VJ40": BTMinerM50SPlusVJ40,
-        "M50S+VJ60": BTMinerM50SPlusVJ60,
-        "M50S+VK10": BTMinerM50SPlusVK10,
-        "M50S+VK20": BTMinerM50SPlusVK20,
-        "M50S+VK30": BTMinerM50SPlusVK30,
-        "M50S+VL10": BTMinerM50SPlusVL10,
-        "M50S+VL20": BTMinerM50SPlusVL20,
-        "M50S+VL30": BTMinerM50SPlusVL30,
-        "M50SVH10": BTMinerM50SVH10,
-        "M50SVH20": BTMinerM50SVH20,
-        "M50SVH30": BTMinerM50SVH30,
-        "M50SVH40": BTMinerM50SVH40,
-        "M50SVH50": BTMinerM50SVH50,
-        "M50SVJ10": BTMinerM50SVJ10,
-        "M50SVJ20": BTMinerM50SVJ20,
-        "M50SVJ30": BTMinerM50SVJ30,
-        "M50SVJ40": BTMinerM50SVJ40,
-        "M50SVJ50": BTMinerM50SVJ50,
-        "M50SVK10": BTMinerM50SVK10,
-        "M50SVK20": BTMinerM50SVK20,
-        "M50SVK30": BTMinerM50SVK30,
-        "M50SVK50": BTMinerM50SVK50,
-        "M50SVK60": BTMinerM50SVK60,
-        "M50SVK70": BTMinerM50SVK70,
-        "M50SVK80": BTMinerM50SVK80,
-        "M50SVL20": BTMinerM50SVL20,
-        "M50SVL30": BTMinerM50SVL30,
-        "M50VE30": BTMinerM50VE30,
-        "M50VG30": BTMinerM50VG30,
-        "M50VH10": BTMinerM50VH10,
-        "M50VH20": BTMinerM50VH20,
-        "M50VH30": BTMinerM50VH30,
-        "M50VH40": BTMinerM50VH40,
-        "M50VH50": BTMinerM50VH50,
-        "M50VH60": BTMinerM50VH60,
-        "M50VH70": BTMinerM50VH70,
-        "M50VH80": BTMinerM50VH80,
-        "M50VH90": BTMinerM50VH90,
-        "M50VJ10": BTMinerM50VJ10,
-        "M50VJ20": BTMinerM50VJ20,
-        "M50VJ30": BTMinerM50VJ30,
-        "M50VJ40": BTMinerM50VJ40,
-        "M50VJ60": BTMinerM50VJ60,
-        "M50VK40": BTMinerM50VK40,
-        "M50VK50": BTMinerM50VK50,
-        "M52S++VL10": BTMinerM52SPlusPlusVL10,
-        "M52SVK30": BTMinerM52SVK30,
-        "M53HVH10": BTMinerM53HVH10,
-        "M53S++VK10": BTMinerM53SPlusPlusVK10,
-        "M53S++VK20": BTMinerM53SPlusPlusVK20,
-        "M53S++VK30": BTMinerM53SPlusPlusVK30,
-        "M53S++VK50": BTMinerM53SPlusPlusVK50,
-        "M53S++VL10": BTMinerM53SPlusPlusVL10,
-        "M53S++VL30": BTMinerM53SPlusPlusVL30,
-        "M53S+VJ30": BTMinerM53SPlusVJ30,
-        "M53S+VJ40": BTMinerM53SPlusVJ40,
-        "M53S+VJ50": BTMinerM53SPlusVJ50,
-        "M53S+VK30": BTMinerM53SPlusVK30,
-        "M53SVH20": BTMinerM53SVH20,
-        "M53SVH30": BTMinerM53SVH30,
-        "M53SVJ30": BTMinerM53SVJ30,
-        "M53SVJ40": BTMinerM53SVJ40,
-        "M53SVK30": BTMinerM53SVK30,
-        "M53VH30": BTMinerM53VH30,
-        "M53VH40": BTMinerM53VH40,
-        "M53VH50": BTMinerM53VH50,
-        "M53VK30": BTMinerM53VK30,
-        "M53VK60": BTMinerM53VK60,
-        "M54S++VK30": BTMinerM54SPlusPlusVK30,
-        "M54S++VL30": BTMinerM54SPlusPlusVL30,
-        "M54S++VL40": BTMinerM54SPlusPlusVL40,
-        "M56S++VK10": BTMinerM56SPlusPlusVK10,
-        "M56S++VK30": BTMinerM56SPlusPlusVK30,
-        "M56S++VK40": BTMinerM56SPlusPlusVK40,
-        "M56S++VK50": BTMinerM56SPlusPlusVK50,
-        "M56S+VJ30": BTMinerM56SPlusVJ30,
-        "M56S+VK30": BTMinerM56SPlusVK30,
-        "M56S+VK40": BTMinerM56SPlusVK40,
-        "M56S+VK50": BTMinerM56SPlusVK50,
-        "M56SVH30": BTMinerM56SVH30,
-        "M56SVJ30": BTMinerM56SVJ30,
-        "M56SVJ40": BTMinerM56SVJ40,
-        "M56VH30": BTMinerM56VH30,
-        "M59VH30": BTMinerM59VH30,
-        "M60S++VL30": BTMinerM60SPlusPlusVL30,
-        "M60S++VL40": BTMinerM60SPlusPlusVL40,
-        "M60S+VK30": BTMinerM60SPlusVK30,
-        "M60S+VK40": BTMinerM60SPlusVK40,
-        "M60S+VK50": BTMinerM60SPlusVK50,
-        "M60S+VK60": BTMinerM60SPlusVK60,
-        "M60S+VK70": BTMinerM60SPlusVK70,
-        "M60S+VL10": BTMinerM60SPlusVL10,
-        "M60S+VL30": BTMinerM60SPlusVL30,
-        "M60S+VL40": BTMinerM60SPlusVL40,
-        "M60S+VL50": BTMinerM60SPlusVL50,
-        "M60S+VL60": BTMinerM60SPlusVL60,
-        "M60SVK10": BTMinerM60SVK10,
-        "M60SVK20": BTMinerM60SVK20,
-        "M60SVK30": BTMinerM60SVK30,
-        "M60SVK40": BTMinerM60SVK40,
-        "M60SVL10": BTMinerM60SVL10,
-        "M60SVL20": BTMinerM60SVL20,
-        "M60SVL30": BTMinerM60SVL30,
-        "M60SVL40": BTMinerM60SVL40,
-        "M60SVL50": BTMinerM60SVL50,
-        "M60SVL60": BTMinerM60SVL60,
-        "M60SVL70": BTMinerM60SVL70,
-        "M60VK10": BTMinerM60VK10,
-        "M60VK20": BTMinerM60VK20,
-        "M60VK30": BTMinerM60VK30,
-        "M60VK40": BTMinerM60VK40,
-        "M60VK6A": BTMinerM60VK6A,
-        "M60VL10": BTMinerM60VL10,
-        "M60VL20": BTMinerM60VL20,
-        "M60VL30": BTMinerM60VL30,
-        "M60VL40": BTMinerM60VL40,
-        "M60VL50": BTMinerM60VL50,
-        "M61S+VL30": BTMinerM61SPlusVL30,
-        "M61SVL10": BTMinerM61SVL10,
-        "M61SVL20": BTMinerM61SVL20,
-        "M61SVL30": BTMinerM61SVL30,
-        "M61VK10": BTMinerM61VK10,
-        "M61VK20": BTMinerM61VK20,
-        "M61VK30": BTMinerM61VK30,
-        "M61VK40": BTMinerM61VK40,
-        "M61VL10": BTMinerM61VL10,
-        "M61VL30": BTMinerM61VL30,
-        "M61VL40": BTMinerM61VL40,
-        "M61VL50": BTMinerM61VL50,
-        "M61VL60": BTMinerM61VL60,
-        "M62S+VK30": BTMinerM62SPlusVK30,
-        "M63S++VL20": BTMinerM63SPlusPlusVL20,
-        "M63S+VK30": BTMinerM63SPlusVK30,
-        "M63S+VL10": BTMinerM63SPlusVL10,
-        "M63S+VL20": BTMinerM63SPlusVL20,
-        "M63S+VL30": BTMinerM63SPlusVL30,
-        "M63S+VL50": BTMinerM63SPlusVL50,
-        "M63SVK10": BTMinerM63SVK10,
-        "M63SVK20": BTMinerM63SVK20,
-        "M63SVK30": BTMinerM63SVK30,
-        "M63SVK60": BTMinerM63SVK60,
-        "M63SVL10": BTMinerM63SVL10,
-        "M63SVL50": BTMinerM63SVL50,
-        "M63SVL60": BTMinerM63SVL60,
-        "M63VK10": BTMinerM63VK10,
-        "M63VK20": BTMinerM63VK20,
-        "M63VK30": BTMinerM63VK30,
-        "M63VL10": BTMinerM63VL10,
-        "M63VL30": BTMinerM63VL30,
-        "M64SVL30": BTMinerM64SVL30,
-        "M64VL30": BTMinerM64VL30,
-        "M64VL40": BTMinerM64VL40,
-        "M65S+VK30": BTMinerM65SPlusVK30,
-        "M65SVK20": BTMinerM65SVK20,
-        "M65SVL60": BTMinerM65SVL60,
-        "M66S++VL20": BTMinerM66SPlusPlusVL20,
-        "M66S+VK30": BTMinerM66SPlusVK30,
-        "M66S+VL10": BTMinerM66SPlusVL10,
-        "M66S+VL20": BTMinerM66SPlusVL20,
-        "M66S+VL30": BTMinerM66SPlusVL30,
-        "M66S+VL40": BTMinerM66SPlusVL40,
-        "M66S+VL60": BTMinerM66SPlusVL60,
-        "M66SVK20": BTMinerM66SVK20,
-        "M66SVK30": BTMinerM66SVK30,
-        "M66SVK40": BTMinerM66SVK40,
-        "M66SVK50": BTMinerM66SVK50,
-        "M66SVK60": BTMinerM66SVK60,
-        "M66SVL10": BTMinerM66SVL10,
-        "M66SVL20": BTMinerM66SVL20,
-        "M66SVL30": BTMinerM66SVL30,
-        "M66SVL40": BTMinerM66SVL40,
-        "M66SVL50": BTMinerM66SVL50,
-        "M66VK20": BTMinerM66VK20,
-        "M66VK30": BTMinerM66VK30,
-        "M66VL20": BTMinerM66VL20,
-        "M66VL30": BTMinerM66VL30,
-        "M67SVK30": BTMinerM67SVK30,
-        "M70VM30": BTMinerM70VM30,
+        None: _unknown("WhatsminerUnknown", "BTMiner", "WhatsMinerMake"),
+        "M20PV10": (_WHATSMINER, "BTMinerM20PV10"),
+        "M20PV30": (_WHATSMINER, "BTMinerM20PV30"),
+        "M20S+V30": (_WHATSMINER, "BTMinerM20SPlusV30"),
+        "M20SV10": (_WHATSMINER, "BTMinerM20SV10"),
+        "M20SV20": (_WHATSMINER, "BTMinerM20SV20"),
+        "M20SV30": (_WHATSMINER, "BTMinerM20SV30"),
+        "M20V10": (_WHATSMINER, "BTMinerM20V10"),
+        "M21S+V20": (_WHATSMINER, "BTMinerM21SPlusV20"),
+        "M21SV20": (_WHATSMINER, "BTMinerM21SV20"),
+        "M21SV60": (_WHATSMINER, "BTMinerM21SV60"),
+        "M21SV70": (_WHATSMINER, "BTMinerM21SV70"),
+        "M21V10": (_WHATSMINER, "BTMinerM21V10"),
+        "M29V10": (_WHATSMINER, "BTMinerM29V10"),
+        "M30KV10": (_WHATSMINER, "BTMinerM30KV10"),
+        "M30LV10": (_WHATSMINER, "BTMinerM30LV10"),
+        "M30S++V10": (_WHATSMINER, "BTMinerM30SPlusPlusV10"),
+        "M30S++V20": (_WHATSMINER, "BTMinerM30SPlusPlusV20"),
+        "M30S++VE30": (_WHATSMINER, "BTMinerM30SPlusPlusVE30"),
+        "M30S++VE40": (_WHATSMINER, "BTMinerM30SPlusPlusVE40"),
+        "M30S++VE50": (_WHATSMINER, "BTMinerM30SPlusPlusVE50"),
+        "M30S++VF40": (_WHATSMINER, "BTMinerM30SPlusPlusVF40"),
+        "M30S++VG30": (_WHATSMINER, "BTMinerM30SPlusPlusVG30"),
+        "M30S++VG40": (_WHATSMINER, "BTMinerM30SPlusPlusVG40"),
+        "M30S++VG50": (_WHATSMINER, "BTMinerM30SPlusPlusVG50"),
+        "M30S++VH10": (_WHATSMINER, "BTMinerM30SPlusPlusVH10"),
+        "M30S++VH100": (_WHATSMINER, "BTMinerM30SPlusPlusVH100"),
+        "M30S++VH110": (_WHATSMINER, "BTMinerM30SPlusPlusVH110"),
+        "M30S++VH20": (_WHATSMINER, "BTMinerM30SPlusPlusVH20"),
+        "M30S++VH30": (_WHATSMINER, "BTMinerM30SPlusPlusVH30"),
+        "M30S++VH40": (_WHATSMINER, "BTMinerM30SPlusPlusVH40"),
+        "M30S++VH50": (_WHATSMINER, "BTMinerM30SPlusPlusVH50"),
+        "M30S++VH60": (_WHATSMINER, "BTMinerM30SPlusPlusVH60"),
+        "M30S++VH70": (_WHATSMINER, "BTMinerM30SPlusPlusVH70"),
+        "M30S++VH80": (_WHATSMINER, "BTMinerM30SPlusPlusVH80"),
+        "M30S++VH90": (_WHATSMINER, "BTMinerM30SPlusPlusVH90"),
+        "M30S++VI30": (_WHATSMINER, "BTMinerM30SPlusPlusVI30"),
+        "M30S++VJ20": (_WHATSMINER, "BTMinerM30SPlusPlusVJ20"),
+        "M30S++VJ30": (_WHATSMINER, "BTMinerM30SPlusPlusVJ30"),
+        "M30S++VJ50": (_WHATSMINER, "BTMinerM30SPlusPlusVJ50"),
+        "M30S++VJ60": (_WHATSMINER, "BTMinerM30SPlusPlusVJ60"),
+        "M30S++VJ70": (_WHATSMINER, "BTMinerM30SPlusPlusVJ70"),
+        "M30S++VK30": (_WHATSMINER, "BTMinerM30SPlusPlusVK30"),
+        "M30S++VK40": (_WHATSMINER, "BTMinerM30SPlusPlusVK40"),
+        "M30S+V10": (_WHATSMINER, "BTMinerM30SPlusV10"),
+        "M30S+V100": (_WHATSMINER, "BTMinerM30SPlusV100"),
+        "M30S+V20": (_WHATSMINER, "BTMinerM30SPlusV20"),
+        "M30S+V30": (_WHATSMINER, "BTMinerM30SPlusV30"),
+        "M30S+V40": (_WHATSMINER, "BTMinerM30SPlusV40"),
+        "M30S+V50": (_WHATSMINER, "BTMinerM30SPlusV50"),
+        "M30S+V60": (_WHATSMINER, "BTMinerM30SPlusV60"),
+        "M30S+V70": (_WHATSMINER, "BTMinerM30SPlusV70"),
+        "M30S+V80": (_WHATSMINER, "BTMinerM30SPlusV80"),
+        "M30S+V90": (_WHATSMINER, "BTMinerM30SPlusV90"),
+        "M30S+VE100": (_WHATSMINER, "BTMinerM30SPlusVE100"),
+        "M30S+VE30": (_WHATSMINER, "BTMinerM30SPlusVE30"),
+        "M30S+VE40": (_WHATSMINER, "BTMinerM30SPlusVE40"),
+        "M30S+VE50": (_WHATSMINER, "BTMinerM30SPlusVE50"),
+        "M30S+VE60": (_WHATSMINER, "BTMinerM30SPlusVE60"),
+        "M30S+VE70": (_WHATSMINER, "BTMinerM30SPlusVE70"),
+        "M30S+VE80": (_WHATSMINER, "BTMinerM30SPlusVE80"),
+        "M30S+VE90": (_WHATSMINER, "BTMinerM30SPlusVE90"),
+        "M30S+VF20": (_WHATSMINER, "BTMinerM30SPlusVF20"),
+        "M30S+VF30": (_WHATSMINER, "BTMinerM30SPlusVF30"),
+        "M30S+VG20": (_WHATSMINER, "BTMinerM30SPlusVG20"),
+        "M30S+VG30": (_WHATSMINER, "BTMinerM30SPlusVG30"),
+        "M30S+VG40": (_WHATSMINER, "BTMinerM30SPlusVG40"),
+        "M30S+VG50": (_WHATSMINER, "BTMinerM30SPlusVG50"),
+        "M30S+VG60": (_WHATSMINER, "BTMinerM30SPlusVG60"),
+        "M30S+VH10": (_WHATSMINER, "BTMinerM30SPlusVH10"),
+        "M30S+VH20": (_WHATSMINER, "BTMinerM30SPlusVH20"),
+        "M30S+VH30": (_WHATSMINER, "BTMinerM30SPlusVH30"),
+        "M30S+VH40": (_WHATSMINER, "BTMinerM30SPlusVH40"),
+        "M30S+VH50": (_WHATSMINER, "BTMinerM30SPlusVH50"),
+        "M30S+VH60": (_WHATSMINER, "BTMinerM30SPlusVH60"),
+        "M30S+VH70": (_WHATSMINER, "BTMinerM30SPlusVH70"),
+        "M30S+VI30": (_WHATSMINER, "BTMinerM30SPlusVI30"),
+        "M30S+VJ30": (_WHATSMINER, "BTMinerM30SPlusVJ30"),
+        "M30S+VJ40": (_WHATSMINER, "BTMinerM30SPlusVJ40"),
+        "M30SV10": (_WHATSMINER, "BTMinerM30SV10"),
+        "M30SV20": (_WHATSMINER, "BTMinerM30SV20"),
+        "M30SV30": (_WHATSMINER, "BTMinerM30SV30"),
+        "M30SV40": (_WHATSMINER, "BTMinerM30SV40"),
+        "M30SV50": (_WHATSMINER, "BTMinerM30SV50"),
+        "M30SV60": (_WHATSMINER, "BTMinerM30SV60"),
+        "M30SV70": (_WHATSMINER, "BTMinerM30SV70"),
+        "M30SV80": (_WHATSMINER, "BTMinerM30SV80"),
+        "M30SVE10": (_WHATSMINER, "BTMinerM30SVE10"),
+        "M30SVE20": (_WHATSMINER, "BTMinerM30SVE20"),
+        "M30SVE30": (_WHATSMINER, "BTMinerM30SVE30"),
+        "M30SVE40": (_WHATSMINER, "BTMinerM30SVE40"),
+        "M30SVE50": (_WHATSMINER, "BTMinerM30SVE50"),
+        "M30SVE60": (_WHATSMINER, "BTMinerM30SVE60"),
+        "M30SVE70": (_WHATSMINER, "BTMinerM30SVE70"),
+        "M30SVF10": (_WHATSMINER, "BTMinerM30SVF10"),
+        "M30SVF20": (_WHATSMINER, "BTMinerM30SVF20"),
+        "M30SVF30": (_WHATSMINER, "BTMinerM30SVF30"),
+        "M30SVG10": (_WHATSMINER, "BTMinerM30SVG10"),
+        "M30SVG20": (_WHATSMINER, "BTMinerM30SVG20"),
+        "M30SVG30": (_WHATSMINER, "BTMinerM30SVG30"),
+        "M30SVG40": (_WHATSMINER, "BTMinerM30SVG40"),
+        "M30SVH10": (_WHATSMINER, "BTMinerM30SVH10"),
+        "M30SVH20": (_WHATSMINER, "BTMinerM30SVH20"),
+        "M30SVH30": (_WHATSMINER, "BTMinerM30SVH30"),
+        "M30SVH40": (_WHATSMINER, "BTMinerM30SVH40"),
+        "M30SVH50": (_WHATSMINER, "BTMinerM30SVH50"),
+        "M30SVH60": (_WHATSMINER, "BTMinerM30SVH60"),
+        "M30SVI20": (_WHATSMINER, "BTMinerM30SVI20"),
+        "M30SVJ30": (_WHATSMINER, "BTMinerM30SVJ30"),
+        "M30V10": (_WHATSMINER, "BTMinerM30V10"),
+        "M30V20": (_WHATSMINER, "BTMinerM30V20"),
+        "M31HV10": (_WHATSMINER, "BTMinerM31HV10"),
+        "M31HV40": (_WHATSMINER, "BTMinerM31HV40"),
+        "M31LV10": (_WHATSMINER, "BTMinerM31LV10"),
+        "M31S+V10": (_WHATSMINER, "BTMinerM31SPlusV10"),
+        "M31S+V100": (_WHATSMINER, "BTMinerM31SPlusV100"),
+        "M31S+V20": (_WHATSMINER, "BTMinerM31SPlusV20"),
+        "M31S+V30": (_WHATSMINER, "BTMinerM31SPlusV30"),
+        "M31S+V40": (_WHATSMINER, "BTMinerM31SPlusV40"),
+        "M31S+V50": (_WHATSMINER, "BTMinerM31SPlusV50"),
+        "M31S+V60": (_WHATSMINER, "BTMinerM31SPlusV60"),
+        "M31S+V80": (_WHATSMINER, "BTMinerM31SPlusV80"),
+        "M31S+V90": (_WHATSMINER, "BTMinerM31SPlusV90"),
+        "M31S+VE10": (_WHATSMINER, "BTMinerM31SPlusVE10"),
+        "M31S+VE20": (_WHATSMINER, "BTMinerM31SPlusVE20"),
+        "M31S+VE30": (_WHATSMINER, "BTMinerM31SPlusVE30"),
+        "M31S+VE40": (_WHATSMINER, "BTMinerM31SPlusVE40"),
+        "M31S+VE50": (_WHATSMINER, "BTMinerM31SPlusVE50"),
+        "M31S+VE60": (_WHATSMINER, "BTMinerM31SPlusVE60"),
+        "M31S+VE80": (_WHATSMINER, "BTMinerM31SPlusVE80"),
+        "M31S+VF20": (_WHATSMINER, "BTMinerM31SPlusVF20"),
+        "M31S+VF30": (_WHATSMINER, "BTMinerM31SPlusVF30"),
+        "M31S+VG20": (_WHATSMINER, "BTMinerM31SPlusVG20"),
+        "M31S+VG30": (_WHATSMINER, "BTMinerM31SPlusVG30"),
+        "M31SEV10": (_WHATSMINER, "BTMinerM31SEV10"),
+        "M31SEV20": (_WHATSMINER, "BTMinerM31SEV20"),
+        "M31SEV30": (_WHATSMINER, "BTMinerM31SEV30"),
+        "M31SV10": (_WHATSMINER, "BTMinerM31SV10"),
+        "M31SV20": (_WHATSMINER, "BTMinerM31SV20"),
+        "M31SV30": (_WHATSMINER, "BTMinerM31SV30"),
+        "M31SV40": (_WHATSMINER, "BTMinerM31SV40"),
+        "M31SV50": (_WHATSMINER, "BTMinerM31SV50"),
+        "M31SV60": (_WHATSMINER, "BTMinerM31SV60"),
+        "M31SV70": (_WHATSMINER, "BTMinerM31SV70"),
+        "M31SV80": (_WHATSMINER, "BTMinerM31SV80"),
+        "M31SV90": (_WHATSMINER, "BTMinerM31SV90"),
+        "M31SVE10": (_WHATSMINER, "BTMinerM31SVE10"),
+        "M31SVE20": (_WHATSMINER, "BTMinerM31SVE20"),
+        "M31SVE30": (_WHATSMINER, "BTMinerM31SVE30"),
+        "M31V10": (_WHATSMINER, "BTMinerM31V10"),
+        "M31V20": (_WHATSMINER, "BTMinerM31V20"),
+        "M32V10": (_WHATSMINER, "BTMinerM32V10"),
+        "M32V20": (_WHATSMINER, "BTMinerM32V20"),
+        "M33S++VG40": (_WHATSMINER, "BTMinerM33SPlusPlusVG40"),
+        "M33S++VH20": (_WHATSMINER, "BTMinerM33SPlusPlusVH20"),
+        "M33S++VH30": (_WHATSMINER, "BTMinerM33SPlusPlusVH30"),
+        "M33S+VG20": (_WHATSMINER, "BTMinerM33SPlusVG20"),
+        "M33S+VG30": (_WHATSMINER, "BTMinerM33SPlusVG30"),
+        "M33S+VH20": (_WHATSMINER, "BTMinerM33SPlusVH20"),
+        "M33S+VH30": (_WHATSMINER, "BTMinerM33SPlusVH30"),
+        "M33SVG30": (_WHATSMINER, "BTMinerM33SVG30"),
+        "M33V10": (_WHATSMINER, "BTMinerM33V10"),
+        "M33V20": (_WHATSMINER, "BTMinerM33V20"),
+        "M33V30": (_WHATSMINER, "BTMinerM33V30"),
+        "M34S+VE10": (_WHATSMINER, "BTMinerM34SPlusVE10"),
+        "M36S++VH30": (_WHATSMINER, "BTMinerM36SPlusPlusVH30"),
+        "M36S+VG30": (_WHATSMINER, "BTMinerM36SPlusVG30"),
+        "M36SVE10": (_WHATSMINER, "BTMinerM36SVE10"),
+        "M39V10": (_WHATSMINER, "BTMinerM39V10"),
+        "M39V20": (_WHATSMINER, "BTMinerM39V20"),
+        "M39V30": (_WHATSMINER, "BTMinerM39V30"),
+        "M50S++VK10": (_WHATSMINER, "BTMinerM50SPlusPlusVK10"),
+        "M50S++VK20": (_WHATSMINER, "BTMinerM50SPlusPlusVK20"),
+        "M50S++VK30": (_WHATSMINER, "BTMinerM50SPlusPlusVK30"),
+        "M50S++VK40": (_WHATSMINER, "BTMinerM50SPlusPlusVK40"),
+        "M50S++VK50": (_WHATSMINER, "BTMinerM50SPlusPlusVK50"),
+        "M50S++VK60": (_WHATSMINER, "BTMinerM50SPlusPlusVK60"),
+        "M50S++VL20": (_WHATSMINER, "BTMinerM50SPlusPlusVL20"),
+        "M50S++VL30": (_WHATSMINER, "BTMinerM50SPlusPlusVL30"),
+        "M50S++VL40": (_WHATSMINER, "BTMinerM50SPlusPlusVL40"),
+        "M50S++VL50": (_WHATSMINER, "BTMinerM50SPlusPlusVL50"),
+        "M50S++VL60": (_WHATSMINER, "BTMinerM50SPlusPlusVL60"),
+        "M50S+VH30": (_WHATSMINER, "BTMinerM50SPlusVH30"),
+        "M50S+VH40": (_WHATSMINER, "BTMinerM50SPlusVH40"),
+        "M50S+VJ30": (_WHATSMINER, "BTMinerM50SPlusVJ30"),
+        "M50S+VJ40": (_WHATSMINER, "BTMinerM50SPlusVJ40"),
+        "M50S+VJ60": (_WHATSMINER, "BTMinerM50SPlusVJ60"),
+        "M50S+VK10": (_WHATSMINER, "BTMinerM50SPlusVK10"),
+        "M50S+VK20": (_WHATSMINER, "BTMinerM50SPlusVK20"),
+        "M50S+VK30": (_WHATSMINER, "BTMinerM50SPlusVK30"),
+        "M50S+VL10": (_WHATSMINER, "BTMinerM50SPlusVL10"),
+        "M50S+VL20": (_WHATSMINER, "BTMinerM50SPlusVL20"),
+        "M50S+VL30": (_WHATSMINER, "BTMinerM50SPlusVL30"),
+        "M50SVH10": (_WHATSMINER, "BTMinerM50SVH10"),
+        "M50SVH20": (_WHATSMINER, "BTMinerM50SVH20"),
+        "M50SVH30": (_WHATSMINER, "BTMinerM50SVH30"),
+        "M50SVH40": (_WHATSMINER, "BTMinerM50SVH40"),
+        "M50SVH50": (_WHATSMINER, "BTMinerM50SVH50"),
+        "M50SVJ10": (_WHATSMINER, "BTMinerM50SVJ10"),
+        "M50SVJ20": (_WHATSMINER, "BTMinerM50SVJ20"),
+        "M50SVJ30": (_WHATSMINER, "BTMinerM50SVJ30"),
+        "M50SVJ40": (_WHATSMINER, "BTMinerM50SVJ40"),
+        "M50SVJ50": (_WHATSMINER, "BTMinerM50SVJ50"),
+        "M50SVK10": (_WHATSMINER, "BTMinerM50SVK10"),
+        "M50SVK20": (_WHATSMINER, "BTMinerM50SVK20"),
+        "M50SVK30": (_WHATSMINER, "BTMinerM50SVK30"),
+        "M50SVK50": (_WHATSMINER, "BTMinerM50SVK50"),
+        "M50SVK60": (_WHATSMINER, "BTMinerM50SVK60"),
+        "M50SVK70": (_WHATSMINER, "BTMinerM50SVK70"),
+        "M50SVK80": (_WHATSMINER, "BTMinerM50SVK80"),
+        "M50SVL20": (_WHATSMINER, "BTMinerM50SVL20"),
+        "M50SVL30": (_WHATSMINER, "BTMinerM50SVL30"),
+        "M50VE30": (_WHATSMINER, "BTMinerM50VE30"),
+        "M50VG30": (_WHATSMINER, "BTMinerM50VG30"),
+        "M50VH10": (_WHATSMINER, "BTMinerM50VH10"),
+        "M50VH20": (_WHATSMINER, "BTMinerM50VH20"),
+        "M50VH30": (_WHATSMINER, "BTMinerM50VH30"),
+        "M50VH40": (_WHATSMINER, "BTMinerM50VH40"),
+        "M50VH50": (_WHATSMINER, "BTMinerM50VH50"),
+        "M50VH60": (_WHATSMINER, "BTMinerM50VH60"),
+        "M50VH70": (_WHATSMINER, "BTMinerM50VH70"),
+        "M50VH80": (_WHATSMINER, "BTMinerM50VH80"),
+        "M50VH90": (_WHATSMINER, "BTMinerM50VH90"),
+        "M50VJ10": (_WHATSMINER, "BTMinerM50VJ10"),
+        "M50VJ20": (_WHATSMINER, "BTMinerM50VJ20"),
+        "M50VJ30": (_WHATSMINER, "BTMinerM50VJ30"),
+        "M50VJ40": (_WHATSMINER, "BTMinerM50VJ40"),
+        "M50VJ60": (_WHATSMINER, "BTMinerM50VJ60"),
+        "M50VK40": (_WHATSMINER, "BTMinerM50VK40"),
+        "M50VK50": (_WHATSMINER, "BTMinerM50VK50"),
+        "M52S++VL10": (_WHATSMINER, "BTMinerM52SPlusPlusVL10"),
+        "M52SVK30": (_WHATSMINER, "BTMinerM52SVK30"),
+        "M53HVH10": (_WHATSMINER, "BTMinerM53HVH10"),
+        "M53S++VK10": (_WHATSMINER, "BTMinerM53SPlusPlusVK10"),
+        "M53S++VK20": (_WHATSMINER, "BTMinerM53SPlusPlusVK20"),
+        "M53S++VK30": (_WHATSMINER, "BTMinerM53SPlusPlusVK30"),
+        "M53S++VK50": (_WHATSMINER, "BTMinerM53SPlusPlusVK50"),
+        "M53S++VL10": (_WHATSMINER, "BTMinerM53SPlusPlusVL10"),
+        "M53S++VL30": (_WHATSMINER, "BTMinerM53SPlusPlusVL30"),
+        "M53S+VJ30": (_WHATSMINER, "BTMinerM53SPlusVJ30"),
+        "M53S+VJ40": (_WHATSMINER, "BTMinerM53SPlusVJ40"),
+        "M53S+VJ50": (_WHATSMINER, "BTMinerM53SPlusVJ50"),
+        "M53S+VK30": (_WHATSMINER, "BTMinerM53SPlusVK30"),
+        "M53SVH20": (_WHATSMINER, "BTMinerM53SVH20"),
+        "M53SVH30": (_WHATSMINER, "BTMinerM53SVH30"),
+        "M53SVJ30": (_WHATSMINER, "BTMinerM53SVJ30"),
+        "M53SVJ40": (_WHATSMINER, "BTMinerM53SVJ40"),
+        "M53SVK30": (_WHATSMINER, "BTMinerM53SVK30"),
+        "M53VH30": (_WHATSMINER, "BTMinerM53VH30"),
+        "M53VH40": (_WHATSMINER, "BTMinerM53VH40"),
+        "M53VH50": (_WHATSMINER, "BTMinerM53VH50"),
+        "M53VK30": (_WHATSMINER, "BTMinerM53VK30"),
+        "M53VK60": (_WHATSMINER, "BTMinerM53VK60"),
+        "M54S++VK30": (_WHATSMINER, "BTMinerM54SPlusPlusVK30"),
+        "M54S++VL30": (_WHATSMINER, "BTMinerM54SPlusPlusVL30"),
+        "M54S++VL40": (_WHATSMINER, "BTMinerM54SPlusPlusVL40"),
+        "M56S++VK10": (_WHATSMINER, "BTMinerM56SPlusPlusVK10"),
+        "M56S++VK30": (_WHATSMINER, "BTMinerM56SPlusPlusVK30"),
+        "M56S++VK40": (_WHATSMINER, "BTMinerM56SPlusPlusVK40"),
+        "M56S++VK50": (_WHATSMINER, "BTMinerM56SPlusPlusVK50"),
+        "M56S+VJ30": (_WHATSMINER, "BTMinerM56SPlusVJ30"),
+        "M56S+VK30": (_WHATSMINER, "BTMinerM56SPlusVK30"),
+        "M56S+VK40": (_WHATSMINER, "BTMinerM56SPlusVK40"),
+        "M56S+VK50": (_WHATSMINER, "BTMinerM56SPlusVK50"),
+        "M56SVH30": (_WHATSMINER, "BTMinerM56SVH30"),
+        "M56SVJ30": (_WHATSMINER, "BTMinerM56SVJ30"),
+        "M56SVJ40": (_WHATSMINER, "BTMinerM56SVJ40"),
+        "M56VH30": (_WHATSMINER, "BTMinerM56VH30"),
+        "M59VH30": (_WHATSMINER, "BTMinerM59VH30"),
+        "M60S++VL30": (_WHATSMINER, "BTMinerM60SPlusPlusVL30"),
+        "M60S++VL40": (_WHATSMINER, "BTMinerM60SPlusPlusVL40"),
+        "M60S+VK30": (_WHATSMINER, "BTMinerM60SPlusVK30"),
+        "M60S+VK40": (_WHATSMINER, "BTMinerM60SPlusVK40"),
+        "M60S+VK50": (_WHATSMINER, "BTMinerM60SPlusVK50"),
+        "M60S+VK60": (_WHATSMINER, "BTMinerM60SPlusVK60"),
+        "M60S+VK70": (_WHATSMINER, "BTMinerM60SPlusVK70"),
+        "M60S+VL10": (_WHATSMINER, "BTMinerM60SPlusVL10"),
+        "M60S+VL30": (_WHATSMINER, "BTMinerM60SPlusVL30"),
+        "M60S+VL40": (_WHATSMINER, "BTMinerM60SPlusVL40"),
+        "M60S+VL50": (_WHATSMINER, "BTMinerM60SPlusVL50"),
+        "M60S+VL60": (_WHATSMINER, "BTMinerM60SPlusVL60"),
+        "M60SVK10": (_WHATSMINER, "BTMinerM60SVK10"),
+        "M60SVK20": (_WHATSMINER, "BTMinerM60SVK20"),
+        "M60SVK30": (_WHATSMINER, "BTMinerM60SVK30"),
+        "M60SVK40": (_WHATSMINER, "BTMinerM60SVK40"),
+        "M60SVL10": (_WHATSMINER, "BTMinerM60SVL10"),
+        "M60SVL20": (_WHATSMINER, "BTMinerM60SVL20"),
+        "M60SVL30": (_WHATSMINER, "BTMinerM60SVL30"),
+        "M60SVL40": (_WHATSMINER, "BTMinerM60SVL40"),
+        "M60SVL50": (_WHATSMINER, "BTMinerM60SVL50"),
+        "M60SVL60": (_WHATSMINER, "BTMinerM60SVL60"),
+        "M60SVL70": (_WHATSMINER, "BTMinerM60SVL70"),
+        "M60VK10": (_WHATSMINER, "BTMinerM60VK10"),
+        "M60VK20": (_WHATSMINER, "BTMinerM60VK20"),
+        "M60VK30": (_WHATSMINER, "BTMinerM60VK30"),
+        "M60VK40": (_WHATSMINER, "BTMinerM60VK40"),
+        "M60VK6A": (_WHATSMINER, "BTMinerM60VK6A"),
+        "M60VL10": (_WHATSMINER, "BTMinerM60VL10"),
+        "M60VL20": (_WHATSMINER, "BTMinerM60VL20"),
+        "M60VL30": (_WHATSMINER, "BTMinerM60VL30"),
+        "M60VL40": (_WHATSMINER, "BTMinerM60VL40"),
+        "M60VL50": (_WHATSMINER, "BTMinerM60VL50"),
+        "M61S+VL30": (_WHATSMINER, "BTMinerM61SPlusVL30"),
+        "M61SVL10": (_WHATSMINER, "BTMinerM61SVL10"),
+        "M61SVL20": (_WHATSMINER, "BTMinerM61SVL20"),
+        "M61SVL30": (_WHATSMINER, "BTMinerM61SVL30"),
+        "M61VK10": (_WHATSMINER, "BTMinerM61VK10"),
+        "M61VK20": (_WHATSMINER, "BTMinerM61VK20"),
+        "M61VK30": (_WHATSMINER, "BTMinerM61VK30"),
+        "M61VK40": (_WHATSMINER, "BTMinerM61VK40"),
+        "M61VL10": (_WHATSMINER, "BTMinerM61VL10"),
+        "M61VL30": (_WHATSMINER, "BTMinerM61VL30"),
+        "M61VL40": (_WHATSMINER, "BTMinerM61VL40"),
+        "M61VL50": (_WHATSMINER, "BTMinerM61VL50"),
+        "M61VL60": (_WHATSMINER, "BTMinerM61VL60"),
+        "M62S+VK30": (_WHATSMINER, "BTMinerM62SPlusVK30"),
+        "M63S++VL20": (_WHATSMINER, "BTMinerM63SPlusPlusVL20"),
+        "M63S+VK30": (_WHATSMINER, "BTMinerM63SPlusVK30"),
+        "M63S+VL10": (_WHATSMINER, "BTMinerM63SPlusVL10"),
+        "M63S+VL20": (_WHATSMINER, "BTMinerM63SPlusVL20"),
+        "M63S+VL30": (_WHATSMINER, "BTMinerM63SPlusVL30"),
+        "M63S+VL50": (_WHATSMINER, "BTMinerM63SPlusVL50"),
+        "M63SVK10": (_WHATSMINER, "BTMinerM63SVK10"),
+        "M63SVK20": (_WHATSMINER, "BTMinerM63SVK20"),
+        "M63SVK30": (_WHATSMINER, "BTMinerM63SVK30"),
+        "M63SVK60": (_WHATSMINER, "BTMinerM63SVK60"),
+        "M63SVL10": (_WHATSMINER, "BTMinerM63SVL10"),
+        "M63SVL50": (_WHATSMINER, "BTMinerM63SVL50"),
+        "M63SVL60": (_WHATSMINER, "BTMinerM63SVL60"),
+        "M63VK10": (_WHATSMINER, "BTMinerM63VK10"),
+        "M63VK20": (_WHATSMINER, "BTMinerM63VK20"),
+        "M63VK30": (_WHATSMINER, "BTMinerM63VK30"),
+        "M63VL10": (_WHATSMINER, "BTMinerM63VL10"),
+        "M63VL30": (_WHATSMINER, "BTMinerM63VL30"),
+        "M64SVL30": (_WHATSMINER, "BTMinerM64SVL30"),
+        "M64VL30": (_WHATSMINER, "BTMinerM64VL30"),
+        "M64VL40": (_WHATSMINER, "BTMinerM64VL40"),
+        "M65S+VK30": (_WHATSMINER, "BTMinerM65SPlusVK30"),
+        "M65SVK20": (_WHATSMINER, "BTMinerM65SVK20"),
+        "M65SVL60": (_WHATSMINER, "BTMinerM65SVL60"),
+        "M66S++VL20": (_WHATSMINER, "BTMinerM66SPlusPlusVL20"),
+        "M66S+VK30": (_WHATSMINER, "BTMinerM66SPlusVK30"),
+        "M66S+VL10": (_WHATSMINER, "BTMinerM66SPlusVL10"),
+        "M66S+VL20": (_WHATSMINER, "BTMinerM66SPlusVL20"),
+        "M66S+VL30": (_WHATSMINER, "BTMinerM66SPlusVL30"),
+        "M66S+VL40": (_WHATSMINER, "BTMinerM66SPlusVL40"),
+        "M66S+VL60": (_WHATSMINER, "BTMinerM66SPlusVL60"),
+        "M66SVK20": (_WHATSMINER, "BTMinerM66SVK20"),
+        "M66SVK30": (_WHATSMINER, "BTMinerM66SVK30"),
+        "M66SVK40": (_WHATSMINER, "BTMinerM66SVK40"),
+        "M66SVK50": (_WHATSMINER, "BTMinerM66SVK50"),
+        "M66SVK60": (_WHATSMINER, "BTMinerM66SVK60"),
+        "M66SVL10": (_WHATSMINER, "BTMinerM66SVL10"),
+        "M66SVL20": (_WHATSMINER, "BTMinerM66SVL20"),
+        "M66SVL30": (_WHATSMINER, "BTMinerM66SVL30"),
+        "M66SVL40": (_WHATSMINER, "BTMinerM66SVL40"),
+        "M66SVL50": (_WHATSMINER, "BTMinerM66SVL50"),
+        "M66VK20": (_WHATSMINER, "BTMinerM66VK20"),
+        "M66VK30": (_WHATSMINER, "BTMinerM66VK30"),
+        "M66VL20": (_WHATSMINER, "BTMinerM66VL20"),
+        "M66VL30": (_WHATSMINER, "BTMinerM66VL30"),
+        "M67SVK30": (_WHATSMINER, "BTMinerM67SVK30"),
+        "M70VM30": (_WHATSMINER, "BTMinerM70VM30"),
     },
     MinerTypes.AVALONMINER: {
-        None: type("AvalonUnknown", (AvalonMiner, AvalonMinerMake), {}),
-        "AVALONMINER 721": CGMinerAvalon721,
-        "AVALONMINER 741": CGMinerAvalon741,
-        "AVALONMINER 761": CGMinerAvalon761,
-        "AVALONMINER 821": CGMinerAvalon821,
-        "AVALONMINER 841": CGMinerAvalon841,
-        "AVALONMINER 851": CGMinerAvalon851,
-        "AVALONMINER 921": CGMinerAvalon921,
-        "AVALONMINER 1026": CGMinerAvalon1026,
-        "AVALONMINER 1047": CGMinerAvalon1047,
-        "AVALONMINER 1066": CGMinerAvalon1066,
-        "AVALONMINER 1126PRO": CGMinerAvalon1126Pro,
-        "AVALONMINER 1166PRO": CGMinerAvalon1166Pro,
-        "AVALONMINER 1246": CGMinerAvalon1246,
-        "AVALONMINER NANO3": CGMinerAvalonNano3,
-        "AVALON NANO3S": CGMinerAvalonNano3s,
-        "AVALONMINER 15-194": CGMinerAvalon1566,
-        "AVALON Q": CGMinerAvalonQHome,
-        "AVALON MINI3": CGMinerAvalonMini3,
+        None: _unknown("AvalonUnknown", "AvalonMiner", "AvalonMinerMake"),
+        "AVALONMINER 721": (_AVALONMINER, "CGMinerAvalon721"),
+        "AVALONMINER 741": (_AVALONMINER, "CGMinerAvalon741"),
+        "AVALONMINER 761": (_AVALONMINER, "CGMinerAvalon761"),
+        "AVALONMINER 821": (_AVALONMINER, "CGMinerAvalon821"),
+        "AVALONMINER 841": (_AVALONMINER, "CGMinerAvalon841"),
+        "AVALONMINER 851": (_AVALONMINER, "CGMinerAvalon851"),
+        "AVALONMINER 921": (_AVALONMINER, "CGMinerAvalon921"),
+        "AVALONMINER 1026": (_AVALONMINER, "CGMinerAvalon1026"),
+        "AVALONMINER 1047": (_AVALONMINER, "CGMinerAvalon1047"),
+        "AVALONMINER 1066": (_AVALONMINER, "CGMinerAvalon1066"),
+        "AVALONMINER 1126PRO": (_AVALONMINER, "CGMinerAvalon1126Pro"),
+        "AVALONMINER 1166PRO": (_AVALONMINER, "CGMinerAvalon1166Pro"),
+        "AVALONMINER 1246": (_AVALONMINER, "CGMinerAvalon1246"),
+        "AVALONMINER NANO3": (_AVALONMINER, "CGMinerAvalonNano3"),
+        "AVALON NANO3S": (_AVALONMINER, "CGMinerAvalonNano3s"),
+        "AVALONMINER 15-194": (_AVALONMINER, "CGMinerAvalon1566"),
+        "AVALON Q": (_AVALONMINER, "CGMinerAvalonQHome"),
+        "AVALON MINI3": (_AVALONMINER, "CGMinerAvalonMini3"),
     },
     MinerTypes.INNOSILICON: {
-        None: type("InnosiliconUnknown", (Innosilicon, InnosiliconMake), {}),
-        "T3H+": InnosiliconT3HPlus,
-        "A10X": InnosiliconA10X,
-        "A11": InnosiliconA11,
-        "A11MX": InnosiliconA11MX,
+        None: _unknown("InnosiliconUnknown", "Innosilicon", "InnosiliconMake"),
+        "T3H+": (_INNOSILICON, "InnosiliconT3HPlus"),
+        "A10X": (_INNOSILICON, "InnosiliconA10X"),
+        "A11": (_INNOSILICON, "InnosiliconA11"),
+        "A11MX": (_INNOSILICON, "InnosiliconA11MX"),
     },
     MinerTypes.GOLDSHELL: {
-        None: type("GoldshellUnknown", (GoldshellMiner, GoldshellMake), {}),
-        "GOLDSHELL CK5": GoldshellCK5,
-        "GOLDSHELL HS5": GoldshellHS5,
-        "GOLDSHELL KD5": GoldshellKD5,
-        "GOLDSHELL KDMAX": GoldshellKDMax,
-        "GOLDSHELL KDBOXII": GoldshellKDBoxII,
-        "GOLDSHELL KDBOXPRO": GoldshellKDBoxPro,
-        "GOLDSHELL BYTE": GoldshellByte,
-        "GOLDSHELL MINIDOGE": GoldshellMiniDoge,
+        None: _unknown("GoldshellUnknown", "GoldshellMiner", "GoldshellMake"),
+        "GOLDSHELL CK5": (_GOLDSHELL, "GoldshellCK5"),
+        "GOLDSHELL HS5": (_GOLDSHELL, "GoldshellHS5"),
+        "GOLDSHELL KD5": (_GOLDSHELL, "GoldshellKD5"),
+        "GOLDSHELL KDMAX": (_GOLDSHELL, "GoldshellKDMax"),
+        "GOLDSHELL KDBOXII": (_GOLDSHELL, "GoldshellKDBoxII"),
+        "GOLDSHELL KDBOXPRO": (_GOLDSHELL, "GoldshellKDBoxPro"),
+        "GOLDSHELL BYTE": (_GOLDSHELL, "GoldshellByte"),
+        "GOLDSHELL MINIDOGE": (_GOLDSHELL, "GoldshellMiniDoge"),
     },
     MinerTypes.BRAIINS_OS: {
-        None: BOSMiner,
-        "ANTMINER S9": BOSMinerS9,
-        "ANTMINER S17": BOSMinerS17,
-        "ANTMINER S17+": BOSMinerS17Plus,
-        "ANTMINER S17 PRO": BOSMinerS17Pro,
-        "ANTMINER S17E": BOSMinerS17e,
-        "ANTMINER T17": BOSMinerT17,
-        "ANTMINER T17+": BOSMinerT17Plus,
-        "ANTMINER T17E": BOSMinerT17e,
-        "ANTMINER S19": BOSMinerS19,
-        "ANTMINER S19+": BOSMinerS19Plus,
-        "ANTMINER S19 PRO": BOSMinerS19Pro,
-        "ANTMINER S19A": BOSMinerS19a,
-        "ANTMINER S19A Pro": BOSMinerS19aPro,
-        "ANTMINER S19J": BOSMinerS19j,
-        "ANTMINER S19J88NOPIC": BOSMinerS19jNoPIC,
-        "ANTMINER S19J PRO": BOSMinerS19jPro,
-        "ANTMINER S19J PRO NOPIC": BOSMinerS19jProNoPIC,
-        "ANTMINER S19J PRO+": BOSMinerS19jProPlus,
-        "ANTMINER S19J PRO PLUS": BOSMinerS19jProPlus,
-        "ANTMINER S19J PRO PLUS NOPIC": BOSMinerS19jProPlusNoPIC,
-        "ANTMINER S19K PRO NOPIC": BOSMinerS19kProNoPIC,
-        "ANTMINER S19K PRO": BOSMinerS19kProNoPIC,
-        "ANTMINER S19 XP": BOSMinerS19XP,
-        "ANTMINER S19 PRO+ HYD.": BOSMinerS19ProPlusHydro,
-        "ANTMINER T19": BOSMinerT19,
-        "ANTMINER S21": BOSMinerS21,
-        "ANTMINER S21 PRO": BOSMinerS21Pro,
-        "ANTMINER S21+": BOSMinerS21Plus,
-        "ANTMINER S21+ HYD.": BOSMinerS21PlusHydro,
-        "ANTMINER S21 HYD.": BOSMinerS21Hydro,
-        "ANTMINER T21": BOSMinerT21,
-        "BRAIINS MINI MINER BMM 100": BraiinsBMM100,
-        "BRAIINS MINI MINER BMM 101": BraiinsBMM101,
-        "ANTMINER S19 XP HYD.": BOSMinerS19XPHydro,
+        None: (_BACKENDS, "BOSMiner"),
+        "ANTMINER S9": (_ANTMINER, "BOSMinerS9"),
+        "ANTMINER S17": (_ANTMINER, "BOSMinerS17"),
+        "ANTMINER S17+": (_ANTMINER, "BOSMinerS17Plus"),
+        "ANTMINER S17 PRO": (_ANTMINER, "BOSMinerS17Pro"),
+        "ANTMINER S17E": (_ANTMINER, "BOSMinerS17e"),
+        "ANTMINER T17": (_ANTMINER, "BOSMinerT17"),
+        "ANTMINER T17+": (_ANTMINER, "BOSMinerT17Plus"),
+        "ANTMINER T17E": (_ANTMINER, "BOSMinerT17e"),
+        "ANTMINER S19": (_ANTMINER, "BOSMinerS19"),
+        "ANTMINER S19+": (_ANTMINER, "BOSMinerS19Plus"),
+        "ANTMINER S19 PRO": (_ANTMINER, "BOSMinerS19Pro"),
+        "ANTMINER S19A": (_ANTMINER, "BOSMinerS19a"),
+        "ANTMINER S19A Pro": (_ANTMINER, "BOSMinerS19aPro"),
+        "ANTMINER S19J": (_ANTMINER, "BOSMinerS19j"),
+        "ANTMINER S19J88NOPIC": (_ANTMINER, "BOSMinerS19jNoPIC"),
+        "ANTMINER S19J PRO": (_ANTMINER, "BOSMinerS19jPro"),
+        "ANTMINER S19J PRO NOPIC": (_ANTMINER, "BOSMinerS19jProNoPIC"),
+        "ANTMINER S19J PRO+": (_ANTMINER, "BOSMinerS19jProPlus"),
+        "ANTMINER S19J PRO PLUS": (_ANTMINER, "BOSMinerS19jProPlus"),
+        "ANTMINER S19J PRO PLUS NOPIC": (_ANTMINER, "BOSMinerS19jProPlusNoPIC"),
+        "ANTMINER S19K PRO NOPIC": (_ANTMINER, "BOSMinerS19kProNoPIC"),
+        "ANTMINER S19K PRO": (_ANTMINER, "BOSMinerS19kProNoPIC"),
+        "ANTMINER S19 XP": (_ANTMINER, "BOSMinerS19XP"),
+        "ANTMINER S19 PRO+ HYD.": (_ANTMINER, "BOSMinerS19ProPlusHydro"),
+        "ANTMINER T19": (_ANTMINER, "BOSMinerT19"),
+        "ANTMINER S21": (_ANTMINER, "BOSMinerS21"),
+        "ANTMINER S21 PRO": (_ANTMINER, "BOSMinerS21Pro"),
+        "ANTMINER S21+": (_ANTMINER, "BOSMinerS21Plus"),
+        "ANTMINER S21+ HYD.": (_ANTMINER, "BOSMinerS21PlusHydro"),
+        "ANTMINER S21 HYD.": (_ANTMINER, "BOSMinerS21Hydro"),
+        "ANTMINER T21": (_ANTMINER, "BOSMinerT21"),
+        "BRAIINS MINI MINER BMM 100": (_BRAIINS, "BraiinsBMM100"),
+        "BRAIINS MINI MINER BMM 101": (_BRAIINS, "BraiinsBMM101"),
+        "ANTMINER S19 XP HYD.": (_ANTMINER, "BOSMinerS19XPHydro"),
     },
     MinerTypes.VNISH: {
-        None: VNish,
-        "L3+": VNishL3Plus,
-        "ANTMINER L3+": VNishL3Plus,
-        "ANTMINER L7": VNishL7,
-        "ANTMINER L9": VNishL9,
-        "ANTMINER S17+": VNishS17Plus,
-        "ANTMINER S17 PRO": VNishS17Pro,
-        "ANTMINER S19": VNishS19,
-        "ANTMINER S19NOPIC": VNishS19NoPIC,
-        "ANTMINER S19 PRO": VNishS19Pro,
-        "ANTMINER S19J": VNishS19j,
-        "ANTMINER S19I": VNishS19i,
-        "ANTMINER S19 XP": VNishS19XP,
-        "ANTMINER S19 XP HYD.": VNishS19XPHydro,
-        "ANTMINER S19J PRO": VNishS19jPro,
-        "ANTMINER S19J PRO A": VNishS19jPro,
-        "ANTMINER S19J PRO BB": VNishS19jPro,
-        "ANTMINER S19A": VNishS19a,
-        "ANTMINER S19 HYD.": VNishS19Hydro,
-        "ANTMINER S19A PRO": VNishS19aPro,
-        "ANTMINER S19 PRO A": VNishS19ProA,
-        "ANTMINER S19 PRO HYD.": VNishS19ProHydro,
-        "ANTMINER S19 PRO HYDRO": VNishS19ProHydro,
-        "ANTMINER S19K PRO": VNishS19kPro,
-        "ANTMINER T19": VNishT19,
-        "ANTMINER T21": VNishT21,
-        "ANTMINER S21": VNishS21,
-        "ANTMINER S21+": VNishS21Plus,
-        "ANTMINER S21+ HYD.": VNishS21PlusHydro,
-        "ANTMINER S21 PRO": VNishS21Pro,
-        "ANTMINER S21 HYD.": VNishS21Hydro,
-        "ANTMINER S19 XP+": VNishS19XPPlus,
-        "ANTMINER S19J PRO+": VNishS19jProPlus,
-        "ANTMINER S19J XP": VNishS19jXP,
-        "ANTMINER S21 HYDRO": VNishS21Hydro,
+        None: (_BACKENDS, "VNish"),
+        "L3+": (_ANTMINER, "VNishL3Plus"),
+        "ANTMINER L3+": (_ANTMINER, "VNishL3Plus"),
+        "ANTMINER L7": (_ANTMINER, "VNishL7"),
+        "ANTMINER L9": (_ANTMINER, "VNishL9"),
+        "ANTMINER S17+": (_ANTMINER, "VNishS17Plus"),
+        "ANTMINER S17 PRO": (_ANTMINER, "VNishS17Pro"),
+        "ANTMINER S19": (_ANTMINER, "VNishS19"),
+        "ANTMINER S19NOPIC": (_ANTMINER, "VNishS19NoPIC"),
+        "ANTMINER S19 PRO": (_ANTMINER, "VNishS19Pro"),
+        "ANTMINER S19J": (_ANTMINER, "VNishS19j"),
+        "ANTMINER S19I": (_ANTMINER, "VNishS19i"),
+        "ANTMINER S19 XP": (_ANTMINER, "VNishS19XP"),
+        "ANTMINER S19 XP HYD.": (_ANTMINER, "VNishS19XPHydro"),
+        "ANTMINER S19J PRO": (_ANTMINER, "VNishS19jPro"),
+        "ANTMINER S19J PRO A": (_ANTMINER, "VNishS19jPro"),
+        "ANTMINER S19J PRO BB": (_ANTMINER, "VNishS19jPro"),
+        "ANTMINER S19A": (_ANTMINER, "VNishS19a"),
+        "ANTMINER S19 HYD.": (_ANTMINER, "VNishS19Hydro"),
+        "ANTMINER S19A PRO": (_ANTMINER, "VNishS19aPro"),
+        "ANTMINER S19 PRO A": (_ANTMINER, "VNishS19ProA"),
+        "ANTMINER S19 PRO HYD.": (_ANTMINER, "VNishS19ProHydro"),
+        "ANTMINER S19 PRO HYDRO": (_ANTMINER, "VNishS19ProHydro"),
+        "ANTMINER S19K PRO": (_ANTMINER, "VNishS19kPro"),
+        "ANTMINER T19": (_ANTMINER, "VNishT19"),
+        "ANTMINER T21": (_ANTMINER, "VNishT21"),
+        "ANTMINER S21": (_ANTMINER, "VNishS21"),
+        "ANTMINER S21+": (_ANTMINER, "VNishS21Plus"),
+        "ANTMINER S21+ HYD.": (_ANTMINER, "VNishS21PlusHydro"),
+        "ANTMINER S21 PRO": (_ANTMINER, "VNishS21Pro"),
+        "ANTMINER S21 HYD.": (_ANTMINER, "VNishS21Hydro"),
+        "ANTMINER S19 XP+": (_ANTMINER, "VNishS19XPPlus"),
+        "ANTMINER S19J PRO+": (_ANTMINER, "VNishS19jProPlus"),
+        "ANTMINER S19J XP": (_ANTMINER, "VNishS19jXP"),
+        "ANTMINER S21 HYDRO": (_ANTMINER, "VNishS21Hydro"),
     },
     MinerTypes.EPIC: {
-        None: ePIC,
-        "ANTMINER S19": ePICS19,
-        "ANTMINER S19 PRO": ePICS19Pro,
-        "ANTMINER S19J": ePICS19j,
-        "ANTMINER S19J PRO": ePICS19jPro,
-        "ANTMINER S19J PRO+": ePICS19jProPlus,
-        "ANTMINER S19K PRO": ePICS19kPro,
-        "ANTMINER S19 XP": ePICS19XP,
-        "ANTMINER S21": ePICS21,
-        "ANTMINER S21 PRO": ePICS21Pro,
-        "ANTMINER T21": ePICT21,
-        "ANTMINER S19J PRO DUAL": ePICS19jProDual,
-        "ANTMINER S19K PRO DUAL": ePICS19kProDual,
-        "BLOCKMINER 520I": ePICBlockMiner520i,
-        "BLOCKMINER 720I": ePICBlockMiner720i,
-        "BLOCKMINER ELITE 1.0": ePICBlockMinerELITE1,
+        None: (_BACKENDS, "ePIC"),
+        "ANTMINER S19": (_ANTMINER, "ePICS19"),
+        "ANTMINER S19 PRO": (_ANTMINER, "ePICS19Pro"),
+        "ANTMINER S19J": (_ANTMINER, "ePICS19j"),
+        "ANTMINER S19J PRO": (_ANTMINER, "ePICS19jPro"),
+        "ANTMINER S19J PRO+": (_ANTMINER, "ePICS19jProPlus"),
+        "ANTMINER S19K PRO": (_ANTMINER, "ePICS19kPro"),
+        "ANTMINER S19 XP": (_ANTMINER, "ePICS19XP"),
+        "ANTMINER S21": (_ANTMINER, "ePICS21"),
+        "ANTMINER S21 PRO": (_ANTMINER, "ePICS21Pro"),
+        "ANTMINER T21": (_ANTMINER, "ePICT21"),
+        "ANTMINER S19J PRO DUAL": (_ANTMINER, "ePICS19jProDual"),
+        "ANTMINER S19K PRO DUAL": (_ANTMINER, "ePICS19kProDual"),
+        "BLOCKMINER 520I": (_BLOCKMINER, "ePICBlockMiner520i"),
+        "BLOCKMINER 720I": (_BLOCKMINER, "ePICBlockMiner720i"),
+        "BLOCKMINER ELITE 1.0": (_BLOCKMINER, "ePICBlockMinerELITE1"),
     },
     MinerTypes.HIVEON: {
-        None: HiveonModern,
-        "ANTMINER T9": HiveonT9,
-        "ANTMINER S19JPRO": HiveonS19jPro,
-        "ANTMINER S19": HiveonS19,
-        "ANTMINER S19K PRO": HiveonS19kPro,
-        "ANTMINER S19X88": HiveonS19NoPIC,
+        None: (_BACKENDS, "HiveonModern"),
+        "ANTMINER T9": (_ANTMINER, "HiveonT9"),
+        "ANTMINER S19JPRO": (_ANTMINER, "HiveonS19jPro"),
+        "ANTMINER S19": (_ANTMINER, "HiveonS19"),
+        "ANTMINER S19K PRO": (_ANTMINER, "HiveonS19kPro"),
+        "ANTMINER S19X88": (_ANTMINER, "HiveonS19NoPIC"),
     },
     MinerTypes.MSKMINER: {
-        None: MSKMiner,
-        "S19-88": MSKMinerS19NoPIC,
+        None: (_BACKENDS, "MSKMiner"),
+        "S19-88": (_ANTMINER, "MSKMinerS19NoPIC"),
     },
     MinerTypes.LUX_OS: {
-        None: LUXMiner,
-        "ANTMINER S9": LUXMinerS9,
-        "ANTMINER S19": LUXMinerS19,
-        "ANTMINER S19 PRO": LUXMinerS19Pro,
-        "ANTMINER S19J PRO": LUXMinerS19jPro,
-        "ANTMINER S19J PRO+": LUXMinerS19jProPlus,
-        "ANTMINER S19K PRO": LUXMinerS19kPro,
-        "ANTMINER S19 XP": LUXMinerS19XP,
-        "ANTMINER T19": LUXMinerT19,
-        "ANTMINER S21": LUXMinerS21,
-        "ANTMINER S21 PRO": LUXMinerS21Pro,
-        "ANTMINER T21": LUXMinerT21,
+        None: (_BACKENDS, "LUXMiner"),
+        "ANTMINER S9": (_ANTMINER, "LUXMinerS9"),
+        "ANTMINER S19": (_ANTMINER, "LUXMinerS19"),
+        "ANTMINER S19 PRO": (_ANTMINER, "LUXMinerS19Pro"),
+        "ANTMINER S19J PRO": (_ANTMINER, "LUXMinerS19jPro"),
+        "ANTMINER S19J PRO+": (_ANTMINER, "LUXMinerS19jProPlus"),
+        "ANTMINER S19K PRO": (_ANTMINER, "LUXMinerS19kPro"),
+        "ANTMINER S19 XP": (_ANTMINER, "LUXMinerS19XP"),
+        "ANTMINER T19": (_ANTMINER, "LUXMinerT19"),
+        "ANTMINER S21": (_ANTMINER, "LUXMinerS21"),
+        "ANTMINER S21 PRO": (_ANTMINER, "LUXMinerS21Pro"),
+        "ANTMINER T21": (_ANTMINER, "LUXMinerT21"),
     },
     MinerTypes.AURADINE: {
-        None: type("AuradineUnknown", (Auradine, AuradineMake), {}),
-        "AT1500": AuradineFluxAT1500,
-        "AT2860": AuradineFluxAT2860,
-        "AT2880": AuradineFluxAT2880,
-        "AI2500": AuradineFluxAI2500,
-        "AI3680": AuradineFluxAI3680,
-        "AD2500": AuradineFluxAD2500,
-        "AD3500": AuradineFluxAD3500,
+        None: _unknown("AuradineUnknown", "Auradine", "AuradineMake"),
+        "AT1500": (_AURADINE, "AuradineFluxAT1500"),
+        "AT2860": (_AURADINE, "AuradineFluxAT2860"),
+        "AT2880": (_AURADINE, "AuradineFluxAT2880"),
+        "AI2500": (_AURADINE, "AuradineFluxAI2500"),
+        "AI3680": (_AURADINE, "AuradineFluxAI3680"),
+        "AD2500": (_AURADINE, "AuradineFluxAD2500"),
+        "AD3500": (_AURADINE, "AuradineFluxAD3500"),
     },
     MinerTypes.MARATHON: {
-        None: MaraMiner,
-        "ANTMINER S19": MaraS19,
-        "ANTMINER S19 PRO": MaraS19Pro,
-        "ANTMINER S19J": MaraS19j,
-        "ANTMINER S19J88NOPIC": MaraS19jNoPIC,
-        "ANTMINER S19J PRO": MaraS19jPro,
-        "ANTMINER S19 XP": MaraS19XP,
-        "ANTMINER S19K PRO": MaraS19KPro,
-        "ANTMINER S21": MaraS21,
-        "ANTMINER T21": MaraT21,
+        None: (_BACKENDS, "MaraMiner"),
+        "ANTMINER S19": (_ANTMINER, "MaraS19"),
+        "ANTMINER S19 PRO": (_ANTMINER, "MaraS19Pro"),
+        "ANTMINER S19J": (_ANTMINER, "MaraS19j"),
+        "ANTMINER S19J88NOPIC": (_ANTMINER, "MaraS19jNoPIC"),
+        "ANTMINER S19J PRO": (_ANTMINER, "MaraS19jPro"),
+        "ANTMINER S19 XP": (_ANTMINER, "MaraS19XP"),
+        "ANTMINER S19K PRO": (_ANTMINER, "MaraS19KPro"),
+        "ANTMINER S21": (_ANTMINER, "MaraS21"),
+        "ANTMINER T21": (_ANTMINER, "MaraT21"),
     },
     MinerTypes.BITAXE: {
-        None: BitAxe,
-        "BM1368": BitAxeSupra,
-        "BM1366": BitAxeUltra,
-        "BM1397": BitAxeMax,
-        "BM1370": BitAxeGamma,
+        None: (_BACKENDS, "BitAxe"),
+        "BM1368": (_BITAXE, "BitAxeSupra"),
+        "BM1366": (_BITAXE, "BitAxeUltra"),
+        "BM1397": (_BITAXE, "BitAxeMax"),
+        "BM1370": (_BITAXE, "BitAxeGamma"),
     },
     MinerTypes.LUCKYMINER: {
-        None: LuckyMiner,
-        "LV08": LuckyMinerLV08,
-        "LV07": LuckyMinerLV07,
+        None: (_BACKENDS, "LuckyMiner"),
+        "LV08": (_LUCKYMINER, "LuckyMinerLV08"),
+        "LV07": (_LUCKYMINER, "LuckyMinerLV07"),
     },
     MinerTypes.ICERIVER: {
-        None: type("IceRiverUnknown", (IceRiver, IceRiverMake), {}),
-        "KS0": IceRiverKS0,
-        "KS1": IceRiverKS1,
-        "KS2": IceRiverKS2,
-        "KS3": IceRiverKS3,
-        "KS3L": IceRiverKS3L,
-        "KS3M": IceRiverKS3M,
-        "KS5": IceRiverKS5,
-        "KS5L": IceRiverKS5L,
-        "KS5M": IceRiverKS5M,
-        "10306": IceRiverAL3,
+        None: _unknown("IceRiverUnknown", "IceRiver", "IceRiverMake"),
+        "KS0": (_ICERIVER, "IceRiverKS0"),
+        "KS1": (_ICERIVER, "IceRiverKS1"),
+        "KS2": (_ICERIVER, "IceRiverKS2"),
+        "KS3": (_ICERIVER, "IceRiverKS3"),
+        "KS3L": (_ICERIVER, "IceRiverKS3L"),
+        "KS3M": (_ICERIVER, "IceRiverKS3M"),
+        "KS5": (_ICERIVER, "IceRiverKS5"),
+        "KS5L": (_ICERIVER, "IceRiverKS5L"),
+        "KS5M": (_ICERIVER, "IceRiverKS5M"),
+        "10306": (_ICERIVER, "IceRiverAL3"),
     },
     MinerTypes.HAMMER: {
-        None: type("HammerUnknown", (BlackMiner, HammerMake), {}),
-        "HAMMER D10": HammerD10,
+        None: _unknown("HammerUnknown", "BlackMiner", "HammerMake"),
+        "HAMMER D10": (_HAMMER, "HammerD10"),
     },
     MinerTypes.VOLCMINER: {
-        None: type("VolcMinerUnknown", (BlackMiner, VolcMinerMake), {}),
-        "VOLCMINER D1": VolcMinerD1,
+        None: _unknown("VolcMinerUnknown", "BlackMiner", "VolcMinerMake"),
+        "VOLCMINER D1": (_VOLCMINER, "VolcMinerD1"),
     },
     MinerTypes.ELPHAPEX: {
-        None: type("ElphapexUnknown", (ElphapexMiner, ElphapexMake), {}),
-        "DG1+": ElphapexDG1Plus,
-        "DG1": ElphapexDG1,
-        "DG1-Home": ElphapexDG1Home,
+        None: _unknown("ElphapexUnknown", "ElphapexMiner", "ElphapexMake"),
+        "DG1+": (_ELPHAPEX, "ElphapexDG1Plus"),
+        "DG1": (_ELPHAPEX, "ElphapexDG1"),
+        "DG1-Home": (_ELPHAPEX, "ElphapexDG1Home"),
     },
 }
 
+MINER_CLASSES: dict[MinerTypes, MinerClasses] = {
+    miner_type: MinerClasses(classes) for miner_type, classes in _MINER_CLASSES.items()
+}
+
+
+# fingerprints are checked in order, register new ones with `.register()`
+WEB_HEADER_FINGERPRINTS: HeaderMatcher[MinerTypes] = HeaderMatcher(
+    [
+        HeaderFingerprint(
+            "www-authenticate", 'realm="antMiner', MinerTypes.ANTMINER, 401
+        ),
+        HeaderFingerprint(
+            "www-authenticate", 'realm="blackMiner', MinerTypes.HAMMER, 401
+        ),
+        HeaderFingerprint("www-authenticate", 'realm="Daoge', MinerTypes.ELPHAPEX, 401),
+    ]
+)
+WEB_FINGERPRINTS: FingerprintMatcher[MinerTypes] = FingerprintMatcher(
+    [
+        Fingerprint("Braiins OS", MinerTypes.BRAIINS_OS),
+        Fingerprint("Luxor Firmware", MinerTypes.LUX_OS),
+        Fingerprint("<TITLE>用户界面</TITLE>", MinerTypes.ICERIVER),
+        Fingerprint("AxeOS", MinerTypes.BITAXE),
+        Fingerprint("Lucky miner", MinerTypes.LUCKYMINER),
+        Fingerprint("cloud-box", MinerTypes.GOLDSHELL),
+        Fingerprint("AnthillOS", MinerTypes.VNISH),
+        Fingerprint("Miner Web Dashboard", MinerTypes.EPIC),
+        Fingerprint("Avalon", MinerTypes.AVALONMINER),
+        Fingerprint("DragonMint", MinerTypes.INNOSILICON),
+        Fingerprint("Miner UI", MinerTypes.AURADINE),
+    ]
+)
+SOCKET_FINGERPRINTS: FingerprintMatcher[MinerTypes] = FingerprintMatcher(
+    [
+        Fingerprint("BOSMINER", MinerTypes.BRAIINS_OS),
+        Fingerprint("BOSER", MinerTypes.BRAIINS_OS),
+        Fingerprint("BTMINER", MinerTypes.WHATSMINER),
+        Fingerprint("BITMICRO", MinerTypes.WHATSMINER),
+        Fingerprint("LUXMINER", MinerTypes.LUX_OS),
+        Fingerprint("HIVEON", MinerTypes.HIVEON),
+        Fingerprint("KAONSU", MinerTypes.MARATHON),
+        Fingerprint("RWGLR", MinerTypes.MSKMINER),
+        Fingerprint("ANTMINER", MinerTypes.ANTMINER, exclude=("DEVDETAILS",)),
+        Fingerprint("INTCHAINS_QOMO", MinerTypes.GOLDSHELL),
+        Fingerprint("KDAMINER", MinerTypes.GOLDSHELL),
+        Fingerprint("BFGMINER", MinerTypes.GOLDSHELL),
+        Fingerprint("INNOMINER", MinerTypes.INNOSILICON),
+        Fingerprint("AVALON", MinerTypes.AVALONMINER),
+        Fingerprint("GCMINER", MinerTypes.AURADINE),
+        Fingerprint("FLUXOS", MinerTypes.AURADINE),
+        Fingerprint("VNISH", MinerTypes.VNISH),
+    ],
+    ignore_case=True,
+)
+# types whose model is the `Type` of their RPC `version` response
+VERSION_MODEL_TYPES = frozenset(
+    {MinerTypes.ANTMINER, MinerTypes.HIVEON, MinerTypes.LUX_OS}
+)
+
+
+def _socket_response_complete(data: bytearray) -> bool:
+    # responses end with a null byte, or with the end of their JSON document
+    if data.endswith(b"\x00"):
+        return True
+    if not data.rstrip().endswith(b"}"):
+        return False
+    try:
+        json.loads(data)
+    except ValueError:
+        # some firmwares send broken JSON, stop once its braces close and it can be identified
+        if data.count(b"{") > data.count(b"}"):
+            return False
+        return (
+            SOCKET_FINGERPRINTS.match(data.decode("utf-8", errors="replace"))
+            is not None
+        )
+    return True
+
 
 async def concurrent_get_first_result(tasks: list, verification_func: Callable) -> Any:
     res = None
@@ -737,6 +877,18 @@ async def concurrent_get_first_result(tasks: list, verification_func: Callable)
 
 
 class MinerFactory:
+    """Identifies miners and creates the matching miner class for them.
+
+    Parameters:
+        cache: An optional [`IdentificationCache`][pyasic.miners.cache.IdentificationCache].
+            Known hosts are revalidated instead of being fully identified again.  An RPC
+            `version` request checks the type, and the model where the response has it,
+            otherwise the model is checked with one more request.
+    """
+
+    def __init__(self, cache: IdentificationCache | None = None) -> None:
+        self.cache = cache
+
     async def get_multiple_miners(
         self, ips: list[str], limit: int = 200
     ) -> list[AnyMiner]:
@@ -764,14 +916,41 @@ class MinerFactory:
                     yield result
 
     async def get_miner(
-        self, ip: str | ipaddress.IPv4Address | ipaddress.IPv6Address
+        self,
+        ip: str | ipaddress.IPv4Address | ipaddress.IPv6Address,
+        mac: str | None = None,
+        ports: Collection[int] | None = None,
     ) -> AnyMiner | None:
+        """Identify a miner and create the matching miner class for it.
+
+        Parameters:
+            ip: The IP address of the miner.
+            mac: The MAC address of the miner, if known, used to check cached identifications.
+            ports: The ports known to be open on the miner, such as from
+                [`probe_ports()`][pyasic.network.probe_ports].  Web or RPC probes for
+                closed ports are skipped.
+
+        Returns:
+            A miner instance, or `None` if no miner could be identified.
+        """
         ip = str(ip)
 
+        if self.cache is not None:
+            cached = self.cache.get(ip, mac)
+            if cached is not None:
+                if await self._revalidate_cached(ip, cached, ports):
+                    return self._select_miner_from_classes(
+                        ip,
+                        miner_type=MinerTypes[cached.miner_type],
+                        miner_model=cached.model,
+                        version=cached.version,
+                    )
+                self.cache.remove(ip)
+
         miner_type = None
 
         for _ in range(settings.get("factory_get_retries", 1)):
-            task = asyncio.create_task(self._get_miner_type(ip))
+            task = asyncio.create_task(self._get_miner_type(ip, ports))
             try:
                 miner_type = await asyncio.wait_for(
                     task, timeout=settings.get("factory_get_timeout", 3)
@@ -783,43 +962,12 @@ class MinerFactory:
                     break
 
         if miner_type is not None:
-            miner_model: str | None = None
-            miner_model_fns = {
-                MinerTypes.ANTMINER: self.get_miner_model_antminer,
-                MinerTypes.WHATSMINER: self.get_miner_model_whatsminer,
-                MinerTypes.AVALONMINER: self.get_miner_model_avalonminer,
-                MinerTypes.INNOSILICON: self.get_miner_model_innosilicon,
-                MinerTypes.GOLDSHELL: self.get_miner_model_goldshell,
-                MinerTypes.BRAIINS_OS: self.get_miner_model_braiins_os,
-                MinerTypes.VNISH: self.get_miner_model_vnish,
-                MinerTypes.EPIC: self.get_miner_model_epic,
-                MinerTypes.HIVEON: self.get_miner_model_hiveon,
-                MinerTypes.LUX_OS: self.get_miner_model_luxos,
-                MinerTypes.AURADINE: self.get_miner_model_auradine,
-                MinerTypes.MARATHON: self.get_miner_model_marathon,
-                MinerTypes.BITAXE: self.get_miner_model_bitaxe,
-                MinerTypes.LUCKYMINER: self.get_miner_model_luckyminer,
-                MinerTypes.ICERIVER: self.get_miner_model_iceriver,
-                MinerTypes.HAMMER: self.get_miner_model_hammer,
-                MinerTypes.VOLCMINER: self.get_miner_model_volcminer,
-                MinerTypes.ELPHAPEX: self.get_miner_model_elphapex,
-            }
+            miner_model = await self._get_miner_model(ip, miner_type)
             version: str | None = None
             miner_version_fns = {
                 MinerTypes.WHATSMINER: self.get_miner_version_whatsminer,
             }
-            model_fn = miner_model_fns.get(miner_type)
             version_fn = miner_version_fns.get(miner_type)
-
-            if model_fn is not None:
-                # noinspection PyArgumentList
-                model_task = asyncio.create_task(model_fn(ip))
-                try:
-                    miner_model = await asyncio.wait_for(
-                        model_task, timeout=settings.get("factory_get_timeout", 3)
-                    )
-                except asyncio.TimeoutError:
-                    pass
             if version_fn is not None:
                 version_task = asyncio.create_task(version_fn(ip))
                 try:
@@ -828,17 +976,139 @@ class MinerFactory:
                     )
                 except asyncio.TimeoutError:
                     pass
+            if self.cache is not None:
+                self.cache.set(
+                    IdentificationEntry(
+                        ip=ip,
+                        miner_type=miner_type.name,
+                        model=miner_model,
+                        version=version,
+                        mac=mac,
+                    )
+                )
             miner = self._select_miner_from_classes(
                 ip, miner_type=miner_type, miner_model=miner_model, version=version
             )
             return miner
         return None
 
-    async def _get_miner_type(self, ip: str) -> MinerTypes | None:
-        tasks = [
-            asyncio.create_task(self._get_miner_web(ip)),
-            asyncio.create_task(self._get_miner_socket(ip)),
-        ]
+    async def _get_miner_model(self, ip: str, miner_type: MinerTypes) -> str | None:
+        miner_model_fns = {
+            MinerTypes.ANTMINER: self.get_miner_model_antminer,
+            MinerTypes.WHATSMINER: self.get_miner_model_whatsminer,
+            MinerTypes.AVALONMINER: self.get_miner_model_avalonminer,
+            MinerTypes.INNOSILICON: self.get_miner_model_innosilicon,
+            MinerTypes.GOLDSHELL: self.get_miner_model_goldshell,
+            MinerTypes.BRAIINS_OS: self.get_miner_model_braiins_os,
+            MinerTypes.VNISH: self.get_miner_model_vnish,
+            MinerTypes.EPIC: self.get_miner_model_epic,
+            MinerTypes.HIVEON: self.get_miner_model_hiveon,
+            MinerTypes.LUX_OS: self.get_miner_model_luxos,
+            MinerTypes.AURADINE: self.get_miner_model_auradine,
+            MinerTypes.MARATHON: self.get_miner_model_marathon,
+            MinerTypes.BITAXE: self.get_miner_model_bitaxe,
+            MinerTypes.LUCKYMINER: self.get_miner_model_luckyminer,
+            MinerTypes.ICERIVER: self.get_miner_model_iceriver,
+            MinerTypes.HAMMER: self.get_miner_model_hammer,
+            MinerTypes.VOLCMINER: self.get_miner_model_volcminer,
+            MinerTypes.ELPHAPEX: self.get_miner_model_elphapex,
+        }
+        model_fn = miner_model_fns.get(miner_type)
+        if model_fn is None:
+            return None
+        # noinspection PyArgumentList
+        model_task = asyncio.create_task(model_fn(ip))
+        try:
+            return await asyncio.wait_for(
+                model_task, timeout=settings.get("factory_get_timeout", 3)
+            )
+        except asyncio.TimeoutError:
+            return None
+
+    async def _revalidate_cached(
+        self,
+        ip: str,
+        cached: IdentificationEntry,
+        ports: Collection[int] | None = None,
+    ) -> bool:
+        try:
+            miner_type = MinerTypes[cached.miner_type]
+        except KeyError:
+            return False
+        if self._has_rpc(ports):
+            try:
+                data = await asyncio.wait_for(
+                    self._socket_ping(ip, "version"),
+                    timeout=settings.get("factory_get_timeout", 3),
+                )
+            except asyncio.TimeoutError:
+                data = None
+            if data is not None and self._parse_socket_type(data) == miner_type:
+                model = None
+                if miner_type in VERSION_MODEL_TYPES:
+                    model = self._parse_version_model(data)
+                if model is not None:
+                    return model.upper() == (cached.model or "").upper()
+                return await self._revalidate_model(ip, cached, miner_type)
+        if not self._has_web(ports):
+            return False
+
+        # web only miners, or miners identified from their web page
+        try:
+            async with settings.http_client(ip, verify=False) as session:
+                text, resp = await asyncio.wait_for(
+                    self._web_ping(session, f"http://{ip}/"),
+                    timeout=settings.get("factory_get_timeout", 3),
+                )
+        except asyncio.TimeoutError:
+            return False
+        if text is None or resp is None:
+            return False
+        web_type = self._parse_web_type(text, resp)
+        if web_type != miner_type and (web_type, miner_type) not in [
+            (MinerTypes.ANTMINER, MinerTypes.MARATHON),
+            (MinerTypes.HAMMER, MinerTypes.VOLCMINER),
+        ]:
+            return False
+        return await self._revalidate_model(ip, cached, miner_type)
+
+    async def _revalidate_model(
+        self, ip: str, cached: IdentificationEntry, miner_type: MinerTypes
+    ) -> bool:
+        # a different model of the same make can take over the IP after DHCP churn
+        model = await self._get_miner_model(ip, miner_type)
+        return (model or "").upper() == (cached.model or "").upper()
+
+    @staticmethod
+    def _parse_version_model(data: str) -> str | None:
+        # the model from a `version` response, parsed as `get_miner_model_antminer`,
+        # `get_miner_model_hiveon`, and `get_miner_model_luxos` do
+        try:
+            model = json.loads(data.rstrip("\x00"))["VERSION"][0]["Type"]
+        except (ValueError, TypeError, LookupError):
+            return None
+        if not isinstance(model, str):
+            return None
+        return model.split(" (")[0].replace(" HIVEON", "")
+
+    @staticmethod
+    def _has_web(ports: Collection[int] | None) -> bool:
+        return ports is None or 80 in ports or 443 in ports
+
+    @staticmethod
+    def _has_rpc(ports: Collection[int] | None) -> bool:
+        return ports is None or 4028 in ports
+
+    async def _get_miner_type(
+        self, ip: str, ports: Collection[int] | None = None
+    ) -> MinerTypes | None:
+        tasks = []
+        if self._has_web(ports):
+            tasks.append(asyncio.create_task(self._get_miner_web(ip)))
+        if self._has_rpc(ports):
+            tasks.append(asyncio.create_task(self._get_miner_socket(ip)))
+        if not tasks:
+            return None
 
         return await concurrent_get_first_result(tasks, lambda x: x is not None)
 
@@ -847,15 +1117,13 @@ class MinerFactory:
         async with httpx.AsyncClient(
             transport=settings.transport(verify=False)
         ) as session:
-            tasks = [asyncio.create_task(self._web_ping(session, url)) for url in urls]
+            tasks = [
+                asyncio.create_task(self._get_miner_web_type(session, url))
+                for url in urls
+            ]
 
-            text, resp = await concurrent_get_first_result(
-                tasks,
-                lambda x: x[0] is not None
-                and self._parse_web_type(x[0], x[1]) is not None,
-            )
-            if text is not None:
-                mtype = self._parse_web_type(text, resp)
+            mtype = await concurrent_get_first_result(tasks, lambda x: x is not None)
+            if mtype is not None:
                 if mtype == MinerTypes.ANTMINER:
                     # could still be mara
                     auth = httpx.DigestAuth("root", "root")
@@ -873,6 +1141,14 @@ class MinerFactory:
                 return mtype
         return None
 
+    async def _get_miner_web_type(
+        self, session: httpx.AsyncClient, url: str
+    ) -> MinerTypes | None:
+        text, resp = await self._web_ping(session, url)
+        if text is None or resp is None:
+            return None
+        return self._parse_web_type(text, resp)
+
     @staticmethod
     async def _web_ping(
         session: httpx.AsyncClient, url: str
@@ -891,18 +1167,11 @@ class MinerFactory:
 
     @staticmethod
     def _parse_web_type(web_text: str, web_resp: httpx.Response) -> MinerTypes | None:
-        if web_resp.status_code == 401 and 'realm="antMiner' in web_resp.headers.get(
-            "www-authenticate", ""
-        ):
-            return MinerTypes.ANTMINER
-        if web_resp.status_code == 401 and 'realm="blackMiner' in web_resp.headers.get(
-            "www-authenticate", ""
-        ):
-            return MinerTypes.HAMMER
-        if web_resp.status_code == 401 and 'realm="Daoge' in web_resp.headers.get(
-            "www-authenticate", ""
-        ):
-            return MinerTypes.ELPHAPEX
+        miner_type = WEB_HEADER_FINGERPRINTS.match(
+            web_resp.status_code, web_resp.headers
+        )
+        if miner_type is not None:
+            return miner_type
         if len(web_resp.history) > 0:
             history_resp = web_resp.history[0]
             if (
@@ -911,46 +1180,26 @@ class MinerFactory:
                 and "https://" in history_resp.headers.get("location", "")
             ):
                 return MinerTypes.WHATSMINER
-        if "Braiins OS" in web_text:
-            return MinerTypes.BRAIINS_OS
-        if "Luxor Firmware" in web_text:
-            return MinerTypes.LUX_OS
-        if "<TITLE>用户界面</TITLE>" in web_text:
-            return MinerTypes.ICERIVER
-        if "AxeOS" in web_text:
-            return MinerTypes.BITAXE
-        if "Lucky miner" in web_text:
-            return MinerTypes.LUCKYMINER
-        if "cloud-box" in web_text:
-            return MinerTypes.GOLDSHELL
-        if "AnthillOS" in web_text:
-            return MinerTypes.VNISH
-        if "Miner Web Dashboard" in web_text:
-            return MinerTypes.EPIC
-        if "Avalon" in web_text:
-            return MinerTypes.AVALONMINER
-        if "DragonMint" in web_text:
-            return MinerTypes.INNOSILICON
-        if "Miner UI" in web_text:
-            return MinerTypes.AURADINE
-        return None
+        return WEB_FINGERPRINTS.match(web_text)
 
     async def _get_miner_socket(self, ip: str) -> MinerTypes | None:
         commands = ["version", "devdetails"]
-        tasks = [asyncio.create_task(self._socket_ping(ip, cmd)) for cmd in commands]
+        tasks = [
+            asyncio.create_task(self._get_miner_socket_type(ip, cmd))
+            for cmd in commands
+        ]
 
-        data = await concurrent_get_first_result(
-            tasks,
-            lambda x: x is not None and self._parse_socket_type(x) is not None,
-        )
-        if data is not None:
-            d = self._parse_socket_type(data)
-            return d
-        return None
+        return await concurrent_get_first_result(tasks, lambda x: x is not None)
+
+    async def _get_miner_socket_type(self, ip: str, cmd: str) -> MinerTypes | None:
+        data = await self._socket_ping(ip, cmd)
+        if data is None:
+            return None
+        return self._parse_socket_type(data)
 
     @staticmethod
     async def _socket_ping(ip: str, cmd: str) -> str | None:
-        data = b""
+        data = bytearray()
         try:
             reader, writer = await asyncio.wait_for(
                 asyncio.open_connection(str(ip), 4028),
@@ -966,14 +1215,17 @@ class MinerFactory:
             writer.write(json.dumps(command_dict).encode("utf-8"))
             await writer.drain()
 
-            # loop to receive all the data
+            # loop to receive the data, until the response is complete or too large
+            max_bytes = settings.get("factory_socket_max_bytes", 65536)
             timeouts_remaining = max(1, int(settings.get("factory_get_timeout", 3)))
-            while True:
+            while len(data) < max_bytes:
                 try:
                     d = await asyncio.wait_for(reader.read(4096), timeout=1)
                     if not d:
                         break
                     data += d
+                    if _socket_response_complete(data):
+                        break
                 except asyncio.TimeoutError:
                     timeouts_remaining -= 1
                     if not timeouts_remaining:
@@ -996,41 +1248,12 @@ class MinerFactory:
             except (ConnectionError, OSError):
                 pass
         if data:
-            return data.decode("utf-8")
+            return data.decode("utf-8", errors="replace")
         return None
 
     @staticmethod
     def _parse_socket_type(data: str) -> MinerTypes | None:
-        upper_data = data.upper()
-        if "BOSMINER" in upper_data or "BOSER" in upper_data:
-            return MinerTypes.BRAIINS_OS
-        if "BTMINER" in upper_data or "BITMICRO" in upper_data:
-            return MinerTypes.WHATSMINER
-        if "LUXMINER" in upper_data:
-            return MinerTypes.LUX_OS
-        if "HIVEON" in upper_data:
-            return MinerTypes.HIVEON
-        if "KAONSU" in upper_data:
-            return MinerTypes.MARATHON
-        if "RWGLR" in upper_data:
-            return MinerTypes.MSKMINER
-        if "ANTMINER" in upper_data and "DEVDETAILS" not in upper_data:
-            return MinerTypes.ANTMINER
-        if (
-            "INTCHAINS_QOMO" in upper_data
-            or "KDAMINER" in upper_data
-            or "BFGMINER" in upper_data
-        ):
-            return MinerTypes.GOLDSHELL
-        if "INNOMINER" in upper_data:
-            return MinerTypes.INNOSILICON
-        if "AVALON" in upper_data:
-            return MinerTypes.AVALONMINER
-        if "GCMINER" in upper_data or "FLUXOS" in upper_data:
-            return MinerTypes.AURADINE
-        if "VNISH" in upper_data:
-            return MinerTypes.VNISH
-        return None
+        return SOCKET_FINGERPRINTS.match(data)
 
     async def send_web_command(
         self,
@@ -1185,7 +1408,7 @@ class MinerFactory:
             miner_type = MinerTypes.HIVEON
 
         if miner_type is None:
-            return cast(AnyMiner, UnknownMiner(str(ip), version))
+            return cast(AnyMiner, _load_class(_UNKNOWN_MINER)(str(ip), version))
 
         try:
             return MINER_CLASSES[miner_type][str(miner_model).upper()](ip, version)
@@ -1197,7 +1420,7 @@ class MinerFactory:
                         f"and this model on GitHub (https://github.com/UpstreamData/pyasic/issues)."
                     )
                 return MINER_CLASSES[miner_type][None](ip, version)
-            return cast(AnyMiner, UnknownMiner(str(ip), version))
+            return cast(AnyMiner, _load_class(_UNKNOWN_MINER)(str(ip), version))
 
     async def get_miner_model_antminer(self, ip: str) -> str | None:
         tasks = [
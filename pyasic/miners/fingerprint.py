@@ -0,0 +1,196 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# identifying tokens are near the start of a response, so don't search huge pages
+DEFAULT_MAX_LENGTH = 256 * 1024
+
+
+@dataclass(frozen=True)
+class Fingerprint(Generic[T]):
+    """A token identifying a response.
+
+    Attributes:
+        token: The text to look for.
+        result: The value to return when the token is found.
+        exclude: Tokens which prevent this fingerprint from matching if any of them are found.
+        priority: Fingerprints with a higher priority are checked first.  Fingerprints with the same priority are checked in the order they were added.
+    """
+
+    token: str
+    result: T
+    exclude: tuple[str, ...] = ()
+    priority: int = 0
+
+
+@dataclass(frozen=True)
+class HeaderFingerprint(Generic[T]):
+    """A token identifying a response from one of its headers.
+
+    Attributes:
+        header: The name of the header to check.
+        token: The text to look for in the header.
+        result: The value to return when the token is found.
+        status_code: The status code the response must have, or `None` to allow any.
+    """
+
+    header: str
+    token: str
+    result: T
+    status_code: int | None = None
+
+
+class FingerprintMatcher(Generic[T]):
+    """Find the first [`Fingerprint`][pyasic.miners.fingerprint.Fingerprint] matching some text.
+
+    Fingerprints are compiled into a table of normalized tokens in priority order the
+    first time text is matched after a change, so each match only normalizes the text
+    once, and stops at the first fingerprint found.
+
+    Parameters:
+        fingerprints: The fingerprints to start with.
+        ignore_case: Whether to match tokens regardless of case.
+        max_length: Only the first `max_length` characters of the text are searched.
+    """
+
+    def __init__(
+        self,
+        fingerprints: Iterable[Fingerprint[T]] = (),
+        ignore_case: bool = False,
+        max_length: int = DEFAULT_MAX_LENGTH,
+    ) -> None:
+        self.ignore_case = ignore_case
+        self.max_length = max_length
+        self._fingerprints: list[Fingerprint[T]] = list(fingerprints)
+        self._table: tuple[tuple[str, tuple[str, ...], T], ...] | None = None
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    @property
+    def fingerprints(self) -> list[Fingerprint[T]]:
+        """The fingerprints, in the order they are checked."""
+        return sorted(self._fingerprints, key=lambda f: -f.priority)
+
+    def add(self, fingerprint: Fingerprint[T]) -> None:
+        """Add a fingerprint.
+
+        Parameters:
+            fingerprint: The fingerprint to add.
+        """
+        self._fingerprints.append(fingerprint)
+        self._table = None
+
+    def register(
+        self,
+        token: str,
+        result: T,
+        exclude: Iterable[str] = (),
+        priority: int = 0,
+    ) -> None:
+        """Add a fingerprint from its token.
+
+        Parameters:
+            token: The text to look for.
+            result: The value to return when the token is found.
+            exclude: Tokens which prevent this fingerprint from matching if any of them are found.
+            priority: Fingerprints with a higher priority are checked first.
+        """
+        self.add(Fingerprint(token, result, tuple(exclude), priority))
+
+    def _normalize(self, text: str) -> str:
+        return text.upper() if self.ignore_case else text
+
+    def _compile(self) -> tuple[tuple[str, tuple[str, ...], T], ...]:
+        self._table = tuple(
+            (
+                self._normalize(f.token),
+                tuple(self._normalize(e) for e in f.exclude),
+                f.result,
+            )
+            for f in self.fingerprints
+        )
+        return self._table
+
+    def match(self, text: str) -> T | None:
+        """Find the result of the first fingerprint matching some text.
+
+        Parameters:
+            text: The text to search.
+
+        Returns:
+            The result of the matching fingerprint, or `None` if no fingerprints match.
+        """
+        table = self._table if self._table is not None else self._compile()
+        if len(text) > self.max_length:
+            text = text[: self.max_length]
+        text = self._normalize(text)
+        for token, exclude, result in table:
+            if token in text:
+                if exclude and any(e in text for e in exclude):
+                    continue
+                return result
+        return None
+
+
+class HeaderMatcher(Generic[T]):
+    """Find the first [`HeaderFingerprint`][pyasic.miners.fingerprint.HeaderFingerprint] matching a response.
+
+    Parameters:
+        fingerprints: The fingerprints to start with.
+    """
+
+    def __init__(self, fingerprints: Iterable[HeaderFingerprint[T]] = ()) -> None:
+        self._fingerprints: list[HeaderFingerprint[T]] = list(fingerprints)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def register(
+        self, header: str, token: str, result: T, status_code: int | None = None
+    ) -> None:
+        """Add a fingerprint.
+
+        Parameters:
+            header: The name of the header to check.
+            token: The text to look for in the header.
+            result: The value to return when the token is found.
+            status_code: The status code the response must have, or `None` to allow any.
+        """
+        self._fingerprints.append(HeaderFingerprint(header, token, result, status_code))
+
+    def match(self, status_code: int, headers: Mapping[str, str]) -> T | None:
+        """Find the result of the first fingerprint matching a response.
+
+        Parameters:
+            status_code: The status code of the response.
+            headers: The headers of the response.
+
+        Returns:
+            The result of the matching fingerprint, or `None` if no fingerprints match.
+        """
+        for f in self._fingerprints:
+            if f.status_code is not None and f.status_code != status_code:
+                continue
+            if f.token in headers.get(f.header, ""):
+                return f.result
+        return None
@@ -95,6 +95,7 @@ class GoldshellByte(GoldshellMiner, Byte):
         allow_warning: bool = False,
         include: list[str | DataOptions] | None = None,
         exclude: list[str | DataOptions] | None = None,
+        validate: bool = True,
     ) -> MinerData:
         if self.web_devs is None:
             try:
@@ -126,7 +127,7 @@ class GoldshellByte(GoldshellMiner, Byte):
         elif zksnark_board_count > 0 and scrypt_board_count == 0:
             self.algo = MinerAlgo.ZKSNARK  # type: ignore[assignment]
 
-        data = await super().get_data(allow_warning, include, exclude)
+        data = await super().get_data(allow_warning, include, exclude, validate)
         data.expected_chips = self.expected_chips
 
         return data
@@ -1 +1,2 @@
+from .ALX import *
 from .KSX import *
@@ -15,9 +15,53 @@
 # ------------------------------------------------------------------------------
 from __future__ import annotations
 
+from collections.abc import Collection
+from contextvars import ContextVar
 from copy import deepcopy
 
-from pyasic.errors import APIError
+from pyasic import settings
+from pyasic.errors import APIError, ParsePhaseIOError
+
+# the data item `get_data` is currently parsing, if any
+parse_phase: ContextVar[str | None] = ContextVar("parse_phase", default=None)
+
+
+def check_parse_phase_io(source: object) -> None:
+    """Flag I/O performed by a data function while `get_data` is parsing.
+
+    Does nothing unless the `debug_parse_phase_io` setting is enabled.
+
+    Parameters:
+        source: The API or connection performing the I/O, used in the error message.
+
+    Raises:
+        ParsePhaseIOError: If called while `get_data` is parsing a data item.
+    """
+    data_name = parse_phase.get()
+    if data_name is not None and settings.get("debug_parse_phase_io", False):
+        raise ParsePhaseIOError(
+            f"{source} performed I/O while parsing {data_name}, "
+            "the data should be gathered in the batched command phase."
+        )
+
+
+def public_commands(cls: type, exclude: Collection[str] = ()) -> frozenset[str]:
+    """Get the names of the public methods of an API class, which are its commands.
+
+    Parameters:
+        cls: The API class.
+        exclude: Names which are not commands, such as the methods of the base class.
+
+    Returns:
+        The names of the public callable attributes of the class.
+    """
+    return frozenset(
+        name
+        for name in dir(cls)
+        if not name.startswith("_")
+        and name not in exclude
+        and callable(getattr(cls, name, None))
+    )
 
 
 def api_min_version(version: str):
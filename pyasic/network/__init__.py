@@ -17,21 +17,29 @@
 import asyncio
 import ipaddress
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from typing import cast
 
 from pyasic import settings
 from pyasic.miners.factory import AnyMiner, miner_factory
+from pyasic.network.hosts import HostRange
+
+# the number of hosts scanned at once if `network_scan_semaphore` is not set
+DEFAULT_SCAN_LIMIT = 1000
+# the number of hosts probed for liveness at once if `network_liveness_semaphore` is not set
+DEFAULT_LIVENESS_LIMIT = 2000
+# web, RPC, and alternate RPC ports checked when probing if a host is up
+LIVENESS_PORTS = (80, 443, 4028, 4029, 8889)
 
 
 class MinerNetwork:
     """A class to handle a network containing miners. Handles scanning and gets miners via [`MinerFactory`][pyasic.miners.factory.MinerFactory].
 
     Parameters:
-        hosts: A list of `ipaddress.IPv4Address` to be used when scanning.
+        hosts: The hosts to be used when scanning, either a [`HostRange`][pyasic.network.hosts.HostRange] or a list of `ipaddress.IPv4Address`.
     """
 
-    def __init__(self, hosts: list[ipaddress.IPv4Address]):
+    def __init__(self, hosts: HostRange | list[ipaddress.IPv4Address]):
         self.hosts = hosts
         semaphore_limit = settings.get("network_scan_semaphore", 255)
         if semaphore_limit is None:
@@ -48,10 +56,14 @@ class MinerNetwork:
         Parameters:
             addresses: A list of address constructors, such as `["10.1-2.1.1-50", "10.4.1-2.1-50"]`.
         """
-        hosts: list[ipaddress.IPv4Address] = []
+        ranges: list[tuple[int, int]] = []
         for address in addresses:
-            hosts = [*hosts, *cls.from_address(address).hosts]
-        return cls(sorted(list(set(hosts))))
+            hosts = cls.from_address(address).hosts
+            if isinstance(hosts, HostRange):
+                ranges.extend(hosts.ranges)
+            else:
+                ranges.extend((int(h), int(h)) for h in hosts)
+        return cls(HostRange(ranges))
 
     @classmethod
     def from_address(cls, address: str) -> "MinerNetwork":
@@ -80,30 +92,11 @@ class MinerNetwork:
             oct_4: An octet constructor, such as `"1-50"`.
         """
 
-        hosts: list[ipaddress.IPv4Address] = []
-
-        oct_1_start, oct_1_end = compute_oct_range(oct_1)
-        for oct_1_idx in range((abs(oct_1_end - oct_1_start)) + 1):
-            oct_1_val = str(oct_1_idx + oct_1_start)
-
-            oct_2_start, oct_2_end = compute_oct_range(oct_2)
-            for oct_2_idx in range((abs(oct_2_end - oct_2_start)) + 1):
-                oct_2_val = str(oct_2_idx + oct_2_start)
-
-                oct_3_start, oct_3_end = compute_oct_range(oct_3)
-                for oct_3_idx in range((abs(oct_3_end - oct_3_start)) + 1):
-                    oct_3_val = str(oct_3_idx + oct_3_start)
-
-                    oct_4_start, oct_4_end = compute_oct_range(oct_4)
-                    for oct_4_idx in range((abs(oct_4_end - oct_4_start)) + 1):
-                        oct_4_val = str(oct_4_idx + oct_4_start)
-
-                        ip_addr = ipaddress.ip_address(
-                            ".".join([oct_1_val, oct_2_val, oct_3_val, oct_4_val])
-                        )
-                        if isinstance(ip_addr, ipaddress.IPv4Address):
-                            hosts.append(ip_addr)
-        return cls(sorted(hosts))
+        bounds = []
+        for octet in (oct_1, oct_2, oct_3, oct_4):
+            start, end = compute_oct_range(octet)
+            bounds.append((min(start, end), max(start, end)))
+        return cls(HostRange.from_octets(*bounds))
 
     @classmethod
     def from_subnet(cls, subnet: str) -> "MinerNetwork":
@@ -113,10 +106,9 @@ class MinerNetwork:
             subnet: A subnet string, such as `"10.0.0.1/24"`.
         """
         network = ipaddress.ip_network(subnet, strict=False)
-        hosts = [
-            host for host in network.hosts() if isinstance(host, ipaddress.IPv4Address)
-        ]
-        return cls(hosts)
+        if not isinstance(network, ipaddress.IPv4Network):
+            return cls(HostRange())
+        return cls(HostRange.from_network(network))
 
     async def scan(self) -> list[AnyMiner]:
         """Scan the network for miners.
@@ -129,14 +121,15 @@ class MinerNetwork:
     async def scan_network_for_miners(self) -> list[AnyMiner]:
         logging.debug(f"{self} - (Scan Network For Miners) - Scanning")
 
-        raw_miners: list[AnyMiner | None] = await asyncio.gather(
-            *[self.ping_and_get_miner(host) for host in self.hosts]
-        )
-
-        # remove all None from the miner list
         miners: list[AnyMiner] = cast(
-            list[AnyMiner], [miner for miner in raw_miners if miner is not None]
+            list[AnyMiner],
+            [
+                miner
+                async for miner in self.scan_network_generator()
+                if miner is not None
+            ],
         )
+        miners.sort()
         logging.debug(
             f"{self} - (Scan Network For Miners) - Found {len(miners)} miners"
         )
@@ -148,20 +141,80 @@ class MinerNetwork:
         """
         Scan the network for miners using an async generator.
 
+        Hosts are pulled from the network lazily and scanned in two stages.  First, a
+        short TCP liveness probe checks all the common miner ports of a host at once,
+        with up to `network_liveness_semaphore` hosts probed at a time.  Hosts with an
+        open port are then identified by [`MinerFactory`][pyasic.miners.factory.MinerFactory],
+        with at most `network_scan_semaphore` (or 1000 if unset) identified at once, and
+        the factory skips any probes for ports known to be closed.
+
         Returns:
              An asynchronous generator containing found miners.
         """
-        # create a list of scan tasks
-        tasks: list[asyncio.Task[AnyMiner | None]] = [
-            asyncio.create_task(self.ping_and_get_miner(host)) for host in self.hosts
-        ]
-        for miner in asyncio.as_completed(tasks):
+        limit = settings.get("network_scan_semaphore") or DEFAULT_SCAN_LIMIT
+        liveness_limit = settings.get(
+            "network_liveness_semaphore", DEFAULT_LIVENESS_LIMIT
+        )
+        hosts = iter(self.hosts)
+        alive: asyncio.Queue[tuple[ipaddress.IPv4Address, set[int]] | None] = (
+            asyncio.Queue(maxsize=limit)
+        )
+        results: asyncio.Queue[AnyMiner | None] = asyncio.Queue(maxsize=limit)
+        done = object()
+
+        async def liveness_worker() -> None:
+            for host in hosts:
+                open_ports = await probe_ports(host)
+                if open_ports:
+                    await alive.put((host, open_ports))
+                else:
+                    await results.put(None)
+
+        async def identify_worker() -> None:
+            while (item := await alive.get()) is not None:
+                host, open_ports = item
+                try:
+                    result = await miner_factory.get_miner(host, ports=open_ports)  # type: ignore[func-returns-value]
+                except TimeoutError:
+                    result = None
+                except Exception as e:
+                    # one bad host should not abort the whole scan
+                    logging.warning(f"{str(host)}: Unhandled ping exception: {e}")
+                    result = None
+                await results.put(result)
+
+        async def run_workers() -> None:
+            probes = [
+                asyncio.create_task(liveness_worker())
+                for _ in range(min(liveness_limit, len(self.hosts)))
+            ]
+            identifiers = [
+                asyncio.create_task(identify_worker())
+                for _ in range(min(limit, len(self.hosts)))
+            ]
+            error: Exception | None = None
             try:
-                result = await miner
+                await asyncio.gather(*probes)
+                for _ in identifiers:
+                    await alive.put(None)
+                await asyncio.gather(*identifiers)
+            except Exception as e:
+                error = e
+            finally:
+                for task in [*probes, *identifiers]:
+                    task.cancel()
+            await results.put(done)  # type: ignore[arg-type]
+            if error is not None:
+                raise error
+
+        runner = asyncio.create_task(run_workers())
+        try:
+            while (result := await results.get()) is not done:
                 yield result
-            except TimeoutError:
-                yield None
-        return
+        finally:
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+        runner.result()
 
     async def ping_and_get_miner(
         self, ip: ipaddress.IPv4Address | ipaddress.IPv6Address
@@ -175,19 +228,54 @@ class MinerNetwork:
     async def _ping_and_get_miner(
         ip: ipaddress.IPv4Address | ipaddress.IPv6Address,
     ) -> AnyMiner | None:
+        open_ports = await probe_ports(ip)
+        if not open_ports:
+            return None
+        return await miner_factory.get_miner(ip, ports=open_ports)  # type: ignore[func-returns-value]
+
+
+async def probe_ports(
+    ip: ipaddress.IPv4Address | ipaddress.IPv6Address | str,
+    ports: Iterable[int] = LIVENESS_PORTS,
+) -> set[int]:
+    """Check which ports of a host accept a TCP connection.
+
+    All ports are probed at once, with a timeout of `network_liveness_timeout`.  If
+    every probe times out, the host is retried up to `network_ping_retries` times.
+
+    Parameters:
+        ip: The host to probe.
+        ports: The ports to probe.
+
+    Returns:
+        The ports that accepted a connection, or an empty set if the host is down.
+    """
+    timeout = settings.get("network_liveness_timeout", 1)
+
+    async def _probe(port: int) -> bool | None:
         try:
-            return await ping_and_get_miner(ip)  # type: ignore[func-returns-value]
-        except ConnectionRefusedError:
-            tasks: list[asyncio.Task[AnyMiner | None]] = [
-                asyncio.create_task(ping_and_get_miner(ip, port=port))
-                for port in [4028, 4029, 8889]
-            ]
-            for miner in asyncio.as_completed(tasks):
-                try:
-                    return await miner
-                except ConnectionRefusedError:
-                    pass
-        return None
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(str(ip), port), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return None
+        except OSError:
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+    ports = list(ports)
+    for _ in range(settings.get("network_ping_retries", 1)):
+        results = await asyncio.gather(*[_probe(port) for port in ports])
+        open_ports = {port for port, res in zip(ports, results) if res}
+        # only retry if nothing answered, a refused connection means the host is up
+        if open_ports or any(res is not None for res in results):
+            return open_ports
+    return set()
 
 
 async def ping_and_get_miner(
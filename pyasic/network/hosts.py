@@ -0,0 +1,125 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import bisect
+import ipaddress
+import itertools
+from collections.abc import Iterable, Iterator
+from typing import Any, overload
+
+
+class HostRange:
+    """A sorted, de-duplicated set of IPv4 hosts, stored as ranges instead of a list.
+
+    Iterating a `HostRange` creates each `ipaddress.IPv4Address` on demand, so even
+    very large ranges use a small, fixed amount of memory.
+
+    Parameters:
+        ranges: Inclusive `(start, end)` pairs of integer IPv4 addresses.
+    """
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        merged: list[tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        self.ranges = merged
+        # offset of the first host of each range, used for indexing
+        self._offsets = list(
+            itertools.accumulate((e - s + 1 for s, e in merged), initial=0)
+        )
+
+    @classmethod
+    def from_network(cls, network: ipaddress.IPv4Network) -> HostRange:
+        """Create a range from the usable hosts of a network, matching `network.hosts()`."""
+        first = int(network.network_address)
+        last = int(network.broadcast_address)
+        if network.prefixlen < network.max_prefixlen - 1:
+            first += 1
+            last -= 1
+        return cls([(first, last)])
+
+    @classmethod
+    def from_octets(
+        cls,
+        oct_1: tuple[int, int],
+        oct_2: tuple[int, int],
+        oct_3: tuple[int, int],
+        oct_4: tuple[int, int],
+    ) -> HostRange:
+        """Create a range from inclusive `(start, end)` bounds for each octet."""
+        for start, end in (oct_1, oct_2, oct_3, oct_4):
+            if not 0 <= start <= end <= 255:
+                raise ValueError(f"Invalid octet range: {start}-{end}")
+        return cls(
+            (
+                (a << 24) + (b << 16) + (c << 8) + oct_4[0],
+                (a << 24) + (b << 16) + (c << 8) + oct_4[1],
+            )
+            for a in range(oct_1[0], oct_1[1] + 1)
+            for b in range(oct_2[0], oct_2[1] + 1)
+            for c in range(oct_3[0], oct_3[1] + 1)
+        )
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __iter__(self) -> Iterator[ipaddress.IPv4Address]:
+        for start, end in self.ranges:
+            for addr in range(start, end + 1):
+                yield ipaddress.IPv4Address(addr)
+
+    @overload
+    def __getitem__(self, idx: int) -> ipaddress.IPv4Address: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[ipaddress.IPv4Address]: ...
+
+    def __getitem__(self, idx: int | slice) -> Any:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("HostRange index out of range")
+        range_idx = bisect.bisect_right(self._offsets, idx) - 1
+        start, _ = self.ranges[range_idx]
+        return ipaddress.IPv4Address(start + idx - self._offsets[range_idx])
+
+    def __contains__(self, item: object) -> bool:
+        try:
+            addr = int(ipaddress.IPv4Address(item))
+        except ValueError:
+            return False
+        range_idx = bisect.bisect_right(self.ranges, (addr, 2**32)) - 1
+        return range_idx >= 0 and self.ranges[range_idx][1] >= addr
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HostRange):
+            return self.ranges == other.ranges
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __or__(self, other: HostRange) -> HostRange:
+        return HostRange([*self.ranges, *other.ranges])
+
+    def __repr__(self) -> str:
+        return f"HostRange({len(self)} hosts, {len(self.ranges)} ranges)"
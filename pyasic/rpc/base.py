@@ -20,12 +20,29 @@ import json
 import logging
 import re
 import warnings
+from collections.abc import Iterable
+from typing import Any
 
+from pyasic import settings
 from pyasic.errors import APIError, APIWarning
-from pyasic.misc import validate_command_output
+from pyasic.misc import (
+    check_parse_phase_io,
+    public_commands,
+    validate_command_output,
+)
+from pyasic.rpc.capabilities import RPCCapabilities
 
 
 class BaseMinerRPCAPI:
+    # whether the firmware keeps the connection open between commands
+    supports_persistent: bool = False
+    # the commands of each subclass, set when the subclass is created
+    command_set: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.command_set = public_commands(cls, exclude=_BASE_COMMANDS)
+
     def __init__(self, ip: str, port: int = 4028, api_ver: str = "0.0.0") -> None:
         # api port, should be 4028
         self.port = port
@@ -36,6 +53,19 @@ class BaseMinerRPCAPI:
 
         self.pwd: str | None = None
 
+        self._persistent = self.supports_persistent and bool(
+            settings.get("rpc_persistent_connections", False)
+        )
+        self._connection: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = (
+            None
+        )
+        self._connection_port: int | None = None
+        self._connection_loop: asyncio.AbstractEventLoop | None = None
+        self._connection_lock: asyncio.Lock | None = None
+
+        # miners share this between instances of the same model and firmware
+        self.capabilities = RPCCapabilities()
+
     def __new__(cls, *args, **kwargs):
         if cls is BaseMinerRPCAPI:
             raise TypeError(f"Only children of '{cls.__name__}' may be instantiated")
@@ -44,6 +74,36 @@ class BaseMinerRPCAPI:
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {str(self.ip)}"
 
+    @property
+    def persistent(self) -> bool:
+        """Whether commands are sent over a single reused connection.
+
+        Only firmwares that keep the RPC connection open support this, and commands are
+        sent one at a time over the connection.  Defaults to the `rpc_persistent_connections`
+        setting.
+        """
+        return self._persistent
+
+    @persistent.setter
+    def persistent(self, value: bool) -> None:
+        if value and not self.supports_persistent:
+            raise ValueError(
+                f"{self.__class__.__name__} does not support persistent connections."
+            )
+        self._persistent = value
+
+    async def aclose(self) -> None:
+        """Close the persistent connection to the miner, if one is open."""
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        _, writer = connection
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
     async def send_command(
         self,
         command: str,
@@ -115,13 +175,30 @@ class BaseMinerRPCAPI:
         """
         # make sure we can actually run each command, otherwise they will fail
         valid_commands = self._check_commands(*commands)
+        capabilities = self.capabilities
+        if capabilities.joined_multicommand is False:
+            # already known not to work, skip straight to sending them separately
+            data = await self._send_split_multicommand(
+                *valid_commands, allow_warning=allow_warning
+            )
+            data["multicommand"] = True
+            return data
+
         # standard multicommand format is "command1+command2"
         # doesn't work for S19 which uses the backup _send_split_multicommand
         command = "+".join(valid_commands)
         try:
             data = await self.send_command(command, allow_warning=allow_warning)
-        except APIError:
-            data = await self._send_split_multicommand(*commands)
+            if len(valid_commands) > 1:
+                capabilities.joined_succeeded()
+        except APIError as e:
+            data = await self._send_split_multicommand(
+                *valid_commands, allow_warning=allow_warning
+            )
+            # if one of the commands failed on its own, it may have been the reason
+            # the joined command failed, so only count it against joining if they all worked
+            if len(valid_commands) > 1 and all(c in data for c in valid_commands):
+                capabilities.joined_failed(e)
         data["multicommand"] = True
         return data
 
@@ -141,7 +218,10 @@ class BaseMinerRPCAPI:
 
         data = {}
         for cmd, result in zip(tasks.keys(), results):
-            if not isinstance(result, (APIError, Exception)):
+            if isinstance(result, APIError):
+                self.capabilities.command_failed(cmd, result)
+            elif not isinstance(result, Exception):
+                self.capabilities.command_succeeded(cmd)
                 if result is None or result == {}:
                     result = {}
                 data[cmd] = [result]
@@ -158,32 +238,17 @@ class BaseMinerRPCAPI:
         Returns:
             A list of all API commands that the miner supports.
         """
-        return [
-            func
-            for func in
-            # each function in self
-            dir(self)
-            if func not in ["commands", "open_api"]
-            if callable(getattr(self, func))
-            and
-            # no __ or _ methods
-            not func.startswith("__")
-            and not func.startswith("_")
-            and
-            # remove all functions that are in this base class
-            func
-            not in [
-                func
-                for func in dir(BaseMinerRPCAPI)
-                if callable(getattr(BaseMinerRPCAPI, func))
-            ]
-        ]
+        return sorted(self.command_set)
 
     def _check_commands(self, *commands) -> list:
-        allowed_commands = self.commands
+        allowed_commands = self.command_set
+        capabilities = self.capabilities
         return_commands = []
 
         for command in commands:
+            if capabilities.is_unsupported(command):
+                # the miner already rejected this, don't ask again
+                continue
             if command in allowed_commands:
                 return_commands.append(command)
             else:
@@ -196,13 +261,26 @@ If you are sure you want to use this command please use API.send_command("{comma
 
     async def _send_bytes(
         self,
-        data: bytes,
+        data: bytes | Iterable[bytes | memoryview],
+        *,
+        port: int | None = None,
+        timeout: int = 100,
+    ) -> bytes:
+        check_parse_phase_io(self)
+        async with settings.governor().limit("rpc", str(self.ip)):
+            return await self._send_bytes_direct(data, port=port, timeout=timeout)
+
+    async def _send_bytes_direct(
+        self,
+        data: bytes | Iterable[bytes | memoryview],
         *,
         port: int | None = None,
         timeout: int = 100,
     ) -> bytes:
         if port is None:
             port = self.port
+        if self.persistent:
+            return await self._send_bytes_persistent(data, port=port, timeout=timeout)
         logging.debug(f"{self} - ([Hidden] Send Bytes) - Sending")
         try:
             # get reader and writer streams
@@ -219,9 +297,7 @@ If you are sure you want to use this command please use API.send_command("{comma
         try:
             data_task = asyncio.create_task(self._read_bytes(reader, timeout=timeout))
             logging.debug(f"{self} - ([Hidden] Send Bytes) - Writing")
-            writer.write(data)
-            logging.debug(f"{self} - ([Hidden] Send Bytes) - Draining")
-            await writer.drain()
+            await self._write(writer, data)
 
             await data_task
             ret_data = data_task.result()
@@ -236,6 +312,95 @@ If you are sure you want to use this command please use API.send_command("{comma
 
         return ret_data
 
+    @staticmethod
+    async def _write(
+        writer: asyncio.StreamWriter, data: bytes | Iterable[bytes | memoryview]
+    ) -> None:
+        if isinstance(data, (bytes, bytearray)):
+            writer.write(data)
+            await writer.drain()
+            return
+        # large payloads are written a chunk at a time, so only one chunk is buffered
+        for chunk in data:
+            writer.write(chunk)
+            await writer.drain()
+
+    async def _send_bytes_persistent(
+        self,
+        data: bytes | Iterable[bytes | memoryview],
+        *,
+        port: int,
+        timeout: int = 100,
+    ) -> bytes:
+        loop = asyncio.get_running_loop()
+        if self._connection_loop is not loop:
+            # connections and locks can't be shared between event loops
+            self._connection = None
+            self._connection_loop = loop
+            self._connection_lock = asyncio.Lock()
+        assert self._connection_lock is not None
+
+        async with self._connection_lock:
+            # retry once on a fresh connection if the kept one was closed by the miner
+            for attempt in range(2):
+                if self._connection_port != port:
+                    await self.aclose()
+                if self._connection is None or self._connection[1].is_closing():
+                    try:
+                        self._connection = await asyncio.open_connection(
+                            str(self.ip), port
+                        )
+                    except OSError:
+                        self._connection = None
+                        return b"{}"
+                    self._connection_port = port
+                reader, writer = self._connection
+                try:
+                    await self._write(writer, data)
+                    return await asyncio.wait_for(
+                        self._read_frame(reader), timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    logging.warning(
+                        f"{self} - ([Hidden] Send Bytes) - Read timeout expired."
+                    )
+                    await self.aclose()
+                    return b"{}"
+                except (ConnectionError, OSError, asyncio.IncompleteReadError):
+                    await self.aclose()
+                    # a partly sent stream can't be sent again
+                    if attempt or not isinstance(data, (bytes, bytearray)):
+                        return b"{}"
+        return b"{}"
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        """Read one response from a persistent connection.
+
+        Responses end with a null byte, or once they hold a complete JSON document.
+        A null byte which arrives after its document was already returned is dropped
+        from the start of the next response.
+        """
+        buffer = bytearray()
+        while True:
+            chunk = await reader.read(4096)
+            if not chunk:
+                if buffer:
+                    return bytes(buffer)
+                raise ConnectionResetError("Connection closed by miner.")
+            buffer += chunk
+            if buffer.startswith(b"\x00"):
+                del buffer[: len(buffer) - len(buffer.lstrip(b"\x00"))]
+                if not buffer:
+                    continue
+            if buffer.endswith(b"\x00"):
+                return bytes(buffer)
+            if buffer.rstrip().endswith(b"}"):
+                try:
+                    json.loads(buffer)
+                except ValueError:
+                    continue
+                return bytes(buffer)
+
     async def _read_bytes(self, reader: asyncio.StreamReader, timeout: int) -> bytes:
         ret_data = b""
 
@@ -290,3 +455,7 @@ If you are sure you want to use this command please use API.send_command("{comma
         except json.decoder.JSONDecodeError as e:
             raise APIError(f"Decode Error {e}: {str_data}")
         return parsed_data
+
+
+# methods of the base class aren't commands
+_BASE_COMMANDS = public_commands(BaseMinerRPCAPI) | {"commands", "open_api"}
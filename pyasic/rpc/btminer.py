@@ -19,23 +19,28 @@ import base64
 import binascii
 import datetime
 import hashlib
+import itertools
 import json
 import logging
 import re
 import struct
 import typing
 import warnings
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any, Literal, Optional
 
 import httpx
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from passlib.handlers.md5_crypt import md5_crypt
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from pyasic import settings
 from pyasic.errors import APIError, APIWarning
-from pyasic.misc import api_min_version, validate_command_output
+from pyasic.firmware import FirmwareImage
+from pyasic.misc import (
+    api_min_version,
+    validate_command_output,
+)
 from pyasic.rpc.base import BaseMinerRPCAPI
 
 ### IMPORTANT ###
@@ -56,11 +61,67 @@ class TokenResponse(BaseModel):
         extra = "allow"
 
 
+# how long a privileged API token is reused for
+TOKEN_TTL = datetime.timedelta(minutes=30)
+
+
 class TokenData(BaseModel):
     host_sign: str
     host_passwd_md5: str
     timestamp: datetime.datetime = Field(default_factory=datetime.datetime.now)
 
+    _cipher: Cipher | None = PrivateAttr(default=None)
+    _encryptor: Any = PrivateAttr(default=None)
+    _decryptor: Any = PrivateAttr(default=None)
+
+    @property
+    def expired(self) -> bool:
+        return self.timestamp <= datetime.datetime.now() - TOKEN_TTL
+
+    @property
+    def cipher(self) -> Cipher:
+        """The AES cipher keyed from `host_passwd_md5`, derived once per token."""
+        if self._cipher is None:
+            aeskey = hashlib.sha256(self.host_passwd_md5.encode()).digest()
+            self._cipher = Cipher(algorithms.AES(aeskey), modes.ECB())
+        return self._cipher
+
+    def encrypt(self, data: bytes) -> bytes:
+        if len(data) % 16 != 0:
+            # a partial block would be held over into the next message
+            return self.cipher.encryptor().update(data)
+        if self._encryptor is None:
+            self._encryptor = self.cipher.encryptor()
+        return self._encryptor.update(data)
+
+    def decrypt(self, data: bytes) -> bytes:
+        if len(data) % 16 != 0:
+            return self.cipher.decryptor().update(data)
+        if self._decryptor is None:
+            self._decryptor = self.cipher.decryptor()
+        return self._decryptor.update(data)
+
+
+# tokens shared between API instances, keyed by miner IP and password
+_token_cache: dict[tuple[str, str], TokenData] = {}
+# V3 API salts shared between API instances, keyed by miner IP
+_salt_cache: dict[str, str] = {}
+
+
+def clear_token_cache(ip: str | None = None) -> None:
+    """Clear cached privileged API tokens and V3 API salts.
+
+    Parameters:
+        ip: The IP of the miner to clear tokens for. Clears all tokens if not passed.
+    """
+    if ip is None:
+        _token_cache.clear()
+        _salt_cache.clear()
+        return
+    for key in [k for k in _token_cache if k[0] == str(ip)]:
+        del _token_cache[key]
+    _salt_cache.pop(str(ip), None)
+
 
 class BTMinerPrivilegedCommand(BaseModel):
     cmd: str
@@ -153,16 +214,9 @@ def parse_btminer_priviledge_data(token_data: TokenData, data: dict) -> dict:
     """
     # get the encoded data from the dict
     enc_data = data["enc"]
-    # get the aes key from the token data
-    aeskey_hex = hashlib.sha256(token_data.host_passwd_md5.encode()).hexdigest()
-    # unhexlify the aes key
-    aeskey = binascii.unhexlify(aeskey_hex.encode())
-    # create the required decryptor
-    aes = Cipher(algorithms.AES(aeskey), modes.ECB())
-    decryptor = aes.decryptor()
-    # decode the message with the decryptor
+    # decode the message with the cached token cipher
     ret_msg = json.loads(
-        decryptor.update(base64.decodebytes(bytes(enc_data, encoding="utf8")))
+        token_data.decrypt(base64.decodebytes(bytes(enc_data, encoding="utf8")))
         .rstrip(b"\0")
         .decode("utf8")
     )
@@ -186,18 +240,11 @@ def create_privileged_cmd(token_data: TokenData, command: dict) -> bytes:
     logging.debug("(Create Prilileged Command) - Creating Privileged Command")
     # add token to command
     command["token"] = token_data.host_sign
-    # encode host_passwd data and get hexdigest
-    aeskey_hex = hashlib.sha256(token_data.host_passwd_md5.encode()).hexdigest()
-    # unhexlify the encoded host_passwd
-    aeskey = binascii.unhexlify(aeskey_hex.encode())
-    # create a new AES key
-    aes = Cipher(algorithms.AES(aeskey), modes.ECB())
-    encryptor = aes.encryptor()
     # dump the command to json
     api_json_str = json.dumps(command)
-    # encode the json command with the aes key
+    # encode the json command with the cached token cipher
     api_json_str_enc = (
-        base64.encodebytes(encryptor.update(_add_to_16(api_json_str)))
+        base64.encodebytes(token_data.encrypt(_add_to_16(api_json_str)))
         .decode("utf-8")
         .replace("\n", "")
     )
@@ -346,26 +393,34 @@ class BTMinerRPCAPI(BaseMinerRPCAPI):
             # if it fails to validate, it is likely an error
             validation = validate_command_output(data_dict)
             if not validation[0]:
+                # the token may have been invalidated, get a new one next time
+                self._clear_token()
                 raise APIError(validation[1])
 
         # return the parsed json as a dict
         return data_dict
 
+    def _clear_token(self) -> None:
+        """Drop the cached token for this miner, so the next privileged command logs in again."""
+        _token_cache.pop((str(self.ip), self.pwd), None)
+        self.token = None
+
     async def get_token(self) -> TokenData:
         """Gets token information from the API.
         <details>
             <summary>Expand</summary>
 
+        Tokens are shared between API instances for the same miner until they expire.
+
         Returns:
             An encoded token and md5 password, which are used for the privileged API.
         </details>
         """
         logging.debug(f"{self} - (Get Token) - Getting token")
-        if self.token:
-            if self.token.timestamp > datetime.datetime.now() - datetime.timedelta(
-                minutes=30
-            ):
-                return self.token
+        if self.token is None or self.token.expired:
+            self.token = _token_cache.get((str(self.ip), self.pwd))
+        if self.token is not None and not self.token.expired:
+            return self.token
 
         # get the token
         data = await self.send_command("get_token")
@@ -394,6 +449,7 @@ class BTMinerRPCAPI(BaseMinerRPCAPI):
             host_passwd_md5=host_passwd_md5,
             timestamp=datetime.datetime.now(),
         )
+        _token_cache[(str(self.ip), self.pwd)] = self.token
         logging.debug(f"{self} - (Get Token) - Gathered token data: {self.token}")
         return self.token
 
@@ -612,7 +668,7 @@ class BTMinerRPCAPI(BaseMinerRPCAPI):
         """
         return await self.send_privileged_command("set_normal_power")
 
-    async def update_firmware(self, firmware: bytes) -> bool:
+    async def update_firmware(self, firmware: bytes | FirmwareImage) -> bool:
         """Upgrade the firmware running on the miner and using the firmware passed in bytes.
         <details>
             <summary>Expand</summary>
@@ -621,7 +677,7 @@ class BTMinerRPCAPI(BaseMinerRPCAPI):
         changing the password of the miner using the Whatsminer tool.
 
         Parameters:
-            firmware (bytes): The firmware binary data to be uploaded.
+            firmware (bytes): The firmware binary data to be uploaded, or a `FirmwareImage` to stream it from.
         Returns:
             A boolean indicating the success of the firmware upgrade.
         Raises:
@@ -632,7 +688,11 @@ class BTMinerRPCAPI(BaseMinerRPCAPI):
         if not ready.get("Msg") == "ready":
             raise APIError(f"Not ready for firmware update: {self}")
         file_size = struct.pack("<I", len(firmware))
-        await self._send_bytes(file_size + firmware)
+        if isinstance(firmware, FirmwareImage):
+            # stream from the shared mapping instead of joining a copy of the image
+            await self._send_bytes(itertools.chain((file_size,), firmware.chunks()))
+        else:
+            await self._send_bytes(file_size + firmware)
         return True
 
     async def reboot(self, timeout: int = 10) -> dict:
@@ -1155,6 +1215,8 @@ class BTMinerRPCAPI(BaseMinerRPCAPI):
 
 
 class BTMinerV3RPCAPI(BaseMinerRPCAPI):
+    supports_persistent = True
+
     def __init__(self, ip: str, port: int = 4433, api_ver: str = "0.0.0"):
         super().__init__(ip, port, api_ver=api_ver)
 
@@ -1210,15 +1272,17 @@ class BTMinerV3RPCAPI(BaseMinerRPCAPI):
         header = struct.pack("<I", len(ser))
         return json.loads(await self._send_bytes(header + ser))
 
-    async def _send_bytes(
+    async def _send_bytes_direct(
         self,
-        data: bytes,
+        data: bytes | Iterable[bytes | memoryview],
         *,
         port: int | None = None,
         timeout: int = 100,
     ) -> bytes:
         if port is None:
             port = self.port
+        if self.persistent:
+            return await self._send_bytes_persistent(data, port=port, timeout=timeout)
         logging.debug(f"{self} - ([Hidden] Send Bytes) - Sending")
         try:
             # get reader and writer streams
@@ -1235,9 +1299,7 @@ class BTMinerV3RPCAPI(BaseMinerRPCAPI):
         try:
             data_task = asyncio.create_task(self._read_bytes(reader, timeout=timeout))
             logging.debug(f"{self} - ([Hidden] Send Bytes) - Writing")
-            writer.write(data)
-            logging.debug(f"{self} - ([Hidden] Send Bytes) - Draining")
-            await writer.drain()
+            await self._write(writer, data)
 
             await data_task
             ret_data = data_task.result()
@@ -1281,11 +1343,20 @@ If you are sure you want to use this command please use API.send_command("{comma
             logging.warning(f"{self} - ([Hidden] Send Bytes) - API Command Error {e}")
         return ret_data
 
+    async def _read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        header = await reader.readexactly(4)
+        length = struct.unpack("<I", header)[0]
+        return await reader.readexactly(length)
+
     async def get_salt(self) -> str:
+        if self.salt is not None:
+            return self.salt
+        self.salt = _salt_cache.get(str(self.ip))
         if self.salt is not None:
             return self.salt
         data = await self.send_command("get.device.info", "salt")
         self.salt = data["msg"]["salt"]
+        _salt_cache[str(self.ip)] = self.salt
         return self.salt
 
     @typing.no_type_check
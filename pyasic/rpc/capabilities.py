@@ -0,0 +1,162 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+
+from pyasic.errors import APIError, GovernorRejectedError
+
+# replies meaning the API does not know a command, as opposed to a transient failure
+UNSUPPORTED_REPLIES = (
+    "invalid command",
+    "invalid cmd",
+    "unknown command",
+    "not supported",
+    "unsupported",
+)
+
+# key the failures of joined multicommands are counted under
+_JOINED = "+"
+
+
+def is_unsupported_reply(error: APIError) -> bool:
+    """Whether an error is the API rejecting a command it does not know.
+
+    Parameters:
+        error: The error raised by sending the command.
+    """
+    if isinstance(error, GovernorRejectedError):
+        return False
+    message = str(error).lower()
+    return any(reply in message for reply in UNSUPPORTED_REPLIES)
+
+
+@dataclass
+class RPCCapabilities:
+    """What an RPC API is known to support, learned from its responses.
+
+    A command is only marked unsupported when the API rejects it as unknown, or after
+    it fails `strikes` times in a row, so a timeout or a garbled reply from one miner
+    isn't remembered for every miner of its kind.  Requests rejected by the governor
+    are never counted.  What is learned expires after `ttl` seconds.
+
+    Attributes:
+        ttl: How long a learned capability is kept, in seconds.
+        strikes: How many failures in a row, without an explicit rejection, mark something unsupported.
+    """
+
+    ttl: float = 3600.0
+    strikes: int = 3
+    _joined: bool | None = None
+    _joined_at: float = 0.0
+    _unsupported: dict[str, float] = field(default_factory=dict)
+    _failures: dict[str, int] = field(default_factory=dict)
+
+    def _fresh(self, learned_at: float) -> bool:
+        return time.monotonic() - learned_at < self.ttl
+
+    @property
+    def joined_multicommand(self) -> bool | None:
+        """Whether commands joined with `+` work, or `None` if not known."""
+        if self._joined is not None and not self._fresh(self._joined_at):
+            self._joined = None
+        return self._joined
+
+    @property
+    def unsupported(self) -> set[str]:
+        """Commands which are known not to be supported."""
+        return {cmd for cmd in list(self._unsupported) if self.is_unsupported(cmd)}
+
+    def is_unsupported(self, command: str) -> bool:
+        learned_at = self._unsupported.get(command)
+        if learned_at is None:
+            return False
+        if not self._fresh(learned_at):
+            del self._unsupported[command]
+            return False
+        return True
+
+    def _failed(self, key: str, error: APIError) -> bool:
+        # returns whether the failure is enough to learn from
+        if isinstance(error, GovernorRejectedError):
+            return False
+        if is_unsupported_reply(error):
+            self._failures.pop(key, None)
+            return True
+        self._failures[key] = self._failures.get(key, 0) + 1
+        if self._failures[key] >= self.strikes:
+            del self._failures[key]
+            return True
+        return False
+
+    def joined_succeeded(self) -> None:
+        self._failures.pop(_JOINED, None)
+        self._joined = True
+        self._joined_at = time.monotonic()
+
+    def joined_failed(self, error: APIError) -> None:
+        if self._failed(_JOINED, error):
+            self._joined = False
+            self._joined_at = time.monotonic()
+
+    def command_succeeded(self, command: str) -> None:
+        self._failures.pop(command, None)
+        self._unsupported.pop(command, None)
+
+    def command_failed(self, command: str, error: APIError) -> None:
+        if self._failed(command, error):
+            self._unsupported[command] = time.monotonic()
+
+    def clear(self) -> None:
+        """Forget everything learned so far."""
+        self._joined = None
+        self._unsupported.clear()
+        self._failures.clear()
+
+
+class CapabilityCache:
+    """Share [`RPCCapabilities`][pyasic.rpc.capabilities.RPCCapabilities] between miners of the same kind.
+
+    Miners are keyed by their model and firmware, so what one miner learns, such as
+    joined multicommands failing on stock S19 firmware, is used by every other miner of
+    that kind without each one making a failed request first.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, RPCCapabilities] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> RPCCapabilities:
+        """Get the shared capabilities for a kind of miner, creating them if needed.
+
+        Parameters:
+            key: The key of the kind of miner, e.g. `(model, firmware)`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = RPCCapabilities()
+        return entry
+
+    def clear(self) -> None:
+        """Forget all capabilities, e.g. after a fleet wide firmware upgrade."""
+        self._entries.clear()
+
+
+capability_cache = CapabilityCache()
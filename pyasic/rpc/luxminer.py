@@ -17,6 +17,7 @@ from typing import Literal
 
 from pyasic import APIError
 from pyasic.rpc.base import BaseMinerRPCAPI
+from pyasic.settings.tokens import StoredToken
 
 
 class LUXMinerRPCAPI(BaseMinerRPCAPI):
@@ -31,18 +32,21 @@ class LUXMinerRPCAPI(BaseMinerRPCAPI):
     function handles sending a command to the miner asynchronously, and
     as such is the base for many of the functions in this class, which
     rely on it to send the command for them.
+
+    LUXMiner keeps the connection open between commands, so setting `persistent`
+    reuses a single connection for all commands.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.session_token = None
+    supports_persistent = True
+    session_token = StoredToken("luxminer", ttl=600)
 
     async def send_privileged_command(self, command: str, *args, **kwargs) -> dict:
-        if self.session_token is None:
-            await self.auth()
+        session_token = self.session_token
+        if session_token is None:
+            session_token = await self.auth()
         return await self.send_command(
             command,
-            self.session_token,
+            session_token,
             *args,
             **kwargs,
         )
@@ -13,6 +13,9 @@
 #  See the License for the specific language governing permissions and         -
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
+import asyncio
+import weakref
+from contextlib import AbstractAsyncContextManager
 from ssl import SSLContext
 from typing import Any, Optional
 
@@ -25,10 +28,16 @@ class Settings(BaseModel):
     network_ping_retries: int = Field(default=1)
     network_ping_timeout: int = Field(default=3)
     network_scan_semaphore: int | None = Field(default=None)
+    network_liveness_timeout: float = Field(default=1)
+    network_liveness_semaphore: int = Field(default=2000)
     factory_get_retries: int = Field(default=1)
     factory_get_timeout: int = Field(default=3)
+    factory_socket_max_bytes: int = Field(default=65536)
     get_data_retries: int = Field(default=1)
     api_function_timeout: int = Field(default=5)
+    rpc_persistent_connections: bool = Field(default=False)
+    rpc_capability_cache: bool = Field(default=True)
+    debug_parse_phase_io: bool = Field(default=False)
     antminer_mining_mode_as_str: bool = Field(default=False)
     default_whatsminer_rpc_password: str = Field(default="admin")
     default_innosilicon_web_password: str = Field(default="admin")
@@ -46,6 +55,22 @@ class Settings(BaseModel):
     default_mskminer_web_password: str = Field(default="root")
     default_antminer_ssh_password: str = Field(default="miner")
     default_bosminer_ssh_password: str = Field(default="root")
+    http_pool_max_hosts: int = Field(default=1024)
+    http_pool_max_connections_per_host: int = Field(default=4)
+    http_pool_keepalive_expiry: float = Field(default=30.0)
+    http_pool_idle_timeout: float = Field(default=120.0)
+    grpc_pool_max_channels: int = Field(default=1024)
+    grpc_pool_idle_timeout: float = Field(default=120.0)
+    governor_concurrency: int | None = Field(default=None)
+    governor_rate: float | None = Field(default=None)
+    governor_transport_concurrency: dict[str, int] = Field(default_factory=dict)
+    governor_transport_rate: dict[str, float] = Field(default_factory=dict)
+    governor_subnet_concurrency: int | None = Field(default=None)
+    governor_subnet_rate: float | None = Field(default=None)
+    governor_max_queued: int | None = Field(default=None)
+    governor_queue_timeout: float | None = Field(default=None)
+    token_refresh_margin: float = Field(default=60.0)
+    token_ttl: dict[str, float] = Field(default_factory=dict)
 
     class Config:
         validate_assignment = True
@@ -60,8 +85,12 @@ ssl_cxt = httpx.create_ssl_context()
 
 # this function returns an AsyncHTTPTransport instance to perform asynchronous HTTP requests
 # using those options.
-def transport(verify: str | bool | SSLContext = ssl_cxt):
-    return AsyncHTTPTransport(verify=verify)
+def transport(
+    verify: str | bool | SSLContext = ssl_cxt, limits: httpx.Limits | None = None
+):
+    if limits is None:
+        return AsyncHTTPTransport(verify=verify)
+    return AsyncHTTPTransport(verify=verify, limits=limits)
 
 
 def get(key: str, other: Any | None = None) -> Any:
@@ -78,3 +107,144 @@ def update(key: str, val: Any) -> None:
         setattr(_settings, key, val)
     else:
         _settings.__dict__[key] = val
+
+
+from .channels import GRPCChannelPool  # noqa: E402
+from .http import HTTPClientPool  # noqa: E402
+from .limits import Governor  # noqa: E402
+from .tokens import MemoryTokenStore, TokenStore  # noqa: E402
+
+_http_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HTTPClientPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def http_pool() -> HTTPClientPool:
+    """Get the shared HTTP client pool for the running event loop.
+
+    The pool is created on first use with the current `http_pool_*` settings.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _http_pools.get(loop)
+    if pool is None:
+        pool = HTTPClientPool(
+            max_hosts=_settings.http_pool_max_hosts,
+            max_connections=_settings.http_pool_max_connections_per_host,
+            keepalive_expiry=_settings.http_pool_keepalive_expiry,
+            idle_timeout=_settings.http_pool_idle_timeout,
+            transport=transport,
+        )
+        _http_pools[loop] = pool
+    return pool
+
+
+def http_client(
+    host: str, verify: str | bool | SSLContext = ssl_cxt
+) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+    """Borrow the pooled keep-alive HTTP client for a host.
+
+    Use as `async with settings.http_client(ip) as client:`, the client is returned
+    to the pool instead of being closed when the block exits.
+    """
+    return http_pool().client(host, verify=verify)
+
+
+_grpc_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, GRPCChannelPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def grpc_pool() -> GRPCChannelPool:
+    """Get the shared gRPC channel pool for the running event loop.
+
+    The pool is created on first use with the current `grpc_pool_*` settings.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _grpc_pools.get(loop)
+    if pool is None:
+        pool = GRPCChannelPool(
+            max_channels=_settings.grpc_pool_max_channels,
+            idle_timeout=_settings.grpc_pool_idle_timeout,
+        )
+        _grpc_pools[loop] = pool
+    return pool
+
+
+_governors: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[tuple, Governor]
+] = weakref.WeakKeyDictionary()
+
+
+def _governor_config() -> tuple:
+    return (
+        _settings.governor_concurrency,
+        _settings.governor_rate,
+        tuple(sorted(_settings.governor_transport_concurrency.items())),
+        tuple(sorted(_settings.governor_transport_rate.items())),
+        _settings.governor_subnet_concurrency,
+        _settings.governor_subnet_rate,
+        _settings.governor_max_queued,
+        _settings.governor_queue_timeout,
+    )
+
+
+def governor() -> Governor:
+    """Get the shared request governor for the running event loop.
+
+    The governor is built from the `governor_*` settings, and rebuilt once it is idle
+    if those settings change.
+    """
+    loop = asyncio.get_running_loop()
+    config = _governor_config()
+    entry = _governors.get(loop)
+    if entry is not None:
+        current_config, current = entry
+        if current_config == config or current.in_flight or current.queued:
+            return current
+    (
+        concurrency,
+        rate,
+        transport_concurrency,
+        transport_rate,
+        subnet_concurrency,
+        subnet_rate,
+        max_queued,
+        queue_timeout,
+    ) = config
+    new = Governor(
+        concurrency=concurrency,
+        rate=rate,
+        transport_concurrency=dict(transport_concurrency),
+        transport_rate=dict(transport_rate),
+        subnet_concurrency=subnet_concurrency,
+        subnet_rate=subnet_rate,
+        max_queued=max_queued,
+        queue_timeout=queue_timeout,
+    )
+    _governors[loop] = (config, new)
+    return new
+
+
+_token_store: TokenStore = MemoryTokenStore()
+
+
+def token_store() -> TokenStore:
+    """Get the token store shared by every API which logs in to the miner."""
+    return _token_store
+
+
+def set_token_store(store: TokenStore) -> None:
+    """Replace the shared token store, e.g. with a `FileTokenStore` or `SQLiteTokenStore` to keep tokens between restarts."""
+    global _token_store
+    _token_store = store
+
+
+async def aclose() -> None:
+    """Close all pooled HTTP connections and gRPC channels for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _http_pools.pop(loop, None)
+    if pool is not None:
+        await pool.aclose()
+    channels = _grpc_pools.pop(loop, None)
+    if channels is not None:
+        channels.close()
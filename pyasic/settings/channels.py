@@ -0,0 +1,150 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from grpclib.client import Channel
+
+
+class _PooledChannel:
+    __slots__ = ("channel", "in_use", "last_used")
+
+    def __init__(self, channel: Channel) -> None:
+        self.channel = channel
+        self.in_use = 0
+        self.last_used = time.monotonic()
+
+
+class GRPCChannelPool:
+    """A bounded pool of long-lived `grpclib` channels, one per host and port.
+
+    gRPC multiplexes calls as streams over a single HTTP/2 connection, so every call
+    to a miner, including concurrent ones, shares the same channel.  A channel whose
+    connection was lost reconnects on its next call.  Channels are kept in LRU order,
+    and idle channels are closed once they exceed `idle_timeout`.  At most
+    `max_channels` channels are open at once, borrowing a channel for a new host waits
+    for one to become idle once the pool is full.
+
+    A pool is bound to the event loop it is used from, use `pyasic.settings.grpc_pool()`
+    to get the pool for the running loop.
+
+    Parameters:
+        max_channels: The maximum number of channels to keep open.
+        idle_timeout: How long an unused channel is kept before it is closed, in seconds.
+    """
+
+    def __init__(self, max_channels: int, idle_timeout: float) -> None:
+        if max_channels < 1:
+            raise ValueError("The gRPC channel pool must allow at least 1 channel.")
+        self.max_channels = max_channels
+        self.idle_timeout = idle_timeout
+        self._channels: OrderedDict[tuple[str, int], _PooledChannel] = OrderedDict()
+        self._released = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __contains__(self, host: str) -> bool:
+        return any(key[0] == host for key in self._channels)
+
+    @asynccontextmanager
+    async def channel(self, host: str, port: int) -> AsyncIterator[Channel]:
+        """Borrow the shared channel for a host.
+
+        The channel is not closed when the context exits, it stays in the pool so
+        later calls to the same host can reuse its connection.
+
+        Parameters:
+            host: The IP address or hostname of the miner.
+            port: The gRPC port of the miner.
+        """
+        key = (host, port)
+        entry = self._channels.get(key)
+        if entry is None:
+            await self._reserve()
+            entry = self._channels.get(key)
+        if entry is None:
+            # grpclib is only imported once a gRPC API is used
+            from grpclib.client import Channel
+
+            entry = _PooledChannel(Channel(host, port))
+            self._channels[key] = entry
+        else:
+            self._channels.move_to_end(key)
+        entry.in_use += 1
+        try:
+            yield entry.channel
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+            if not entry.in_use:
+                async with self._released:
+                    self._released.notify_all()
+
+    async def _reserve(self) -> None:
+        # make room for a new channel, waiting for one to go idle if the pool is full
+        async with self._released:
+            while True:
+                self._evict(room=1)
+                if len(self._channels) < self.max_channels:
+                    return
+                await self._released.wait()
+
+    def _evict(self, room: int = 0) -> None:
+        now = time.monotonic()
+        for key in list(self._channels):
+            entry = self._channels[key]
+            if entry.in_use:
+                continue
+            if (
+                len(self._channels) + room > self.max_channels
+                or now - entry.last_used > self.idle_timeout
+            ):
+                del self._channels[key]
+                entry.channel.close()
+
+    def reset(self, host: str, port: int) -> None:
+        """Drop the connection of a channel after a failure, it reconnects on its next call.
+
+        Parameters:
+            host: The IP address or hostname of the miner.
+            port: The gRPC port of the miner.
+        """
+        entry = self._channels.get((host, port))
+        if entry is not None:
+            entry.channel.close()
+
+    def discard(self, host: str) -> None:
+        """Close and remove any channels held for a host.
+
+        Parameters:
+            host: The IP address or hostname to drop channels for.
+        """
+        for key in [k for k in self._channels if k[0] == host]:
+            self._channels.pop(key).channel.close()
+
+    def close(self) -> None:
+        """Close every channel in the pool."""
+        while self._channels:
+            _, entry = self._channels.popitem(last=False)
+            entry.channel.close()
@@ -0,0 +1,153 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from ssl import SSLContext
+from typing import Any
+
+import httpx
+
+
+class _PooledClient:
+    __slots__ = ("client", "in_use", "last_used")
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self.client = client
+        self.in_use = 0
+        self.last_used = time.monotonic()
+
+
+class HTTPClientPool:
+    """A bounded pool of keep-alive `httpx.AsyncClient` instances, one per host.
+
+    Each client owns its own connection pool, so the per-host connection limit is
+    enforced by `httpx` itself.  Clients are kept in LRU order, and idle clients are
+    closed once they exceed `idle_timeout` or the pool holds more than `max_hosts`.
+
+    A pool is bound to the event loop it is used from, use `pyasic.settings.http_pool()`
+    to get the pool for the running loop.
+
+    Parameters:
+        max_hosts: The maximum number of idle host clients to keep open.
+        max_connections: The maximum number of connections to open to a single host.
+        keepalive_expiry: How long an idle connection to a host is kept alive, in seconds.
+        idle_timeout: How long an unused host client is kept before it is closed, in seconds.
+        transport: A callable returning a transport for a given `verify` value and `httpx.Limits`.
+    """
+
+    def __init__(
+        self,
+        max_hosts: int,
+        max_connections: int,
+        keepalive_expiry: float,
+        idle_timeout: float,
+        transport: Callable[..., httpx.AsyncBaseTransport],
+    ) -> None:
+        self.max_hosts = max_hosts
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.idle_timeout = idle_timeout
+        self._transport = transport
+        self._clients: OrderedDict[tuple[str, Any], _PooledClient] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, host: str) -> bool:
+        return any(key[0] == host for key in self._clients)
+
+    @staticmethod
+    def _verify_key(verify: str | bool | SSLContext) -> Any:
+        if isinstance(verify, SSLContext):
+            return id(verify)
+        return verify
+
+    @asynccontextmanager
+    async def client(
+        self, host: str, verify: str | bool | SSLContext = True
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow the shared client for a host.
+
+        The client is not closed when the context exits, it stays in the pool so
+        later requests to the same host can reuse its open connections.
+
+        Parameters:
+            host: The IP address or hostname the client will be used for.
+            verify: SSL verification options, passed to the transport.
+        """
+        key = (host, self._verify_key(verify))
+        entry = self._clients.get(key)
+        if entry is None:
+            entry = _PooledClient(
+                httpx.AsyncClient(transport=self._transport(verify, self.limits))
+            )
+            self._clients[key] = entry
+        else:
+            self._clients.move_to_end(key)
+        entry.in_use += 1
+        try:
+            await self._evict()
+            yield entry.client
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+
+    async def _evict(self) -> None:
+        now = time.monotonic()
+        expired: list[tuple[str, Any]] = []
+        for key, entry in self._clients.items():
+            if entry.in_use:
+                continue
+            if (
+                len(self._clients) - len(expired) > self.max_hosts
+                or now - entry.last_used > self.idle_timeout
+            ):
+                expired.append(key)
+            else:
+                break
+        # remove every client before awaiting any close, so a client can not be
+        # borrowed again while it is being closed
+        closing = []
+        for key in expired:
+            pooled = self._clients.get(key)
+            if pooled is None or pooled.in_use:
+                continue
+            del self._clients[key]
+            closing.append(pooled.client)
+        for client in closing:
+            await client.aclose()
+
+    async def discard(self, host: str) -> None:
+        """Close and remove any clients held for a host.
+
+        Parameters:
+            host: The IP address or hostname to drop clients for.
+        """
+        for key in [k for k in self._clients if k[0] == host]:
+            await self._clients.pop(key).client.aclose()
+
+    async def aclose(self) -> None:
+        """Close every client in the pool."""
+        while self._clients:
+            _, entry = self._clients.popitem(last=False)
+            await entry.client.aclose()
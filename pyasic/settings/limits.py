@@ -0,0 +1,287 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from pyasic.errors import GovernorRejectedError
+
+TRANSPORTS = ("rpc", "http", "grpc", "ssh")
+
+# the (transport, host) pairs the current task already holds a slot for, so nested
+# calls to the same miner, such as logging in from inside a command, don't wait on
+# themselves
+_held: ContextVar[frozenset[tuple[str, str]]] = ContextVar(
+    "governor_held", default=frozenset()
+)
+
+
+def subnet(host: str) -> str:
+    """Get the subnet a host is limited under, the /24 for IPv4 addresses.
+
+    Parameters:
+        host: The IP address or hostname of the miner.
+    """
+    parts = host.split(".")
+    if len(parts) == 4 and parts[-1].isdigit():
+        return f"{parts[0]}.{parts[1]}.{parts[2]}.0/24"
+    return host
+
+
+class TokenBucket:
+    """A token bucket, refilled at `rate` tokens per second up to `burst` tokens.
+
+    Parameters:
+        rate: The number of tokens added per second.
+        burst: The maximum number of tokens held, defaults to one second of tokens.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be greater than 0.")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def empty(self) -> bool:
+        self._refill()
+        return self.tokens < 1
+
+    async def acquire(self) -> None:
+        """Wait for a token and take it."""
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class _Scope:
+    __slots__ = ("semaphore", "bucket", "in_flight")
+
+    def __init__(self, concurrency: int | None, rate: float | None) -> None:
+        self.semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        self.bucket = TokenBucket(rate) if rate else None
+        self.in_flight = 0
+
+    @property
+    def limited(self) -> bool:
+        return self.semaphore is not None or self.bucket is not None
+
+    @property
+    def busy(self) -> bool:
+        return (self.semaphore is not None and self.semaphore.locked()) or (
+            self.bucket is not None and self.bucket.empty
+        )
+
+
+@dataclass
+class GovernorMetrics:
+    """A snapshot of the work passing through a [`Governor`][pyasic.settings.limits.Governor].
+
+    Attributes:
+        in_flight: Requests currently running.
+        queued: Requests waiting for a limit.
+        rejected: Requests rejected since the governor was created, because the queue was full or they waited too long.
+        admitted: Requests admitted since the governor was created.
+        in_flight_by_transport: Requests currently running, per transport.
+        in_flight_by_subnet: Requests currently running, per subnet.
+    """
+
+    in_flight: int
+    queued: int
+    rejected: int
+    admitted: int
+    in_flight_by_transport: dict[str, int]
+    in_flight_by_subnet: dict[str, int]
+
+
+class Governor:
+    """Limit requests to miners globally, per transport, and per /24 subnet.
+
+    Each scope can have a concurrency limit, capping how many requests are in flight
+    at once, and a rate limit, enforced with a token bucket.  A request waits until
+    every scope it falls under admits it.  Requests are rejected with
+    `GovernorRejectedError` if `max_queued` requests are already waiting, or if they
+    wait longer than `queue_timeout`.
+
+    Limits set to `None` are not enforced, so a governor without any limits only
+    tracks metrics.  Use `pyasic.settings.governor()` to get the governor built from
+    the `governor_*` settings for the running event loop.
+
+    Parameters:
+        concurrency: The maximum number of requests in flight across all miners.
+        rate: The maximum number of requests started per second across all miners.
+        transport_concurrency: The maximum number of requests in flight per transport, one of `rpc`, `http`, `grpc`, or `ssh`.
+        transport_rate: The maximum number of requests started per second per transport.
+        subnet_concurrency: The maximum number of requests in flight to each /24 subnet.
+        subnet_rate: The maximum number of requests started per second to each /24 subnet.
+        max_queued: The maximum number of requests waiting for a limit at once.
+        queue_timeout: The maximum time a request waits for a limit, in seconds.
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        rate: float | None = None,
+        transport_concurrency: Mapping[str, int] | None = None,
+        transport_rate: Mapping[str, float] | None = None,
+        subnet_concurrency: int | None = None,
+        subnet_rate: float | None = None,
+        max_queued: int | None = None,
+        queue_timeout: float | None = None,
+    ) -> None:
+        transport_concurrency = transport_concurrency or {}
+        transport_rate = transport_rate or {}
+        self.subnet_concurrency = subnet_concurrency
+        self.subnet_rate = subnet_rate
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+
+        self._global = _Scope(concurrency, rate)
+        self._transports = {
+            t: _Scope(transport_concurrency.get(t), transport_rate.get(t))
+            for t in {*TRANSPORTS, *transport_concurrency, *transport_rate}
+        }
+        self._subnets: dict[str, _Scope] = {}
+
+        self.queued = 0
+        self.rejected = 0
+        self.admitted = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._global.in_flight
+
+    def metrics(self) -> GovernorMetrics:
+        """Get a snapshot of the current metrics."""
+        return GovernorMetrics(
+            in_flight=self._global.in_flight,
+            queued=self.queued,
+            rejected=self.rejected,
+            admitted=self.admitted,
+            in_flight_by_transport={
+                t: s.in_flight for t, s in self._transports.items()
+            },
+            in_flight_by_subnet={
+                k: s.in_flight for k, s in self._subnets.items() if s.in_flight
+            },
+        )
+
+    def _scopes(self, transport: str, host: str) -> tuple[_Scope, ...]:
+        transport_scope = self._transports.get(transport)
+        if transport_scope is None:
+            transport_scope = self._transports[transport] = _Scope(None, None)
+        key = subnet(host)
+        subnet_scope = self._subnets.get(key)
+        if subnet_scope is None:
+            subnet_scope = self._subnets[key] = _Scope(
+                self.subnet_concurrency, self.subnet_rate
+            )
+        # the most specific scope is waited on first, so a request waiting on its
+        # subnet doesn't hold a global slot other subnets could use
+        return subnet_scope, transport_scope, self._global
+
+    @staticmethod
+    async def _admit(scopes: tuple[_Scope, ...], acquired: list[_Scope]) -> None:
+        for scope in scopes:
+            if scope.semaphore is not None:
+                await scope.semaphore.acquire()
+                acquired.append(scope)
+            if scope.bucket is not None:
+                await scope.bucket.acquire()
+
+    @asynccontextmanager
+    async def limit(self, transport: str, host: str) -> AsyncIterator[None]:
+        """Hold a slot for a request to a miner for the length of the block.
+
+        Nested blocks for the same transport and miner in the same task reuse the
+        outer slot.
+
+        Parameters:
+            transport: The transport used, one of `rpc`, `http`, `grpc`, or `ssh`.
+            host: The IP address or hostname of the miner.
+
+        Raises:
+            GovernorRejectedError: If the request was rejected instead of queued.
+        """
+        key = (transport, host)
+        held = _held.get()
+        if key in held:
+            yield
+            return
+
+        scopes = self._scopes(transport, host)
+        acquired: list[_Scope] = []
+        if any(scope.busy for scope in scopes):
+            if self.max_queued is not None and self.queued >= self.max_queued:
+                self.rejected += 1
+                raise GovernorRejectedError(
+                    f"Too many requests queued, rejected {transport} request to {host}."
+                )
+            self.queued += 1
+            try:
+                await asyncio.wait_for(
+                    self._admit(scopes, acquired), timeout=self.queue_timeout
+                )
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                for scope in acquired:
+                    scope.semaphore.release()  # type: ignore[union-attr]
+                raise GovernorRejectedError(
+                    f"Timed out waiting to send {transport} request to {host}."
+                ) from None
+            except BaseException:
+                for scope in acquired:
+                    scope.semaphore.release()  # type: ignore[union-attr]
+                raise
+            finally:
+                self.queued -= 1
+        else:
+            # nothing to wait for, take the slots without scheduling a task
+            await self._admit(scopes, acquired)
+
+        self.admitted += 1
+        for scope in scopes:
+            scope.in_flight += 1
+        token = _held.set(held | {key})
+        try:
+            yield
+        finally:
+            _held.reset(token)
+            for scope in scopes:
+                scope.in_flight -= 1
+            for scope in acquired:
+                scope.semaphore.release()  # type: ignore[union-attr]
+            # unlimited subnets only hold metrics, so drop them once they are idle
+            subnet_scope = scopes[0]
+            if not subnet_scope.in_flight and not subnet_scope.limited:
+                key_subnet = subnet(host)
+                if self._subnets.get(key_subnet) is subnet_scope:
+                    del self._subnets[key_subnet]
@@ -0,0 +1,317 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class TokenEntry:
+    """A stored authentication token.
+
+    Attributes:
+        token: The token or session ID.
+        expires: The unix time the token should no longer be used after.
+    """
+
+    token: str
+    expires: float
+
+    def valid(self, margin: float = 0.0) -> bool:
+        return time.time() + margin < self.expires
+
+
+def token_key(backend: str, host: str, username: str = "") -> str:
+    """Get the key a token is stored under.
+
+    Parameters:
+        backend: The name of the API the token is for, such as `vnish`.
+        host: The IP address of the miner.
+        username: The user the token was issued to.
+    """
+    return f"{backend}|{host}|{username}"
+
+
+class TokenStore(ABC):
+    """Storage for authentication tokens, shared by every API instance.
+
+    Tokens are keyed by [`token_key()`][pyasic.settings.tokens.token_key], so a new
+    API instance for the same miner, or a new process using a persistent store, can
+    reuse a token instead of logging in again.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> TokenEntry | None:
+        """Get the entry stored under a key, or `None` if there is none or it has expired."""
+
+    @abstractmethod
+    def set(self, key: str, entry: TokenEntry) -> None:
+        """Store an entry under a key, replacing any existing entry."""
+
+    @abstractmethod
+    def remove(self, key: str) -> None:
+        """Remove the entry stored under a key."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    def save(self) -> None:
+        """Write any pending changes to storage."""
+
+
+class MemoryTokenStore(TokenStore):
+    """An in-memory token store, which evicts the least recently used token once full.
+
+    Parameters:
+        max_size: The maximum number of tokens to keep.
+    """
+
+    def __init__(self, max_size: int = 65536) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, TokenEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> TokenEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry.valid():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: TokenEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileTokenStore(MemoryTokenStore):
+    """A token store persisted to a JSON file.
+
+    Tokens are served from memory.  Changes are written to the file at most once
+    every `save_interval` seconds, when `save()` is called, and when the process
+    exits.  The file is replaced atomically, so a crash never leaves it half written.
+
+    Parameters:
+        path: The JSON file to load tokens from and save tokens to.
+        max_size: The maximum number of tokens to keep.
+        save_interval: The minimum time between writes, in seconds.
+    """
+
+    def __init__(
+        self, path: str | Path, max_size: int = 65536, save_interval: float = 5.0
+    ) -> None:
+        super().__init__(max_size=max_size)
+        self.path = Path(path)
+        self.save_interval = save_interval
+        self._dirty = False
+        self._saved = time.monotonic()
+        if self.path.exists():
+            self.load()
+        atexit.register(self.save)
+
+    def load(self) -> None:
+        """Load unexpired tokens from the file."""
+        with open(self.path) as f:
+            raw: dict[str, Any] = json.load(f)
+        now = time.time()
+        for key, item in raw.items():
+            entry = TokenEntry(**item)
+            if entry.expires > now:
+                super().set(key, entry)
+
+    def set(self, key: str, entry: TokenEntry) -> None:
+        super().set(key, entry)
+        self._changed()
+
+    def remove(self, key: str) -> None:
+        super().remove(key)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def _changed(self) -> None:
+        self._dirty = True
+        if time.monotonic() - self._saved >= self.save_interval:
+            self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            raw = {
+                key: {"token": e.token, "expires": e.expires}
+                for key, e in self._entries.items()
+                if e.expires > now
+            }
+            self._dirty = False
+            self._saved = time.monotonic()
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        # tokens are credentials, keep them readable by the owner only
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(raw, f)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, self.path)
+
+
+class SQLiteTokenStore(MemoryTokenStore):
+    """A token store persisted to a SQLite database.
+
+    Tokens are served from memory, and written through to the database as they are
+    set, so no explicit `save()` is needed.
+
+    Parameters:
+        path: The SQLite database file.
+        max_size: The maximum number of tokens to keep in memory.
+    """
+
+    def __init__(self, path: str | Path, max_size: int = 65536) -> None:
+        super().__init__(max_size=max_size)
+        self.path = Path(path)
+        # tokens are credentials, keep them readable by the owner only
+        os.close(os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o600))
+        os.chmod(self.path, 0o600)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS tokens ("
+            "key TEXT PRIMARY KEY, token TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        self._db.execute("DELETE FROM tokens WHERE expires <= ?", (time.time(),))
+        self._db.commit()
+        self.load()
+
+    def load(self) -> None:
+        """Load unexpired tokens from the database."""
+        rows = self._db.execute(
+            "SELECT key, token, expires FROM tokens WHERE expires > ?", (time.time(),)
+        )
+        for key, token, expires in rows:
+            super().set(key, TokenEntry(token, expires))
+
+    def get(self, key: str) -> TokenEntry | None:
+        entry = super().get(key)
+        if entry is not None:
+            return entry
+        # entries evicted from memory are still in the database
+        row = self._db.execute(
+            "SELECT token, expires FROM tokens WHERE key = ? AND expires > ?",
+            (key, time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+        entry = TokenEntry(*row)
+        super().set(key, entry)
+        return entry
+
+    def set(self, key: str, entry: TokenEntry) -> None:
+        super().set(key, entry)
+        self._db.execute(
+            "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)",
+            (key, entry.token, entry.expires),
+        )
+        self._db.commit()
+
+    def remove(self, key: str) -> None:
+        super().remove(key)
+        self._db.execute("DELETE FROM tokens WHERE key = ?", (key,))
+        self._db.commit()
+
+    def clear(self) -> None:
+        super().clear()
+        self._db.execute("DELETE FROM tokens")
+        self._db.commit()
+
+    def save(self) -> None:
+        self._db.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+
+class StoredToken:
+    """An API attribute backed by the shared token store.
+
+    Reading the attribute returns the token stored for the miner, or `None` if there
+    is none, or if it expires within the `token_refresh_margin` setting, so the API
+    logs in again before the miner starts rejecting it.  Setting the attribute
+    stores the token with the TTL of the backend, and setting it to `None` removes it.
+
+    Parameters:
+        backend: The name of the API, used in the token key and to look up TTL overrides in the `token_ttl` setting.
+        ttl: How long a token is valid for, in seconds.
+    """
+
+    def __init__(self, backend: str, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    def _key(self, obj: Any) -> str:
+        return token_key(
+            self.backend, str(obj.ip), getattr(obj, "username", None) or ""
+        )
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        from pyasic import settings
+
+        entry = settings.token_store().get(self._key(obj))
+        if entry is None or not entry.valid(settings.get("token_refresh_margin", 0)):
+            return None
+        return entry.token
+
+    def __set__(self, obj: Any, value: str | None) -> None:
+        from pyasic import settings
+
+        store = settings.token_store()
+        key = self._key(obj)
+        if value is None:
+            store.remove(key)
+            return
+        ttl = settings.get("token_ttl", {}).get(self.backend, self.ttl)
+        store.set(key, TokenEntry(value, time.time() + ttl))
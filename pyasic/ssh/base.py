@@ -3,6 +3,9 @@ import logging
 
 import asyncssh
 
+from pyasic import settings
+from pyasic.misc import check_parse_phase_io
+
 
 class BaseSSH:
     def __init__(self, ip: str) -> None:
@@ -30,17 +33,19 @@ class BaseSSH:
 
     async def send_command(self, cmd: str) -> str | None:
         """Send an ssh command to the miner"""
-        try:
-            conn = await asyncio.wait_for(self._get_connection(), timeout=10)
-        except (ConnectionError, asyncio.TimeoutError):
-            return None
+        check_parse_phase_io(self)
+        async with settings.governor().limit("ssh", str(self.ip)):
+            try:
+                conn = await asyncio.wait_for(self._get_connection(), timeout=10)
+            except (ConnectionError, asyncio.TimeoutError):
+                return None
 
-        try:
-            async with conn:
-                resp = await conn.run(cmd)
-                result = str(max(resp.stdout, resp.stderr, key=len))
+            try:
+                async with conn:
+                    resp = await conn.run(cmd)
+                    result = str(max(resp.stdout, resp.stderr, key=len))
 
-                return result
-        except Exception as e:
-            logging.error(f"{self} command {cmd} error: {e}")
-            return None
+                    return result
+            except Exception as e:
+                logging.error(f"{self} command {cmd} error: {e}")
+                return None
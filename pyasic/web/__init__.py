@@ -16,10 +16,19 @@
 from .antminer import AntminerModernWebAPI, AntminerOldWebAPI
 from .auradine import AuradineWebAPI
 from .base import BaseWebAPI
-from .braiins_os import BOSerWebAPI, BOSMinerWebAPI
+from .braiins_os import BOSMinerWebAPI
 from .epic import ePICWebAPI
 from .goldshell import GoldshellWebAPI
 from .hammer import HammerWebAPI
 from .iceriver import IceRiverWebAPI
 from .innosilicon import InnosiliconWebAPI
 from .vnish import VNishWebAPI
+
+
+def __getattr__(name: str) -> type:
+    # imported on first use, see `pyasic.web.braiins_os`
+    if name == "BOSerWebAPI":
+        from .braiins_os.boser import BOSerWebAPI
+
+        return BOSerWebAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
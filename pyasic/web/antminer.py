@@ -20,11 +20,11 @@ import json
 from pathlib import Path
 from typing import Any
 
-import aiofiles
 import httpx
 
 from pyasic import settings
 from pyasic.errors import APIError
+from pyasic.firmware import FirmwareImage, open_image
 from pyasic.web.base import BaseWebAPI
 
 
@@ -60,10 +60,19 @@ class AntminerModernWebAPI(BaseWebAPI):
             dict: The JSON response from the device or an empty dictionary if an error occurs.
         """
         url = f"http://{self.ip}:{self.port}/cgi-bin/{command}.cgi"
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
         try:
-            async with httpx.AsyncClient(transport=settings.transport()) as client:
-                if parameters:
+            async with self._client() as client:
+                files = parameters.pop("files", None)
+                if files is not None:
+                    data = await client.post(
+                        url,
+                        auth=auth,
+                        timeout=settings.get("api_function_timeout", 3),
+                        files=files,
+                        data=parameters,
+                    )
+                elif parameters:
                     data = await client.post(
                         url,
                         auth=auth,
@@ -95,7 +104,7 @@ class AntminerModernWebAPI(BaseWebAPI):
         Returns:
             dict: A dictionary containing the results of all commands executed.
         """
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client() as client:
             tasks = [
                 asyncio.create_task(self._handle_multicommand(client, command))
                 for command in commands
@@ -121,7 +130,7 @@ class AntminerModernWebAPI(BaseWebAPI):
         Returns:
             dict: A dictionary containing the response of the executed command.
         """
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
 
         try:
             url = f"http://{self.ip}/cgi-bin/{command}.cgi"
@@ -241,6 +250,25 @@ class AntminerModernWebAPI(BaseWebAPI):
             ipSub=subnet_mask,
         )
 
+    async def update_firmware(
+        self, file: Path | FirmwareImage, keep_settings: bool = True
+    ) -> dict:
+        """Perform a system update by uploading a firmware file and sending a command to initiate the update.
+
+        The file is streamed from a memory mapped `FirmwareImage`, so passing the same
+        image to many miners shares one copy of the file.
+        """
+
+        with open_image(file) as image:
+            return await self.send_command(
+                "upgrade",
+                files={
+                    "file": (image.name, image.reader(), "application/octet-stream")
+                },
+                filename=image.name,
+                keep_settings=keep_settings,
+            )
+
 
 class AntminerOldWebAPI(BaseWebAPI):
     def __init__(self, ip: str) -> None:
@@ -274,13 +302,15 @@ class AntminerOldWebAPI(BaseWebAPI):
             dict: The JSON response from the device or an empty dictionary if an error occurs.
         """
         url = f"http://{self.ip}:{self.port}/cgi-bin/{command}.cgi"
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
         try:
-            async with httpx.AsyncClient(transport=settings.transport()) as client:
-                if parameters:
+            async with self._client() as client:
+                files = parameters.pop("files", None)
+                if parameters or files is not None:
                     data = await client.post(
                         url,
                         data=parameters,
+                        files=files,
                         auth=auth,
                         timeout=settings.get("api_function_timeout", 3),
                     )
@@ -310,8 +340,8 @@ class AntminerOldWebAPI(BaseWebAPI):
             dict: A dictionary containing the results of all commands executed.
         """
         data = {k: None for k in commands}
-        auth = httpx.DigestAuth(self.username, self.pwd)
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        auth = self._get_digest_auth()
+        async with self._client() as client:
             for command in commands:
                 try:
                     url = f"http://{self.ip}/cgi-bin/{command}.cgi"
@@ -407,15 +437,21 @@ class AntminerOldWebAPI(BaseWebAPI):
         """
         return await self.send_command("miner_pools")
 
-    async def update_firmware(self, file: Path, keep_settings: bool = True) -> dict:
-        """Perform a system update by uploading a firmware file and sending a command to initiate the update."""
+    async def update_firmware(
+        self, file: Path | FirmwareImage, keep_settings: bool = True
+    ) -> dict:
+        """Perform a system update by uploading a firmware file and sending a command to initiate the update.
 
-        async with aiofiles.open(file, "rb") as firmware:
-            file_content = await firmware.read()
+        The file is streamed from a memory mapped `FirmwareImage`, so passing the same
+        image to many miners shares one copy of the file.
+        """
 
-        return await self.send_command(
-            command="upgrade",
-            file=(file.name, file_content, "application/octet-stream"),
-            filename=file.name,
-            keep_settings=keep_settings,
-        )
+        with open_image(file) as image:
+            return await self.send_command(
+                "upgrade",
+                files={
+                    "file": (image.name, image.reader(), "application/octet-stream")
+                },
+                filename=image.name,
+                keep_settings=keep_settings,
+            )
@@ -25,10 +25,13 @@ import httpx
 from pyasic import settings
 from pyasic.errors import APIError
 from pyasic.misc import validate_command_output
+from pyasic.settings.tokens import StoredToken
 from pyasic.web.base import BaseWebAPI
 
 
 class AuradineWebAPI(BaseWebAPI):
+    token = StoredToken("auradine", ttl=3600)
+
     def __init__(self, ip: str) -> None:
         """Initializes the API client for interacting with Auradine mining devices.
 
@@ -39,7 +42,6 @@ class AuradineWebAPI(BaseWebAPI):
         self.username = "admin"
         self.pwd = settings.get("default_auradine_web_password", "admin")
         self.port = 8080
-        self.token = None
 
     async def auth(self) -> str | None:
         """Authenticate and retrieve a web token from the Auradine miner.
@@ -47,7 +49,8 @@ class AuradineWebAPI(BaseWebAPI):
         Returns:
             str | None: A token if authentication is successful, None otherwise.
         """
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        token = self.token
+        async with self._client() as client:
             try:
                 auth = await client.post(
                     f"http://{self.ip}:{self.port}/token",
@@ -62,10 +65,10 @@ class AuradineWebAPI(BaseWebAPI):
             else:
                 json_auth = auth.json()
                 try:
-                    self.token = json_auth["Token"][0]["Token"]
+                    self.token = token = json_auth["Token"][0]["Token"]
                 except LookupError:
                     return None
-            return self.token
+            return token
 
     async def send_command(
         self,
@@ -91,11 +94,13 @@ class AuradineWebAPI(BaseWebAPI):
         if not parameters == {}:
             parameters["command"] = command
 
-        if self.token is None:
-            await self.auth()
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        # the stored token can expire between reads, so only read it once
+        token = self.token
+        if token is None:
+            token = await self.auth()
+        async with self._client() as client:
             for i in range(settings.get("get_data_retries", 1)):
-                if self.token is None:
+                if token is None:
                     raise APIError(
                         f"Could not authenticate web token with miner: {self}"
                     )
@@ -103,14 +108,14 @@ class AuradineWebAPI(BaseWebAPI):
                     if post:
                         response = await client.post(
                             f"http://{self.ip}:{self.port}/{command}",
-                            headers={"Token": self.token},
+                            headers={"Token": token},
                             timeout=settings.get("api_function_timeout", 5),
                             json=parameters,
                         )
                     else:
                         response = await client.get(
                             f"http://{self.ip}:{self.port}/{command}",
-                            headers={"Token": self.token},
+                            headers={"Token": token},
                             timeout=settings.get("api_function_timeout", 5),
                         )
                     json_data = response.json()
@@ -119,7 +124,7 @@ class AuradineWebAPI(BaseWebAPI):
                         if i == settings.get("get_data_retries", 1):
                             raise APIError(validation[1])
                         # refresh the token, retry
-                        await self.auth()
+                        token = await self.auth()
                         continue
                     return json_data
                 except (httpx.HTTPError, json.JSONDecodeError):
@@ -60,7 +60,7 @@ class AvalonMinerWebAPI(BaseWebAPI):
 
         url = f"http://{self.ip}:{self.port}/{command}.cgi"
         try:
-            async with httpx.AsyncClient(transport=settings.transport()) as client:
+            async with self._client() as client:
                 client.cookies.set("auth", cookie_data)
                 resp = await client.get(url)
                 raw_data = resp.text.replace("minerinfoCallback(", "").replace(");", "")
@@ -84,7 +84,7 @@ class AvalonMinerWebAPI(BaseWebAPI):
     async def multicommand(
         self, *commands: str, ignore_errors: bool = False, allow_warning: bool = True
     ) -> dict:
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client() as client:
             cookie_data = (
                 "ff0000ff" + hashlib.sha256(self.pwd.encode()).hexdigest()[:24]
             )
@@ -17,12 +17,64 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Generator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from ssl import SSLContext
 from typing import Any
 
+import httpx
+
+from pyasic import settings
 from pyasic.errors import APIWarning
+from pyasic.misc import check_parse_phase_io, public_commands
+
+
+class CachedDigestAuth(httpx.DigestAuth):
+    """HTTP digest auth that keeps its challenge between requests.
+
+    `httpx.DigestAuth` already signs requests with the last challenge it saw, so a
+    single instance shared by every request to a miner only needs a new challenge
+    when the server rejects the cached nonce.  This subclass tracks how often that
+    happens, and how many 401 round trips were skipped by reusing the challenge.
+    """
+
+    def __init__(self, username: str, password: str) -> None:
+        super().__init__(username, password)
+        self.credentials = (username, password)
+        self.challenges = 0
+        self.challenges_avoided = 0
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        flow = super().auth_flow(request)
+        request = next(flow)
+        cached = "Authorization" in request.headers
+        response = yield request
+        try:
+            request = flow.send(response)
+        except StopIteration:
+            if cached:
+                self.challenges_avoided += 1
+            return
+        self.challenges += 1
+        yield request
 
 
 class BaseWebAPI(ABC):
+    # the commands of each subclass, set when the subclass is created
+    command_set: frozenset[str] = frozenset()
+    # APIs which log in replace this with a `StoredToken`
+    token: str | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.command_set = cls._get_command_set()
+
+    @classmethod
+    def _get_command_set(cls) -> frozenset[str]:
+        return public_commands(cls, exclude=_BASE_COMMANDS)
+
     def __init__(self, ip: str) -> None:
         # ip address of the miner
         self.ip = ip
@@ -30,7 +82,7 @@ class BaseWebAPI(ABC):
         self.pwd: str | None = None
         self.port: int = 80
 
-        self.token: str | None = None
+        self._digest_auth: CachedDigestAuth | None = None
 
     def __new__(cls, *args: Any, **kwargs: Any) -> BaseWebAPI:
         if cls is BaseWebAPI:
@@ -40,6 +92,47 @@ class BaseWebAPI(ABC):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {str(self.ip)}"
 
+    def _client(
+        self, verify: str | bool | SSLContext = settings.ssl_cxt
+    ) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Borrow the pooled keep-alive HTTP client for this miner.
+
+        The client is held under the `http` limits of the request governor.
+
+        Args:
+            verify: SSL verification options for the client.
+
+        Returns:
+            An async context manager yielding the shared `httpx.AsyncClient`.
+        """
+        check_parse_phase_io(self)
+        return self._governed_client(verify)
+
+    @asynccontextmanager
+    async def _governed_client(
+        self, verify: str | bool | SSLContext
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        async with settings.governor().limit("http", str(self.ip)):
+            async with settings.http_client(self.ip, verify=verify) as client:
+                yield client
+
+    def _get_digest_auth(self) -> CachedDigestAuth:
+        """Get the digest auth shared by all requests to this miner.
+
+        The auth is rebuilt if the username or password changed since it was created.
+
+        Returns:
+            The cached digest auth for the current credentials.
+        """
+        credentials = (self.username or "", self.pwd or "")
+        if self._digest_auth is None or self._digest_auth.credentials != credentials:
+            self._digest_auth = CachedDigestAuth(*credentials)
+        return self._digest_auth
+
+    async def aclose(self) -> None:
+        """Close any pooled HTTP connections held open to this miner."""
+        await settings.http_pool().discard(self.ip)
+
     @abstractmethod
     async def send_command(
         self,
@@ -58,7 +151,7 @@ class BaseWebAPI(ABC):
         pass
 
     def _check_commands(self, *commands: str) -> list[str]:
-        allowed_commands = self.get_commands()
+        allowed_commands = self.command_set
         return_commands = []
         for command in [*commands]:
             if command in allowed_commands:
@@ -81,21 +174,8 @@ If you are sure you want to use this command please use WebAPI.send_command("{co
         Returns:
             A list of all web commands that the miner supports.
         """
-        return [
-            func
-            for func in
-            # each function in self
-            dir(self)
-            if not func == "commands"
-            if callable(getattr(self, func))
-            and
-            # no __ or _ methods
-            not func.startswith("__")
-            and not func.startswith("_")
-            and
-            # remove all functions that are in this base class
-            func
-            not in [
-                func for func in dir(BaseWebAPI) if callable(getattr(BaseWebAPI, func))
-            ]
-        ]
+        return sorted(self.command_set)
+
+
+# methods of the base class aren't commands
+_BASE_COMMANDS = public_commands(BaseWebAPI) | {"commands"}
@@ -1,2 +1,10 @@
-from .boser import BOSerWebAPI
 from .bosminer import BOSMinerWebAPI
+
+
+def __getattr__(name: str) -> type:
+    # the gRPC client is imported on first use, as grpclib and the protobuf messages are slow to import
+    if name == "BOSerWebAPI":
+        from .boser import BOSerWebAPI
+
+        return BOSerWebAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,16 +17,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from grpclib import GRPCError, Status
 from grpclib.client import Channel
+from grpclib.exceptions import StreamTerminatedError
 
 from pyasic import settings
 from pyasic.errors import APIError
+from pyasic.misc import check_parse_phase_io, public_commands
+from pyasic.settings.tokens import StoredToken
 from pyasic.web.base import BaseWebAPI
 from pyasic.web.braiins_os.better_monkey import patch
+from pyasic.web.braiins_os.projection import Projection
 
 patch()
 
@@ -45,46 +51,74 @@ class BOSMinerGRPCStub(
     ActionsServiceStub,
     PerformanceServiceStub,
 ):
-    pass
+    def __init__(
+        self, channel: Channel, *, fields: tuple[str, ...] = (), **kwargs: Any
+    ) -> None:
+        super().__init__(channel, **kwargs)
+        self.fields = fields
+
+    async def _unary_unary(
+        self, route: str, request: Any, response_type: Any, **kwargs: Any
+    ) -> Any:
+        if self.fields:
+            response_type = Projection(response_type, self.fields)
+        return await super()._unary_unary(route, request, response_type, **kwargs)
+
+
+# the fields to decode from the response to the current command, set per command
+# by `multicommand`
+projected_fields: ContextVar[tuple[str, ...]] = ContextVar(
+    "projected_fields", default=()
+)
 
 
 class BOSerWebAPI(BaseWebAPI):
+    # BOS+ tokens are valid for an hour
+    token = StoredToken("boser", ttl=3540)
+
     def __init__(self, ip: str) -> None:
         super().__init__(ip)
         self.username: str = "root"
         self.pwd: str = settings.get("default_bosminer_password", "root")
         self.port = 50051
-        self._auth_time: datetime | None = None
-
-    @property
-    def commands(self) -> list:
-        return self.get_commands()
-
-    def get_commands(self) -> list:
-        return [
-            func
-            for func in
-            # each function in self
-            dir(self)
-            if func
-            not in ["send_command", "multicommand", "auth", "commands", "get_commands"]
-            if callable(getattr(self, func))
-            and
-            # no __ or _ methods
-            not func.startswith("__")
-            and not func.startswith("_")
-        ]
+        self._auth_lock: asyncio.Lock | None = None
+
+    @classmethod
+    def _get_command_set(cls) -> frozenset[str]:
+        # public methods of the base class are kept, unlike other web APIs
+        return public_commands(
+            cls,
+            exclude={
+                "send_command",
+                "multicommand",
+                "auth",
+                "commands",
+                "get_commands",
+                # closes the channel the other commands share
+                "aclose",
+            },
+        )
 
     async def multicommand(
-        self, *commands: str, ignore_errors: bool = False, allow_warning: bool = True
+        self,
+        *commands: str,
+        ignore_errors: bool = False,
+        allow_warning: bool = True,
+        fields: dict[str, tuple[str, ...]] | None = None,
     ) -> dict:
+        # `fields` maps commands to the dotted paths to decode from their responses,
+        # commands left out are decoded whole
         result: dict[str, Any] = {"multicommand": True}
         tasks = {}
+        fields = fields or {}
         for command in commands:
+            token = projected_fields.set(fields.get(command, ()))
             try:
                 tasks[command] = asyncio.create_task(getattr(self, command)())
             except AttributeError:
                 pass
+            finally:
+                projected_fields.reset(token)
 
         results = await asyncio.gather(
             *[t for t in tasks.values()], return_exceptions=True
@@ -104,13 +138,19 @@ class BOSerWebAPI(BaseWebAPI):
         privileged: bool = False,
         **parameters: Any,
     ) -> dict:
+        check_parse_phase_io(self)
         message: betterproto.Message = parameters["message"]
         metadata = []
         if privileged:
             metadata.append(("authorization", await self.auth()))
+        endpoint = None
         try:
-            async with Channel(self.ip, self.port) as c:
-                endpoint = getattr(BOSMinerGRPCStub(c), command)
+            async with (
+                settings.governor().limit("grpc", str(self.ip)),
+                self._channel() as c,
+            ):
+                stub = BOSMinerGRPCStub(c, fields=projected_fields.get())
+                endpoint = getattr(stub, command)
                 if endpoint is None:
                     if not ignore_errors:
                         raise APIError(f"Command not found - {endpoint}")
@@ -119,25 +159,51 @@ class BOSerWebAPI(BaseWebAPI):
                     return (await endpoint(message, metadata=metadata)).to_pydict()
                 except GRPCError as e:
                     if e.status == Status.UNAUTHENTICATED:
-                        await self._get_auth()
+                        await self._get_auth(stale=metadata[0][1] if metadata else None)
                         metadata = [("authorization", await self.auth())]
                         return (await endpoint(message, metadata=metadata)).to_pydict()
                     raise e
-        except (GRPCError, ConnectionError) as e:
+        except (GRPCError, ConnectionError, StreamTerminatedError) as e:
             raise APIError(f"gRPC command failed - {endpoint}") from e
 
+    @asynccontextmanager
+    async def _channel(self) -> AsyncIterator[Channel]:
+        # borrow the shared channel, dropping its connection if it fails so the
+        # next call reconnects
+        pool = settings.grpc_pool()
+        async with pool.channel(str(self.ip), self.port) as c:
+            try:
+                yield c
+            except (ConnectionError, StreamTerminatedError):
+                pool.reset(str(self.ip), self.port)
+                raise
+
+    async def aclose(self) -> None:
+        """Close the gRPC channel held open to this miner."""
+        settings.grpc_pool().discard(str(self.ip))
+
     async def auth(self) -> str | None:
-        if (
-            self.token is not None
-            and self._auth_time is not None
-            and datetime.now() - self._auth_time < timedelta(seconds=3540)
+        token = self.token
+        if token is not None:
+            return token
+        return await self._get_auth()
+
+    async def _get_auth(self, stale: str | None = None) -> str | None:
+        # concurrent calls share a single login, a call whose token was rejected
+        # only logs in again if no other call has done so since
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            token = self.token
+            if token is not None and token != stale:
+                return token
+            return await self._login()
+
+    async def _login(self) -> str | None:
+        async with (
+            settings.governor().limit("grpc", str(self.ip)),
+            self._channel() as c,
         ):
-            return self.token
-        await self._get_auth()
-        return self.token
-
-    async def _get_auth(self) -> str | None:
-        async with Channel(self.ip, self.port) as c:
             req = LoginRequest(username=self.username, password=self.pwd)
             async with c.request(
                 "/braiins.bos.v1.AuthenticationService/Login",
@@ -151,8 +217,7 @@ class BOSerWebAPI(BaseWebAPI):
                     auth = stream.initial_metadata.get("authorization")
                     if auth is not None and isinstance(auth, str):
                         self.token = auth
-                        self._auth_time = datetime.now()
-                        return self.token
+                        return auth
                 return None
 
     async def get_api_version(self) -> dict:
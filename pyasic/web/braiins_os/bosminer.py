@@ -41,7 +41,7 @@ class BOSMinerWebAPI(BaseWebAPI):
         **parameters: Any,
     ) -> dict:
         try:
-            async with httpx.AsyncClient(transport=settings.transport()) as client:
+            async with self._client() as client:
                 await self.auth(client)
                 data = await client.get(
                     f"http://{self.ip}:{self.port}/cgi-bin/luci/{command}",
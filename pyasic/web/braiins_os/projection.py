@@ -0,0 +1,125 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache, lru_cache
+from typing import Any, Generic, TypeVar
+
+import betterproto
+from betterproto import (
+    TYPE_MESSAGE,
+    WIRE_LEN_DELIM,
+    ProtoClassMetadata,
+    encode_varint,
+    parse_fields,
+)
+from betterproto.casing import camel_case
+
+T = TypeVar("T", bound=betterproto.Message)
+
+# a tree of camelCase field names, an empty tree means the whole field
+FieldTree = dict[str, "FieldTree"]
+
+
+def field_tree(paths: Iterable[str]) -> FieldTree:
+    """Build a tree of fields from dotted paths.
+
+    A path selects a field and everything below it, so `"a"` and `"a.b"` together
+    select all of `a`.
+
+    Parameters:
+        paths: Dotted paths of camelCase field names, as used in `to_pydict()` output.
+    """
+    tree: FieldTree = {}
+    for path in sorted(paths, key=lambda p: p.count(".")):
+        node = tree
+        parts = path.split(".")
+        for idx, part in enumerate(parts):
+            if part in node and not node[part]:
+                # a parent is already selected whole
+                break
+            if idx == len(parts) - 1:
+                node[part] = {}
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+
+@cache
+def _fields(cls: type[betterproto.Message]) -> dict[int, tuple[str, type | None]]:
+    # field number -> (cased name, message class to descend into)
+    # the same metadata as `cls._betterproto`, whose classproperty mypy can't bind
+    meta = ProtoClassMetadata(cls)
+    fields = {}
+    for number, name in meta.field_name_by_number.items():
+        child = None
+        if meta.meta_by_field_name[name].proto_type == TYPE_MESSAGE:
+            child = meta.cls_by_field[name]
+            if not (isinstance(child, type) and issubclass(child, betterproto.Message)):
+                child = None
+        fields[number] = (camel_case(name).rstrip("_"), child)
+    return fields
+
+
+def project(cls: type[betterproto.Message], data: bytes, tree: FieldTree) -> bytes:
+    """Drop every field not in `tree` from an encoded message, without decoding it.
+
+    Parameters:
+        cls: The type of the encoded message.
+        data: The encoded message.
+        tree: The fields to keep.
+
+    Returns:
+        The encoded message, holding only the selected fields.
+    """
+    fields = _fields(cls)
+    out = bytearray()
+    for parsed in parse_fields(data):
+        name, child = fields.get(parsed.number, (None, None))
+        if name is None or name not in tree:
+            continue
+        subtree = tree[name]
+        if subtree and child is not None and parsed.wire_type == WIRE_LEN_DELIM:
+            value = project(child, parsed.value, subtree)
+            out += encode_varint((parsed.number << 3) | WIRE_LEN_DELIM)
+            out += encode_varint(len(value))
+            out += value
+        else:
+            out += parsed.raw
+    return bytes(out)
+
+
+class Projection(Generic[T]):
+    """A response type which only decodes some fields of a message.
+
+    Passed to `grpclib` in place of the message type, the fields which are not
+    selected are skipped on the wire, so they are never decoded into objects.
+
+    Parameters:
+        cls: The type of the response message.
+        paths: Dotted paths of camelCase field names to decode.
+    """
+
+    def __init__(self, cls: type[T], paths: Iterable[str]) -> None:
+        self.cls = cls
+        self.tree = field_tree(paths)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.cls, name)
+
+    def FromString(self, data: bytes) -> T:
+        return self.cls().parse(project(self.cls, data, self.tree))
@@ -57,9 +57,9 @@ class ElphapexWebAPI(BaseWebAPI):
             dict: The JSON response from the device or an empty dictionary if an error occurs.
         """
         url = f"http://{self.ip}:{self.port}/cgi-bin/{command}.cgi"
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
         try:
-            async with httpx.AsyncClient(transport=settings.transport()) as client:
+            async with self._client() as client:
                 if parameters:
                     data = await client.post(
                         url,
@@ -92,7 +92,7 @@ class ElphapexWebAPI(BaseWebAPI):
         Returns:
             dict: A dictionary containing the results of all commands executed.
         """
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client() as client:
             tasks = [
                 asyncio.create_task(self._handle_multicommand(client, command))
                 for command in commands
@@ -118,7 +118,7 @@ class ElphapexWebAPI(BaseWebAPI):
         Returns:
             dict: A dictionary containing the response of the executed command.
         """
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
 
         async def _send():
             try:
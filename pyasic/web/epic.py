@@ -15,16 +15,15 @@
 # ------------------------------------------------------------------------------
 from __future__ import annotations
 
-import hashlib
 import json
 from pathlib import Path
 from typing import Any
 
-import aiofiles
 import httpx
 
 from pyasic import settings
 from pyasic.errors import APIError
+from pyasic.firmware import FirmwareImage, open_image
 from pyasic.web.base import BaseWebAPI
 
 
@@ -46,7 +45,7 @@ class ePICWebAPI(BaseWebAPI):
     ) -> dict:
         post = privileged or not parameters == {}
 
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client() as client:
             for retry_cnt in range(settings.get("get_data_retries", 1)):
                 try:
                     if parameters.get("files") is not None:
@@ -150,19 +149,20 @@ class ePICWebAPI(BaseWebAPI):
     async def capabilities(self) -> dict:
         return await self.send_command("capabilities")
 
-    async def system_update(self, file: Path | str, keep_settings: bool = True) -> None:
+    async def system_update(
+        self, file: Path | str | FirmwareImage, keep_settings: bool = True
+    ) -> None:
         """Perform a system update by uploading a firmware file and sending a
-        command to initiate the update."""
-
-        # calculate the SHA256 checksum of the firmware file
-        sha256_hash = hashlib.sha256()
-        async with aiofiles.open(str(file), "rb") as f:
-            while chunk := await f.read(8192):
-                sha256_hash.update(chunk)
-        checksum = sha256_hash.hexdigest()
-
-        # prepare the multipart/form-data request
-        with open(file, "rb") as f:
-            files = {"update.zip": ("update.zip", f, "application/zip")}
-            data = {"checksum": checksum, "keepsettings": str(keep_settings).lower()}
+        command to initiate the update.
+
+        The file is streamed from a memory mapped `FirmwareImage`, which also caches
+        its checksum, so passing the same image to many miners only maps and hashes
+        the file once."""
+
+        with open_image(file) as image:
+            files = {"update.zip": ("update.zip", image.reader(), "application/zip")}
+            data = {
+                "checksum": image.sha256,
+                "keepsettings": str(keep_settings).lower(),
+            }
             await self.send_command("systemupdate", files=files, data=data)
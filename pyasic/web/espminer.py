@@ -20,7 +20,7 @@ class ESPMinerWebAPI(BaseWebAPI):
         **parameters: Any,
     ) -> dict:
         url = f"http://{self.ip}:{self.port}/api/{command}"
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client() as client:
             retries = settings.get("get_data_retries", 1)
             for attempt in range(retries):
                 try:
@@ -23,20 +23,23 @@ import httpx
 
 from pyasic import settings
 from pyasic.errors import APIError
+from pyasic.settings.tokens import StoredToken
 from pyasic.web.base import BaseWebAPI
 
 PoolPass = TypedDict("PoolPass", {"pass": str})
 
 
 class GoldshellWebAPI(BaseWebAPI):
+    token = StoredToken("goldshell", ttl=3600)
+
     def __init__(self, ip: str) -> None:
         super().__init__(ip)
         self.username: str = "admin"
         self.pwd: str = settings.get("default_goldshell_web_password", "123456789")
-        self.token: str | None = None
 
     async def auth(self) -> str | None:
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        token = self.token
+        async with self._client() as client:
             try:
                 await client.get(f"http://{self.ip}:{self.port}/user/logout")
                 auth = (
@@ -59,10 +62,10 @@ class GoldshellWebAPI(BaseWebAPI):
                         f"Could not authenticate web token with miner: {self}"
                     )
                 else:
-                    self.token = auth.get("JWT Token")
+                    self.token = token = auth.get("JWT Token")
             else:
-                self.token = auth.get("JWT Token")
-            return self.token
+                self.token = token = auth.get("JWT Token")
+            return token
 
     async def send_command(
         self,
@@ -72,12 +75,14 @@ class GoldshellWebAPI(BaseWebAPI):
         privileged: bool = False,
         **parameters: Any,
     ) -> dict:
-        if self.token is None:
-            await self.auth()
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        # the stored token can expire between reads, so only read it once
+        token = self.token
+        if token is None:
+            token = await self.auth()
+        async with self._client() as client:
             retries = settings.get("get_data_retries", 1)
             for attempt in range(retries):
-                if self.token is None:
+                if token is None:
                     raise APIError(
                         f"Could not authenticate web token with miner: {self}"
                     )
@@ -85,20 +90,20 @@ class GoldshellWebAPI(BaseWebAPI):
                     if not parameters == {}:
                         response = await client.put(
                             f"http://{self.ip}:{self.port}/mcb/{command}",
-                            headers={"Authorization": "Bearer " + self.token},
+                            headers={"Authorization": "Bearer " + token},
                             timeout=settings.get("api_function_timeout", 5),
                             json=parameters,
                         )
                     else:
                         response = await client.get(
                             f"http://{self.ip}:{self.port}/mcb/{command}",
-                            headers={"Authorization": "Bearer " + self.token},
+                            headers={"Authorization": "Bearer " + token},
                             timeout=settings.get("api_function_timeout", 5),
                         )
                     json_data = response.json()
                     return json_data
                 except TypeError:
-                    await self.auth()
+                    token = await self.auth()
                 except httpx.HTTPError as e:
                     if attempt == retries - 1:
                         raise APIError(
@@ -119,10 +124,10 @@ class GoldshellWebAPI(BaseWebAPI):
     ) -> dict:
         data: dict[str, Any] = {k: None for k in commands}
         data["multicommand"] = True
-        await self.auth()
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        token = await self.auth()
+        async with self._client() as client:
             for command in commands:
-                if self.token is None:
+                if token is None:
                     raise APIError(
                         f"Could not authenticate web token with miner: {self}"
                     )
@@ -133,7 +138,7 @@ class GoldshellWebAPI(BaseWebAPI):
 
                     response = await client.get(
                         f"http://{self.ip}:{self.port}/mcb/{uri_commnand}",
-                        headers={"Authorization": "Bearer " + self.token},
+                        headers={"Authorization": "Bearer " + token},
                         timeout=settings.get("api_function_timeout", 5),
                     )
                     json_data = response.json()
@@ -143,7 +148,7 @@ class GoldshellWebAPI(BaseWebAPI):
                 except json.JSONDecodeError:
                     pass
                 except TypeError:
-                    await self.auth()
+                    token = await self.auth()
         return data
 
     async def pools(self) -> dict:
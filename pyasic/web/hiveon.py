@@ -19,10 +19,10 @@ import json
 from pathlib import Path
 from typing import Any
 
-import aiofiles
 import httpx
 
 from pyasic import APIError, settings
+from pyasic.firmware import FirmwareImage, open_image
 from pyasic.web.base import BaseWebAPI
 
 
@@ -58,13 +58,15 @@ class HiveonWebAPI(BaseWebAPI):
             dict: The JSON response from the device or an empty dictionary if an error occurs.
         """
         url = f"http://{self.ip}:{self.port}/cgi-bin/{command}.cgi"
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
         try:
-            async with httpx.AsyncClient(transport=settings.transport()) as client:
-                if parameters:
+            async with self._client() as client:
+                files = parameters.pop("files", None)
+                if parameters or files is not None:
                     response = await client.post(
                         url,
                         data=parameters,
+                        files=files,
                         auth=auth,
                         timeout=settings.get("api_function_timeout", 3),
                     )
@@ -97,8 +99,8 @@ class HiveonWebAPI(BaseWebAPI):
             dict: A dictionary containing the results of all commands executed.
         """
         data = {k: None for k in commands}
-        auth = httpx.DigestAuth(self.username, self.pwd)
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        auth = self._get_digest_auth()
+        async with self._client() as client:
             for command in commands:
                 try:
                     url = f"http://{self.ip}/cgi-bin/{command}.cgi"
@@ -202,15 +204,21 @@ class HiveonWebAPI(BaseWebAPI):
         """
         return await self.send_command("miner_pools")
 
-    async def update_firmware(self, file: Path, keep_settings: bool = True) -> dict:
-        """Perform a system update by uploading a firmware file and sending a command to initiate the update."""
+    async def update_firmware(
+        self, file: Path | FirmwareImage, keep_settings: bool = True
+    ) -> dict:
+        """Perform a system update by uploading a firmware file and sending a command to initiate the update.
 
-        async with aiofiles.open(file, "rb") as firmware:
-            file_content = await firmware.read()
+        The file is streamed from a memory mapped `FirmwareImage`, so passing the same
+        image to many miners shares one copy of the file.
+        """
 
-        return await self.send_command(
-            "upgrade",
-            file=(file.name, file_content, "application/octet-stream"),
-            filename=file.name,
-            keep_settings=keep_settings,
-        )
+        with open_image(file) as image:
+            return await self.send_command(
+                "upgrade",
+                files={
+                    "file": (image.name, image.reader(), "application/octet-stream")
+                },
+                filename=image.name,
+                keep_settings=keep_settings,
+            )
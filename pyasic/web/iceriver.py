@@ -32,6 +32,13 @@ class IceRiverWebAPI(BaseWebAPI):
         self.username = "admin"
         self.pwd = settings.get("default_iceriver_web_password", "12345678")
 
+        # the session is kept between commands, and only renewed once it expires
+        self._cookies = httpx.Cookies()
+        self._session: int | None = None
+        self._login_lock: asyncio.Lock | None = None
+        self.logins = 0
+        self.logins_avoided = 0
+
     async def multicommand(
         self, *commands: str, ignore_errors: bool = False, allow_warning: bool = True
     ) -> dict:
@@ -39,6 +46,39 @@ class IceRiverWebAPI(BaseWebAPI):
         await asyncio.gather(*[t for t in tasks.values()])
         return {t: tasks[t].result() for t in tasks}
 
+    async def _login(self, client: httpx.AsyncClient, stale: int | None = None) -> None:
+        """Log in, unless another command already logged in since `stale` was seen.
+
+        Args:
+            client: The client to log in with.
+            stale: The session a command found expired, or `None` if not logged in yet.
+        """
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        async with self._login_lock:
+            if self._session is not None and self._session != stale:
+                self.logins_avoided += 1
+                return
+            try:
+                resp = await client.post(
+                    f"http://{self.ip}:{self.port}/user/loginpost",
+                    params={"post": "6", "user": self.username, "pwd": self.pwd},
+                )
+            except httpx.HTTPError:
+                warnings.warn(f"Could not authenticate with miner web: {self}")
+                return
+            self.logins += 1
+            self._cookies.update(resp.cookies)
+            self._session = self.logins
+
+    @staticmethod
+    def _session_expired(resp: httpx.Response) -> bool:
+        if resp.status_code in (301, 302, 303, 401, 403):
+            return True
+        # an expired session is sent back to the login page instead of JSON
+        content_type = resp.headers.get("content-type", "")
+        return "html" in content_type and "login" in resp.text.lower()
+
     async def send_command(
         self,
         command: str,
@@ -47,19 +87,23 @@ class IceRiverWebAPI(BaseWebAPI):
         privileged: bool = False,
         **parameters: Any,
     ) -> dict:
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client() as client:
+            if self._session is None:
+                await self._login(client)
+            else:
+                self.logins_avoided += 1
             try:
-                # auth
-                await client.post(
-                    f"http://{self.ip}:{self.port}/user/loginpost",
-                    params={"post": "6", "user": self.username, "pwd": self.pwd},
-                )
-            except httpx.HTTPError:
-                warnings.warn(f"Could not authenticate with miner web: {self}")
-            try:
-                resp = await client.post(
-                    f"http://{self.ip}:{self.port}/user/{command}", params=parameters
-                )
+                for retry in range(2):
+                    session = self._session
+                    if self._cookies:
+                        client.cookies.update(self._cookies)
+                    resp = await client.post(
+                        f"http://{self.ip}:{self.port}/user/{command}",
+                        params=parameters,
+                    )
+                    if retry or not self._session_expired(resp):
+                        break
+                    await self._login(client, stale=session)
                 if not resp.status_code == 200:
                     if not ignore_errors:
                         raise APIError(f"Command failed: {command}")
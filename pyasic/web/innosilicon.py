@@ -23,18 +23,21 @@ import httpx
 
 from pyasic import settings
 from pyasic.errors import APIError
+from pyasic.settings.tokens import StoredToken
 from pyasic.web.base import BaseWebAPI
 
 
 class InnosiliconWebAPI(BaseWebAPI):
+    token = StoredToken("innosilicon", ttl=3600)
+
     def __init__(self, ip: str) -> None:
         super().__init__(ip)
         self.username: str = "admin"
         self.pwd: str = settings.get("default_innosilicon_web_password", "admin")
-        self.token: str | None = None
 
     async def auth(self) -> str | None:
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        token = self.token
+        async with self._client() as client:
             try:
                 auth = await client.post(
                     f"http://{self.ip}:{self.port}/api/auth",
@@ -44,8 +47,8 @@ class InnosiliconWebAPI(BaseWebAPI):
                 warnings.warn(f"Could not authenticate web token with miner: {self}")
             else:
                 json_auth = auth.json()
-                self.token = json_auth.get("jwt")
-            return self.token
+                self.token = token = json_auth.get("jwt")
+            return token
 
     async def send_command(
         self,
@@ -55,19 +58,21 @@ class InnosiliconWebAPI(BaseWebAPI):
         privileged: bool = False,
         **parameters: Any,
     ) -> dict:
-        if self.token is None:
-            await self.auth()
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        # the stored token can expire between reads, so only read it once
+        token = self.token
+        if token is None:
+            token = await self.auth()
+        async with self._client() as client:
             retries = settings.get("get_data_retries", 1)
             for attempt in range(retries):
-                if self.token is None:
+                if token is None:
                     raise APIError(
                         f"Could not authenticate web token with miner: {self}"
                     )
                 try:
                     response = await client.post(
                         f"http://{self.ip}:{self.port}/api/{command}",
-                        headers={"Authorization": "Bearer " + self.token},
+                        headers={"Authorization": "Bearer " + token},
                         timeout=settings.get("api_function_timeout", 5),
                         json=parameters,
                     )
@@ -78,7 +83,7 @@ class InnosiliconWebAPI(BaseWebAPI):
                         and json_data.get("token") == "expired"
                     ):
                         # refresh the token, retry
-                        await self.auth()
+                        token = await self.auth()
                         continue
                     if not json_data.get("success"):
                         if json_data.get("msg"):
@@ -107,17 +112,17 @@ class InnosiliconWebAPI(BaseWebAPI):
     ) -> dict:
         data: dict[str, Any] = {k: None for k in commands}
         data["multicommand"] = True
-        await self.auth()
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        token = await self.auth()
+        async with self._client() as client:
             for command in commands:
-                if self.token is None:
+                if token is None:
                     raise APIError(
                         f"Could not authenticate web token with miner: {self}"
                     )
                 try:
                     response = await client.post(
                         f"http://{self.ip}:{self.port}/api/{command}",
-                        headers={"Authorization": "Bearer " + self.token},
+                        headers={"Authorization": "Bearer " + token},
                         timeout=settings.get("api_function_timeout", 5),
                     )
                     json_data = response.json()
@@ -127,7 +132,7 @@ class InnosiliconWebAPI(BaseWebAPI):
                 except json.JSONDecodeError:
                     pass
                 except TypeError:
-                    await self.auth()
+                    token = await self.auth()
         return data
 
     async def reboot(self) -> dict:
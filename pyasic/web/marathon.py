@@ -19,7 +19,7 @@ class MaraWebAPI(BaseWebAPI):
     async def multicommand(
         self, *commands: str, ignore_errors: bool = False, allow_warning: bool = True
     ) -> dict:
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client() as client:
             tasks = [
                 asyncio.create_task(self._handle_multicommand(client, command))
                 for command in commands
@@ -36,7 +36,7 @@ class MaraWebAPI(BaseWebAPI):
     async def _handle_multicommand(
         self, client: httpx.AsyncClient, command: str
     ) -> dict:
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
 
         try:
             url = f"http://{self.ip}:{self.port}/kaonsu/v1/{command}"
@@ -61,11 +61,9 @@ class MaraWebAPI(BaseWebAPI):
         **parameters: Any,
     ) -> dict:
         url = f"http://{self.ip}:{self.port}/kaonsu/v1/{command}"
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
         try:
-            async with httpx.AsyncClient(
-                transport=settings.transport(),
-            ) as client:
+            async with self._client() as client:
                 if parameters:
                     response = await client.post(
                         url,
@@ -47,7 +47,7 @@ class MSKMinerWebAPI(BaseWebAPI):
         privileged: bool = False,
         **parameters: Any,
     ) -> dict:
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client() as client:
             try:
                 # auth
                 await client.post(
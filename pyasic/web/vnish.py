@@ -23,18 +23,21 @@ import httpx
 
 from pyasic import settings
 from pyasic.errors import APIError
+from pyasic.settings.tokens import StoredToken
 from pyasic.web.base import BaseWebAPI
 
 
 class VNishWebAPI(BaseWebAPI):
+    token = StoredToken("vnish", ttl=3600)
+
     def __init__(self, ip: str) -> None:
         super().__init__(ip)
         self.username = "admin"
         self.pwd = settings.get("default_vnish_web_password", "admin")
-        self.token = None
 
     async def auth(self) -> str | None:
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        token = self.token
+        async with self._client() as client:
             try:
                 auth = await client.post(
                     f"http://{self.ip}:{self.port}/api/v1/unlock",
@@ -49,8 +52,8 @@ class VNishWebAPI(BaseWebAPI):
                     )
                     return None
                 json_auth = auth.json()
-                self.token = json_auth["token"]
-            return self.token
+                self.token = token = json_auth["token"]
+            return token
 
     async def send_command(
         self,
@@ -61,13 +64,15 @@ class VNishWebAPI(BaseWebAPI):
         **parameters: Any,
     ) -> dict:
         post = privileged or not parameters == {}
-        if self.token is None:
-            await self.auth()
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        # the stored token can expire between reads, so only read it once
+        token = self.token
+        if token is None:
+            token = await self.auth()
+        async with self._client() as client:
             retries = settings.get("get_data_retries", 1)
             for attempt in range(retries):
                 try:
-                    auth = self.token
+                    auth = token
                     if auth is None:
                         raise APIError(
                             f"Could not authenticate web token with miner: {self}"
@@ -90,7 +95,7 @@ class VNishWebAPI(BaseWebAPI):
                         )
                     if not response.status_code == 200:
                         # refresh the token, retry
-                        await self.auth()
+                        token = await self.auth()
                         continue
                     json_data = response.json()
                     if json_data:
@@ -0,0 +1,100 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import unittest
+
+from pyasic.data import Fan, HashBoard, MinerData, encode_influxdb
+from pyasic.data.device import DeviceInfo
+from pyasic.data.error_codes import WhatsminerError
+from pyasic.data.influxdb import encode_influxdb_line
+from pyasic.data.pools import PoolMetrics, PoolUrl
+from pyasic.device.algorithm import SHA256Algo
+from pyasic.device.firmware import MinerFirmware
+from pyasic.device.makes import MinerMake
+from pyasic.device.models import WhatsminerModels
+
+
+def make_data(idx: int) -> MinerData:
+    return MinerData(
+        ip=f"10.0.0.{idx}",
+        mac="AA:BB:CC:DD:EE:FF",
+        device_info=DeviceInfo(
+            make=MinerMake.WHATSMINER,
+            model=WhatsminerModels.M30SV10,
+            firmware=MinerFirmware.STOCK,
+            algo=SHA256Algo,
+        ),
+        uptime=3600,
+        wattage=3200,
+        wattage_limit=3300,
+        env_temp=25.5,
+        expected_hashrate=SHA256Algo.hashrate(rate=90, unit=SHA256Algo.unit.TH),
+        hashboards=[
+            HashBoard(
+                slot=i,
+                hashrate=SHA256Algo.hashrate(rate=29.876, unit=SHA256Algo.unit.TH),
+                temp=60.0,
+                chip_temp=75,
+                chips=148,
+                expected_chips=148,
+                tuned=True,
+            )
+            for i in range(3)
+        ]
+        + [HashBoard(slot=3)],
+        fans=[Fan(speed=4000), Fan()],
+        fault_light=False,
+        errors=[WhatsminerError(error_code=110)],
+        pools=[
+            PoolMetrics(
+                url=PoolUrl.from_str("stratum+tcp://pool.example.com:3333"),
+                user="worker name",
+                accepted=10,
+                rejected=0,
+                active=True,
+                alive=True,
+            )
+        ],
+    )
+
+
+class TestInfluxDBEncoder(unittest.TestCase):
+    def test_line_matches_as_influxdb(self):
+        data = make_data(1)
+        self.assertEqual(encode_influxdb_line(data), data.as_influxdb())
+        self.assertEqual(
+            encode_influxdb_line(data, "miners", level_delimiter="_"),
+            data.as_influxdb("miners", level_delimiter="_"),
+        )
+        empty = MinerData(ip="10.0.0.2")
+        self.assertEqual(encode_influxdb_line(empty), empty.as_influxdb())
+
+    def test_chunks_end_on_line_boundaries(self):
+        data = [make_data(i) for i in range(50)]
+        expected = [d.as_influxdb() for d in data]
+
+        chunks = list(encode_influxdb(data, chunk_size=4096))
+        self.assertGreater(len(chunks), 1)
+        lines = []
+        for chunk in chunks:
+            self.assertTrue(chunk.endswith(b"\n"))
+            lines.extend(chunk.decode("utf-8").splitlines())
+        self.assertEqual(lines, expected)
+
+        self.assertEqual(list(encode_influxdb([])), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import math
+import unittest
+
+from pyasic.data import Fan, FleetSnapshot, HashBoard, MinerData
+from pyasic.data.device import DeviceInfo
+from pyasic.device.algorithm import SHA256Algo
+from pyasic.device.firmware import MinerFirmware
+from pyasic.device.makes import MinerMake
+from pyasic.device.models import AntminerModels, WhatsminerModels
+
+
+def make_data(ip: str, model, firmware, make, board_th: float, wattage: int | None):
+    return MinerData(
+        ip=ip,
+        device_info=DeviceInfo(
+            make=make, model=model, firmware=firmware, algo=SHA256Algo
+        ),
+        wattage=wattage,
+        hashboards=[
+            HashBoard(
+                slot=i,
+                hashrate=SHA256Algo.hashrate(rate=board_th, unit=SHA256Algo.unit.TH),
+                temp=60 + i,
+                chips=100,
+                expected_chips=100,
+            )
+            for i in range(3)
+        ],
+        fans=[Fan(speed=4000), Fan(speed=4200)],
+    )
+
+
+class TestFleetSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.data = [
+            make_data(
+                "10.0.0.1",
+                AntminerModels.S19,
+                MinerFirmware.STOCK,
+                MinerMake.ANTMINER,
+                30,
+                3000,
+            ),
+            make_data(
+                "10.0.0.2",
+                AntminerModels.S19,
+                MinerFirmware.BRAIINS_OS,
+                MinerMake.ANTMINER,
+                35,
+                3150,
+            ),
+            make_data(
+                "10.0.0.3",
+                WhatsminerModels.M30SV10,
+                MinerFirmware.STOCK,
+                MinerMake.WHATSMINER,
+                28,
+                None,
+            ),
+        ]
+        self.snapshot = FleetSnapshot(self.data)
+
+    def test_columns_match_miner_data(self):
+        self.assertEqual(len(self.snapshot), 3)
+        self.assertEqual(len(self.snapshot.boards), 9)
+        self.assertEqual(len(self.snapshot.fans), 6)
+        for row, data in enumerate(self.data):
+            miners = self.snapshot.miners
+            self.assertEqual(miners["ip"][row], data.ip)
+            self.assertEqual(miners["model"][row], data.model)
+            self.assertAlmostEqual(miners["hashrate"][row], float(data.hashrate))
+            self.assertEqual(miners["total_chips"][row], data.total_chips)
+            self.assertEqual(miners["temperature_avg"][row], data.temperature_avg)
+            if data.efficiency_fract is None:
+                self.assertTrue(math.isnan(miners["efficiency"][row]))
+            else:
+                self.assertAlmostEqual(
+                    miners["efficiency"][row], data.efficiency_fract, places=2
+                )
+
+    def test_aggregations(self):
+        self.assertAlmostEqual(self.snapshot.total_hashrate(), 3 * (30 + 35 + 28))
+        # missing wattage is skipped
+        self.assertEqual(self.snapshot.total_wattage(), 6150)
+        self.assertEqual(
+            self.snapshot.miners.count(by="make"),
+            {
+                "AntMiner": 2,
+                "WhatsMiner": 1,
+            },
+        )
+        by_model = self.snapshot.total_hashrate(by="model")
+        self.assertAlmostEqual(by_model["S19"], 195)
+        self.assertAlmostEqual(self.snapshot.miners.mean("wattage"), 3075)
+
+    def test_percentiles(self):
+        pct = self.snapshot.efficiency_percentiles(q=(0, 50, 100))
+        self.assertAlmostEqual(pct[0], 3150 / 105)
+        self.assertAlmostEqual(pct[100], 3000 / 90)
+        self.assertAlmostEqual(pct[50], (3150 / 105 + 3000 / 90) / 2)
+
+    def test_child_table_grouping(self):
+        self.assertEqual(
+            self.snapshot.boards.count(by="firmware"),
+            {
+                "Stock": 6,
+                "BOS+": 3,
+            },
+        )
+        self.assertAlmostEqual(
+            self.snapshot.fans.mean("speed", by="make")["AntMiner"], 4100
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
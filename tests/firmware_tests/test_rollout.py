@@ -0,0 +1,215 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import hashlib
+import itertools
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+
+from pyasic.firmware import FirmwareImage, Rollout, RolloutState
+from pyasic.miners.antminer.bmminer.X19.S19 import BMMinerS19
+from pyasic.miners.antminer.epic.X19.S19 import ePICS19
+from pyasic.rpc.btminer import BTMinerRPCAPI
+from pyasic.web.hiveon import HiveonWebAPI
+
+CONTENT = os.urandom(200_000)
+
+
+class FakeMiner:
+    def __init__(self, ip: str, fail: bool = False) -> None:
+        self.ip = ip
+        self.fail = fail
+        self.received = b""
+        self.calls = 0
+
+    async def upgrade_firmware(self, *, file=None, keep_settings=True) -> bool:
+        self.calls += 1
+        reader = file.reader()
+        while chunk := reader.read(65536):
+            self.received += chunk
+            await asyncio.sleep(0)
+        return not self.fail
+
+
+class FirmwareTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "firmware.tar"
+        self.path.write_bytes(CONTENT)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+class TestFirmwareImage(FirmwareTestCase):
+    def test_image(self):
+        with FirmwareImage(self.path) as image:
+            self.assertEqual(len(image), len(CONTENT))
+            self.assertEqual(image.name, "firmware.tar")
+            self.assertEqual(image.sha256, hashlib.sha256(CONTENT).hexdigest())
+            self.assertEqual(b"".join(image.chunks(4096)), CONTENT)
+
+            reader = image.reader()
+            self.assertEqual(reader.read(), CONTENT)
+            reader.seek(-10, os.SEEK_END)
+            self.assertEqual(reader.read(), CONTENT[-10:])
+        self.assertTrue(image.closed)
+
+    def test_empty_image(self):
+        self.path.write_bytes(b"")
+        with FirmwareImage(self.path) as image:
+            self.assertEqual(image.reader().read(), b"")
+            self.assertEqual(image.sha256, hashlib.sha256(b"").hexdigest())
+
+    def test_multipart_upload(self):
+        with FirmwareImage(self.path) as image:
+            request = httpx.Request(
+                "POST",
+                "http://127.0.0.1/upgrade",
+                files={
+                    "file": (image.name, image.reader(), "application/octet-stream")
+                },
+            )
+            body = request.read()
+        self.assertIn(CONTENT, body)
+
+    async def test_btminer_stream(self):
+        received = asyncio.get_running_loop().create_future()
+
+        async def handle(reader, writer):
+            received.set_result(await reader.readexactly(len(CONTENT) + 4))
+            writer.write(b"{}")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            rpc = BTMinerRPCAPI("127.0.0.1")
+            with FirmwareImage(self.path) as image:
+                await rpc._send_bytes(
+                    itertools.chain((b"head",), image.chunks()), port=port
+                )
+        finally:
+            server.close()
+            await server.wait_closed()
+        self.assertEqual(received.result(), b"head" + CONTENT)
+
+
+class TestRollout(FirmwareTestCase):
+    async def test_rollout(self):
+        miners = [FakeMiner(f"10.0.0.{i}") for i in range(4)]
+        miners.append(FakeMiner("10.0.0.9", fail=True))
+        updates = []
+
+        state = await Rollout(
+            miners, self.path, concurrency=2, on_progress=updates.append
+        ).run()
+
+        self.assertEqual(len(state.done), 4)
+        self.assertEqual(state.failed, ["10.0.0.9"])
+        self.assertTrue(all(m.received == CONTENT for m in miners))
+        self.assertEqual(state["10.0.0.0"].sent, len(CONTENT))
+        self.assertGreater(len(updates), len(miners) * 2)
+
+    async def test_concurrency(self):
+        active = []
+        peak = []
+
+        class SlowMiner(FakeMiner):
+            async def upgrade_firmware(self, **kwargs) -> bool:
+                active.append(1)
+                peak.append(len(active))
+                await asyncio.sleep(0.02)
+                active.pop()
+                return True
+
+        miners = [SlowMiner(f"10.0.0.{i}") for i in range(6)]
+        await Rollout(miners, self.path, concurrency=2).run()
+        self.assertLessEqual(max(peak), 2)
+
+    async def test_resume(self):
+        state_path = Path(self.tmp.name) / "rollout.json"
+        miners = [FakeMiner("10.0.0.1"), FakeMiner("10.0.0.2", fail=True)]
+        await Rollout(miners, self.path, state=state_path).run()
+
+        saved = RolloutState.load(state_path)
+        self.assertEqual(saved.done, ["10.0.0.1"])
+        self.assertEqual(saved.failed, ["10.0.0.2"])
+
+        miners[1].fail = False
+        state = await Rollout(miners, self.path, state=state_path).run()
+        self.assertEqual(miners[0].calls, 1)
+        self.assertEqual(miners[1].calls, 2)
+        self.assertEqual(state["10.0.0.2"].attempts, 2)
+        self.assertEqual(len(state.done), 2)
+
+        self.path.write_bytes(b"other")
+        with self.assertRaises(ValueError):
+            Rollout(miners, self.path, state=state_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestWebUploads(FirmwareTestCase):
+    def setUp(self):
+        super().setUp()
+        self.requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(200, json={"success": True})
+
+        patcher = patch(
+            "pyasic.settings.transport",
+            lambda verify=None, limits=None: httpx.MockTransport(handler),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_uploaded(self, path: str) -> None:
+        request = self.requests[-1]
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.url.path, path)
+        self.assertTrue(
+            request.headers["Content-Type"].startswith("multipart/form-data")
+        )
+        self.assertIn(CONTENT, request.content)
+
+    async def test_antminer_upload(self):
+        miner = BMMinerS19("127.0.0.1")
+        with FirmwareImage(self.path) as image:
+            self.assertTrue(await miner.upgrade_firmware(file=image))
+        self.assert_uploaded("/cgi-bin/upgrade.cgi")
+
+    async def test_hiveon_upload(self):
+        web = HiveonWebAPI("127.0.0.1")
+        with FirmwareImage(self.path) as image:
+            await web.update_firmware(image)
+        self.assert_uploaded("/cgi-bin/upgrade.cgi")
+
+    async def test_epic_upload(self):
+        miner = ePICS19("127.0.0.1")
+        with FirmwareImage(self.path) as image:
+            self.assertTrue(await miner.upgrade_firmware(file=image))
+        self.assert_uploaded("/systemupdate")
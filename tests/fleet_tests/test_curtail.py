@@ -0,0 +1,164 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import unittest
+
+from pyasic.data import HashBoard, MinerData
+from pyasic.data.device import DeviceInfo
+from pyasic.device.algorithm import SHA256Algo
+from pyasic.device.firmware import MinerFirmware
+from pyasic.device.makes import MinerMake
+from pyasic.device.models import AntminerModels
+from pyasic.fleet import Curtailer
+from pyasic.fleet.curtail import SLEEP, THROTTLE
+
+
+class FakeMiner:
+    def __init__(self, ip: str, delay: float = 0.0, fail: bool = False) -> None:
+        self.ip = ip
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[tuple] = []
+
+    async def _call(self, *call) -> bool:
+        self.calls.append(call)
+        await asyncio.sleep(self.delay)
+        return not self.fail
+
+    async def stop_mining(self) -> bool:
+        return await self._call("stop_mining")
+
+    async def resume_mining(self) -> bool:
+        return await self._call("resume_mining")
+
+    async def set_power_limit(self, wattage: int) -> bool:
+        return await self._call("set_power_limit", wattage)
+
+
+def make_data(ip: str, th: float, wattage: int) -> MinerData:
+    return MinerData(
+        ip=ip,
+        device_info=DeviceInfo(
+            make=MinerMake.ANTMINER,
+            model=AntminerModels.S19,
+            firmware=MinerFirmware.STOCK,
+            algo=SHA256Algo,
+        ),
+        wattage=wattage,
+        raw_wattage_limit=wattage,
+        hashboards=[
+            HashBoard(
+                slot=0, hashrate=SHA256Algo.hashrate(rate=th, unit=SHA256Algo.unit.TH)
+            )
+        ],
+    )
+
+
+class TestCurtailer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # efficiencies of 35, 30, 25, and 20 J/TH
+        self.miners = [FakeMiner(f"10.0.0.{i}") for i in range(4)]
+        self.data = [
+            make_data("10.0.0.0", 100, 3500),
+            make_data("10.0.0.1", 100, 3000),
+            make_data("10.0.0.2", 100, 2500),
+            make_data("10.0.0.3", 100, 2000),
+        ]
+
+    def test_plan(self):
+        curtailer = Curtailer(self.miners, self.data)
+        self.assertEqual(curtailer.fleet_wattage(), 11000)
+
+        plan = curtailer.plan(5000)
+        self.assertEqual([a.ip for a in plan], ["10.0.0.0", "10.0.0.1"])
+        self.assertEqual([a.action for a in plan], [SLEEP, THROTTLE])
+        self.assertEqual(plan[1].power_limit, 1500)
+
+        # throttling below the floor sleeps the miner instead
+        plan = curtailer.plan(6000)
+        self.assertEqual([a.action for a in plan], [SLEEP, SLEEP])
+
+        plan = Curtailer(self.miners, self.data, throttle=False).plan(5000)
+        self.assertEqual([a.action for a in plan], [SLEEP, SLEEP])
+
+    async def test_curtail_and_restore(self):
+        seen = []
+        curtailer = Curtailer(
+            self.miners, self.data, on_progress=lambda a: seen.append(a.status)
+        )
+        report = await curtailer.curtail(6000)
+
+        self.assertTrue(report.met)
+        self.assertEqual(report.achieved, 5000)
+        self.assertEqual(report.wattage, 6000)
+        self.assertEqual(self.miners[0].calls, [("stop_mining",)])
+        self.assertEqual(self.miners[1].calls, [("set_power_limit", 1500)])
+        self.assertEqual(seen.count("done"), 2)
+
+        restored = await curtailer.restore(report, target=10000)
+        # only the throttled miner fits under the target
+        self.assertEqual([a.ip for a in restored.actions], ["10.0.0.1"])
+        self.assertEqual(self.miners[1].calls[-1], ("set_power_limit", 3000))
+        self.assertEqual(restored.wattage, 7500)
+
+        restored = await curtailer.restore(report)
+        self.assertEqual(self.miners[0].calls[-1], ("resume_mining",))
+
+    async def test_stragglers_are_made_up_in_next_wave(self):
+        self.miners[0].fail = True
+        self.miners[1].delay = 1
+        curtailer = Curtailer(self.miners, self.data, timeout=0.1)
+        report = await curtailer.curtail(8000)
+
+        self.assertEqual({a.ip for a in report.stragglers}, {"10.0.0.0", "10.0.0.1"})
+        self.assertIn("Timed out", report.stragglers[1].error)
+        self.assertEqual([a.wave for a in report.done], [2, 2])
+        self.assertEqual(report.achieved, 3000)
+        self.assertTrue(report.met)
+        self.assertEqual([a.ip for a in report.timed_out], ["10.0.0.1"])
+
+        # the timed out miner may have gone to sleep anyway, so it is resumed too
+        self.miners[1].delay = 0
+        restored = await curtailer.restore(report, target=9000)
+        self.assertIn("10.0.0.1", [a.ip for a in restored.actions])
+        self.assertNotIn("10.0.0.0", [a.ip for a in restored.actions])
+        self.assertEqual(self.miners[1].calls[-1], ("resume_mining",))
+        self.assertEqual(restored.wattage, 8500)
+
+    async def test_unknown_limit_is_not_restored(self):
+        self.data[1].wattage_limit = None
+        curtailer = Curtailer(self.miners, self.data)
+        report = await curtailer.curtail(6000)
+        self.assertEqual(report.done[1].action, THROTTLE)
+
+        restored = await curtailer.restore(report)
+        self.assertEqual([a.ip for a in restored.stragglers], ["10.0.0.1"])
+        self.assertIn("unknown", restored.stragglers[0].error)
+        self.assertEqual(self.miners[1].calls, [("set_power_limit", 1500)])
+        self.assertEqual(self.miners[0].calls[-1], ("resume_mining",))
+
+    async def test_deadline(self):
+        miners = [FakeMiner(f"10.0.0.{i}", delay=1) for i in range(4)]
+        curtailer = Curtailer(miners, self.data, concurrency=1, deadline=0.1)
+        report = await curtailer.curtail(0)
+
+        self.assertFalse(report.met)
+        self.assertEqual(len(report.stragglers), 4)
+        self.assertEqual(report.achieved, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
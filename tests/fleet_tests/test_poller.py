@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+
+from pyasic.fleet import Poller
+
+
+class FakeMiner:
+    def __init__(self, ip: str, delay: float = 0.0, fail: bool = False) -> None:
+        self.ip = ip
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[float] = []
+        self.active = 0
+        self.peak = 0
+
+    async def get_data(
+        self, allow_warning=False, include=None, exclude=None, validate=True
+    ):
+        self.calls.append(asyncio.get_running_loop().time())
+        self.active += 1
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.fail:
+            raise ConnectionError(self.ip)
+        return {"ip": self.ip}
+
+
+class TestPoller(unittest.IsolatedAsyncioTestCase):
+    async def test_polls_are_spread_across_interval(self):
+        miners = [FakeMiner(f"10.0.0.{i}") for i in range(4)]
+        poller = Poller(miners, interval=0.4)
+
+        results = [r async for r in poller.poll(cycles=2)]
+
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r.ok for r in results))
+        starts = [m.calls[0] for m in miners]
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 0.05)
+        for miner in miners:
+            self.assertGreaterEqual(miner.calls[1] - miner.calls[0], 0.3)
+
+    async def test_concurrency_budget(self):
+        active = []
+
+        class CountingMiner(FakeMiner):
+            async def get_data(self, **kwargs):
+                active.append(1)
+                try:
+                    self.peak = len(active)
+                    await asyncio.sleep(0.05)
+                finally:
+                    active.pop()
+                return {}
+
+        miners = [CountingMiner(f"10.0.0.{i}") for i in range(10)]
+        poller = Poller(miners, interval=0.01, concurrency=2)
+
+        results = [r async for r in poller.poll(cycles=1)]
+
+        self.assertEqual(len(results), 10)
+        self.assertLessEqual(max(m.peak for m in miners), 2)
+
+    async def test_errors_and_timeouts_are_reported(self):
+        slow = FakeMiner("10.0.0.1", delay=1)
+        broken = FakeMiner("10.0.0.2", fail=True)
+        poller = Poller([slow, broken], interval=0.05, timeout=0.05)
+
+        results = {r.miner.ip: r async for r in poller.poll(cycles=1)}
+
+        self.assertIsInstance(results["10.0.0.1"].error, asyncio.TimeoutError)
+        self.assertIsInstance(results["10.0.0.2"].error, ConnectionError)
+        self.assertIsNone(results["10.0.0.2"].data)
+
+    async def test_stop_ends_iteration(self):
+        miners = [FakeMiner(f"10.0.0.{i}") for i in range(2)]
+        poller = Poller(miners, interval=0.05)
+
+        results = []
+        async for result in poller:
+            results.append(result)
+            if len(results) == 3:
+                poller.stop()
+
+        self.assertGreaterEqual(len(results), 3)
+        self.assertLess(len(results), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Tests for memoized estats parsing within a single get_data call."""
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pyasic.miners.avalonminer import CGMinerAvalon1566
+from pyasic.miners.backends.avalonminer import AvalonMiner
+
+from .version_24102401_25462b2_9ddf522 import data
+
+RPC_DATA = data[CGMinerAvalon1566]
+
+
+class TestAvalonParseCache(unittest.IsolatedAsyncioTestCase):
+    async def test_estats_parsed_once_per_get_data(self):
+        miner = CGMinerAvalon1566("127.0.0.1")
+        multicommand = {
+            name[len("rpc_") :]: [value] for name, value in RPC_DATA.items()
+        }
+        multicommand["multicommand"] = True
+        parse_estats = AvalonMiner.parse_estats
+
+        with (
+            patch.object(
+                miner.rpc, "multicommand", AsyncMock(return_value=multicommand)
+            ),
+            patch.object(AvalonMiner, "parse_estats", wraps=parse_estats) as mock_parse,
+        ):
+            result = await miner.get_data(include=["hashboards", "wattage", "fans"])
+            self.assertEqual(mock_parse.call_count, 1)
+            self.assertEqual(result.wattage, 3731)
+
+            # each get_data call parses its own responses
+            await miner.get_data(include=["hashboards", "wattage", "fans"])
+            self.assertEqual(mock_parse.call_count, 2)
+
+    async def test_parse_without_get_data(self):
+        miner = CGMinerAvalon1566("127.0.0.1")
+        self.assertEqual(
+            await miner._get_wattage(rpc_estats=RPC_DATA["rpc_estats"]), 3731
+        )
@@ -0,0 +1,75 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import unittest
+
+from pyasic.data import Fan, HashBoard
+from pyasic.device.algorithm import SHA256Algo
+from pyasic.miners.antminer.bmminer.X19.S19 import BMMinerS19Pro
+
+
+class TestBuildMinerData(unittest.TestCase):
+    def setUp(self):
+        self.miner = BMMinerS19Pro("127.0.0.1")
+        self.gathered = {
+            "mac": "00:11:22:33:44:55",
+            "hashrate": SHA256Algo.hashrate(rate=110.0, unit=SHA256Algo.unit.TH),
+            "wattage_limit": 3300,
+            "wattage": 3250,
+            "hashboards": [
+                HashBoard(
+                    slot=i,
+                    hashrate=SHA256Algo.hashrate(rate=36.6, unit=SHA256Algo.unit.TH),
+                    chips=114,
+                    missing=False,
+                )
+                for i in range(3)
+            ],
+            "fans": [Fan(speed=5000) for _ in range(4)],
+            "uptime": None,
+        }
+
+    def test_validate_matches_trusted(self):
+        validated = self.miner._build_miner_data(self.gathered)
+        trusted = self.miner._build_miner_data(self.gathered, validate=False)
+        validated.raw_datetime = trusted.raw_datetime
+        self.assertEqual(validated.as_dict(), trusted.as_dict())
+        self.assertEqual(trusted.wattage_limit, 3300)
+        self.assertAlmostEqual(float(trusted.hashrate), 109.8)
+        self.assertEqual(trusted.expected_chips, 3 * self.miner.expected_chips)
+        self.assertIsNone(trusted.uptime)
+
+    def test_default_hashboards(self):
+        del self.gathered["hashboards"]
+        for validate in (True, False):
+            data = self.miner._build_miner_data(self.gathered, validate=validate)
+            self.assertEqual([b.slot for b in data.hashboards], [0, 1, 2])
+
+    def test_trusted_defaults_not_shared(self):
+        first = self.miner._build_miner_data({}, validate=False)
+        second = self.miner._build_miner_data({}, validate=False)
+        first.errors.append("error")
+        self.assertEqual(second.errors, [])
+        self.assertEqual(second.pools, [])
+
+    def test_invalid_data_is_kept(self):
+        self.gathered["uptime"] = "not a number"
+        data = self.miner._build_miner_data(self.gathered)
+        self.assertEqual(data.uptime, "not a number")
+        self.assertEqual(data.wattage, 3250)
+
+
+if __name__ == "__main__":
+    unittest.main()
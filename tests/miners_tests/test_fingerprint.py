@@ -0,0 +1,111 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import unittest
+
+import httpx
+
+from pyasic.miners.factory import MinerFactory, MinerTypes
+from pyasic.miners.fingerprint import FingerprintMatcher
+
+SOCKET_CORPUS = [
+    ('{"Description": "bosminer 1.0"}', MinerTypes.BRAIINS_OS),
+    ('{"Description": "btminer"}', MinerTypes.WHATSMINER),
+    ('{"Type": "Antminer S19 Pro"}', MinerTypes.ANTMINER),
+    # antminer is only matched outside of devdetails responses
+    ('{"DEVDETAILS": [{"Model": "Antminer S19"}]}', None),
+    (
+        '{"DEVDETAILS": [{"Driver": "bfgminer"}], "Type": "Antminer"}',
+        MinerTypes.GOLDSHELL,
+    ),
+    ('{"Type": "Antminer S19 Hiveon"}', MinerTypes.HIVEON),
+    (
+        '{"Description": "cgminer 4.11.1", "Type": "Avalon 1246"}',
+        MinerTypes.AVALONMINER,
+    ),
+    ('{"Description": "cgminer"}', None),
+]
+
+WEB_CORPUS = [
+    ("<title>Braiins OS</title>", MinerTypes.BRAIINS_OS),
+    ("<TITLE>用户界面</TITLE>", MinerTypes.ICERIVER),
+    ("<div>cloud-box</div>", MinerTypes.GOLDSHELL),
+    # earlier fingerprints win regardless of position
+    ("<title>Miner UI</title><p>Avalon</p>", MinerTypes.AVALONMINER),
+    ("<title>Router</title>", None),
+]
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_socket_corpus(self):
+        for data, expected in SOCKET_CORPUS:
+            with self.subTest(data=data):
+                self.assertEqual(MinerFactory._parse_socket_type(data), expected)
+
+    def test_web_corpus(self):
+        resp = httpx.Response(200)
+        for text, expected in WEB_CORPUS:
+            with self.subTest(text=text):
+                self.assertEqual(MinerFactory._parse_web_type(text, resp), expected)
+
+    def test_web_headers(self):
+        resp = httpx.Response(
+            401, headers={"WWW-Authenticate": 'Digest realm="antMiner Configuration"'}
+        )
+        self.assertEqual(
+            MinerFactory._parse_web_type("<title>Avalon</title>", resp),
+            MinerTypes.ANTMINER,
+        )
+        resp = httpx.Response(
+            200, headers={"WWW-Authenticate": 'Digest realm="antMiner Configuration"'}
+        )
+        self.assertIsNone(MinerFactory._parse_web_type("", resp))
+
+    def test_whatsminer_redirect(self):
+        request = httpx.Request("GET", "http://127.0.0.1/")
+        redirect = httpx.Response(
+            307, headers={"location": "https://127.0.0.1/"}, request=request
+        )
+        resp = httpx.Response(200, request=request)
+        resp.history = [redirect]
+        self.assertEqual(
+            MinerFactory._parse_web_type("/cgi-bin/luci", resp),
+            MinerTypes.WHATSMINER,
+        )
+
+    def test_register(self):
+        matcher = FingerprintMatcher(ignore_case=True)
+        matcher.register("cgminer", "cgminer")
+        matcher.register("avalon", "avalon")
+        self.assertEqual(matcher.match("CGMiner, Avalon"), "cgminer")
+        matcher.register("avalon", "avalon first", priority=1)
+        self.assertEqual(matcher.match("CGMiner, Avalon"), "avalon first")
+        self.assertEqual(len(matcher), 3)
+
+    def test_exclude(self):
+        matcher = FingerprintMatcher()
+        matcher.register("Antminer", "antminer", exclude=["DEVDETAILS"])
+        self.assertEqual(matcher.match("Antminer"), "antminer")
+        self.assertIsNone(matcher.match("DEVDETAILS Antminer"))
+
+    def test_max_length(self):
+        matcher = FingerprintMatcher(max_length=10)
+        matcher.register("token", "found")
+        self.assertEqual(matcher.match("token" + " " * 20), "found")
+        self.assertIsNone(matcher.match(" " * 20 + "token"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from pyasic.miners.cache import (
+    IdentificationCache,
+    IdentificationEntry,
+    SQLiteIdentificationCache,
+)
+from pyasic.miners.factory import MinerFactory, MinerTypes
+
+VERSION_RESPONSE = json.dumps(
+    {
+        "STATUS": [{"STATUS": "S"}],
+        "VERSION": [{"BMMiner": "1.0.0", "Type": "Antminer S9"}],
+    }
+)
+
+
+class TestIdentificationCache(unittest.TestCase):
+    def test_ttl_and_mac(self):
+        cache = IdentificationCache(ttl=60)
+        cache.set(IdentificationEntry("10.0.0.1", "ANTMINER", mac="AA:BB"))
+        cache.set(
+            IdentificationEntry("10.0.0.2", "ANTMINER", timestamp=time.time() - 120)
+        )
+
+        self.assertIsNotNone(cache.get("10.0.0.1"))
+        self.assertIsNotNone(cache.get("10.0.0.1", mac="aa:bb"))
+        self.assertIsNone(cache.get("10.0.0.1", mac="CC:DD"))
+        self.assertIsNone(cache.get("10.0.0.2"))
+        self.assertEqual(len(cache), 1)
+
+    def test_json_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.json"
+            cache = IdentificationCache(path=path)
+            cache.set(IdentificationEntry("10.0.0.1", "WHATSMINER", "M30S+V10"))
+            cache.save()
+
+            loaded = IdentificationCache(path=path)
+            self.assertEqual(loaded.get("10.0.0.1").model, "M30S+V10")
+
+    def test_sqlite_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.db"
+            cache = SQLiteIdentificationCache(path)
+            cache.set(IdentificationEntry("10.0.0.1", "BRAIINS_OS", "S19 XP"))
+            cache.close()
+
+            loaded = SQLiteIdentificationCache(path)
+            self.assertEqual(loaded.get("10.0.0.1").miner_type, "BRAIINS_OS")
+            loaded.close()
+
+
+class TestFactoryIdentificationCache(unittest.IsolatedAsyncioTestCase):
+    async def test_cached_host_is_revalidated_with_one_request(self):
+        cache = IdentificationCache()
+        factory = MinerFactory(cache=cache)
+
+        with (
+            patch.object(
+                factory, "_get_miner_type", AsyncMock(return_value=MinerTypes.ANTMINER)
+            ) as get_type,
+            patch.object(
+                factory,
+                "get_miner_model_antminer",
+                AsyncMock(return_value="Antminer S9"),
+            ),
+            patch.object(
+                factory, "_socket_ping", AsyncMock(return_value=VERSION_RESPONSE)
+            ) as socket_ping,
+        ):
+            first = await factory.get_miner("10.0.0.1")
+            second = await factory.get_miner("10.0.0.1")
+
+        self.assertEqual(get_type.await_count, 1)
+        socket_ping.assert_awaited_once_with("10.0.0.1", "version")
+        self.assertIs(type(first), type(second))
+        self.assertEqual(cache.get("10.0.0.1").model, "Antminer S9")
+
+    async def test_failed_revalidation_reidentifies(self):
+        cache = IdentificationCache()
+        cache.set(IdentificationEntry("10.0.0.1", "WHATSMINER", "M30S+V10"))
+        factory = MinerFactory(cache=cache)
+
+        with (
+            patch.object(
+                factory, "_socket_ping", AsyncMock(return_value=VERSION_RESPONSE)
+            ),
+            patch.object(factory, "_web_ping", AsyncMock(return_value=(None, None))),
+            patch.object(
+                factory, "_get_miner_type", AsyncMock(return_value=MinerTypes.ANTMINER)
+            ) as get_type,
+            patch.object(
+                factory,
+                "get_miner_model_antminer",
+                AsyncMock(return_value="Antminer S9"),
+            ),
+        ):
+            await factory.get_miner("10.0.0.1")
+
+        self.assertEqual(get_type.await_count, 1)
+        self.assertEqual(cache.get("10.0.0.1").miner_type, "ANTMINER")
+
+    async def test_changed_model_reidentifies(self):
+        cache = IdentificationCache()
+        cache.set(IdentificationEntry("10.0.0.1", "ANTMINER", "Antminer S19"))
+        factory = MinerFactory(cache=cache)
+
+        with (
+            patch.object(
+                factory, "_socket_ping", AsyncMock(return_value=VERSION_RESPONSE)
+            ),
+            patch.object(
+                factory, "_get_miner_type", AsyncMock(return_value=MinerTypes.ANTMINER)
+            ) as get_type,
+            patch.object(
+                factory,
+                "get_miner_model_antminer",
+                AsyncMock(return_value="Antminer S9"),
+            ),
+        ):
+            await factory.get_miner("10.0.0.1")
+
+        self.assertEqual(get_type.await_count, 1)
+        self.assertEqual(cache.get("10.0.0.1").model, "Antminer S9")
+
+    async def test_model_is_checked_when_version_has_none(self):
+        cache = IdentificationCache()
+        cache.set(IdentificationEntry("10.0.0.1", "WHATSMINER", "M30S+ V10"))
+        factory = MinerFactory(cache=cache)
+        version = json.dumps({"STATUS": "S", "Msg": {"fw_ver": "BTMiner"}})
+
+        with (
+            patch.object(factory, "_socket_ping", AsyncMock(return_value=version)),
+            patch.object(
+                factory,
+                "_get_miner_type",
+                AsyncMock(return_value=MinerTypes.WHATSMINER),
+            ) as get_type,
+            patch.object(
+                factory,
+                "get_miner_model_whatsminer",
+                AsyncMock(side_effect=["M30S+ V10", "M50 VH50", "M50 VH50"]),
+            ),
+            patch.object(
+                factory, "get_miner_version_whatsminer", AsyncMock(return_value=None)
+            ),
+        ):
+            await factory.get_miner("10.0.0.1")
+            self.assertEqual(get_type.await_count, 0)
+            await factory.get_miner("10.0.0.1")
+            self.assertEqual(get_type.await_count, 1)
+
+        self.assertEqual(cache.get("10.0.0.1").model, "M50 VH50")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import subprocess
+import sys
+import unittest
+
+from pyasic.miners.factory import MINER_CLASSES, MinerFactory, MinerTypes
+
+IMPORT_CHECK = """
+import sys
+import pyasic
+loaded = [
+    m for m in sys.modules
+    if m.startswith(("pyasic.miners.antminer", "pyasic.miners.whatsminer"))
+    or m in ("grpclib", "betterproto", "pyasic.web.braiins_os.boser")
+]
+print(",".join(loaded))
+"""
+
+
+class TestLazyRegistry(unittest.TestCase):
+    def test_import_is_lazy(self):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_CHECK],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        self.assertEqual(out, "")
+
+    def test_lookup(self):
+        from pyasic.miners.antminer import BMMinerS19Pro
+
+        classes = MINER_CLASSES[MinerTypes.ANTMINER]
+        self.assertIn("ANTMINER S19 PRO", classes)
+        self.assertIs(classes["ANTMINER S19 PRO"], BMMinerS19Pro)
+        self.assertIs(classes[None], classes[None])
+        with self.assertRaises(KeyError):
+            classes["ANTMINER S0"]
+
+    def test_select_unknown_model(self):
+        with self.assertWarns(UserWarning):
+            miner = MinerFactory._select_miner_from_classes(
+                "127.0.0.1", "ANTMINER S0", MinerTypes.ANTMINER
+            )
+        self.assertEqual(type(miner).__name__, "AntminerUnknown")
+
+    def test_boser_web_is_built(self):
+        from pyasic.web.braiins_os import BOSerWebAPI
+
+        miner = MINER_CLASSES[MinerTypes.BRAIINS_OS]["ANTMINER S19 PRO"]("127.0.0.1")
+        self.assertIsInstance(miner.web, BOSerWebAPI)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pyasic import APIError, settings
+from pyasic.errors import ParsePhaseIOError
+from pyasic.miners.antminer.bmminer.X19.S19 import BMMinerS19Pro
+from pyasic.miners.data import RPCAPICommand
+
+NEW_API_STATS = {
+    "STATS": [
+        {
+            "chain": [
+                {
+                    "index": i,
+                    "rate_real": 36000.0,
+                    "asic_num": 114,
+                    "temp_pcb": [40, 40, 55, 55],
+                    "temp_chip": [60, 60, 75, 75],
+                    "sn": f"SN{i}",
+                }
+                for i in range(3)
+            ]
+        }
+    ]
+}
+
+
+class TestParsePhase(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        settings.update("debug_parse_phase_io", False)
+
+    def test_param_command_key(self):
+        self.assertEqual(RPCAPICommand("rpc_stats", "stats").key, "stats")
+        self.assertEqual(
+            RPCAPICommand("rpc_new_api_stats", "stats", {"new_api": True}).key,
+            ("stats", (("new_api", True),)),
+        )
+
+    async def test_param_command_sent_in_batch(self):
+        miner = BMMinerS19Pro("127.0.0.1")
+        with (
+            patch.object(
+                miner.rpc, "multicommand", AsyncMock(return_value={})
+            ) as multicommand,
+            patch.object(
+                miner.rpc, "stats", AsyncMock(return_value=NEW_API_STATS)
+            ) as stats,
+        ):
+            data = await miner.get_data(include=["hashboards"])
+
+        multicommand.assert_not_awaited()
+        stats.assert_awaited_once_with(new_api=True)
+        self.assertEqual([b.chips for b in data.hashboards], [114, 114, 114])
+
+    async def test_failed_batch_command_not_refetched(self):
+        miner = BMMinerS19Pro("127.0.0.1")
+        with patch.object(
+            miner.rpc, "stats", AsyncMock(side_effect=APIError("failed"))
+        ) as stats:
+            data = await miner.get_data(include=["hashboards"])
+
+        self.assertEqual(stats.await_count, 1)
+        self.assertEqual(len(data.hashboards), 3)
+
+    async def test_debug_flags_parse_phase_io(self):
+        settings.update("debug_parse_phase_io", True)
+        miner = BMMinerS19Pro("127.0.0.1")
+        # the fan data is missing from the batch, so the getter fetches it itself
+        with patch.object(
+            miner.rpc, "multicommand", AsyncMock(return_value={"multicommand": True})
+        ):
+            with self.assertRaises(APIError) as ctx:
+                await miner.get_data(include=["fans"])
+        self.assertIsInstance(ctx.exception.__cause__, ParsePhaseIOError)
+
+
+if __name__ == "__main__":
+    unittest.main()
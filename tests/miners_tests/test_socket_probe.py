@@ -0,0 +1,86 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from pyasic import settings
+from pyasic.miners.factory import MinerFactory, MinerTypes
+
+VERSION_RESPONSE = b'{"STATUS":[{"STATUS":"S"}],"VERSION":[{"Type":"Antminer S9"}]}'
+
+
+class TestSocketProbe(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.responses: list[bytes] = []
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        open_connection = asyncio.open_connection
+        self.patcher = patch(
+            "pyasic.miners.factory.asyncio.open_connection",
+            lambda host, _: open_connection(host, port),
+        )
+        self.patcher.start()
+
+    async def asyncTearDown(self):
+        self.patcher.stop()
+        self.server.close()
+        await self.server.wait_closed()
+        settings.update("factory_socket_max_bytes", 65536)
+
+    async def _handle(self, reader, writer):
+        await reader.read(4096)
+        for response in self.responses:
+            writer.write(response)
+            await writer.drain()
+        # keep the connection open, like a slow device
+        await asyncio.sleep(5)
+        writer.close()
+
+    async def _ping(self) -> tuple[str | None, float]:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        data = await MinerFactory._socket_ping("127.0.0.1", "version")
+        return data, loop.time() - start
+
+    async def test_returns_on_complete_json(self):
+        self.responses = [VERSION_RESPONSE[:20], VERSION_RESPONSE[20:]]
+        data, elapsed = await self._ping()
+        self.assertEqual(data, VERSION_RESPONSE.decode())
+        self.assertLess(elapsed, 0.5)
+
+    async def test_returns_on_null_byte(self):
+        self.responses = [b'{"VERSION":[{"Type":"Antminer S9"}]\x00']
+        data, elapsed = await self._ping()
+        self.assertEqual(MinerFactory._parse_socket_type(data), MinerTypes.ANTMINER)
+        self.assertLess(elapsed, 0.5)
+
+    async def test_returns_on_identified_broken_json(self):
+        self.responses = [b'{"VERSION":[{"Type":"Antminer S9",}],}']
+        data, elapsed = await self._ping()
+        self.assertEqual(MinerFactory._parse_socket_type(data), MinerTypes.ANTMINER)
+        self.assertLess(elapsed, 0.5)
+
+    async def test_byte_cap(self):
+        settings.update("factory_socket_max_bytes", 8192)
+        self.responses = [b"x" * 4096] * 8
+        data, elapsed = await self._ping()
+        self.assertEqual(len(data), 8192)
+        self.assertLess(elapsed, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
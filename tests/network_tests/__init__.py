@@ -14,10 +14,17 @@
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
 
+import asyncio
 import ipaddress
+import socket
 import unittest
+from unittest.mock import AsyncMock, patch
 
-from pyasic.network import MinerNetwork
+from pyasic import settings
+from pyasic.miners.antminer.bmminer.X19.S19 import BMMinerS19
+from pyasic.miners.factory import MinerFactory, miner_factory
+from pyasic.network import MinerNetwork, probe_ports
+from pyasic.network.hosts import HostRange
 
 
 class NetworkTest(unittest.TestCase):
@@ -73,6 +80,107 @@ class NetworkTest(unittest.TestCase):
             net.hosts, list(ipaddress.ip_network("192.168.1.0/24").hosts())
         )
 
+    def test_net_is_lazy(self):
+        net = MinerNetwork.from_subnet("10.0.0.0/12")
+        self.assertIsInstance(net.hosts, HostRange)
+        self.assertEqual(len(net), 2**20 - 2)
+        self.assertEqual(net.hosts[0], ipaddress.IPv4Address("10.0.0.1"))
+        self.assertEqual(net.hosts[-1], ipaddress.IPv4Address("10.15.255.254"))
+        self.assertIn("10.8.1.1", net.hosts)
+        self.assertNotIn("10.16.0.0", net.hosts)
+
+    def test_net_list_merges_ranges(self):
+        net = MinerNetwork.from_list(
+            ["10.0.0.1-10", "10.0.0.5-20", "10.0-1.1.1-5", "10.0.0.3"]
+        )
+        self.assertEqual(len(net), 30)
+        self.assertEqual(len(net.hosts.ranges), 3)
+        self.assertEqual(net.hosts[20], ipaddress.IPv4Address("10.0.1.1"))
+
+    def test_net_invalid_octet(self):
+        with self.assertRaises(ValueError):
+            MinerNetwork.from_address("10.0.0.1-300")
+
+
+class NetworkScanTest(unittest.IsolatedAsyncioTestCase):
+    async def test_scan_bounds_in_flight(self):
+        in_flight = 0
+        peak = 0
+        identified = []
+
+        async def fake_probe(ip, ports=None):
+            return {80} if int(ip) % 2 else set()
+
+        async def fake_get_miner(ip, ports=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            identified.append((ip, ports))
+            return None
+
+        net = MinerNetwork.from_subnet("10.0.0.0/24")
+        with (
+            patch("pyasic.network.probe_ports", fake_probe),
+            patch.object(miner_factory, "get_miner", fake_get_miner),
+            patch.object(settings._settings, "network_scan_semaphore", 16),
+        ):
+            results = [r async for r in net.scan_network_generator()]
+
+        self.assertEqual(len(results), 254)
+        self.assertEqual(len(identified), 127)
+        self.assertTrue(all(ports == {80} for _, ports in identified))
+        self.assertLessEqual(peak, 16)
+
+    async def test_scan_survives_host_errors(self):
+        async def fake_probe(ip, ports=None):
+            return {80}
+
+        async def fake_get_miner(ip, ports=None):
+            if ip == ipaddress.ip_address("10.0.0.2"):
+                raise KeyError("broken")
+            return BMMinerS19(str(ip))
+
+        net = MinerNetwork.from_address("10.0.0.1-3")
+        with (
+            patch("pyasic.network.probe_ports", fake_probe),
+            patch.object(miner_factory, "get_miner", fake_get_miner),
+            self.assertLogs(level="WARNING"),
+        ):
+            miners = await net.scan()
+
+        self.assertEqual([m.ip for m in miners], ["10.0.0.1", "10.0.0.3"])
+
+    async def test_probe_ports(self):
+        server = await asyncio.start_server(
+            lambda r, w: w.close(), host="127.0.0.1", port=0
+        )
+        open_port = server.sockets[0].getsockname()[1]
+        closed = socket.socket()
+        closed.bind(("127.0.0.1", 0))
+        closed_port = closed.getsockname()[1]
+        closed.close()
+
+        async with server:
+            self.assertEqual(
+                await probe_ports("127.0.0.1", [open_port, closed_port]), {open_port}
+            )
+
+    async def test_factory_skips_closed_probes(self):
+        factory = MinerFactory()
+        with (
+            patch.object(factory, "_get_miner_web", AsyncMock()) as web,
+            patch.object(factory, "_get_miner_socket", AsyncMock()) as sock,
+        ):
+            await factory._get_miner_type("10.0.0.1", ports={4028})
+            self.assertEqual(
+                await factory._get_miner_type("10.0.0.1", ports={8889}), None
+            )
+
+        web.assert_not_called()
+        sock.assert_awaited_once()
+
 
 if __name__ == "__main__":
     unittest.main()
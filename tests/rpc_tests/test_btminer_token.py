@@ -0,0 +1,61 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import base64
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pyasic.rpc.btminer import (
+    BTMinerRPCAPI,
+    TokenData,
+    clear_token_cache,
+    create_privileged_cmd,
+    parse_btminer_priviledge_data,
+)
+
+
+class TestBTMinerToken(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        clear_token_cache()
+
+    def test_privileged_round_trip(self):
+        token = TokenData(host_sign="sign", host_passwd_md5="passwd_md5")
+        for i in range(3):
+            packet = json.loads(create_privileged_cmd(token, {"cmd": "x", "n": i}))
+            enc = base64.encodebytes(base64.b64decode(packet["data"])).decode()
+            data = parse_btminer_priviledge_data(token, {"enc": enc})
+            self.assertEqual(data, {"cmd": "x", "n": i, "token": "sign"})
+
+    async def test_token_shared_between_instances(self):
+        response = {"Msg": {"salt": "BQ5hoXV9", "time": "3204", "newsalt": "Lw9O0fk2"}}
+        with patch.object(
+            BTMinerRPCAPI, "send_command", AsyncMock(return_value=response)
+        ) as send_command:
+            first = await BTMinerRPCAPI("10.0.0.1").get_token()
+            second = await BTMinerRPCAPI("10.0.0.1").get_token()
+            self.assertIs(first, second)
+            self.assertEqual(send_command.await_count, 1)
+
+            await BTMinerRPCAPI("10.0.0.2").get_token()
+            self.assertEqual(send_command.await_count, 2)
+
+            clear_token_cache("10.0.0.1")
+            await BTMinerRPCAPI("10.0.0.1").get_token()
+            self.assertEqual(send_command.await_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
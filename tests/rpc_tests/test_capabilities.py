@@ -0,0 +1,108 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import unittest
+
+from pyasic.errors import APIError, GovernorRejectedError
+from pyasic.miners.antminer import BMMinerS9
+from pyasic.rpc.capabilities import RPCCapabilities, capability_cache
+from pyasic.rpc.cgminer import CGMinerRPCAPI
+
+
+class FakeRPC(CGMinerRPCAPI):
+    def __init__(
+        self,
+        joined: bool = False,
+        broken: tuple[str, ...] = (),
+        error: APIError | None = None,
+    ) -> None:
+        super().__init__("127.0.0.1")
+        self.joined = joined
+        self.broken = broken
+        self.error = error
+        self.sent: list[str] = []
+
+    async def send_command(self, command, *args, **kwargs) -> dict:
+        self.sent.append(command)
+        if "+" in command and not self.joined:
+            raise APIError("joined commands not supported")
+        if any(c in self.broken for c in command.split("+")):
+            raise self.error or APIError(f"{command}: invalid command")
+        return {c: [{"STATUS": "S"}] for c in command.split("+")}
+
+
+class TestRPCCapabilities(unittest.IsolatedAsyncioTestCase):
+    async def test_learns_split_multicommand(self):
+        rpc = FakeRPC()
+        data = await rpc.multicommand("version", "stats")
+        self.assertIn("stats", data)
+        self.assertFalse(rpc.capabilities.joined_multicommand)
+
+        rpc.sent.clear()
+        await rpc.multicommand("version", "stats")
+        self.assertEqual(rpc.sent, ["version", "stats"])
+
+    async def test_learns_joined_multicommand(self):
+        rpc = FakeRPC(joined=True)
+        await rpc.multicommand("version", "stats")
+        self.assertTrue(rpc.capabilities.joined_multicommand)
+        self.assertEqual(rpc.sent, ["version+stats"])
+
+    async def test_skips_unsupported_commands(self):
+        rpc = FakeRPC(joined=True, broken=("pools",))
+        await rpc.multicommand("version", "pools")
+        # the joined command may have failed because of pools, so try joining again
+        self.assertIsNone(rpc.capabilities.joined_multicommand)
+        self.assertEqual(rpc.capabilities.unsupported, {"pools"})
+
+        rpc.sent.clear()
+        await rpc.multicommand("version", "stats", "pools")
+        self.assertEqual(rpc.sent, ["version+stats"])
+
+    async def test_transient_errors_need_strikes(self):
+        rpc = FakeRPC(
+            joined=True, broken=("pools",), error=APIError("Decode Error: truncated")
+        )
+        for _ in range(rpc.capabilities.strikes - 1):
+            await rpc.multicommand("version", "pools")
+            self.assertEqual(rpc.capabilities.unsupported, set())
+        await rpc.multicommand("version", "pools")
+        self.assertEqual(rpc.capabilities.unsupported, {"pools"})
+
+        # learned capabilities expire
+        rpc.capabilities.ttl = 0
+        self.assertEqual(rpc.capabilities.unsupported, set())
+
+    async def test_governor_rejections_are_ignored(self):
+        rpc = FakeRPC(
+            joined=True, broken=("pools",), error=GovernorRejectedError("queue full")
+        )
+        for _ in range(rpc.capabilities.strikes + 1):
+            await rpc.multicommand("version", "pools")
+        self.assertEqual(rpc.capabilities.unsupported, set())
+        self.assertIsNone(rpc.capabilities.joined_multicommand)
+
+    async def test_shared_between_miners(self):
+        capability_cache.clear()
+        a, b = BMMinerS9("127.0.0.1"), BMMinerS9("127.0.0.2")
+        self.assertIs(a.rpc.capabilities, b.rpc.capabilities)
+        self.assertEqual(len(capability_cache), 1)
+
+        capability_cache.clear()
+        self.assertIsInstance(FakeRPC().capabilities, RPCCapabilities)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import unittest
+from unittest.mock import patch
+
+from pyasic.rpc.bmminer import BMMinerRPCAPI
+from pyasic.rpc.cgminer import CGMinerRPCAPI
+from pyasic.web.antminer import AntminerModernWebAPI
+
+
+class TestCommandSet(unittest.TestCase):
+    def test_rpc_command_set(self):
+        self.assertIsInstance(CGMinerRPCAPI.command_set, frozenset)
+        self.assertIn("summary", CGMinerRPCAPI.command_set)
+        self.assertNotIn("send_command", CGMinerRPCAPI.command_set)
+        self.assertNotIn("_send_bytes", CGMinerRPCAPI.command_set)
+        self.assertEqual(
+            CGMinerRPCAPI("127.0.0.1").get_commands(),
+            sorted(CGMinerRPCAPI.command_set),
+        )
+
+    def test_subclass_command_set(self):
+        class CustomRPCAPI(BMMinerRPCAPI):
+            async def custom(self) -> dict:
+                return {}
+
+        self.assertIn("custom", CustomRPCAPI.command_set)
+        self.assertNotIn("custom", BMMinerRPCAPI.command_set)
+        self.assertTrue(BMMinerRPCAPI.command_set < CustomRPCAPI.command_set)
+
+    def test_boser_command_set(self):
+        from pyasic.web.braiins_os.boser import BOSerWebAPI
+
+        self.assertIn("get_api_version", BOSerWebAPI.command_set)
+        self.assertNotIn("aclose", BOSerWebAPI.command_set)
+        self.assertNotIn("multicommand", BOSerWebAPI.command_set)
+
+    def test_check_commands_does_not_reflect(self):
+        rpc = CGMinerRPCAPI("127.0.0.1")
+        web = AntminerModernWebAPI("127.0.0.1")
+        with (
+            patch("pyasic.rpc.base.public_commands") as rpc_reflect,
+            patch("pyasic.web.base.public_commands") as web_reflect,
+        ):
+            self.assertEqual(
+                rpc._check_commands("summary", "pools"), ["summary", "pools"]
+            )
+            self.assertEqual(web._check_commands("summary"), ["summary"])
+        rpc_reflect.assert_not_called()
+        web_reflect.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import json
+import struct
+import unittest
+
+from pyasic.rpc.btminer import BTMinerV3RPCAPI
+from pyasic.rpc.cgminer import CGMinerRPCAPI
+from pyasic.rpc.luxminer import LUXMinerRPCAPI
+
+
+class TestPersistentConnection(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.connections = 0
+        self.terminator = b""
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    break
+                command = json.loads(data)["command"]
+                writer.write(json.dumps({"STATUS": "S", "command": command}).encode())
+                await writer.drain()
+                if self.terminator:
+                    # the null terminator arrives in its own chunk
+                    await asyncio.sleep(0.01)
+                    writer.write(self.terminator)
+                    await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_reuses_connection(self):
+        api = LUXMinerRPCAPI("127.0.0.1", port=self.port)
+        api.persistent = True
+        for command in ["summary", "pools", "devs"]:
+            data = await api._send_bytes(json.dumps({"command": command}).encode())
+            self.assertEqual(json.loads(data)["command"], command)
+        self.assertEqual(self.connections, 1)
+        await api.aclose()
+
+    async def test_split_terminator(self):
+        self.terminator = b"\x00"
+        api = LUXMinerRPCAPI("127.0.0.1", port=self.port)
+        api.persistent = True
+        for command in ["summary", "pools", "devs"]:
+            data = await api._send_bytes(json.dumps({"command": command}).encode())
+            self.assertEqual(api._load_api_data(data)["command"], command)
+            await asyncio.sleep(0.05)
+        await api.aclose()
+
+    async def test_reconnects_after_close(self):
+        api = LUXMinerRPCAPI("127.0.0.1", port=self.port)
+        api.persistent = True
+        await api._send_bytes(b'{"command": "summary"}')
+        # simulate the miner dropping the connection
+        await api.aclose()
+        data = await api._send_bytes(b'{"command": "pools"}')
+        self.assertEqual(json.loads(data)["command"], "pools")
+        self.assertEqual(self.connections, 2)
+        await api.aclose()
+
+    async def test_unsupported(self):
+        api = CGMinerRPCAPI("127.0.0.1")
+        self.assertFalse(api.persistent)
+        with self.assertRaises(ValueError):
+            api.persistent = True
+
+
+class TestBTMinerV3PersistentConnection(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.connections = 0
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                header = await reader.readexactly(4)
+                body = await reader.readexactly(struct.unpack("<I", header)[0])
+                response = json.dumps({"code": 0, "echo": json.loads(body)}).encode()
+                writer.write(struct.pack("<I", len(response)) + response)
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    async def test_length_prefixed_frames(self):
+        api = BTMinerV3RPCAPI("127.0.0.1", port=self.port)
+        api.persistent = True
+        for i in range(3):
+            body = json.dumps({"cmd": "get.device.info", "n": i}).encode()
+            data = await api._send_bytes(struct.pack("<I", len(body)) + body)
+            self.assertEqual(json.loads(data)["echo"]["n"], i)
+        self.assertEqual(self.connections, 1)
+        await api.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
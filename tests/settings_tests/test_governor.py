@@ -0,0 +1,118 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from pyasic import settings
+from pyasic.errors import GovernorRejectedError
+from pyasic.rpc.cgminer import CGMinerRPCAPI
+from pyasic.settings.limits import Governor, TokenBucket, subnet
+
+
+class TestGovernor(unittest.IsolatedAsyncioTestCase):
+    async def run_requests(self, governor, hosts, transport="rpc", delay=0.02):
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def request(host):
+            async with governor.limit(transport, host):
+                key = subnet(host)
+                active[key] = active.get(key, 0) + 1
+                peak[key] = max(peak.get(key, 0), active[key])
+                peak["all"] = max(peak.get("all", 0), sum(active.values()))
+                await asyncio.sleep(delay)
+                active[key] -= 1
+
+        await asyncio.gather(*(request(h) for h in hosts))
+        return peak
+
+    async def test_global_and_transport_concurrency(self):
+        hosts = [f"10.0.{i}.1" for i in range(6)]
+        peak = await self.run_requests(Governor(concurrency=2), hosts)
+        self.assertEqual(peak["all"], 2)
+
+        governor = Governor(transport_concurrency={"ssh": 1})
+        self.assertEqual((await self.run_requests(governor, hosts, "ssh"))["all"], 1)
+        self.assertEqual((await self.run_requests(governor, hosts, "rpc"))["all"], 6)
+
+    async def test_subnet_concurrency(self):
+        hosts = [f"10.0.{i}.{j}" for i in range(2) for j in range(4)]
+        peak = await self.run_requests(Governor(subnet_concurrency=1), hosts)
+        self.assertEqual(peak["10.0.0.0/24"], 1)
+        self.assertEqual(peak["10.0.1.0/24"], 1)
+        self.assertEqual(peak["all"], 2)
+
+    async def test_rate(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(6):
+            await bucket.acquire()
+        self.assertGreaterEqual(loop.time() - start, 0.09)
+
+    async def test_rejects_when_queue_is_full(self):
+        governor = Governor(concurrency=1, max_queued=0)
+        async with governor.limit("rpc", "10.0.0.1"):
+            with self.assertRaises(GovernorRejectedError):
+                async with governor.limit("rpc", "10.0.0.2"):
+                    pass
+        self.assertEqual(governor.metrics().rejected, 1)
+
+    async def test_rejects_after_queue_timeout(self):
+        governor = Governor(concurrency=1, queue_timeout=0.01)
+        async with governor.limit("rpc", "10.0.0.1"):
+            with self.assertRaises(GovernorRejectedError):
+                async with governor.limit("rpc", "10.0.0.2"):
+                    pass
+            self.assertEqual(governor.metrics().queued, 0)
+        async with governor.limit("rpc", "10.0.0.2"):
+            pass
+        self.assertEqual(governor.metrics().admitted, 2)
+
+    async def test_nested_requests_reuse_slot(self):
+        governor = Governor(concurrency=1)
+        async with governor.limit("http", "10.0.0.1"):
+            async with governor.limit("http", "10.0.0.1"):
+                metrics = governor.metrics()
+        self.assertEqual(metrics.in_flight, 1)
+        self.assertEqual(metrics.in_flight_by_transport["http"], 1)
+        self.assertEqual(metrics.in_flight_by_subnet, {"10.0.0.0/24": 1})
+        self.assertEqual(governor.metrics().in_flight_by_subnet, {})
+
+    async def test_rpc_is_governed(self):
+        settings.update("governor_transport_concurrency", {"rpc": 1})
+        self.addCleanup(settings.update, "governor_transport_concurrency", {})
+        active = []
+        peak = []
+
+        async def send(self, data, **kwargs):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+            return b'{"STATUS": [{"STATUS": "S"}]}'
+
+        with patch.object(CGMinerRPCAPI, "_send_bytes_direct", send):
+            await asyncio.gather(
+                *(CGMinerRPCAPI(f"10.0.0.{i}").summary() for i in range(4))
+            )
+        self.assertEqual(max(peak), 1)
+        self.assertEqual(settings.governor().metrics().admitted, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
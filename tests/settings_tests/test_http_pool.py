@@ -0,0 +1,115 @@
+import asyncio
+import unittest
+
+import httpx
+
+from pyasic import settings
+from pyasic.settings.http import HTTPClientPool
+from pyasic.web.antminer import AntminerModernWebAPI
+
+
+class TestHTTPClientPool(unittest.IsolatedAsyncioTestCase):
+    def make_pool(self, **kwargs) -> HTTPClientPool:
+        options = {
+            "max_hosts": 8,
+            "max_connections": 2,
+            "keepalive_expiry": 5.0,
+            "idle_timeout": 60.0,
+            "transport": lambda verify, limits: httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"host": request.url.host})
+            ),
+        }
+        options.update(kwargs)
+        return HTTPClientPool(**options)
+
+    async def test_client_is_reused_per_host(self):
+        pool = self.make_pool()
+        async with pool.client("10.0.0.1") as first:
+            pass
+        async with pool.client("10.0.0.1") as second:
+            self.assertFalse(second.is_closed)
+        async with pool.client("10.0.0.2") as other:
+            pass
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(len(pool), 2)
+        await pool.aclose()
+        self.assertTrue(first.is_closed)
+        self.assertEqual(len(pool), 0)
+
+    async def test_max_hosts_evicts_least_recently_used(self):
+        pool = self.make_pool(max_hosts=2)
+        async with pool.client("10.0.0.1") as first:
+            pass
+        async with pool.client("10.0.0.2"):
+            pass
+        async with pool.client("10.0.0.3"):
+            pass
+
+        self.assertTrue(first.is_closed)
+        self.assertNotIn("10.0.0.1", pool)
+        self.assertEqual(len(pool), 2)
+        await pool.aclose()
+
+    async def test_evicted_clients_are_not_reused(self):
+        class SlowCloseTransport(httpx.MockTransport):
+            async def aclose(self) -> None:
+                await asyncio.sleep(0.01)
+
+        pool = self.make_pool(
+            idle_timeout=0.05,
+            transport=lambda verify, limits: SlowCloseTransport(
+                lambda request: httpx.Response(200)
+            ),
+        )
+        for host in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            async with pool.client(host):
+                pass
+        await asyncio.sleep(0.1)
+
+        async def evict() -> None:
+            async with pool.client("10.0.0.4"):
+                pass
+
+        async def borrow() -> None:
+            await asyncio.sleep(0)
+            async with pool.client("10.0.0.3") as client:
+                await asyncio.sleep(0.05)
+                await client.get("http://10.0.0.3/")
+
+        await asyncio.gather(evict(), evict(), borrow())
+        await pool.aclose()
+
+    async def test_idle_clients_are_evicted(self):
+        pool = self.make_pool(idle_timeout=-1)
+        async with pool.client("10.0.0.1") as first:
+            pass
+        async with pool.client("10.0.0.2"):
+            self.assertTrue(first.is_closed)
+        await pool.aclose()
+
+    async def test_in_use_clients_are_not_evicted(self):
+        pool = self.make_pool(max_hosts=1)
+        async with pool.client("10.0.0.1") as first:
+            async with pool.client("10.0.0.2"):
+                pass
+            self.assertFalse(first.is_closed)
+        await pool.aclose()
+
+    async def test_web_api_uses_shared_pool(self):
+        api = AntminerModernWebAPI("10.0.0.1")
+        async with api._client() as first:
+            pass
+        async with api._client() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertIn("10.0.0.1", settings.http_pool())
+        await api.aclose()
+        self.assertNotIn("10.0.0.1", settings.http_pool())
+        await settings.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
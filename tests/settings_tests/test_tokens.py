@@ -0,0 +1,132 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from pyasic import settings
+from pyasic.rpc.luxminer import LUXMinerRPCAPI
+from pyasic.settings.tokens import (
+    FileTokenStore,
+    MemoryTokenStore,
+    SQLiteTokenStore,
+    TokenEntry,
+    token_key,
+)
+from pyasic.web.vnish import VNishWebAPI
+
+
+class TestTokenStores(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_memory_lru(self):
+        store = MemoryTokenStore(max_size=2)
+        store.set("a", TokenEntry("1", time.time() + 60))
+        store.set("b", TokenEntry("2", time.time() + 60))
+        store.get("a")
+        store.set("c", TokenEntry("3", time.time() + 60))
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.get("a").token, "1")
+        store.set("d", TokenEntry("4", time.time() - 1))
+        self.assertIsNone(store.get("d"))
+
+    def test_file_store_reload(self):
+        path = Path(self.tmp.name) / "tokens.json"
+        store = FileTokenStore(path, save_interval=3600)
+        store.set("a", TokenEntry("1", time.time() + 60))
+        store.set("b", TokenEntry("2", time.time() - 1))
+        self.assertFalse(path.exists())
+        store.save()
+        reloaded = FileTokenStore(path)
+        self.assertEqual(reloaded.get("a").token, "1")
+        self.assertEqual(len(reloaded), 1)
+
+    def test_sqlite_store_reload(self):
+        path = Path(self.tmp.name) / "tokens.db"
+        store = SQLiteTokenStore(path, max_size=1)
+        store.set("a", TokenEntry("1", time.time() + 60))
+        store.set("b", TokenEntry("2", time.time() + 60))
+        # evicted from memory, but still in the database
+        self.assertEqual(store.get("a").token, "1")
+        store.remove("b")
+        store.close()
+        reloaded = SQLiteTokenStore(path)
+        self.assertEqual(reloaded.get("a").token, "1")
+        self.assertIsNone(reloaded.get("b"))
+        reloaded.close()
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_stores_are_private(self):
+        file_path = Path(self.tmp.name) / "tokens.json"
+        store = FileTokenStore(file_path)
+        store.set("a", TokenEntry("1", time.time() + 60))
+        store.save()
+        self.assertEqual(file_path.stat().st_mode & 0o777, 0o600)
+        db_path = Path(self.tmp.name) / "tokens.db"
+        SQLiteTokenStore(db_path).close()
+        self.assertEqual(db_path.stat().st_mode & 0o777, 0o600)
+
+
+class TestStoredToken(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        store = MemoryTokenStore()
+        patcher = patch.object(settings, "_token_store", store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = store
+
+    def test_shared_between_instances(self):
+        VNishWebAPI("10.0.0.1").token = "abc"
+        self.assertEqual(VNishWebAPI("10.0.0.1").token, "abc")
+        self.assertIsNone(VNishWebAPI("10.0.0.2").token)
+        VNishWebAPI("10.0.0.1").token = None
+        self.assertEqual(len(self.store), 0)
+
+    def test_refresh_before_expiry(self):
+        api = VNishWebAPI("10.0.0.1")
+        key = token_key("vnish", "10.0.0.1", "admin")
+        self.store.set(key, TokenEntry("abc", time.time() + 30))
+        # within the refresh margin, so the API logs in again
+        self.assertIsNone(api.token)
+        api.token = "def"
+        entry = self.store.get(key)
+        self.assertGreater(entry.expires, time.time() + 3000)
+
+    def test_ttl_override(self):
+        with patch.object(settings._settings, "token_ttl", {"vnish": 120}):
+            VNishWebAPI("10.0.0.1").token = "abc"
+        entry = self.store.get(token_key("vnish", "10.0.0.1", "admin"))
+        self.assertLess(entry.expires, time.time() + 121)
+
+    async def test_luxminer_reuses_session(self):
+        LUXMinerRPCAPI("10.0.0.1").session_token = "session"
+        api = LUXMinerRPCAPI("10.0.0.1")
+        with (
+            patch.object(api, "auth", AsyncMock()) as auth,
+            patch.object(api, "send_command", AsyncMock(return_value={})) as send,
+        ):
+            await api.send_privileged_command("curtail", "sleep")
+        auth.assert_not_called()
+        send.assert_awaited_once_with("curtail", "session", "sleep")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from grpclib.client import Channel
+from grpclib.exceptions import StreamTerminatedError
+from grpclib.server import Server
+
+from pyasic import settings
+from pyasic.errors import APIError
+from pyasic.settings.channels import GRPCChannelPool
+from pyasic.web.braiins_os.boser import BOSerWebAPI, BOSMinerGRPCStub
+from pyasic.web.braiins_os.proto.braiins.bos import (
+    ApiVersion,
+    ApiVersionRequest,
+    ApiVersionServiceBase,
+)
+
+
+class _ApiVersionService(ApiVersionServiceBase):
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def get_api_version(
+        self, api_version_request: ApiVersionRequest
+    ) -> ApiVersion:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        return ApiVersion(major=1, minor=3)
+
+
+class TestBOSerChannel(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = _ApiVersionService()
+        self.server = Server([self.service])
+        await self.server.start("127.0.0.1", 0)
+        self.port = self.server._server.sockets[0].getsockname()[1]
+
+        # count connections opened by channels
+        self.connections = 0
+        create_connection = Channel._create_connection
+
+        async def counted(channel):
+            self.connections += 1
+            return await create_connection(channel)
+
+        patcher = patch.object(Channel, "_create_connection", counted)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await settings.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def api(self) -> BOSerWebAPI:
+        api = BOSerWebAPI("127.0.0.1")
+        api.port = self.port
+        return api
+
+    async def test_calls_share_one_channel(self):
+        api = self.api()
+        results = await asyncio.gather(*(api.get_api_version() for _ in range(5)))
+        await self.api().get_api_version()
+        self.assertEqual(results[0], {"major": 1, "minor": 3})
+        # concurrent calls are streams on the same connection
+        self.assertEqual(self.service.peak, 5)
+        self.assertEqual(self.connections, 1)
+        self.assertEqual(len(settings.grpc_pool()), 1)
+
+    async def test_reconnects(self):
+        api = self.api()
+        await api.get_api_version()
+        await api.aclose()
+        self.assertNotIn("127.0.0.1", settings.grpc_pool())
+        await api.get_api_version()
+        settings.grpc_pool().reset("127.0.0.1", self.port)
+        await api.get_api_version()
+        self.assertEqual(self.connections, 3)
+
+    async def test_dropped_connection_raises_api_error(self):
+        api = self.api()
+        await api.get_api_version()
+        with patch.object(
+            BOSMinerGRPCStub,
+            "get_api_version",
+            side_effect=StreamTerminatedError("Connection lost"),
+        ):
+            with self.assertRaises(APIError):
+                await api.get_api_version()
+        # the channel reconnects on the next call
+        await api.get_api_version()
+        self.assertEqual(self.connections, 2)
+
+
+class TestGRPCChannelPool(unittest.IsolatedAsyncioTestCase):
+    async def test_channel_cap(self):
+        pool = GRPCChannelPool(max_channels=1, idle_timeout=60)
+        order = []
+
+        async def borrow(host):
+            async with pool.channel(host, 50051):
+                order.append(host)
+                self.assertEqual(len(pool), 1)
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(borrow("10.0.0.1"), borrow("10.0.0.2"))
+        self.assertEqual(order, ["10.0.0.1", "10.0.0.2"])
+        self.assertNotIn("10.0.0.1", pool)
+        pool.close()
+
+    async def test_idle_timeout(self):
+        pool = GRPCChannelPool(max_channels=4, idle_timeout=0)
+        async with pool.channel("10.0.0.1", 50051):
+            pass
+        with patch("time.monotonic", return_value=1e12):
+            async with pool.channel("10.0.0.2", 50051):
+                pass
+        self.assertNotIn("10.0.0.1", pool)
+        pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import unittest
+
+from grpclib.server import Server
+
+from pyasic import settings
+from pyasic.web.braiins_os.boser import BOSerWebAPI
+from pyasic.web.braiins_os.projection import Projection, field_tree
+from pyasic.web.braiins_os.proto.braiins.bos.v1 import (
+    Frequency,
+    GetHashboardsRequest,
+    GetHashboardsResponse,
+    GigaHashrate,
+    Hashboard,
+    MinerServiceBase,
+    RealHashrate,
+    Temperature,
+    TemperatureSensor,
+    Voltage,
+    WorkSolverStats,
+)
+
+FIELDS = (
+    "hashboards.id",
+    "hashboards.boardTemp",
+    "hashboards.stats.realHashrate.last5S",
+)
+
+
+def _hashboards() -> GetHashboardsResponse:
+    return GetHashboardsResponse(
+        hashboards=[
+            Hashboard(
+                id=str(i),
+                enabled=True,
+                chips_count=63,
+                current_voltage=Voltage(volt=13.2),
+                current_frequency=Frequency(hertz=525e6),
+                highest_chip_temp=TemperatureSensor(
+                    temperature=Temperature(degree_c=71)
+                ),
+                board_temp=Temperature(degree_c=55 + i),
+                stats=WorkSolverStats(
+                    real_hashrate=RealHashrate(
+                        last_5_s=GigaHashrate(gigahash_per_second=30000 + i),
+                        last_1_h=GigaHashrate(gigahash_per_second=29000),
+                    ),
+                    nominal_hashrate=GigaHashrate(gigahash_per_second=31000),
+                    found_blocks=1,
+                ),
+            )
+            for i in range(3)
+        ]
+    )
+
+
+EXPECTED = {
+    "hashboards": [
+        {
+            "id": str(i),
+            "boardTemp": {"degreeC": 55.0 + i},
+            "stats": {"realHashrate": {"last5S": {"gigahashPerSecond": 30000.0 + i}}},
+        }
+        for i in range(3)
+    ]
+}
+
+
+class TestProjection(unittest.TestCase):
+    def test_field_tree(self):
+        self.assertEqual(
+            field_tree(["a.b.c", "a", "d.e", "d.f"]),
+            {"a": {}, "d": {"e": {}, "f": {}}},
+        )
+
+    def test_projection_matches_full_decode(self):
+        data = bytes(_hashboards())
+        projected = Projection(GetHashboardsResponse, FIELDS).FromString(data)
+        self.assertEqual(projected.to_pydict(), EXPECTED)
+        self.assertEqual(
+            GetHashboardsResponse.FromString(data).to_pydict(),
+            _hashboards().to_pydict(),
+        )
+
+
+class _MinerService(MinerServiceBase):
+    async def get_hashboards(
+        self, get_hashboards_request: GetHashboardsRequest
+    ) -> GetHashboardsResponse:
+        return _hashboards()
+
+
+class TestBOSerProjection(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = Server([_MinerService()])
+        await self.server.start("127.0.0.1", 0)
+        self.api = BOSerWebAPI("127.0.0.1")
+        self.api.port = self.server._server.sockets[0].getsockname()[1]
+        self.api.token = "token"
+
+    async def asyncTearDown(self):
+        self.api.token = None
+        await settings.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_multicommand_fields(self):
+        projected, full = await asyncio.gather(
+            self.api.multicommand("get_hashboards", fields={"get_hashboards": FIELDS}),
+            self.api.multicommand("get_hashboards"),
+        )
+        self.assertEqual(projected["get_hashboards"], EXPECTED)
+        self.assertEqual(full["get_hashboards"], _hashboards().to_pydict())
+
+
+if __name__ == "__main__":
+    unittest.main()
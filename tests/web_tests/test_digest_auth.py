@@ -0,0 +1,70 @@
+import unittest
+
+import httpx
+
+from pyasic.web.antminer import AntminerModernWebAPI
+from pyasic.web.base import CachedDigestAuth
+
+
+class DigestServer:
+    def __init__(self) -> None:
+        self.nonce = "nonce-1"
+        self.requests = 0
+
+    def challenge(self, stale: bool = False) -> httpx.Response:
+        header = f'Digest realm="antMiner", nonce="{self.nonce}", qop="auth"'
+        if stale:
+            header += ', stale="true"'
+        return httpx.Response(401, headers={"WWW-Authenticate": header})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        auth = request.headers.get("Authorization")
+        if auth is None:
+            return self.challenge()
+        if f'nonce="{self.nonce}"' not in auth:
+            return self.challenge(stale=True)
+        return httpx.Response(200, json={"ok": True})
+
+
+class TestCachedDigestAuth(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = DigestServer()
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.server))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_challenge_is_reused(self):
+        auth = CachedDigestAuth("root", "root")
+        for _ in range(3):
+            resp = await self.client.get(
+                "http://10.0.0.1/cgi-bin/summary.cgi", auth=auth
+            )
+            self.assertEqual(resp.status_code, 200)
+
+        self.assertEqual(auth.challenges, 1)
+        self.assertEqual(auth.challenges_avoided, 2)
+        self.assertEqual(self.server.requests, 4)
+
+    async def test_stale_nonce_renegotiates(self):
+        auth = CachedDigestAuth("root", "root")
+        await self.client.get("http://10.0.0.1/cgi-bin/summary.cgi", auth=auth)
+        self.server.nonce = "nonce-2"
+        resp = await self.client.get("http://10.0.0.1/cgi-bin/summary.cgi", auth=auth)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(auth.challenges, 2)
+        self.assertEqual(auth.challenges_avoided, 0)
+
+    def test_web_api_shares_auth_until_credentials_change(self):
+        api = AntminerModernWebAPI("10.0.0.1")
+        auth = api._get_digest_auth()
+        self.assertIs(api._get_digest_auth(), auth)
+
+        api.pwd = "changed"
+        self.assertIsNot(api._get_digest_auth(), auth)
+
+
+if __name__ == "__main__":
+    unittest.main()
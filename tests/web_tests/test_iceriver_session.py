@@ -0,0 +1,84 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import httpx
+
+from pyasic.web.iceriver import IceRiverWebAPI
+
+
+class IceRiverServer:
+    def __init__(self) -> None:
+        self.session = 0
+        self.logins = 0
+        self.commands = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        if request.url.path == "/user/loginpost":
+            self.logins += 1
+            self.session += 1
+            return httpx.Response(
+                200, json={}, headers={"Set-Cookie": f"session={self.session}"}
+            )
+        self.commands += 1
+        if f"session={self.session}" not in request.headers.get("cookie", ""):
+            return httpx.Response(302, headers={"Location": "/login"})
+        return httpx.Response(200, json={"data": request.url.path})
+
+
+class TestIceRiverSession(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = IceRiverServer()
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.server))
+
+        @asynccontextmanager
+        async def http_client(host, verify=None):
+            yield self.client
+
+        self.patcher = patch("pyasic.web.base.settings.http_client", http_client)
+        self.patcher.start()
+
+    async def asyncTearDown(self):
+        self.patcher.stop()
+        await self.client.aclose()
+
+    async def test_multicommand_logs_in_once(self):
+        api = IceRiverWebAPI("10.0.0.1")
+        data = await api.multicommand("userpanel", "userpanel", "userpanel")
+        self.assertEqual(data["userpanel"], {"data": "/user/userpanel"})
+
+        await api.userpanel()
+        self.assertEqual(self.server.logins, 1)
+        self.assertEqual(api.logins, 1)
+        self.assertGreaterEqual(api.logins_avoided, 1)
+
+    async def test_relogin_on_expired_session(self):
+        api = IceRiverWebAPI("10.0.0.1")
+        await api.userpanel()
+        # the miner dropped the session, e.g. after a reboot
+        self.server.session += 1
+
+        results = await asyncio.gather(*(api.userpanel() for _ in range(4)))
+        self.assertTrue(all(r == {"data": "/user/userpanel"} for r in results))
+        self.assertEqual(self.server.logins, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()